@@ -9,6 +9,7 @@ from arkouda.numpy import *
 from arkouda.client import *
 from arkouda.client_dtypes import *
 from arkouda.pdarrayclass import *
+from arkouda.lazy import *
 from arkouda.sorting import *
 from arkouda.pdarraysetops import *
 from arkouda.pdarraycreation import *
@@ -43,3 +44,4 @@ from arkouda.util import (
 from arkouda.scipy.special import *
 from arkouda.scipy import *
 from arkouda.testing import *
+from arkouda import aio
@@ -0,0 +1,91 @@
+"""
+Asyncio-friendly interface to the Arkouda server.
+
+The functions in this module are coroutines built on top of the pipelined
+``arkouda.client.generic_msg_async`` API, so independent commands issued from
+an event loop can be in flight together instead of each waiting a full round
+trip for the previous one.
+
+Examples
+--------
+>>> import asyncio
+>>> import arkouda as ak
+>>> ak.connect()
+>>> async def infos(names):
+...     replies = await asyncio.gather(
+...         *(ak.aio.generic_msg(cmd="info", args={"names": n}) for n in names)
+...     )
+...     return replies
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Union, cast
+
+from arkouda import client
+
+__all__ = ["generic_msg", "noop"]
+
+
+async def generic_msg(
+    cmd: str,
+    args: Optional[Dict] = None,
+    payload: Optional[memoryview] = None,
+    send_binary: bool = False,
+    recv_binary: bool = False,
+) -> Union[str, memoryview]:
+    """
+    Sends a binary or string message composed of a command and corresponding
+    arguments to the arkouda_server and awaits the response.
+
+    Parameters
+    ----------
+    cmd : str
+        The server-side command to be executed
+    args : dict
+        A dictionary of command arguments
+    payload : memoryview
+        The payload when sending binary data
+    send_binary : bool
+        Indicates if the message to be sent is a string or binary
+    recv_binary : bool
+        Indicates if the return message will be a string or binary
+
+    Returns
+    -------
+    Union[str, memoryview]
+        The string or binary return message
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the client is not connected to the server or if
+        there is a server-side error thrown
+
+    See Also
+    --------
+    arkouda.client.generic_msg_async
+    """
+    return await asyncio.wrap_future(
+        client.generic_msg_async(
+            cmd=cmd, args=args, payload=payload, send_binary=send_binary, recv_binary=recv_binary
+        )
+    )
+
+
+async def noop(count: int = 1) -> List[str]:
+    """
+    Send ``count`` no-op messages concurrently, which is useful for measuring
+    pipelined round trip throughput.
+
+    Parameters
+    ----------
+    count : int
+        The number of no-op messages to send
+
+    Returns
+    -------
+    List[str]
+        The noop command results
+    """
+    replies = await asyncio.gather(*(generic_msg(cmd="noop") for _ in range(count)))
+    return [cast(str, r) for r in replies]
@@ -1,5 +1,5 @@
 import functools
-from typing import Sequence
+from typing import Optional, Sequence
 from warnings import warn
 
 import numpy as np
@@ -12,7 +12,7 @@ from arkouda.numpy.dtypes import bigint
 from arkouda.numpy.dtypes import float64 as akfloat64
 from arkouda.numpy.dtypes import int64 as akint64
 from arkouda.numpy.dtypes import uint64 as akuint64
-from arkouda.pdarrayclass import create_pdarray, pdarray
+from arkouda.pdarrayclass import RegistrationError, create_pdarray, pdarray
 from arkouda.pdarraycreation import arange, full, ones, zeros
 from arkouda.pdarraysetops import concatenate, in1d
 from arkouda.sorting import argsort, coargsort
@@ -267,9 +267,11 @@ def lookup(keys, values, arguments, fillvalue=-1):
 
     Parameters
     ----------
-    keys : (sequence of) array-like
+    keys : (sequence of) array-like, Index or MultiIndex
         The domain of the function. Entries must be unique (if a sequence of
-        arrays is given, each row is treated as a tuple-valued entry).
+        arrays is given, each row is treated as a tuple-valued entry). An
+        Index or MultiIndex keeps the hash index it builds for the lookup,
+        which later lookups in it reuse.
     values : pdarray
         The range of the function. Must be same length as keys.
     arguments : (sequence of) array-like
@@ -312,8 +314,10 @@ def lookup(keys, values, arguments, fillvalue=-1):
     if isinstance(values, Categorical):
         codes = lookup(keys, values.codes, arguments, fillvalue=values._NAcode)
         return Categorical.from_codes(codes, values.categories, NAvalue=values.NAvalue)
+    from arkouda.index import Index
+
     # Find arguments in keys array
-    idx = find(arguments, keys)
+    idx = keys._find(arguments) if isinstance(keys, Index) else find(arguments, keys)
     # Initialize return values with fillvalue for missing values
     retvals = full(idx.size, fillvalue, dtype=values.dtype)
     # Where arguments were found in keys, put corresponding fuction values
@@ -382,10 +386,11 @@ def search_intervals(vals, intervals, tiebreak=None, hierarchical=True):
     ----------
     vals : (sequence of) pdarray(int, uint, float)
         Values to search for in intervals. If multiple arrays, each "row" is an item.
-    intervals : 2-tuple of (sequences of) pdarrays
+    intervals : 2-tuple of (sequences of) pdarrays, or IntervalIndex
         Non-overlapping, half-open intervals, as a tuple of
         (lower_bounds_inclusive, upper_bounds_exclusive)
-        Must have same dtype(s) as vals.
+        Must have same dtype(s) as vals. An IntervalIndex built in advance
+        avoids re-sorting the intervals when they are searched repeatedly.
     tiebreak : (optional) pdarray, numeric
         When a value is present in more than one interval, the interval with the
         lowest tiebreak value will be chosen. If no tiebreak is given, the
@@ -429,6 +434,11 @@ def search_intervals(vals, intervals, tiebreak=None, hierarchical=True):
     """
     from arkouda.join import gen_ranges
 
+    if isinstance(intervals, IntervalIndex):
+        if tiebreak is not None:
+            raise ValueError("The tiebreak of an IntervalIndex is given when it is built")
+        return intervals.lookup(vals)
+
     if len(intervals) != 2:
         raise ValueError("intervals must be 2-tuple of (lower_bound_inclusive, upper_bounds_inclusive)")
 
@@ -694,7 +704,7 @@ def interval_lookup(keys, values, arguments, fillvalue=-1, tiebreak=None, hierar
 
     Parameters
     ----------
-    keys : 2-tuple of (sequences of) pdarrays
+    keys : 2-tuple of (sequences of) pdarrays, or IntervalIndex
         Tuple of closed intervals expressed as (lower_bounds_inclusive, upper_bounds_inclusive).
         Must have same dtype(s) as vals.
     values : pdarray
@@ -726,3 +736,244 @@ def interval_lookup(keys, values, arguments, fillvalue=-1, tiebreak=None, hierar
     found = idx > -1
     res[found] = values[idx[found]]
     return res
+
+
+class IntervalIndex:
+    """
+    A reusable, server-resident index of closed intervals.
+
+    Building the index does the sorting and tiebreaking that ``search_intervals``
+    would otherwise redo on every call: the distinct bounds of the intervals are
+    sorted once, and every stretch of the number line between them is labeled
+    with the best interval containing it. Each ``lookup`` is then a single
+    server call, which makes the index worthwhile when the same intervals are
+    searched many times. Unlike ``search_intervals``, the intervals do not need
+    to be sorted and may overlap arbitrarily.
+
+    Parameters
+    ----------
+    starts : pdarray(int64, uint64, float64)
+        Lower bounds of the intervals, inclusive
+    ends : pdarray(int64, uint64, float64)
+        Upper bounds of the intervals, inclusive. Must have the same size and
+        dtype as starts.
+    tiebreak : (optional) pdarray, numeric
+        When a value is present in more than one interval, the interval with the
+        lowest tiebreak value will be chosen. If no tiebreak is given, the
+        first containing interval will be chosen.
+
+    Attributes
+    ----------
+    starts : pdarray
+        Lower bounds of the intervals
+    ends : pdarray
+        Upper bounds of the intervals
+    breaks : pdarray
+        The distinct bounds of the intervals, sorted
+    labels : pdarray(int64)
+        The interval chosen for each bound and each gap between two bounds, in
+        order, or -1 if the bound or gap is in no interval
+
+    Notes
+    -----
+    Only single pdarray bounds are supported, not the sequences of pdarrays or
+    bigint bounds that ``search_intervals`` also accepts.
+
+    Examples
+    --------
+    >>> index = ak.IntervalIndex(ak.array([0, 10, 5]), ak.array([9, 19, 12]))
+    >>> index.lookup(ak.array([3, 7, 11, 15, 20]))
+    array([0 0 1 1 -1])
+    >>> index.register("my_intervals")
+    >>> ak.attach("my_intervals").lookup(ak.array([12]))
+    array([1])
+    """
+
+    objType = "IntervalIndex"
+
+    def __init__(self, starts: pdarray, ends: pdarray, tiebreak: Optional[pdarray] = None) -> None:
+        if not isinstance(starts, pdarray) or not isinstance(ends, pdarray):
+            raise TypeError("starts and ends must be pdarrays")
+        if starts.dtype not in (akint64, akuint64, akfloat64):
+            raise TypeError("arguments must be numeric arrays")
+        if starts.dtype != ends.dtype:
+            raise TypeError(
+                f"starts and ends must have the same dtype. Found {starts.dtype} and {ends.dtype}"
+            )
+        if starts.size != ends.size:
+            raise ValueError("Lower and upper bound arrays must be same size")
+        if not (ends >= starts).all():
+            raise ValueError("Upper bounds must be greater than lower bounds")
+        if tiebreak is not None and (not isinstance(tiebreak, pdarray) or tiebreak.size != starts.size):
+            raise TypeError("Tiebreak must be pdarray of same size as number of intervals")
+
+        import json
+        from typing import cast as typecast
+
+        args = {"starts": starts, "ends": ends, "has_order": tiebreak is not None}
+        if tiebreak is not None:
+            # argsort is stable, so intervals with equal tiebreaks keep their order
+            args["order"] = argsort(tiebreak)
+        rep_msg = json.loads(typecast(str, generic_msg(cmd="buildIntervalIndex", args=args)))
+        self.starts = starts
+        self.ends = ends
+        self.breaks = create_pdarray(rep_msg["breaks"])
+        self.labels = create_pdarray(rep_msg["labels"])
+        self.registered_name: Optional[str] = None
+
+    @classmethod
+    def _from_parts(
+        cls, starts: pdarray, ends: pdarray, breaks: pdarray, labels: pdarray
+    ) -> "IntervalIndex":
+        index = cls.__new__(cls)
+        index.starts = starts
+        index.ends = ends
+        index.breaks = breaks
+        index.labels = labels
+        index.registered_name = None
+        return index
+
+    @classmethod
+    def from_return_msg(cls, rep_msg: str) -> "IntervalIndex":
+        import json
+
+        data = json.loads(rep_msg)
+        return cls._from_parts(
+            create_pdarray(data["starts"]),
+            create_pdarray(data["ends"]),
+            create_pdarray(data["breaks"]),
+            create_pdarray(data["labels"]),
+        )
+
+    @property
+    def size(self) -> int:
+        """
+        The number of intervals in the index.
+        """
+        return int(self.starts.size)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def lookup(self, vals: pdarray) -> pdarray:
+        """
+        Return the index of the best interval containing each query value, or
+        -1 if it is not present in any interval.
+
+        Parameters
+        ----------
+        vals : pdarray
+            Values to search for in the intervals. Must have the same dtype as
+            the bounds of the intervals.
+
+        Returns
+        -------
+        pdarray(int64)
+            Index of the interval containing each query value, or -1 if not found
+
+        Raises
+        ------
+        TypeError
+            Raised if vals is not a pdarray of the same dtype as the bounds
+        """
+        if not isinstance(vals, pdarray):
+            raise TypeError("vals must be a pdarray")
+        if vals.dtype != self.breaks.dtype:
+            raise TypeError(
+                f"vals and intervals must all have the same dtype. "
+                f"Found {self.breaks.dtype} and {vals.dtype}"
+            )
+        from typing import cast as typecast
+
+        rep_msg = generic_msg(
+            cmd="lookupIntervalIndex",
+            args={"values": vals, "breaks": self.breaks, "labels": self.labels},
+        )
+        return create_pdarray(typecast(str, rep_msg))
+
+    def register(self, user_defined_name: str) -> "IntervalIndex":
+        """
+        Register this IntervalIndex object and underlying components with the Arkouda server
+
+        Parameters
+        ----------
+        user_defined_name : str
+            user defined name which this IntervalIndex object will be registered under
+
+        Returns
+        -------
+        IntervalIndex
+            The same IntervalIndex which is now registered with the arkouda server and has an
+            updated name. This is an in-place modification, the original is returned to support
+            a fluid programming style.
+            Please note you cannot register two different IntervalIndexes with the same name.
+
+        Raises
+        ------
+        RegistrationError
+            Raised if the server could not register the IntervalIndex object
+
+        Notes
+        -----
+        Objects registered with the server are immune to deletion until
+        they are unregistered.
+
+        See Also
+        --------
+        unregister, is_registered
+        """
+        if self.registered_name is not None and self.is_registered():
+            raise RegistrationError(f"This object is already registered as {self.registered_name}")
+        generic_msg(
+            cmd="register",
+            args={
+                "name": user_defined_name,
+                "objType": self.objType,
+                "starts": self.starts,
+                "ends": self.ends,
+                "breaks": self.breaks,
+                "labels": self.labels,
+            },
+        )
+        self.registered_name = user_defined_name
+        return self
+
+    def unregister(self) -> None:
+        """
+        Unregister this IntervalIndex object in the arkouda server which was previously
+        registered using register() and/or attached to using attach()
+
+        Raises
+        ------
+        RegistrationError
+            Raised if the IntervalIndex is not registered
+
+        See Also
+        --------
+        register, is_registered
+        """
+        from arkouda.util import unregister
+
+        if not self.registered_name:
+            raise RegistrationError("This object is not registered")
+        unregister(self.registered_name)
+        self.registered_name = None
+
+    def is_registered(self) -> bool:
+        """
+        Checks if the name of the IntervalIndex object is registered in the Symbol Table
+
+        Returns
+        -------
+        bool
+            True if IntervalIndex is registered, false if not
+
+        See Also
+        --------
+        register, unregister
+        """
+        from arkouda.util import is_registered
+
+        if self.registered_name is None:
+            return False
+        return is_registered(self.registered_name)
@@ -20,7 +20,7 @@ from pandas import Categorical as pd_Categorical
 from typeguard import typechecked
 
 from arkouda.client import generic_msg
-from arkouda.groupbyclass import GroupBy, unique
+from arkouda.groupbyclass import _DIRECT_MAX_CATEGORIES, GroupBy, unique
 from arkouda.infoclass import information
 from arkouda.logger import getArkoudaLogger
 from arkouda.numpy import cast as akcast
@@ -423,6 +423,68 @@ class Categorical:
             codes=self.codes.to_ndarray(), categories=self.categories.to_ndarray()
         )
 
+    def to_arrow(self):
+        """
+        Convert the Categorical to a pyarrow DictionaryArray, whose indices are
+        the codes and whose dictionary is the categories, transferring only
+        those two arrays from the arkouda server.
+
+        Returns
+        -------
+        pyarrow.DictionaryArray
+            A pyarrow array with the same values and categories as this
+            Categorical
+
+        See Also
+        --------
+        from_arrow, Strings.to_arrow
+        """
+        import pyarrow as pa  # type: ignore
+
+        return pa.DictionaryArray.from_arrays(self.codes.to_arrow(), self.categories.to_arrow())
+
+    @classmethod
+    def from_arrow(cls, arr) -> Categorical:
+        """
+        Make a Categorical from a pyarrow DictionaryArray or ChunkedArray of
+        dictionary type whose dictionary holds strings, transferring the
+        indices as the codes and the dictionary as the categories.
+
+        Parameters
+        ----------
+        arr : pyarrow.DictionaryArray or pyarrow.ChunkedArray
+            The array to transfer
+
+        Returns
+        -------
+        Categorical
+            A Categorical with the same values and categories as arr
+
+        Raises
+        ------
+        TypeError
+            Raised if arr is not of a dictionary type with string values
+        ValueError
+            Raised if arr contains nulls
+
+        See Also
+        --------
+        to_arrow, from_codes
+        """
+        import pyarrow as pa  # type: ignore
+
+        if isinstance(arr, pa.ChunkedArray):
+            if not pa.types.is_dictionary(arr.type):
+                raise TypeError(f"Unsupported pyarrow type {arr.type}")
+            # give every chunk the same dictionary so the indices agree
+            arr = arr.unify_dictionaries().combine_chunks()
+        if not pa.types.is_dictionary(arr.type):
+            raise TypeError(f"Unsupported pyarrow type {arr.type}")
+        if arr.null_count > 0:
+            raise ValueError("Categorical cannot contain null values")
+        codes = pdarray.from_arrow(arr.indices.cast(pa.int64()))
+        return cls.from_codes(codes, Strings.from_arrow(arr.dictionary))
+
     def to_list(self) -> List:
         """
         Convert the Categorical to a list, transferring data from
@@ -850,11 +912,22 @@ class Categorical:
         Categorical was created from a Strings object, then this function
         simply returns the cached permutation. Even if the Categorical was
         created using from_codes(), this function will be faster than
-        Strings.group() because it sorts dense integer values, rather than
-        128-bit hash values.
+        Strings.group() because it groups dense integer values, rather than
+        sorting 128-bit hash values. Codes of a Categorical with few categories
+        are grouped with a single counting-sort pass instead of a sort.
         """
         if self.permutation is None:
-            return argsort(self.codes)
+            if self.categories.size > _DIRECT_MAX_CATEGORIES:
+                return argsort(self.codes)
+            return cast(
+                Tuple,
+                unique(
+                    self.codes,
+                    return_groups=True,
+                    method="direct",
+                    key_range=(0, self.categories.size - 1),
+                ),
+            )[1]
         else:
             return self.permutation
 
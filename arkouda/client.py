@@ -1,8 +1,17 @@
+import asyncio
+import itertools
 import json
 import os
+import re
+import secrets
+import threading
+import uuid
 import warnings
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
 from enum import Enum
-from typing import Dict, List, Mapping, Optional, Tuple, Union, cast
+from typing import Deque, Dict, Iterator, List, Mapping, Optional, Tuple, Union, cast
 
 from arkouda import __version__, io_util, security
 from arkouda.logger import LogLevel, getArkoudaLogger
@@ -27,6 +36,8 @@ __all__ = [
     "print_server_commands",
     "generate_history",
     "ruok",
+    "generic_msg_async",
+    "batch",
 ]
 
 username = security.get_username()
@@ -43,8 +54,25 @@ sparrayIterThresh = sparrayIterThreshDefVal
 
 maxTransferBytesDefVal = 2**30
 maxTransferBytes = maxTransferBytesDefVal
+# size of the chunks that large arrays are streamed from the server in
+transferChunkBytesDefVal = 2**26
+transferChunkBytes = transferChunkBytesDefVal
+# smallest array that is transferred through shared memory, when it is available
+sharedMemoryMinBytesDefVal = 2**20
+sharedMemoryMinBytes = sharedMemoryMinBytesDefVal
+# largest right side of a hash join that is broadcast to every locale rather than shuffled
+broadcastJoinMaxRowsDefVal = 2**16
+broadcastJoinMaxRows = broadcastJoinMaxRowsDefVal
+# directory shared with the server for bulk array transfers, negotiated by connect()
+sharedMemoryDir: Optional[str] = None
 # maximum number of capture group for regex
 regexMaxCaptures: int = -1
+# whether command arguments are sent in the compact binary format; see connect()
+binaryArgs = False
+# names of garbage-collected objects waiting to be deleted on the server; a
+# deque, whose append and popleft are atomic, since names are queued from
+# __del__, which may run while the queue is being flushed on the same thread
+_pending_deletes: Deque[str] = deque()
 # unit conversion for get_mem_used
 _memunit2normunit = {
     "bytes": "b",
@@ -207,17 +235,88 @@ if mode == ClientMode.UI:
 # reset settings to default values
 def set_defaults() -> None:
     """
-    Sets client variables including verbose, maxTransferBytes and
+    Sets client variables including verbose, maxTransferBytes,
+    transferChunkBytes, sharedMemoryMinBytes, broadcastJoinMaxRows and
     pdarrayIterThresh to default values.
 
     Returns
     -------
     None
     """
-    global verbose, maxTransferBytes, pdarrayIterThresh
+    global verbose, maxTransferBytes, transferChunkBytes, sharedMemoryMinBytes, pdarrayIterThresh
+    global broadcastJoinMaxRows
     verbose = verboseDefVal
     pdarrayIterThresh = pdarrayIterThreshDefVal
     maxTransferBytes = maxTransferBytesDefVal
+    transferChunkBytes = transferChunkBytesDefVal
+    sharedMemoryMinBytes = sharedMemoryMinBytesDefVal
+    broadcastJoinMaxRows = broadcastJoinMaxRowsDefVal
+
+
+def _parse_binary_reply(frame) -> memoryview:
+    """
+    Returns the buffer of a binary reply frame, raising any error the
+    Arkouda server sent back in place of the binary data.
+
+    Parameters
+    ----------
+    frame : zmq.Frame
+        The reply frame received from the Arkouda server
+
+    Returns
+    -------
+    memoryview
+        The binary data sent back from the Arkouda server
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the reply starts with "Error:", indicating a server-side
+        error was thrown
+    """
+    view = frame.buffer
+    # raise errors sent back from the server
+    if bytes(view[0 : len(b"Error:")]) == b"Error:":
+        raise RuntimeError(frame.bytes.decode())
+    return view
+
+
+def _parse_string_reply(raw_message: str) -> str:
+    """
+    Parses a JSON-formatted reply from the Arkouda server into the reply
+    msg, raising errors and emitting warnings sent back from the server.
+
+    Parameters
+    ----------
+    raw_message : str
+        The JSON-formatted ReplyMessage received from the Arkouda server
+
+    Returns
+    -------
+    str
+        The msg field of the ReplyMessage
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the ReplyMessage msgType is ERROR
+    ValueError
+        Raised if the return message is malformed JSON or is missing 1..n
+        expected fields
+    """
+    try:
+        return_message = ReplyMessage.fromdict(json.loads(raw_message))
+
+        # raise errors or warnings sent back from the server
+        if return_message.msgType == MessageType.ERROR:
+            raise RuntimeError(return_message.msg)
+        elif return_message.msgType == MessageType.WARNING:
+            warnings.warn(return_message.msg)
+        return return_message.msg
+    except KeyError as ke:
+        raise ValueError(f"Return message is missing the {ke} field")
+    except json.decoder.JSONDecodeError:
+        raise ValueError(f"Return message is not valid JSON: {raw_message}")
 
 
 class ChannelType(Enum):
@@ -461,6 +560,43 @@ class Channel:
         """
         raise NotImplementedError("send_binary_message must be implemented in derived class")
 
+    def send_message_async(
+        self,
+        cmd: str,
+        payload: Optional[memoryview] = None,
+        recv_binary: bool = False,
+        args: Optional[str] = None,
+        size: int = -1,
+    ) -> Future:
+        """
+        Generates a RequestMessage encapsulating command and requesting user
+        information, sends it to the Arkouda server without waiting for the
+        reply, and returns a Future that resolves to either a string or binary
+        depending upon the message format. Any number of asynchronous requests
+        may be in flight at once; each reply is matched back to its Future.
+
+        Parameters
+        ----------
+        cmd : str
+            The name of the command to be executed by the Arkouda server
+        payload : memoryview, defaults to None
+            The binary data to send along with the request, if any
+        recv_binary : bool, defaults to False
+            Indicates if the return message will be a string or binary data
+        args : str, defaults to None
+            A delimited string containing 1..n command arguments
+        size : int
+            Default -1
+            Number of parameters contained in args. Only set if args is json.
+
+        Returns
+        -------
+        Future
+            Resolves to the response string or binary data sent back from the
+            Arkouda server. Server-side errors are raised from Future.result()
+        """
+        raise NotImplementedError("send_message_async must be implemented in derived class")
+
     def connect(self, timeout: int = 0) -> None:
         """
         Establishes a connection to the Arkouda server
@@ -494,10 +630,14 @@ class Channel:
 class ZmqChannel(Channel):
     """
     The ZmqChannel class implements the Channel methods for ZMQ request/reply communication
-    patterns, which is the Arkouda-Chapel default
+    patterns, which is the Arkouda-Chapel default. Asynchronous requests are sent over a
+    separate, lazily-created ZMQ DEALER socket (see _ZmqPipeline) so that the synchronous
+    REQ socket is never left waiting on a reply.
     """
 
-    __slots__ = "socket"
+    __slots__ = ("socket", "pipeline")
+
+    pipeline: Optional["_ZmqPipeline"]
 
     def send_string_message(
         self,
@@ -517,27 +657,9 @@ class ZmqChannel(Channel):
         self.socket.send_string(json.dumps(message.asdict()))
 
         if recv_binary:
-            frame = self.socket.recv(copy=False)
-            view = frame.buffer
-            # raise errors sent back from the server
-            if bytes(view[0 : len(b"Error:")]) == b"Error:":
-                raise RuntimeError(frame.bytes.decode())
-            return view
+            return _parse_binary_reply(self.socket.recv(copy=False))
         else:
-            raw_message = self.socket.recv_string()
-            try:
-                return_message = ReplyMessage.fromdict(json.loads(raw_message))
-
-                # raise errors or warnings sent back from the server
-                if return_message.msgType == MessageType.ERROR:
-                    raise RuntimeError(return_message.msg)
-                elif return_message.msgType == MessageType.WARNING:
-                    warnings.warn(return_message.msg)
-                return return_message.msg
-            except KeyError as ke:
-                raise ValueError(f"Return message is missing the {ke} field")
-            except json.decoder.JSONDecodeError:
-                raise ValueError(f"Return message is not valid JSON: {raw_message}")
+            return _parse_string_reply(self.socket.recv_string())
 
     def send_binary_message(
         self,
@@ -561,27 +683,33 @@ class ZmqChannel(Channel):
         self.socket.send(payload, copy=False)
 
         if recv_binary:
-            frame = self.socket.recv(copy=False)
-            view = frame.buffer
-            # raise errors sent back from the server
-            if bytes(view[0 : len(b"Error:")]) == b"Error:":
-                raise RuntimeError(frame.bytes.decode())
-            return view
+            return _parse_binary_reply(self.socket.recv(copy=False))
         else:
-            raw_message = self.socket.recv_string()
-            try:
-                return_message = ReplyMessage.fromdict(json.loads(raw_message))
-
-                # raise errors or warnings sent back from the server
-                if return_message.msgType == MessageType.ERROR:
-                    raise RuntimeError(return_message.msg)
-                elif return_message.msgType == MessageType.WARNING:
-                    warnings.warn(return_message.msg)
-                return return_message.msg
-            except KeyError as ke:
-                raise ValueError(f"Return message is missing the {ke} field")
-            except json.decoder.JSONDecodeError:
-                raise ValueError(f"{raw_message} is not valid JSON, may be server-side error")
+            return _parse_string_reply(self.socket.recv_string())
+
+    def send_message_async(
+        self,
+        cmd: str,
+        payload: Optional[memoryview] = None,
+        recv_binary: bool = False,
+        args: Optional[str] = None,
+        size: int = -1,
+    ) -> Future:
+        message = RequestMessage(
+            user=username,
+            token=self.token,
+            cmd=cmd,
+            format=MessageFormat.STRING if payload is None else MessageFormat.BINARY,
+            args=args,
+            size=size,
+        )
+        self.logger.debug(f"sending async message {message}")
+
+        if getattr(self, "pipeline", None) is None:
+            self.pipeline = _ZmqPipeline(self.url)
+        return cast(_ZmqPipeline, self.pipeline).submit(
+            message, payload=payload, recv_binary=recv_binary
+        )
 
     def connect(self, timeout: int = 0) -> None:
         # create and configure socket for connections to arkouda server
@@ -605,11 +733,116 @@ class ZmqChannel(Channel):
 
     def disconnect(self) -> None:
         try:
+            if getattr(self, "pipeline", None) is not None:
+                cast(_ZmqPipeline, self.pipeline).close()
+                self.pipeline = None
             self.socket.disconnect(self.url)
         except Exception as e:
             raise RuntimeError(e)
 
 
+class _ZmqPipeline:
+    """
+    Sends pipelined requests to the Arkouda server over a ZMQ DEALER socket.
+
+    The socket is owned by an asyncio event loop running in a daemon thread, so
+    requests can be submitted from any thread. Each request is prefixed with a
+    request id envelope frame, which the server's REP socket echoes back on the
+    reply; replies are therefore matched to their callers by request id rather
+    than by arrival order.
+
+    Attributes
+    ----------
+    url : str
+        Url of the Arkouda server the DEALER socket connects to
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self._request_ids = itertools.count()
+        self._pending: Dict[bytes, Tuple[asyncio.Future, bool]] = {}
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="arkouda-pipeline", daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def _run(self) -> None:
+        import zmq
+        import zmq.asyncio
+
+        asyncio.set_event_loop(self._loop)
+        context = zmq.asyncio.Context()
+        self._socket = context.socket(zmq.DEALER)
+        self._socket.connect(self.url)
+        self._loop.create_task(self._read_replies())
+        self._started.set()
+
+        self._loop.run_forever()
+
+        # cancel outstanding requests and the reply reader before closing the socket
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._socket.close(linger=0)
+        context.term()
+        self._loop.close()
+
+    async def _read_replies(self) -> None:
+        while True:
+            # replies are [request_id, empty delimiter, reply]
+            frames = await self._socket.recv_multipart(copy=False)
+            request_id = frames[0].bytes
+            pending = self._pending.pop(request_id, None)
+            if pending is None:
+                logger.warning(f"discarding reply to unknown request {request_id!r}")
+                continue
+            reply, recv_binary = pending
+            if reply.cancelled():
+                continue
+            try:
+                if recv_binary:
+                    reply.set_result(_parse_binary_reply(frames[-1]))
+                else:
+                    reply.set_result(_parse_string_reply(frames[-1].bytes.decode()))
+            except Exception as e:
+                reply.set_exception(e)
+
+    async def _request(
+        self, message: RequestMessage, payload: Optional[memoryview], recv_binary: bool
+    ) -> Union[str, memoryview]:
+        request_id = str(next(self._request_ids)).encode()
+        reply = self._loop.create_future()
+        self._pending[request_id] = (reply, recv_binary)
+
+        header = json.dumps(message.asdict())
+        frames: List[Union[bytes, memoryview]]
+        if payload is None:
+            frames = [request_id, b"", header.encode()]
+        else:
+            frames = [request_id, b"", f"{header}BINARY_PAYLOAD".encode(), payload]
+        await self._socket.send_multipart(frames, copy=False)
+        return await reply
+
+    def submit(
+        self, message: RequestMessage, payload: Optional[memoryview] = None, recv_binary: bool = False
+    ) -> Future:
+        """
+        Schedules the message to be sent and returns a Future for its reply
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._request(message, payload, recv_binary), self._loop
+        )
+
+    def close(self) -> None:
+        """
+        Stops the event loop, cancelling any requests still awaiting a reply
+        """
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
 # Global Channel object reference
 channel = None
 
@@ -665,6 +898,8 @@ def connect(
     access_token: Optional[str] = None,
     connect_url: Optional[str] = None,
     access_channel: Optional[Channel] = None,
+    binary_args: bool = False,
+    shared_memory: bool = True,
 ) -> None:
     """
     Connect to a running arkouda server.
@@ -687,6 +922,18 @@ def connect(
         where the token is optional
     access_channel : Channel, optional
         The desired Channel implementation that differs from the default ZmqChannel
+    binary_args : bool, optional
+        If True, send command arguments in the compact binary format instead of
+        JSON when the server supports it, which reduces the per-command encoding
+        and decoding overhead. Defaults to False.
+    shared_memory : bool, optional
+        If True, transfer arrays of at least `ak.client.sharedMemoryMinBytes`
+        bytes between the client and a single-locale server running on the same
+        host through files in a shared memory directory such as /dev/shm,
+        instead of over the socket. The transport is only used if a test file
+        written by each side can be read by the other. The files are created
+        by the client, readable and writable only by its user, and removed as
+        soon as the transfer is done. Defaults to True.
 
     Returns
     -------
@@ -706,7 +953,15 @@ def connect(
     On success, prints the connected address, as seen by the server. If called
     with an existing connection, the socket will be re-initialized.
     """
-    global connected, serverConfig, verbose, regexMaxCaptures, channel
+    global connected, serverConfig, verbose, regexMaxCaptures, channel, binaryArgs, sharedMemoryDir
+
+    # delete the objects queued for deletion on the existing connection's server
+    if connected:
+        try:
+            _flush_deletes()
+        except Exception:
+            pass
+    _pending_deletes.clear()
 
     # send the connect message
     cmd = "connect"
@@ -729,6 +984,8 @@ def connect(
     return_message = channel.send_string_message(cmd=cmd)
     logger.debug(f"[Python] Received response: {str(return_message)}")
     connected = True
+    binaryArgs = False
+    sharedMemoryDir = None
 
     serverConfig = _get_config_msg()
     if serverConfig["arkoudaVersion"] != __version__:
@@ -741,9 +998,78 @@ def connect(
             RuntimeWarning,
         )
     regexMaxCaptures = serverConfig["regexMaxCaptures"]  # type: ignore
+    # only use the binary argument format if the server supports it
+    binaryArgs = binary_args and bool(serverConfig.get("binaryArguments", False))
+    if shared_memory:
+        sharedMemoryDir = _negotiate_shared_memory(str(serverConfig.get("sharedMemoryDir", "")))
     clientLogger.info(return_message)
 
 
+def _negotiate_shared_memory(shm_dir: str) -> Optional[str]:
+    """
+    Check that the server and client can exchange files through shm_dir, the
+    shared memory directory reported by the server, by having the server echo
+    a random token from a file written by the client into a file of its own.
+
+    Returns
+    -------
+    Optional[str]
+        shm_dir if it can be used for array transfers, otherwise None
+    """
+    if not shm_dir:
+        return None
+    # the server may report the directory with a trailing separator
+    shm_dir = os.path.normpath(shm_dir)
+    if not os.path.isdir(shm_dir):
+        return None
+    path = _shared_memory_path(shm_dir)
+    token = secrets.token_hex(16)
+    try:
+        with os.fdopen(_create_shared_memory_file(path), "w") as f:
+            f.write(token)
+        os.close(_create_shared_memory_file(f"{path}.reply"))
+        _send_msg(cmd="sharedMemoryProbe", args={"path": path})
+        with open(f"{path}.reply") as f:
+            reply = f.read()
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"shared memory transport is not available: {e}")
+        return None
+    finally:
+        _remove_shared_memory_file(path)
+        _remove_shared_memory_file(f"{path}.reply")
+    return shm_dir if reply == token else None
+
+
+def _shared_memory_path(shm_dir: Optional[str] = None) -> str:
+    """
+    Returns a new, unique path for a shared memory transfer file.
+    """
+    return os.path.join(cast(str, shm_dir or sharedMemoryDir), f"arkouda-{uuid.uuid4().hex}")
+
+
+def _use_shared_memory(nbytes: int) -> bool:
+    """
+    Whether an array of nbytes bytes should be transferred through shared memory.
+    """
+    return sharedMemoryDir is not None and nbytes > 0 and nbytes >= sharedMemoryMinBytes
+
+
+def _create_shared_memory_file(path: str) -> int:
+    """
+    Creates the shared memory transfer file path, which must not exist,
+    readable and writable only by the user, and returns a file descriptor
+    open for writing it. The server only writes to files the client created.
+    """
+    return os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+
+
+def _remove_shared_memory_file(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
 def _parse_url(url: str) -> Tuple[str, int, Optional[str]]:
     """
     Parses the url in the following format if authentication enabled:
@@ -856,6 +1182,7 @@ def disconnect() -> None:
     global connected, serverConfig, verbose
 
     if connected:
+        _flush_deletes()
         # send disconnect message to server
         message = "disconnect"
         logger.debug(f"[Python] Sending request: {message}")
@@ -949,6 +1276,45 @@ def _json_args_to_str(json_obj: Optional[Dict] = None) -> Tuple[int, str]:
     return len(j), json.dumps(j)
 
 
+def _binary_args_to_str(json_obj: Optional[Dict] = None) -> Tuple[int, str]:
+    """
+    Convert Python Dictionary into the compact binary argument format that can
+    be parsed by the msg processing system on the Arkouda Server. Each parameter
+    is encoded as its key, dtype, and val fields, each prefixed by its length in
+    bytes and a colon, which avoids encoding and decoding each parameter as JSON.
+
+    Parameters
+    ----------
+    json_obj : dict = None
+        Python dictionary of key:val representing command arguments
+
+    Return
+    ------
+    Tuple - the number of parameters found and the encoded string
+
+    Raises
+    ------
+    TypeError
+        - Keys are a type other than str
+        - A list contains values of multiple types.
+    """
+    if json_obj is None:
+        return 0, ""
+    j: List[str] = []
+    for key, val in json_obj.items():
+        if not isinstance(key, str):
+            raise TypeError(f"Argument keys are required to be str. Found {type(key)}")
+        j.append(ParameterObject.factory(key, val).binary)
+    return len(j), "".join(j)
+
+
+def _args_to_str(args: Optional[Dict] = None) -> Tuple[int, str]:
+    """
+    Encode command arguments in the format negotiated with the server at connect()
+    """
+    return _binary_args_to_str(args) if binaryArgs else _json_args_to_str(args)
+
+
 def generic_msg(
     cmd: str,
     args: Optional[Dict] = None,
@@ -997,7 +1363,27 @@ def generic_msg(
     if not connected:
         raise RuntimeError("client is not connected to a server")
 
-    size, msg_args = _json_args_to_str(args)
+    # send any commands queued in an open batch first to preserve command order
+    if _batch is not None:
+        _batch.execute()
+    _flush_deletes()
+
+    return _send_msg(
+        cmd=cmd, args=args, payload=payload, send_binary=send_binary, recv_binary=recv_binary
+    )
+
+
+def _send_msg(
+    cmd: str,
+    args: Optional[Dict] = None,
+    payload: Optional[memoryview] = None,
+    send_binary: bool = False,
+    recv_binary: bool = False,
+) -> Union[str, memoryview]:
+    """
+    Sends a message to the arkouda_server over the global Channel; see generic_msg.
+    """
+    size, msg_args = _args_to_str(args)
 
     try:
         if send_binary:
@@ -1017,6 +1403,336 @@ def generic_msg(
         raise e
 
 
+def generic_msg_async(
+    cmd: str,
+    args: Optional[Dict] = None,
+    payload: Optional[memoryview] = None,
+    send_binary: bool = False,
+    recv_binary: bool = False,
+) -> Future:
+    """
+    Sends a binary or string message composed of a command and corresponding
+    arguments to the arkouda_server without waiting for the reply, returning
+    a Future for the response sent by the server.
+
+    Unlike generic_msg, any number of these requests may be in flight at once,
+    which hides the round trip latency of issuing many small, independent
+    commands. Replies are matched back to their Future by request id.
+
+    Parameters
+    ----------
+    cmd : str
+        The server-side command to be executed
+    args : dict
+        A dictionary of command arguments
+    payload : memoryview
+        The payload when sending binary data
+    send_binary : bool
+        Indicates if the message to be sent is a string or binary
+    recv_binary : bool
+        Indicates if the return message will be a string or binary
+
+    Returns
+    -------
+    Future
+        Resolves to the string or binary return message. Server-side errors
+        are raised from Future.result()
+
+    Raises
+    ------
+    RuntimeError
+        Raised if the client is not connected to the server
+
+    Notes
+    -----
+    The server executes commands in the order it receives them, but no order is
+    guaranteed between asynchronous requests and those sent via generic_msg.
+    Commands that consume the result of an asynchronous request should only be
+    sent once its Future has resolved.
+
+    Examples
+    --------
+    >>> futures = [ak.client.generic_msg_async(cmd="noop") for _ in range(1000)]
+    >>> replies = [f.result() for f in futures]
+    """
+    if not connected:
+        raise RuntimeError("client is not connected to a server")
+
+    # send any commands queued in an open batch first to preserve command order
+    if _batch is not None:
+        _batch.execute()
+    _flush_deletes()
+
+    return _send_msg_async(
+        cmd=cmd, args=args, payload=payload, send_binary=send_binary, recv_binary=recv_binary
+    )
+
+
+def _send_msg_async(
+    cmd: str,
+    args: Optional[Dict] = None,
+    payload: Optional[memoryview] = None,
+    send_binary: bool = False,
+    recv_binary: bool = False,
+) -> Future:
+    """
+    Sends a message to the arkouda_server over the global Channel without
+    waiting for the reply; see generic_msg_async.
+    """
+    size, msg_args = _args_to_str(args)
+
+    if send_binary:
+        assert payload is not None
+    else:
+        assert payload is None
+    return cast(Channel, channel).send_message_async(
+        cmd=cmd, payload=payload, recv_binary=recv_binary, args=msg_args, size=size
+    )
+
+
+def _delete_later(name: str) -> None:
+    """
+    Queues the server-side object name for deletion. Called when the client
+    object is garbage-collected, so it must not communicate with the server;
+    the queued names are deleted in one deleteMany command when the next
+    request is sent.
+    """
+    if connected:
+        _pending_deletes.append(name)
+
+
+def _flush_deletes() -> None:
+    """
+    Deletes the names queued by _delete_later on the server with one
+    deleteMany command. The command is sent on the same channel as
+    generic_msg and waited for, so the deletes are ordered after the
+    commands sent before and complete before the next one is sent.
+    """
+    names = []
+    while True:
+        try:
+            names.append(_pending_deletes.popleft())
+        except IndexError:
+            break
+    if not names:
+        return
+    try:
+        _send_msg(cmd="deleteMany", args={"names": names})
+    except RuntimeError:
+        pass
+
+
+def _created_symbol_names(msg: str) -> List[str]:
+    """
+    Returns the names of the symbols a server reply reports as created, in
+    the order they appear in the reply. The server applies the same rule when
+    substituting batch placeholders.
+    """
+    return re.findall(r"created\s+(\S+)", msg)
+
+
+class BatchReply:
+    """
+    The reply to a command queued in an ak.batch() context. The reply is
+    available via result() once the batch has been sent to the server.
+
+    Before then, the symbols created by the command can be passed as arguments
+    to later commands in the same batch via the name property (the first
+    symbol created) or symbol(n); these are placeholders that the server
+    replaces with the actual symbol names as it executes the batch.
+
+    Attributes
+    ----------
+    index : int
+        The position of the command within the batch request
+    """
+
+    __slots__ = ("index", "_msg", "_error")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self._msg: Optional[str] = None
+        self._error: Optional[Exception] = None
+
+    @property
+    def done(self) -> bool:
+        """
+        True once the batch containing the command has been sent to the server
+        """
+        return self._msg is not None or self._error is not None
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the first symbol created by the command
+        """
+        return self.symbol(0)
+
+    def symbol(self, n: int = 0) -> str:
+        """
+        The name of the nth symbol created by the command, or a placeholder for
+        it if the batch has not yet been sent to the server
+        """
+        if not self.done:
+            return f"__batch_{self.index}_{n}__"
+        return _created_symbol_names(self.result())[n]
+
+    def result(self) -> str:
+        """
+        Returns the reply the server sent for the command
+
+        Raises
+        ------
+        RuntimeError
+            Raised if the batch has not been sent to the server, or if there was
+            a server-side error executing the command (or an earlier command in
+            the same batch)
+        """
+        if self._error is not None:
+            raise self._error
+        if self._msg is None:
+            raise RuntimeError("batch has not been sent to the server")
+        return self._msg
+
+
+class Batch:
+    """
+    Queues commands so that they can be sent to the Arkouda server and
+    executed in a single request; see batch().
+    """
+
+    def __init__(self) -> None:
+        self._requests: List[str] = []
+        self._replies: List[BatchReply] = []
+
+    def generic_msg(self, cmd: str, args: Optional[Dict] = None) -> BatchReply:
+        """
+        Queues a string message composed of a command and corresponding
+        arguments, returning a BatchReply for the response the server will send.
+
+        Parameters
+        ----------
+        cmd : str
+            The server-side command to be executed
+        args : dict
+            A dictionary of command arguments, which may include the BatchReply
+            of (or symbol placeholders from) commands queued earlier in the batch
+
+        Returns
+        -------
+        BatchReply
+            The reply to the command, available once the batch is executed
+        """
+        # always JSON, since the server substitutes placeholders of a different
+        # length than the symbol names, which would invalidate binary field lengths
+        size, msg_args = _json_args_to_str(args)
+        message = RequestMessage(user=username, cmd=cmd, args=msg_args, size=size)
+        reply = BatchReply(len(self._requests))
+        self._requests.append(json.dumps(message.asdict()))
+        self._replies.append(reply)
+        return reply
+
+    def execute(self) -> None:
+        """
+        Sends all queued commands to the server as a single request. The
+        server executes them in order, stopping at the first failure.
+        """
+        if not self._requests:
+            return
+        # commands queued earlier in an enclosing batch() context go first
+        if _batch is not None and _batch is not self:
+            _batch.execute()
+        requests, replies = self._requests, self._replies
+        self._requests, self._replies = [], []
+
+        raw_replies = json.loads(cast(str, _send_msg(cmd="batch", args={"commands": requests})))
+        for reply, raw_reply in zip(replies, raw_replies):
+            try:
+                reply._msg = _parse_string_reply(raw_reply)
+            except Exception as e:
+                reply._error = e
+        for reply in replies[len(raw_replies) :]:
+            reply._error = RuntimeError("not executed because an earlier command in the batch failed")
+
+        for reply in replies:
+            if reply._error is not None:
+                raise reply._error
+
+
+# The Batch that generic_msg commands are queued in while a batch() context is open
+_batch: Optional[Batch] = None
+
+
+@contextmanager
+def batch() -> Iterator[Batch]:
+    """
+    Context manager that queues commands and sends them to the Arkouda server
+    as a single request when the context exits, turning a chain of N round
+    trips into one.
+
+    Commands are queued with Batch.generic_msg, which returns a BatchReply in
+    place of the server response. Commands may refer to symbols created by
+    earlier commands in the batch through their BatchReply. Any command sent
+    with generic_msg while the context is open first flushes the queue, so
+    command order is always preserved. Nested batch() contexts share the
+    enclosing batch.
+
+    Yields
+    ------
+    Batch
+        The batch that commands are queued in
+
+    Raises
+    ------
+    RuntimeError
+        Raised on exit if the client is not connected to a server, or if a
+        queued command fails on the server
+
+    Examples
+    --------
+    >>> a = ak.arange(10)
+    >>> with ak.batch() as b:
+    ...     doubled = b.generic_msg(cmd="binopvs<int64,int64,1>",
+    ...                             args={"op": "*", "a": a, "value": 2})
+    ...     shifted = b.generic_msg(cmd="binopvs<int64,int64,1>",
+    ...                             args={"op": "+", "a": doubled, "value": 1})
+    >>> ak.create_pdarray(shifted.result())
+    array([1 3 5 7 9 11 13 15 17 19])
+    """
+    global _batch
+
+    enclosing = _batch
+    current = enclosing if enclosing is not None else Batch()
+    _batch = current
+    try:
+        yield current
+    finally:
+        _batch = enclosing
+
+    # the outermost context sends the batch
+    if enclosing is not None:
+        return
+    if not connected:
+        raise RuntimeError("client is not connected to a server")
+    current.execute()
+
+
+@contextmanager
+def _own_batch() -> Iterator[Batch]:
+    """
+    Like batch(), but queues commands in a new Batch that is sent when the
+    context exits even inside a batch() context, whose queued commands are
+    sent first. Functions that read the replies of the commands they batch
+    use it, since the replies of commands queued in the caller's batch only
+    arrive when the caller's context exits.
+    """
+    if not connected:
+        raise RuntimeError("client is not connected to a server")
+    current = Batch()
+    yield current
+    current.execute()
+
+
 def get_config() -> Mapping[str, Union[str, int, float]]:
     """
     Get runtime information about the server.
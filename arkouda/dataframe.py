@@ -4,6 +4,7 @@ import json
 import os
 import random
 from collections import UserDict
+from datetime import timedelta
 from functools import reduce
 from typing import Callable, Dict, List, Optional, Tuple, Union, cast
 from warnings import warn
@@ -22,7 +23,7 @@ from arkouda.groupbyclass import GROUPBY_REDUCTION_TYPES
 from arkouda.groupbyclass import GroupBy as akGroupBy
 from arkouda.groupbyclass import unique
 from arkouda.index import Index, MultiIndex
-from arkouda.join import inner_join
+from arkouda.join import _broadcast_joinable, asof_join, hash_join, inner_join
 from arkouda.numpy import cast as akcast
 from arkouda.numpy import cumsum, where
 from arkouda.numpy.dtypes import _is_dtype_in_union, bigint
@@ -32,7 +33,15 @@ from arkouda.numpy.dtypes import int64 as akint64
 from arkouda.numpy.dtypes import numeric_scalars
 from arkouda.numpy.dtypes import uint64 as akuint64
 from arkouda.pdarrayclass import RegistrationError, pdarray
-from arkouda.pdarraycreation import arange, array, create_pdarray, full, zeros
+from arkouda.pdarraycreation import (
+    _array_many,
+    _to_ndarray_many,
+    arange,
+    array,
+    create_pdarray,
+    full,
+    zeros,
+)
 from arkouda.pdarraysetops import concatenate, in1d, intersect1d
 from arkouda.row import Row
 from arkouda.segarray import SegArray
@@ -53,6 +62,7 @@ __all__ = [
     "invert_permutation",
     "intx",
     "merge",
+    "merge_asof",
 ]
 
 
@@ -182,26 +192,80 @@ class DataFrameGroupBy:
             ]
 
             if isinstance(colnames, List):
-                if isinstance(self.gb_key_names, str):
-                    return DataFrame(
-                        {c: self.gb.aggregate(self._get_df_col(c), opname)[1] for c in colnames},
-                        index=Index(self.gb.unique_keys, name=self.gb_key_names),
-                    )
-                elif isinstance(self.gb_key_names, list) and len(self.gb_key_names) == 1:
-                    return DataFrame(
-                        {c: self.gb.aggregate(self._get_df_col(c), opname)[1] for c in colnames},
-                        index=Index(self.gb.unique_keys, name=self.gb_key_names[0]),
-                    )
-                elif isinstance(self.gb_key_names, list):
-                    column_dict = dict(zip(self.gb_key_names, self.unique_keys))
-                    for c in colnames:
-                        column_dict[c] = self.gb.aggregate(self._get_df_col(c), opname)[1]
-                    return DataFrame(column_dict)
-                else:
-                    return None
+                # aggregate all the columns in a single request
+                results = self.gb.agg({c: (self._get_df_col(c), opname) for c in colnames})[1]
+                return self._agg_dataframe({c: results[c][opname] for c in colnames})
 
         return aggop
 
+    def _agg_dataframe(self, column_dict):
+        # helper function to build the DataFrame of aggregated columns, with the
+        # grouped column(s) values as index or as leading columns
+        if isinstance(self.gb_key_names, str):
+            return DataFrame(column_dict, index=Index(self.gb.unique_keys, name=self.gb_key_names))
+        elif isinstance(self.gb_key_names, list) and len(self.gb_key_names) == 1:
+            return DataFrame(column_dict, index=Index(self.gb.unique_keys, name=self.gb_key_names[0]))
+        elif isinstance(self.gb_key_names, list):
+            return DataFrame({**dict(zip(self.gb_key_names, self.unique_keys)), **column_dict})
+        else:
+            return None
+
+    def agg(self, func):
+        """
+        Aggregate several columns with one or more operations each, with the
+        grouped column(s) values as keys. All the aggregations are computed by
+        the server in a single request.
+
+        Parameters
+        ----------
+        func : str, list of str or dict
+            The operation(s) to apply to every numeric column other than the
+            grouped column(s), or a dict mapping column names to the
+            operation(s) to apply to that column.
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+            A column per aggregated column and operation. Columns with a single
+            operation given as a str keep their name; otherwise the columns are
+            named "<column>_<operation>".
+
+        Examples
+        --------
+
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> df = ak.DataFrame({"A": [1, 2, 2, 3], "B": [3, 4, 5, 6], "C": [1.0, 0.5, 1.5, 2.0]})
+        >>> df.groupby("A").agg({"B": ["min", "max"], "C": "mean"})
+
+        +----+---------+---------+-----+
+        |  A |   B_min |   B_max |   C |
+        +====+=========+=========+=====+
+        |  1 |       3 |       3 | 1   |
+        +----+---------+---------+-----+
+        |  2 |       4 |       5 | 1   |
+        +----+---------+---------+-----+
+        |  3 |       6 |       6 | 2   |
+        +----+---------+---------+-----+
+
+        """
+        if not isinstance(func, dict):
+            key_names = [self.gb_key_names] if isinstance(self.gb_key_names, str) else self.gb_key_names
+            func = {
+                c: func
+                for c, col in self.df.data.items()
+                if col.dtype in [akfloat64, akint64, akuint64, bigint] and c not in key_names
+            }
+        results = self.gb.agg({c: (self._get_df_col(c), ops) for c, ops in func.items()})[1]
+        column_dict = {}
+        for c, ops in func.items():
+            if isinstance(ops, str):
+                column_dict[c] = results[c][ops.lower()]
+            else:
+                for op in ops:
+                    column_dict[f"{c}_{op}"] = results[c][op.lower()]
+        return self._agg_dataframe(column_dict)
+
     def size(self, as_series=None, sort_index=True):
         """
         Compute the size of each value as the total number of rows, including NaN values.
@@ -644,6 +708,200 @@ class DataFrameGroupBy:
 
         return DiffAggregate(self.gb, self.df.data[colname])
 
+    def _scan_dataframe(self, colnames, scan, dtypes=(akfloat64, akint64, akuint64)):
+        # helper function to apply a group-wise scan to each column, keeping the
+        # rows, and index, of the original frame
+        key_names = [self.gb_key_names] if isinstance(self.gb_key_names, str) else self.gb_key_names
+        if colnames is None:
+            colnames = [
+                c for c, col in self.df.data.items() if col.dtype in dtypes and c not in key_names
+            ]
+        elif isinstance(colnames, str):
+            colnames = [colnames]
+        index = self.df.index
+        if self.dropna and not self.all_non_nan:
+            index = index[self.where_not_nan]
+        return DataFrame({c: scan(self._get_df_col(c)) for c in colnames}, index=index)
+
+    def cumsum(self, colnames=None):
+        """
+        Compute the cumulative sum of each group's values, in one pass on the server.
+
+        Parameters
+        ----------
+        colnames : (list of) str, default=None
+            Column name or list of column names to compute the cumulative sum of.
+            By default, every numeric column other than the grouped column(s).
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+            The cumulative sums, with the rows and index of the original frame.
+
+        Examples
+        --------
+
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> df = ak.DataFrame({"A": [1, 2, 1, 2], "B": [3, 4, 5, 6]})
+        >>> df.groupby("A").cumsum()
+
+        +----+-----+
+        |    |   B |
+        +====+=====+
+        |  0 |   3 |
+        +----+-----+
+        |  1 |   4 |
+        +----+-----+
+        |  2 |   8 |
+        +----+-----+
+        |  3 |  10 |
+        +----+-----+
+
+        """
+        return self._scan_dataframe(colnames, self.gb.cumsum)
+
+    def cumprod(self, colnames=None):
+        """
+        Compute the cumulative product of each group's values, in one pass on the server.
+
+        Parameters
+        ----------
+        colnames : (list of) str, default=None
+            Column name or list of column names to compute the cumulative product of.
+            By default, every numeric column other than the grouped column(s).
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+            The cumulative products, with the rows and index of the original frame.
+        """
+        return self._scan_dataframe(colnames, self.gb.cumprod)
+
+    def cummax(self, colnames=None):
+        """
+        Compute the cumulative maximum of each group's values, in one pass on the server.
+
+        Parameters
+        ----------
+        colnames : (list of) str, default=None
+            Column name or list of column names to compute the cumulative maximum of.
+            By default, every numeric column other than the grouped column(s).
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+            The cumulative maxima, with the rows and index of the original frame.
+        """
+        return self._scan_dataframe(colnames, self.gb.cummax)
+
+    def cummin(self, colnames=None):
+        """
+        Compute the cumulative minimum of each group's values, in one pass on the server.
+
+        Parameters
+        ----------
+        colnames : (list of) str, default=None
+            Column name or list of column names to compute the cumulative minimum of.
+            By default, every numeric column other than the grouped column(s).
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+            The cumulative minima, with the rows and index of the original frame.
+        """
+        return self._scan_dataframe(colnames, self.gb.cummin)
+
+    def cumcount(self):
+        """
+        Number each row within its group, from 0 to the size of the group minus one.
+
+        Returns
+        -------
+        arkouda.series.Series
+            The position of each row within its group, with the index of the original frame.
+
+        Examples
+        --------
+
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> df = ak.DataFrame({"A": [1, 2, 1, 1], "B": [3, 4, 5, 6]})
+        >>> df.groupby("A").cumcount().values
+        array([0 0 1 2])
+
+        """
+        index = self.df.index
+        if self.dropna and not self.all_non_nan:
+            index = index[self.where_not_nan]
+        return Series(data=self.gb.cumcount(), index=index)
+
+    def rank(self, colnames=None, method="dense"):
+        """
+        Rank each group's values, starting from 1.
+
+        Parameters
+        ----------
+        colnames : (list of) str, default=None
+            Column name or list of column names to rank.
+            By default, every numeric column other than the grouped column(s).
+        method : {"dense", "min", "first"}, default="dense"
+            How to rank equal values. See arkouda.GroupBy.rank.
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+            The ranks, with the rows and index of the original frame.
+        """
+        return self._scan_dataframe(colnames, lambda values: self.gb.rank(values, method=method))
+
+    def shift(self, colnames=None, periods=1, fill_value=None):
+        """
+        Shift each group's values by periods rows.
+
+        Parameters
+        ----------
+        colnames : (list of) str, default=None
+            Column name or list of column names to shift.
+            By default, every numeric or bool column other than the grouped column(s).
+        periods : int, default=1
+            The number of rows to shift by, forwards if positive and backwards if negative.
+        fill_value : scalar, default=None
+            The value of rows shifted in from outside the group. If None, they are NaN
+            and integer and bool columns are converted to float64.
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+            The shifted values, with the rows and index of the original frame.
+
+        Examples
+        --------
+
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> df = ak.DataFrame({"A": [1, 2, 1, 1], "B": [3, 4, 5, 6]})
+        >>> df.groupby("A").shift(fill_value=0)
+
+        +----+-----+
+        |    |   B |
+        +====+=====+
+        |  0 |   0 |
+        +----+-----+
+        |  1 |   0 |
+        +----+-----+
+        |  2 |   3 |
+        +----+-----+
+        |  3 |   5 |
+        +----+-----+
+
+        """
+        return self._scan_dataframe(
+            colnames,
+            lambda values: self.gb.shift(values, periods=periods, fill_value=fill_value),
+            dtypes=(akfloat64, akint64, akuint64, akbool),
+        )
+
     def broadcast(self, x, permute=True):
         """
         Fill each group’s segment with a constant value.
@@ -929,6 +1187,8 @@ class DataFrame(UserDict):
             else:
                 self._set_index(index)
             self.data = {}
+            # columns held in numpy arrays are sent together by _array_many
+            ndarray_keys, ndarrays = [], []
             for key in initialdata.columns:
                 if hasattr(initialdata[key], "values") and isinstance(
                     initialdata[key].values[0], (list, np.ndarray)
@@ -938,8 +1198,14 @@ class DataFrame(UserDict):
                     initialdata[key].values, pd.Categorical
                 ):
                     self.data[key] = Categorical(initialdata[key].values)
+                elif isinstance(initialdata[key].dtype, np.dtype):
+                    self.data[key] = None
+                    ndarray_keys.append(key)
+                    ndarrays.append(initialdata[key].to_numpy())
                 else:
                     self.data[key] = array(initialdata[key])
+            for key, col in zip(ndarray_keys, _array_many(ndarrays)):
+                self.data[key] = col
 
             self.data.update()
             return
@@ -1463,6 +1729,71 @@ class DataFrame(UserDict):
         """
         return DataFrame(initialdata=pd_df)
 
+    @classmethod
+    def from_arrow(cls, table):
+        """
+        Copy the data from a pyarrow Table into a new arkouda.dataframe.DataFrame.
+
+        String columns become Strings, dictionary columns become Categoricals,
+        timestamp and duration columns become Datetime and Timedelta, and
+        numeric and bool columns become pdarrays. Every column is transferred
+        as contiguous buffers, without building Python objects for its values.
+
+        Parameters
+        ----------
+        table : pyarrow.Table
+            A pyarrow Table to convert.
+
+        Returns
+        -------
+        arkouda.dataframe.DataFrame
+
+        Raises
+        ------
+        TypeError
+            Raised if a column is of a pyarrow type with no arkouda equivalent
+        ValueError
+            Raised if a column contains nulls
+
+        See Also
+        --------
+        to_arrow, from_pandas
+
+        Examples
+        --------
+
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> import pyarrow as pa
+        >>> table = pa.table({"A": [1, 2], "B": ["x", "y"]})
+        >>> ak_df = DataFrame.from_arrow(table)
+        >>> display(ak_df)
+
+        +----+-----+-----+
+        |    |   A | B   |
+        +====+=====+=====+
+        |  0 |   1 | x   |
+        +----+-----+-----+
+        |  1 |   2 | y   |
+        +----+-----+-----+
+
+        """
+        import pyarrow as pa  # type: ignore
+
+        data = {}
+        for name, col in zip(table.column_names, table.columns):
+            if pa.types.is_dictionary(col.type):
+                data[name] = Categorical.from_arrow(col)
+            elif pa.types.is_string(col.type) or pa.types.is_large_string(col.type):
+                data[name] = Strings.from_arrow(col)
+            elif pa.types.is_timestamp(col.type):
+                data[name] = Datetime(pdarray.from_arrow(col.cast(pa.int64())), unit=col.type.unit)
+            elif pa.types.is_duration(col.type):
+                data[name] = Timedelta(pdarray.from_arrow(col.cast(pa.int64())), unit=col.type.unit)
+            else:
+                data[name] = pdarray.from_arrow(col)
+        return cls(data)
+
     def _drop_column(self, keys):
         """
         Drop a column or columns from the dataframe, in-place.
@@ -2952,7 +3283,17 @@ class DataFrame(UserDict):
             warn(msg, UserWarning)
             return None
 
-        # Proceed with conversion if possible
+        # Proceed with conversion if possible. The arrays of most columns are
+        # transferred together by _to_ndarray_many, with None for the rest.
+        arrays = []
+        for key in self._columns:
+            val = self[key]
+            if isinstance(val, Categorical):
+                arrays += [val.codes, val.categories]
+            elif isinstance(val, (pdarray, Strings)):
+                arrays.append(val)
+        fetched = iter(_to_ndarray_many(arrays))
+
         pandas_data = {}
         for key in self._columns:
             val = self[key]
@@ -2962,7 +3303,14 @@ class DataFrame(UserDict):
                 if isinstance(val, SegArray):
                     pandas_data[key] = val.to_list()
                 elif isinstance(val, Categorical):
-                    pandas_data[key] = val.to_pandas()
+                    codes, categories = next(fetched), next(fetched)
+                    pandas_data[key] = pd.Categorical.from_codes(
+                        codes=val.codes.to_ndarray() if codes is None else codes,
+                        categories=val.categories.to_ndarray() if categories is None else categories,
+                    )
+                elif isinstance(val, (pdarray, Strings)):
+                    nd = next(fetched)
+                    pandas_data[key] = val.to_ndarray() if nd is None else nd
                 else:
                     pandas_data[key] = val.to_ndarray()
             except TypeError:
@@ -2975,6 +3323,52 @@ class DataFrame(UserDict):
         else:
             return pd.DataFrame(data=pandas_data)
 
+    def to_arrow(self):
+        """
+        Send this DataFrame to a pyarrow Table. The data is transferred column
+        by column as contiguous buffers: Strings become large_string columns,
+        Categoricals become dictionary columns, and no Python objects are built
+        for their values. SegArray columns become list columns, which are built
+        from Python lists. The index is not included.
+
+        Returns
+        -------
+        pyarrow.Table
+            The result of converting this DataFrame to a pyarrow Table
+
+        Raises
+        ------
+        RuntimeError
+            Raised if a column exceeds the built-in client.maxTransferBytes size
+            limit
+
+        See Also
+        --------
+        from_arrow, to_pandas
+
+        Examples
+        --------
+
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> ak_df = ak.DataFrame({"A": ak.arange(2), "B": ak.array(["x", "y"])})
+        >>> table = ak_df.to_arrow()
+        >>> table.to_pydict()
+        {'A': [0, 1], 'B': ['x', 'y']}
+
+        """
+        import pyarrow as pa  # type: ignore
+
+        self.update_nrows()
+        arrays = []
+        for key in self._columns:
+            val = self[key]
+            if isinstance(val, SegArray):
+                arrays.append(pa.array(val.to_list()))
+            else:
+                arrays.append(val.to_arrow())
+        return pa.Table.from_arrays(arrays, names=[str(key) for key in self._columns])
+
     def to_markdown(self, mode="wt", index=True, tablefmt="grid", storage_options=None, **kwargs):
         r"""
         Print DataFrame in Markdown-friendly format.
@@ -5950,6 +6344,16 @@ def _inner_join_merge(
     return ret_df
 
 
+def _unmatched_rows(keys, other_keys) -> pdarray:
+    """
+    Which rows of keys match no row of other_keys, as a mask, or as indices
+    found by an anti hash join when that join broadcasts the smaller side.
+    """
+    if _broadcast_joinable(keys, other_keys):
+        return cast(pdarray, hash_join(keys, other_keys, how="anti"))
+    return in1d(keys, other_keys, invert=True)
+
+
 def _right_join_merge(
     left: DataFrame,
     right: DataFrame,
@@ -6008,7 +6412,7 @@ def _right_join_merge(
             left_cols.remove(col)
             in_left_cols.remove(col)
 
-    not_in_left = right[in1d(right_at_on, left_at_on, invert=True)]
+    not_in_left = right[_unmatched_rows(right_at_on, left_at_on)]
     for col in not_in_left.columns:
         if col in left_cols:
             not_in_left[col + right_suffix] = not_in_left[col]
@@ -6089,13 +6493,13 @@ def _outer_join_merge(
             left_cols.remove(col)
             right_cols.remove(col)
 
-    not_in_left = right[in1d(right_at_on, left_at_on, invert=True)]
+    not_in_left = right[_unmatched_rows(right_at_on, left_at_on)]
     for col in not_in_left.columns:
         if col in left_cols:
             not_in_left[col + right_suffix] = not_in_left[col]
             not_in_left = not_in_left.drop(col, axis=1)
 
-    not_in_right = left[in1d(left_at_on, right_at_on, invert=True)]
+    not_in_right = left[_unmatched_rows(left_at_on, right_at_on)]
     for col in not_in_right.columns:
         if col in right_cols:
             not_in_right[col + left_suffix] = not_in_right[col]
@@ -6371,3 +6775,131 @@ def merge(
         raise ValueError(
             f"Unexpected value of {how} for how. Must choose: 'inner', 'left', 'right' or 'outer'"
         )
+
+
+def _take_or_null(
+    arry: Union[pdarray, Strings, Categorical], idx: pdarray, convert_ints: bool = True
+) -> Union[pdarray, Strings, Categorical]:
+    """
+    Gather arry at idx, with nulls wherever idx is -1.
+    """
+    found = idx >= 0
+    nfound = int(found.sum())
+    if nfound == idx.size:
+        return arry[idx]
+    if convert_ints is True and isinstance(arry, pdarray) and arry.dtype == int:
+        arry = akcast(arry, akfloat64)
+    nulls = __nulls_like(arry, idx.size - nfound)
+    if isinstance(arry, Categorical):
+        nulls = Categorical(nulls)
+    # the found values and the nulls, put back in row order
+    order = where(found, cumsum(found) - 1, nfound + cumsum(~found) - 1)
+    return concatenate([arry[idx[found]], nulls])[order]
+
+
+@typechecked
+def merge_asof(
+    left: DataFrame,
+    right: DataFrame,
+    on: str,
+    by: Optional[Union[str, List[str]]] = None,
+    direction: str = "backward",
+    tolerance: Optional[
+        Union[int, float, np.integer, np.floating, np.timedelta64, pd.Timedelta, timedelta]
+    ] = None,
+    left_suffix: str = "_x",
+    right_suffix: str = "_y",
+    convert_ints: bool = True,
+) -> DataFrame:
+    r"""
+    Merge Arkouda DataFrames by nearest key rather than equal keys.
+
+    Each row of the left DataFrame is matched with the right row whose "on"
+    value is nearest to its own in the given direction, optionally among the
+    right rows with the same "by" values, e.g. the latest quote at or before
+    each trade. Both DataFrames must be sorted by their "on" column.
+
+    Based on pandas merge_asof functionality.
+    https://pandas.pydata.org/docs/reference/api/pandas.merge_asof.html
+
+    Parameters
+    ----------
+    left: DataFrame
+        The Left DataFrame to be joined.
+    right: DataFrame
+        The Right DataFrame to be joined.
+    on: str
+        The name of the column to match on, which must be int64, float64,
+        Datetime or Timedelta, of the same type in both DataFrames, and sorted.
+    by: Optional[Union[str, List[str]]] = None
+        The name or list of names of columns whose values must also be equal
+        for rows to be matched.
+    direction: str, default = "backward"
+        Whether to match each left row with the last right row whose "on"
+        value is at or before its own ("backward"), the first one at or after
+        it ("forward") or the closest of the two ("nearest").
+    tolerance: Optional[Union[int, float, timedelta]] = None
+        The farthest a matched right "on" value can be from the left one.
+        It must be an integer for int64 "on" columns.
+    left_suffix: str, default = "_x"
+        A string indicating the suffix to add to columns from the left dataframe for overlapping
+        column names in both left and right.
+    right_suffix: str, default = "_y"
+        A string indicating the suffix to add to columns from the right dataframe for overlapping
+        column names in both left and right.
+    convert_ints: bool = True
+        If True, convert right int columns with missing values (due to left rows without a
+        match) to float64. This is to match pandas.
+        If False, do not convert the column dtypes.
+
+    Returns
+    -------
+    arkouda.dataframe.DataFrame
+        The left DataFrame, with the columns of the matching right rows other
+        than "on" and "by", and null values for the left rows without a match.
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> ak.connect()
+    >>> trades = ak.DataFrame({'time': ak.array([1, 5, 10]), 'sym': ak.array(['a', 'b', 'a'])})
+    >>> quotes = ak.DataFrame({'time': ak.array([0, 2, 3, 7]),
+    ...                        'sym': ak.array(['a', 'b', 'a', 'b']),
+    ...                        'bid': ak.array([10, 20, 11, 21])})
+    >>> ak.merge_asof(trades, quotes, on='time', by='sym')
+
+    +----+--------+-------+-------+
+    |    |   time | sym   |   bid |
+    +====+========+=======+=======+
+    |  0 |      1 | a     |    10 |
+    +----+--------+-------+-------+
+    |  1 |      5 | b     |    20 |
+    +----+--------+-------+-------+
+    |  2 |     10 | a     |    11 |
+    +----+--------+-------+-------+
+
+    """
+    by_cols = [] if by is None else [by] if isinstance(by, str) else by
+    if by is None:
+        right_idx = asof_join(left[on], right[on], direction=direction, tolerance=tolerance)
+    else:
+        right_idx = asof_join(
+            left[on],
+            right[on],
+            left_by=[left[col] for col in by_cols],
+            right_by=[right[col] for col in by_cols],
+            direction=direction,
+            tolerance=tolerance,
+        )
+
+    key_cols = [on] + by_cols
+    left_cols = left.columns.values
+    right_cols = [col for col in right.columns.values if col not in key_cols]
+    new_dict = {}
+    for col in left_cols:
+        new_col = col + left_suffix if col in right_cols else col
+        new_dict[new_col] = left[col]
+    for col in right_cols:
+        new_col = col + right_suffix if col in left_cols else col
+        new_dict[new_col] = _take_or_null(right[col], right_idx, convert_ints=convert_ints)
+    return DataFrame(new_dict)
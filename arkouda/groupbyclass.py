@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import enum
 import json
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -22,7 +25,7 @@ if TYPE_CHECKING:
 import numpy as np
 from typeguard import typechecked
 
-from arkouda.client import generic_msg
+from arkouda.client import Batch, BatchReply, _own_batch, generic_msg
 from arkouda.logger import getArkoudaLogger
 from arkouda.numpy.dtypes import _val_isinstance_of_union, bigint
 from arkouda.numpy.dtypes import float64 as akfloat64
@@ -33,10 +36,10 @@ from arkouda.numpy.dtypes import uint64 as akuint64
 from arkouda.pdarrayclass import RegistrationError, create_pdarray, is_sorted, pdarray
 from arkouda.pdarraycreation import arange, full
 from arkouda.numpy.random import default_rng
-from arkouda.sorting import argsort, sort
+from arkouda.sorting import argsort, coargsort, sort
 from arkouda.strings import Strings
 
-__all__ = ["unique", "GroupBy", "broadcast", "GROUPBY_REDUCTION_TYPES"]
+__all__ = ["unique", "GroupBy", "broadcast", "groupby_cache", "GROUPBY_REDUCTION_TYPES"]
 
 groupable_element_type = Union[pdarray, Strings, "Categorical"]
 groupable = Union[groupable_element_type, Sequence[groupable_element_type]]
@@ -63,11 +66,34 @@ def _get_grouping_keys(pda: groupable):
     return grouping_keys, nkeys
 
 
+def _queue_gather(b: Batch, key, idx: str) -> Optional[BatchReply]:
+    """
+    Queue the gather of key at the indices named idx in batch b, returning
+    None if key is not a 1D pdarray or Strings and must be gathered directly.
+    """
+    if type(key) is pdarray and key.ndim == 1:
+        return b.generic_msg(cmd="[pdarray]", args={"array": key, "idx": idx})
+    elif type(key) is Strings:
+        return b.generic_msg(
+            cmd="segmentedIndex",
+            args={
+                "subcmd": "pdarrayIndex",
+                "objType": key.objType,
+                "dtype": key.entry.dtype,
+                "obj": key.entry,
+                "key": idx,
+            },
+        )
+    return None
+
+
 def unique(
     pda: groupable,
     return_groups: bool = False,
     assume_sorted: bool = False,
     return_indices: bool = False,
+    method: str = "sort",
+    key_range: Optional[Tuple[int, int]] = None,
 ) -> Union[groupable, Tuple[groupable, pdarray, pdarray, int]]:
     """
     Find the unique elements of an array.
@@ -87,6 +113,19 @@ def unique(
     return_indices: bool, optional
         Only applicable if return_groups is True.
         If True, return unique key indices along with other groups
+    method : {"sort", "hash", "direct"}, optional
+        If "sort" (the default), find the unique elements by sorting pda. If
+        "hash", group the elements by sending each to the locale that owns its
+        hash instead, which avoids sorting pda across locales; the unique
+        elements are then returned in no particular order. If "direct", pda
+        must be a single int64, uint64 or bool pdarray, or a Categorical, whose
+        values lie in a small range; the elements are grouped with a single
+        counting-sort pass over that range, with the same result as "sort".
+    key_range : (int, int), optional
+        Only applicable if method is "direct". The smallest and largest value
+        pda may hold. If None (the default), the range of a Categorical is its
+        codes, that of a bool array is (0, 1) and that of an integer array is
+        its minimum and maximum.
 
     Returns
     -------
@@ -101,6 +140,12 @@ def unique(
     ------
     TypeError
         Raised if pda is not a pdarray or Strings object
+    ValueError
+        Raised if method is not "sort", "hash" or "direct", if method is
+        "hash" or "direct" and assume_sorted is True, or if method is
+        "direct" and pda is not a single array or its range is not an
+        increasing range of int64 values, as for uint64 values of 2**63 or
+        more
     RuntimeError
         Raised if the pdarray or Strings dtype is unsupported
 
@@ -110,6 +155,13 @@ def unique(
     and, if so, whether it is already unique. This step can save considerable
     computation. Otherwise, this function will sort `pda`.
 
+    With method="hash", rows are identified by a 128-bit hash of their values,
+    like multi-array keys are when sorting them would need more than 128 bits.
+
+    With method="direct", the server keeps a count per value of the range for
+    each of its tasks, so the range should be small compared to the size of
+    pda divided by the number of tasks.
+
     Examples
     --------
     >>> A = ak.array([3, 2, 1, 1, 2, 3])
@@ -118,7 +170,11 @@ def unique(
     """
     from arkouda.categorical import Categorical as Categorical_
 
-    if not return_groups and hasattr(pda, "unique"):
+    if method not in ("sort", "hash", "direct"):
+        raise ValueError(f"method must be 'sort', 'hash' or 'direct', not {method}")
+    if method != "sort" and assume_sorted:
+        raise ValueError(f"assume_sorted cannot be used with method='{method}'")
+    if not return_groups and hasattr(pda, "unique") and method == "sort":
         return cast(Categorical_, pda).unique()
 
     # Get all grouping keys
@@ -126,28 +182,66 @@ def unique(
     keynames = [k.name for k in grouping_keys]
     keytypes = [k.objType for k in grouping_keys]
     effectiveKeys = len(grouping_keys)
-    repMsg = generic_msg(
-        cmd="unique",
-        args={
-            "returnGroupStr": return_groups,
-            "assumeSortedStr": assume_sorted,
-            "nstr": effectiveKeys,
-            "keynames": keynames,
-            "keytypes": keytypes,
-        },
-    )
+    keys = [pda] if nkeys == 1 and not isinstance(pda, Sequence) else list(pda)
+    if method == "direct":
+        if isinstance(pda, Sequence) or effectiveKeys != 1:
+            raise ValueError("method='direct' requires a single key array")
+        if key_range is None:
+            key_range = _direct_key_range(pda)
+        if key_range is None:
+            raise TypeError("method='direct' requires an int64, uint64 or bool pdarray or a Categorical")
+        lo, hi = _check_key_range(key_range)
+    # Queue the unique computation and the gathers of the unique keys together
+    # so they are sent to the server as a single request
+    with _own_batch() as b:
+        if method == "direct":
+            unique_reply = b.generic_msg(
+                cmd="directUnique",
+                args={
+                    "returnGroupStr": return_groups,
+                    "keyname": keynames[0],
+                    "lo": lo,
+                    "hi": hi,
+                },
+            )
+        else:
+            unique_reply = b.generic_msg(
+                cmd="unique" if method == "sort" else "hashUnique",
+                args={
+                    "returnGroupStr": return_groups,
+                    "assumeSortedStr": assume_sorted,
+                    "nstr": effectiveKeys,
+                    "keynames": keynames,
+                    "keytypes": keytypes,
+                },
+            )
+        uki_name = unique_reply.symbol(2 if return_groups else 0)
+        gather_replies = [_queue_gather(b, k, uki_name) for k in keys]
+    repMsg = unique_reply.result()
     if return_groups:
         parts = cast(str, repMsg).split("+")
         permutation = create_pdarray(cast(str, parts[0]))
         segments = create_pdarray(cast(str, parts[1]))
+        segments._set_stat("sorted", True)
         unique_key_indices = create_pdarray(cast(str, parts[2]))
     else:
         unique_key_indices = create_pdarray(cast(str, repMsg))
 
+    gathered = []
+    for k, r in zip(keys, gather_replies):
+        if r is None:
+            gathered.append(k[unique_key_indices])
+        elif isinstance(k, Strings):
+            gathered.append(Strings.from_return_msg(r.result()))
+        else:
+            gathered.append(create_pdarray(r.result()))
     if nkeys == 1 and not isinstance(pda, Sequence):
-        unique_keys = pda[unique_key_indices]
+        unique_keys = gathered[0]
+        if method == "sort" and type(unique_keys) is pdarray:
+            if unique_keys.dtype in (akint64, akuint64):
+                unique_keys._set_stat("sorted", True)
     else:
-        unique_keys = tuple(a[unique_key_indices] for a in pda)
+        unique_keys = tuple(gathered)
     if return_groups:
         if return_indices:
             return unique_keys, permutation, segments, nkeys, unique_key_indices
@@ -157,6 +251,176 @@ def unique(
         return unique_keys
 
 
+# largest number of categories of a Categorical key grouped with method
+# "direct" by default; the server keeps a count per category for each task
+_DIRECT_MAX_CATEGORIES = 2**12
+
+
+def _direct_key_range(key: groupable) -> Optional[Tuple[int, int]]:
+    """
+    The range of the values of key, if it can be grouped with method="direct":
+    the codes of a Categorical, (0, 1) for a bool array and the minimum and
+    maximum of an integer array. None if it cannot.
+    """
+    from arkouda.categorical import Categorical as Categorical_
+
+    if isinstance(key, Categorical_):
+        return 0, int(key.categories.size) - 1
+    if type(key) is not pdarray or key.ndim != 1:
+        return None
+    if key.dtype == bool:
+        return 0, 1
+    if key.dtype in (akint64, akuint64):
+        return (int(cast(int, key.min())), int(cast(int, key.max()))) if key.size > 0 else (0, 0)
+    return None
+
+
+def _check_key_range(key_range: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    The bounds of key_range as ints. The server counts the keys in int64
+    buckets, so the bounds must be an increasing range of int64 values.
+    """
+    lo, hi = int(key_range[0]), int(key_range[1])
+    if not -(2**63) <= lo <= hi < 2**63:
+        raise ValueError(f"Keys must lie in an increasing range of int64 values, not {lo}..{hi}")
+    return lo, hi
+
+
+def _mutation_count(a: pdarray) -> int:
+    return a._mutation_count()
+
+
+def _not_nan(key: pdarray) -> Optional[pdarray]:
+    """
+    Which values of the float64 array key are not NaN, or None if none are,
+    which is remembered, so that later groupings of key do not check again.
+    """
+    from arkouda.numpy import isnan
+
+    if key._stat("nan_count") == 0:
+        return None
+    nans = isnan(key)
+    nan_count = int(cast(int, nans.sum()))
+    key._set_stat("nan_count", nan_count)
+    return ~nans if nan_count > 0 else None
+
+
+def _key_identity(keys: groupable) -> Optional[Tuple]:
+    """
+    The identity of the key array(s) of a GroupBy: the type, server names and
+    mutation count of each array, or None if the keys cannot be identified.
+    """
+    from arkouda.categorical import Categorical as Categorical_
+
+    identity: List[Tuple] = []
+    for k in keys if isinstance(keys, Sequence) else [keys]:
+        if isinstance(k, Categorical_):
+            identity.append((Categorical_, k.codes.name, _mutation_count(k.codes), k.categories.name))
+        elif isinstance(k, pdarray):
+            identity.append((type(k), k.name, _mutation_count(k)))
+        elif type(k) is Strings:
+            identity.append((Strings, k.name))
+        else:
+            return None
+    return tuple(identity)
+
+
+class _GroupByCache:
+    """
+    A least recently used cache of the groupings computed by GroupBy, keyed
+    on the identity of the key arrays and bounded by the total size of the
+    permutations, segments and unique key indices it holds on the server.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: OrderedDict[Tuple, Tuple] = OrderedDict()
+
+    def _purge_modified(self) -> None:
+        # an entry whose keys have been modified in place can never be hit
+        # again, so release its server memory right away
+        for identity, entry in list(self._entries.items()):
+            if _key_identity(entry[0]) != identity[0]:
+                self._remove(identity)
+
+    def _remove(self, identity: Tuple) -> None:
+        entry = self._entries.pop(identity)
+        self.nbytes -= entry[-1]
+
+    def get(self, identity: Tuple) -> Optional[Tuple]:
+        """
+        Return the grouping cached for identity, or None if there is none.
+        """
+        self._purge_modified()
+        entry = self._entries.get(identity)
+        if entry is not None:
+            self._entries.move_to_end(identity)
+        return entry
+
+    def put(self, identity: Tuple, entry: Tuple) -> None:
+        """
+        Cache a grouping, evicting the least recently used groupings to make
+        room for it. The last element of entry is the grouping's size in bytes.
+        """
+        if entry[-1] > self.max_bytes:
+            return
+        while self._entries and self.nbytes + entry[-1] > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+        self._entries[identity] = entry
+        self.nbytes += entry[-1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+
+
+# the cache of groupings in effect, if any; see groupby_cache
+_cache: Optional[_GroupByCache] = None
+
+
+@contextmanager
+def groupby_cache(max_bytes: int_scalars = 2**30) -> Iterator[None]:
+    """
+    Reuse the grouping computed by GroupBy for the same key arrays inside the
+    block, instead of grouping them again.
+
+    Grouping is the most expensive part of many operations, such as
+    DataFrame.groupby, Categorical construction from Strings, SegArray
+    construction and joins, all of which create a GroupBy for their keys.
+    Inside the block, creating a GroupBy on the same key arrays, identified
+    by their server names, as an earlier GroupBy reuses its permutation,
+    segments and unique keys. Modifying a key array in place, with
+    ``__setitem__``, ``fill`` or an ``op=`` operator, invalidates the
+    groupings of that array.
+
+    The cached groupings are kept on the server until they are evicted, least
+    recently used first, or the block exits.
+
+    Parameters
+    ----------
+    max_bytes : int_scalars
+        The largest total size, in bytes, of the permutations, segments and
+        unique key indices kept in the cache (Default: 1 GiB)
+
+    Examples
+    --------
+    >>> a = ak.randint(0, 10, 10**8)
+    >>> b = ak.randint(0, 100, 10**8)
+    >>> with ak.groupby_cache():
+    ...     s = ak.GroupBy(a).sum(b)
+    ...     m = ak.GroupBy(a).max(b)  # no regrouping of a
+    """
+    global _cache
+    enclosing = _cache
+    _cache = _GroupByCache(int(max_bytes))
+    try:
+        yield
+    finally:
+        _cache.clear()
+        _cache = enclosing
+
+
 class GroupByReductionType(enum.Enum):
     SUM = "sum"
     COUNT = "count"
@@ -210,6 +474,20 @@ class GroupBy:
         The array to group by value, or if list, the column arrays to group by row
     assume_sorted : bool
         If True, assume keys is already sorted (Default: False)
+    method : {"sort", "hash"}
+        How the keys are grouped. "sort" (the default) sorts the keys, so
+        that unique_keys are sorted when the keys are integers. "hash" sends
+        each row to the locale that owns the hash of its keys and groups the
+        rows there, which avoids sorting the keys across locales and is faster
+        for high-cardinality keys when only aggregates are needed; unique_keys
+        are then in no particular order. "direct" groups a single int64,
+        uint64 or bool array, or a Categorical, whose values lie in a small
+        range with one counting-sort pass over the range, with the same result
+        as "sort". Bool and Categorical keys are always grouped this way
+        unless method is "hash".
+    key_range : (int, int), optional
+        The smallest and largest value of a single integer key array. Giving
+        it groups the keys with method "direct" instead of "sort".
 
     Attributes
     ----------
@@ -231,11 +509,17 @@ class GroupBy:
         If True, and the groupby keys contain NaN values,
         the NaN values together with the corresponding row will be dropped.
         Otherwise, the rows corresponding to NaN values will be kept.
+    method : str
+        How the keys were grouped, "sort", "hash" or "direct"
 
     Raises
     ------
     TypeError
         Raised if keys is a pdarray with a dtype other than int64
+    ValueError
+        Raised if method is not "sort", "hash" or "direct", if method is
+        "hash" or "direct" and assume_sorted is True, or if method is
+        "direct" and pda is not a single array
 
     Notes
     -----
@@ -262,20 +546,24 @@ class GroupBy:
         keys: Optional[groupable] = None,
         assume_sorted: bool = False,
         dropna: bool = True,
+        method: str = "sort",
+        key_range: Optional[Tuple[int, int]] = None,
         **kwargs,
     ):
-        from arkouda.numpy import isnan
-
         def drop_na_keys():
             if self.dropna is True:
                 if isinstance(self.keys, pdarray) and self.keys.dtype == akfloat64:
-                    self.keys = self.keys[~isnan(self.keys)]
+                    not_nan = _not_nan(self.keys)
+                    if not_nan is not None:
+                        self.keys = self.keys[not_nan]
+                        self.keys._set_stat("nan_count", 0)
                 elif isinstance(self.keys, list):
-                    is_not_nan = [
-                        ~isnan(key)
+                    masks = [
+                        _not_nan(key)
                         for key in self.keys
                         if isinstance(key, pdarray) and key.dtype == akfloat64
                     ]
+                    is_not_nan = [mask for mask in masks if mask is not None]
 
                     if len(is_not_nan) > 0:
                         use_value = is_not_nan[0]
@@ -294,6 +582,23 @@ class GroupBy:
         self.logger = getArkoudaLogger(name=self.__class__.__name__)
         self.assume_sorted = assume_sorted
         self.dropna = dropna
+        self.method = method
+        self.key_range = key_range
+        if method == "sort" and not assume_sorted and keys is not None:
+            from arkouda.categorical import Categorical as Categorical_
+
+            # bounded keys are grouped by counting rather than sorting
+            if key_range is not None:
+                self.method = "direct"
+            elif isinstance(keys, Categorical_) and keys.categories.size <= _DIRECT_MAX_CATEGORIES:
+                self.method = "direct"
+            elif isinstance(keys, pdarray) and keys.dtype == bool:
+                self.method = "direct"
+            elif isinstance(keys, pdarray) and keys._stat("sorted"):
+                # keys already known to be sorted are grouped without sorting
+                self.assume_sorted = True
+        # grouping of the unique keys and of the new keys of the last extend
+        self._extension: Optional[Tuple[Optional[GroupBy], Optional[GroupBy]]] = None
         if (
             "orig_keys" in kwargs
             and "permutation" in kwargs
@@ -326,20 +631,54 @@ class GroupBy:
         elif keys is None:
             raise ValueError("No keys passed to GroupBy.")
         else:
-            self.keys = cast(groupable, keys)
-            drop_na_keys()
-            (
-                self.unique_keys,
-                self.permutation,
-                self.segments,
-                self.nkeys,
-                self._uki,
-            ) = unique(  # type: ignore
-                self.keys,
-                return_groups=True,
-                return_indices=True,
-                assume_sorted=self.assume_sorted,
-            )
+            key_identity = _key_identity(keys) if _cache is not None else None
+            identity = None
+            if key_identity is not None:
+                identity = (key_identity, self.assume_sorted, self.dropna, self.method, self.key_range)
+            cached = cast(_GroupByCache, _cache).get(identity) if identity is not None else None
+            if cached is not None:
+                (
+                    _,
+                    self.keys,
+                    self.unique_keys,
+                    self.permutation,
+                    self.segments,
+                    self.nkeys,
+                    self._uki,
+                    _,
+                ) = cached
+            else:
+                self.keys = cast(groupable, keys)
+                drop_na_keys()
+                (
+                    self.unique_keys,
+                    self.permutation,
+                    self.segments,
+                    self.nkeys,
+                    self._uki,
+                ) = unique(  # type: ignore
+                    self.keys,
+                    return_groups=True,
+                    return_indices=True,
+                    assume_sorted=self.assume_sorted,
+                    method=self.method,
+                    key_range=self.key_range,
+                )
+                if identity is not None:
+                    nbytes = self.permutation.nbytes + self.segments.nbytes + self._uki.nbytes
+                    cast(_GroupByCache, _cache).put(
+                        identity,
+                        (
+                            keys,
+                            self.keys,
+                            self.unique_keys,
+                            self.permutation,
+                            self.segments,
+                            self.nkeys,
+                            self._uki,
+                            nbytes,
+                        ),
+                    )
         self.length = self.permutation.size
         self.ngroups = self.segments.size
 
@@ -508,6 +847,186 @@ class GroupBy:
         if repack:
             _repack_hdf(prefix_path)
 
+    # reductions whose result over all the rows can be computed from their
+    # results over the old and the new rows, and the reduction that does it
+    _ExtendableReductions = {
+        "sum": "sum",
+        "count": "sum",
+        "prod": "prod",
+        "min": "min",
+        "max": "max",
+        "any": "any",
+        "all": "all",
+        "or": "or",
+        "and": "and",
+        "xor": "xor",
+    }
+
+    def extend(self, new_keys: groupable) -> None:
+        """
+        Add rows to the GroupBy in place, as if its keys had been
+        concatenated with new_keys, without grouping the existing rows again.
+
+        Only new_keys are grouped; the groups they form are then merged with
+        the existing groups by grouping the unique keys of both, so the
+        expensive part of the work is proportional to the number of new rows
+        and of groups rather than to the total number of rows. The rows of
+        new_keys come after the existing rows, so values to aggregate must
+        be concatenated in the same order.
+
+        Parameters
+        ----------
+        new_keys : (list of) pdarray, Strings, or Categorical
+            The keys of the new rows, with the same number and types of
+            arrays as the keys of the GroupBy
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if new_keys does not have as many arrays as the keys
+
+        See Also
+        --------
+        extend_aggregate
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([3, 1, 3]))
+        >>> g.extend(ak.array([2, 3]))
+        >>> g.unique_keys
+        array([1 2 3])
+        >>> g.size()[1]
+        array([1 1 3])
+        """
+        from arkouda.numpy import cumsum
+        from arkouda.pdarraysetops import concatenate
+
+        multi_key = isinstance(self.keys, Sequence)
+        if multi_key != isinstance(new_keys, Sequence) or (
+            multi_key and len(cast(Sequence, new_keys)) != self.nkeys
+        ):
+            raise ValueError(f"Expected new keys made of {self.nkeys} arrays, like the keys")
+        size = cast(Sequence, new_keys)[0].size if multi_key else cast(pdarray, new_keys).size
+        if size == 0:
+            self._extension = (None, None)
+            return
+
+        batch = GroupBy(new_keys, dropna=self.dropna, method=self.method)
+        # group the unique keys of the existing and new groups together; the
+        # groups of this grouping are the merged groups
+        if multi_key:
+            uniques = [
+                concatenate([old, new], ordered=True)
+                for old, new in zip(cast(Sequence, self.unique_keys), cast(Sequence, batch.unique_keys))
+            ]
+        else:
+            uniques = concatenate([self.unique_keys, batch.unique_keys], ordered=True)
+        merged = GroupBy(uniques, dropna=self.dropna, method=self.method)
+        # index of the merged group of each existing and new group
+        merged_idx = merged.broadcast(arange(merged.ngroups), permute=True)
+        old_idx = merged_idx[: self.ngroups]
+        new_idx = merged_idx[self.ngroups :]
+
+        old_counts = self.size()[1]
+        new_counts = batch.size()[1]
+        counts = merged.sum(concatenate([old_counts, new_counts]))[1]
+        prev_counts = merged.sum(concatenate([old_counts, full(batch.ngroups, 0, akint64)]))[1]
+        segments = cumsum(counts) - counts
+
+        # the rows of each merged group are its existing rows, in their order,
+        # followed by its new rows, in theirs
+        permutation = full(self.length + batch.length, 0, akint64)
+        old_dest = arange(self.length) + self.broadcast(
+            segments[old_idx] - self.segments, permute=False
+        )
+        permutation[old_dest] = self.permutation
+        new_dest = arange(batch.length) + batch.broadcast(
+            segments[new_idx] + prev_counts[new_idx] - batch.segments, permute=False
+        )
+        permutation[new_dest] = batch.permutation + self.length
+
+        if multi_key:
+            self.keys = [
+                concatenate([old, new], ordered=True)
+                for old, new in zip(cast(Sequence, self.keys), cast(Sequence, batch.keys))
+            ]
+        else:
+            self.keys = concatenate([self.keys, batch.keys], ordered=True)
+        self.unique_keys = merged.unique_keys
+        self.permutation = permutation
+        self.segments = segments
+        self._uki = permutation[segments]
+        self.length = permutation.size
+        self.ngroups = segments.size
+        # the permutation of the merged rows is no longer the identity
+        self.assume_sorted = False
+        self._extension = (merged, batch)
+
+    def extend_aggregate(
+        self, previous: pdarray, new_values: pdarray, operator: str, skipna: bool = True
+    ) -> pdarray:
+        """
+        Update the result of an aggregation after the last call to extend,
+        by aggregating only the values of the new rows and combining them with
+        the result over the existing rows.
+
+        Parameters
+        ----------
+        previous : pdarray
+            The result of the aggregation over the rows before the last
+            call to extend, one value per group at the time
+        new_values : pdarray
+            The values of the rows added by the last call to extend
+        operator : str
+            The reduction operator of the aggregation, one of "sum", "count",
+            "prod", "min", "max", "any", "all", "or", "and" and "xor"
+        skipna : bool
+            boolean which determines if NANs should be skipped
+
+        Returns
+        -------
+        pdarray
+            The result of the aggregation over all the rows, one value per
+            unique key of the GroupBy
+
+        Raises
+        ------
+        ValueError
+            Raised if extend has not been called, if the operator cannot be
+            updated incrementally or if an array size does not match
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([3, 1, 3]))
+        >>> _, sums = g.sum(ak.array([1, 2, 3]))
+        >>> g.extend(ak.array([2, 3]))
+        >>> g.extend_aggregate(sums, ak.array([4, 5]), "sum")
+        array([2 4 9])
+        """
+        from arkouda.pdarraysetops import concatenate
+
+        operator = operator.lower()
+        if operator not in self._ExtendableReductions:
+            raise ValueError(
+                f"Unsupported reduction: {operator}\n"
+                f"Must be one of {list(self._ExtendableReductions.keys())}"
+            )
+        if self._extension is None:
+            raise ValueError("extend_aggregate must follow a call to extend")
+        merged, batch = self._extension
+        if merged is None or batch is None:
+            # the last extend added no rows
+            return previous
+        if previous.size != merged.length - batch.ngroups:
+            raise ValueError("Expected one previous result per group before the last extend")
+        new_result = batch.aggregate(new_values, operator, skipna)[1]
+        combined = concatenate([previous, cast(pdarray, new_result)], ordered=True)
+        return cast(pdarray, merged.aggregate(combined, self._ExtendableReductions[operator], skipna)[1])
+
     def size(self) -> Tuple[groupable, pdarray]:
         """
         Count the number of elements in each group, i.e. the number of times
@@ -677,6 +1196,107 @@ class GroupBy:
         else:
             return self.unique_keys, create_pdarray(repMsg)
 
+    def agg(
+        self,
+        aggregations: Dict[str, Tuple[groupable_element_type, Union[str, List[str]]]],
+        skipna: bool = True,
+        ddof: int_scalars = 1,
+    ) -> Tuple[groupable, Dict[str, Dict[str, groupable]]]:
+        """
+        Using the permutation stored in the GroupBy instance, group several
+        arrays of values and apply one or more reductions to each.
+
+        All the reductions of pdarray values are computed by the server in a
+        single request, which permutes each values array only once, instead of
+        once per call to aggregate.
+
+        Parameters
+        ----------
+        aggregations : Dict[str, Tuple[groupable_element_type, Union[str, List[str]]]]
+            Maps a name to the values to group and the name(s) of the reduction
+            operator(s) to apply to them
+        skipna: bool
+            boolean which determines if NANs should be skipped
+        ddof : int_scalars
+            "Delta Degrees of Freedom" used in calculating std and var
+
+        Returns
+        -------
+        unique_keys : groupable
+            The unique keys, in grouped order
+        aggregates : Dict[str, Dict[str, groupable]]
+            For each name in aggregations, maps each of its operators to one
+            aggregate value per unique key in the GroupBy instance
+
+        Raises
+        ------
+        ValueError
+            Raised if a values array size does not match the key array size or
+            if an operator is not in the GroupBy.Reductions array
+        RuntimeError
+            Raised if a requested operator is not supported for the values dtype
+
+        See Also
+        --------
+        aggregate
+
+        Examples
+        --------
+        >>> keys = ak.array([0, 1, 0, 1, 2])
+        >>> a = ak.arange(5)
+        >>> b = ak.linspace(0, 1, 5)
+        >>> g = ak.GroupBy(keys)
+        >>> unique_keys, results = g.agg({"a": (a, ["sum", "max"]), "b": (b, "mean")})
+        >>> results["a"]["sum"]
+        array([2 4 4])
+        >>> results["b"]["mean"]
+        array([0.25 0.5 1])
+        """
+        requested: Dict[str, List[str]] = {}
+        computed: Dict[Tuple[str, str], groupable] = {}
+        names: List[str] = []
+        ops: List[str] = []
+        which: List[int] = []
+        for key, (values, key_ops) in aggregations.items():
+            requested[key] = [op.lower() for op in ([key_ops] if isinstance(key_ops, str) else key_ops)]
+            for op in requested[key]:
+                if op not in self.Reductions:
+                    raise ValueError(f"Unsupported reduction: {op}\nMust be one of {self.Reductions}")
+                # TO DO: remove once logic is ported over to Chapel
+                if not isinstance(values, pdarray) or op in ("nunique", "first", "mode", "unique"):
+                    computed[key, op] = self.aggregate(values, op, skipna, ddof)[1]
+                    continue
+                if values.size != self.length:
+                    raise ValueError("Attempt to group array using key array of different length")
+                if values.name not in names:
+                    names.append(values.name)
+                ops.append(op)
+                which.append(names.index(values.name))
+
+        if ops:
+            repMsg = generic_msg(
+                cmd="segmentedReductionMulti",
+                args={
+                    "values": names,
+                    "ops": ops,
+                    "which": which,
+                    "permutation": "" if self.assume_sorted else cast(pdarray, self.permutation),
+                    "segments": self.segments,
+                    "skip_nan": skipna,
+                    "ddof": ddof,
+                },
+            )
+            self.logger.debug(repMsg)
+            targets = [(key, op) for key, key_ops in requested.items() for op in key_ops]
+            targets = [t for t in targets if t not in computed]
+            for (key, op), msg in zip(targets, json.loads(cast(str, repMsg))):
+                if op.startswith("arg"):
+                    computed[key, op] = cast(pdarray, self.permutation)[create_pdarray(msg)]
+                else:
+                    computed[key, op] = create_pdarray(msg)
+        results = {key: {op: computed[key, op] for op in key_ops} for key, key_ops in requested.items()}
+        return cast(groupable, self.unique_keys), results
+
     def sum(self, values: pdarray, skipna: bool = True) -> Tuple[groupable, pdarray]:
         """
         Using the permutation stored in the GroupBy instance, group
@@ -1458,6 +2078,311 @@ class GroupBy:
 
         return self.aggregate(values, "xor")  # type: ignore
 
+    def _scan(
+        self,
+        values: Optional[pdarray],
+        operator: str,
+        periods: int = 0,
+        fill: str = "0",
+        permutation: Optional[pdarray] = None,
+    ) -> pdarray:
+        """
+        Send a segmentedScan request for values, which are gathered into
+        grouped order with permutation, or with the GroupBy's own permutation
+        if it is None, and return the result in the original order.
+        """
+        if values is not None and values.size != self.length:
+            raise ValueError("Attempt to group array using key array of different length")
+        if permutation is None and not self.assume_sorted:
+            permutation = cast(pdarray, self.permutation)
+        args = {
+            "segments": self.segments,
+            "permutation": "" if permutation is None else permutation,
+            "size": self.length,
+            "op": operator,
+            "periods": periods,
+            "fill": fill,
+        }
+        if values is not None:
+            args["values"] = values
+        repMsg = generic_msg(cmd="segmentedScan", args=args)
+        self.logger.debug(repMsg)
+        return create_pdarray(repMsg)
+
+    def cumsum(self, values: pdarray) -> pdarray:
+        """
+        Using the permutation stored in the GroupBy instance, compute the
+        cumulative sum of each group's values. NaN values are skipped and give
+        NaN at their own position.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to group and sum
+
+        Returns
+        -------
+        pdarray
+            The cumulative sum of the group of each value, in the original order
+
+        Raises
+        ------
+        ValueError
+            Raised if the key array size does not match the values size
+        RuntimeError
+            Raised if cumsum is not supported for the values dtype
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.cumsum(ak.array([1, 2, 3, 4, 5]))
+        array([1 2 4 6 9])
+        """
+        return self._scan(values, "cumsum")
+
+    def cumprod(self, values: pdarray) -> pdarray:
+        """
+        Using the permutation stored in the GroupBy instance, compute the
+        cumulative product of each group's values. NaN values are skipped and
+        give NaN at their own position.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to group and multiply
+
+        Returns
+        -------
+        pdarray
+            The cumulative product of the group of each value, in the original order
+
+        Raises
+        ------
+        ValueError
+            Raised if the key array size does not match the values size
+        RuntimeError
+            Raised if cumprod is not supported for the values dtype
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.cumprod(ak.array([1, 2, 3, 4, 5]))
+        array([1 2 3 8 15])
+        """
+        return self._scan(values, "cumprod")
+
+    def cummax(self, values: pdarray) -> pdarray:
+        """
+        Using the permutation stored in the GroupBy instance, compute the
+        cumulative maximum of each group's values. NaN values are skipped and
+        give NaN at their own position.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to group and take the maximum of
+
+        Returns
+        -------
+        pdarray
+            The cumulative maximum of the group of each value, in the original order
+
+        Raises
+        ------
+        ValueError
+            Raised if the key array size does not match the values size
+        RuntimeError
+            Raised if cummax is not supported for the values dtype
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.cummax(ak.array([3, 2, 1, 4, 5]))
+        array([3 2 3 4 5])
+        """
+        return self._scan(values, "cummax")
+
+    def cummin(self, values: pdarray) -> pdarray:
+        """
+        Using the permutation stored in the GroupBy instance, compute the
+        cumulative minimum of each group's values. NaN values are skipped and
+        give NaN at their own position.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to group and take the minimum of
+
+        Returns
+        -------
+        pdarray
+            The cumulative minimum of the group of each value, in the original order
+
+        Raises
+        ------
+        ValueError
+            Raised if the key array size does not match the values size
+        RuntimeError
+            Raised if cummin is not supported for the values dtype
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.cummin(ak.array([3, 2, 1, 4, 5]))
+        array([3 2 1 2 1])
+        """
+        return self._scan(values, "cummin")
+
+    def cumcount(self) -> pdarray:
+        """
+        Number each row within its group, from 0 to the size of the group
+        minus one, in the order of the GroupBy's permutation.
+
+        Returns
+        -------
+        pdarray, int64
+            The position of each row within its group, in the original order
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.cumcount()
+        array([0 0 1 1 2])
+        """
+        return self._scan(None, "cumcount")
+
+    def rank(self, values: pdarray, method: str = "dense") -> pdarray:
+        """
+        Rank each value within its group, starting from 1.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to rank
+        method : str
+            How to rank equal values. "dense" (default) gives them the same
+            rank, with no gaps between ranks, "min" gives them the lowest rank
+            in the group they would have if they were distinct and "first"
+            gives them distinct ranks in the order they appear.
+
+        Returns
+        -------
+        pdarray, int64
+            The rank of each value within its group, in the original order
+
+        Raises
+        ------
+        ValueError
+            Raised if the key array size does not match the values size or if
+            method is not one of "dense", "min" or "first"
+
+        Notes
+        -----
+        The values of each group are sorted with a coargsort of the group
+        indices and the values, so ranking costs a sort of the values.
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 0, 0, 0, 1, 1]))
+        >>> v = ak.array([3, 1, 3, 2, 5, 4])
+        >>> g.rank(v)
+        array([3 1 3 2 2 1])
+        >>> g.rank(v, method="min")
+        array([3 1 3 2 2 1])
+        >>> g.rank(v, method="first")
+        array([3 1 4 2 2 1])
+        """
+        if method not in ("dense", "min", "first"):
+            raise ValueError(f"Unsupported rank method: {method}\nMust be one of dense, min, first")
+        if values.size != self.length:
+            raise ValueError("Attempt to group array using key array of different length")
+        # sorting by group first keeps the GroupBy's segments
+        group_idx = self.broadcast(arange(self.ngroups), permute=True)
+        perm = coargsort([cast(pdarray, group_idx), values])
+        return self._scan(values, f"rank_{method}", permutation=perm)
+
+    def shift(self, values: pdarray, periods: int = 1, fill_value=None) -> pdarray:
+        """
+        Shift each group's values by periods positions, in the order of the
+        GroupBy's permutation.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to shift
+        periods : int
+            The number of positions to shift by, forwards if positive and
+            backwards if negative
+        fill_value : scalar, optional
+            The value of positions shifted in from outside the group. If None
+            (default), they are NaN and integer and bool values are converted
+            to float64.
+
+        Returns
+        -------
+        pdarray
+            The shifted values, in the original order
+
+        Raises
+        ------
+        ValueError
+            Raised if the key array size does not match the values size
+        RuntimeError
+            Raised if shift is not supported for the values dtype
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.shift(ak.array([1, 2, 3, 4, 5]), fill_value=0)
+        array([0 0 1 2 3])
+        >>> g.shift(ak.array([1.0, 2.0, 3.0, 4.0, 5.0]), periods=-1)
+        array([3.00000000000000000 4.00000000000000000 5.00000000000000000 nan nan])
+        """
+        if fill_value is None:
+            if values.dtype != akfloat64:
+                values = values.astype(akfloat64)
+            fill = "nan"
+        elif values.dtype == bool:
+            fill = str(bool(fill_value)).lower()
+        else:
+            fill = str(values.dtype.type(fill_value))
+        return self._scan(values, "shift", periods=periods, fill=fill)
+
+    def diff(self, values: pdarray, periods: int = 1) -> pdarray:
+        """
+        Compute the difference between each value and the value periods
+        positions earlier in its group, in the order of the GroupBy's
+        permutation.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to difference
+        periods : int
+            The number of positions back to take the difference with, or
+            forwards if negative
+
+        Returns
+        -------
+        pdarray, float64
+            The differences, in the original order. Values with no value
+            periods positions away in their group give NaN.
+
+        Raises
+        ------
+        ValueError
+            Raised if the key array size does not match the values size
+        RuntimeError
+            Raised if diff is not supported for the values dtype
+
+        Examples
+        --------
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.diff(ak.array([1, 2, 4, 8, 16]))
+        array([nan nan 3.00000000000000000 6.00000000000000000 12.00000000000000000])
+        """
+        return self._scan(values, "diff", periods=periods)
+
     def head(
         self,
         values: groupable_element_type,
@@ -10,20 +10,133 @@ from numpy import dtype as npdtype
 from typeguard import typechecked
 
 from arkouda import Categorical, Strings
-from arkouda.groupbyclass import GroupBy, unique
+from arkouda.client import generic_msg
+from arkouda.groupbyclass import GroupBy, _key_identity, unique
 from arkouda.numpy import cast as akcast
 from arkouda.numpy.dtypes import bool_ as akbool
 from arkouda.numpy.dtypes import float64 as akfloat64
 from arkouda.numpy.dtypes import int64 as akint64
 from arkouda.pdarrayclass import RegistrationError, pdarray
 from arkouda.pdarraycreation import arange, array, create_pdarray, ones
-from arkouda.pdarraysetops import argsort, in1d
+from arkouda.pdarraysetops import argsort, in1d, indexof1d
 from arkouda.sorting import coargsort
 from arkouda.util import convert_if_categorical, generic_concat, get_callback
 
 if TYPE_CHECKING:
     from arkouda.series import Series
 
+# dtypes of the pdarrays whose values the server can hash
+_HASHABLE_DTYPES = frozenset(["int64", "uint64", "float64", "bool"])
+
+
+def _hash_key_args(keys: list) -> Tuple[list, list]:
+    """
+    The names and object types under which the server hashes the rows of keys.
+    """
+    names: list = []
+    types: list = []
+    for k in keys:
+        if isinstance(k, Categorical):
+            names.append(json.dumps({"categories": k.categories.name, "codes": k.codes.name}))
+            types.append(Categorical.objType)
+        elif isinstance(k, Strings):
+            names.append(k.name)
+            types.append(Strings.objType)
+        else:
+            names.append(k.name)
+            types.append(pdarray.objType)
+    return names, types
+
+
+def _hashable_together(keys: list, query: list) -> bool:
+    """
+    Whether the rows of query can be looked up in a hash index of the rows of
+    keys. Equal rows must hash equally, which holds column by column for
+    pdarrays of the same dtype, and for Strings and Categoricals, since the
+    categories of a Categorical are hashed as Strings.
+    """
+    if len(keys) != len(query):
+        return False
+    for k, q in zip(keys, query):
+        if isinstance(k, pdarray) and isinstance(q, pdarray):
+            if k.ndim != 1 or q.ndim != 1 or k.dtype != q.dtype or k.dtype.name not in _HASHABLE_DTYPES:
+                return False
+        elif not (isinstance(k, (Strings, Categorical)) and isinstance(q, (Strings, Categorical))):
+            return False
+    return True
+
+
+class _HashIndex:
+    """
+    The rows of the key arrays of an Index grouped by hash on the server, so
+    that labels can be looked up without grouping the keys again.
+
+    Parameters
+    ----------
+    keys : list of pdarray, Strings or Categorical
+        The key arrays, all of the same size
+    identity : tuple
+        The identity of the key arrays, as given by _key_identity, which
+        tells whether they have changed since the hash index was built
+    """
+
+    def __init__(self, keys: list, identity: tuple) -> None:
+        from typing import cast as typecast
+
+        names, types = _hash_key_args(keys)
+        rep_msg = json.loads(
+            typecast(
+                str,
+                generic_msg(
+                    cmd="buildHashIndex",
+                    args={"nkeys": len(keys), "keynames": names, "keytypes": types},
+                ),
+            )
+        )
+        self.identity = identity
+        self.hi = create_pdarray(rep_msg["hi"])
+        self.lo = create_pdarray(rep_msg["lo"])
+        self.segments = create_pdarray(rep_msg["segments"])
+        self.permutation = create_pdarray(rep_msg["permutation"])
+        self.buckets = create_pdarray(rep_msg["buckets"])
+
+    def lookup(self, query: list, mode: str) -> pdarray:
+        """
+        Look the rows of the query arrays up in the hash index.
+
+        Parameters
+        ----------
+        query : list of pdarray, Strings or Categorical
+            The query arrays, hashable together with the key arrays
+        mode : str
+            "first" for the position of the first key row equal to each query
+            row, or -1, "all" for the positions of all the key rows equal to
+            each query row, in the order of the query rows, or "mask" for
+            whether each key row is equal to any query row
+
+        Returns
+        -------
+        pdarray
+        """
+        from typing import cast as typecast
+
+        names, types = _hash_key_args(query)
+        rep_msg = generic_msg(
+            cmd="hashIndexLookup",
+            args={
+                "mode": mode,
+                "hi": self.hi,
+                "lo": self.lo,
+                "segments": self.segments,
+                "permutation": self.permutation,
+                "buckets": self.buckets,
+                "nkeys": len(query),
+                "keynames": names,
+                "keytypes": types,
+            },
+        )
+        return create_pdarray(typecast(str, rep_msg))
+
 
 class Index:
     objType = "Index"
@@ -65,6 +178,10 @@ class Index:
 
     """
 
+    # the hash index of the values, built by the first label lookup that can
+    # use it and rebuilt when the values change; see _hash_lookup
+    _hash_index: Optional[_HashIndex] = None
+
     @typechecked
     def __init__(
         self,
@@ -656,6 +773,63 @@ class Index:
 
         return Index(map(self.values, arg))
 
+    def _hash_keys(self) -> Optional[list]:
+        """
+        The key arrays whose rows are the labels of the Index, or None if they
+        are not arkouda arrays.
+        """
+        return None if isinstance(self.values, list) else [self.values]
+
+    def _hash_lookup(self, key, mode: str) -> Optional[pdarray]:
+        """
+        Look labels up in the hash index of the Index, building the hash index
+        first if there is none or the Index values have changed since it was
+        built.
+
+        Parameters
+        ----------
+        key : pdarray, Strings, Categorical, or a list of them for a MultiIndex
+            The labels to look up
+        mode : str
+            "first", "all" or "mask", as for _HashIndex.lookup
+
+        Returns
+        -------
+        pdarray or None
+            The result of the lookup, or None if the labels cannot be looked up
+            in a hash index of the Index values, in which case the caller falls
+            back to in1d or find
+        """
+        keys = self._hash_keys()
+        query = list(key) if isinstance(key, (list, tuple)) else [key]
+        if keys is None or not _hashable_together(keys, query):
+            return None
+        identity = _key_identity(keys)
+        if identity is None:
+            return None
+        if self._hash_index is None or self._hash_index.identity != identity:
+            self._hash_index = _HashIndex(keys, identity)
+        return self._hash_index.lookup(query, mode)
+
+    def _find(self, key) -> pdarray:
+        """
+        The position of the first label of the Index equal to each of key, or -1.
+        """
+        idx = self._hash_lookup(key, "first")
+        if idx is None:
+            from arkouda.alignment import find
+
+            idx = find(key, self.index)
+        return idx
+
+    def _indexof(self, key) -> pdarray:
+        """
+        The positions of all the labels of the Index equal to each of key, in
+        the order of key, skipping the keys that are not in the Index.
+        """
+        idx = self._hash_lookup(key, "all")
+        return idx if idx is not None else indexof1d(key, self.index)
+
     def concat(self, other):
         self._check_types(other)
 
@@ -663,14 +837,32 @@ class Index:
         return Index(idx)
 
     def lookup(self, key):
-        if not isinstance(key, pdarray):
+        """
+        Whether each label of the Index is in key.
+
+        The first lookup builds a hash index of the labels, which is kept on
+        the server and reused by later lookups, as long as the labels do not
+        change.
+
+        Parameters
+        ----------
+        key : pdarray, Strings, Categorical or scalar
+            The labels to look up
+
+        Returns
+        -------
+        pdarray(bool)
+            True for each label of the Index that is in key
+        """
+        if not isinstance(key, (pdarray, Strings, Categorical)):
             # try to handle single value
             try:
                 key = array([key])
             except Exception:
                 raise TypeError("Lookup must be on an arkouda array")
 
-        return in1d(self.values, key)
+        mask = self._hash_lookup(key, "mask")
+        return mask if mask is not None else in1d(self.values, key)
 
     def to_hdf(
         self,
@@ -1282,6 +1474,9 @@ class MultiIndex(Index):
     def to_ndarray(self):
         return ndarray([convert_if_categorical(val).to_ndarray() for val in self.levels])
 
+    def _hash_keys(self) -> Optional[list]:
+        return list(self.levels)
+
     def to_list(self):
         return self.to_ndarray().tolist()
 
@@ -1412,7 +1607,8 @@ class MultiIndex(Index):
             dt = self.levels[0].dtype if isinstance(self.levels[0], pdarray) else akint64
             key = [akcast(array([x]), dt) for x in key]
 
-        return in1d(self.index, key)
+        mask = self._hash_lookup(key, "mask")
+        return mask if mask is not None else in1d(self.index, key)
 
     def to_hdf(
         self,
@@ -1,6 +1,10 @@
 from typing import Callable, Optional, Sequence, Tuple, Union, cast
 
+import json
+from datetime import timedelta
+
 import numpy as np
+import pandas as pd  # type: ignore
 from typeguard import typechecked
 
 from arkouda.alignment import right_align
@@ -15,11 +19,14 @@ from arkouda.pdarrayclass import create_pdarray, pdarray
 from arkouda.pdarraycreation import arange, array, ones, zeros
 from arkouda.pdarraysetops import concatenate, in1d
 from arkouda.strings import Strings
+from arkouda.timeclass import Datetime, Timedelta
 
-__all__ = ["join_on_eq_with_dt", "gen_ranges", "compute_join_size"]
+__all__ = ["join_on_eq_with_dt", "gen_ranges", "compute_join_size", "hash_join", "asof_join"]
 
 predicates = {"true_dt": 0, "abs_dt": 1, "pos_dt": 2}
 
+_JOIN_TYPES = ("inner", "left", "right", "outer", "semi", "anti")
+
 
 @typechecked
 def join_on_eq_with_dt(
@@ -198,6 +205,7 @@ def inner_join(
             Union[pdarray, Strings, Categorical, Sequence[Union[pdarray, Strings]]],
         ]
     ] = None,
+    method: str = "auto",
 ) -> Tuple[pdarray, pdarray]:
     """Perform inner join on values in <left> and <right>,
     using conditions defined by <wherefunc> evaluated on
@@ -215,6 +223,16 @@ def inner_join(
         which wherefunc is False will be dropped.
     whereargs : 2-tuple of pdarray, Strings, Categorical, or Sequence of pdarray, optional
         The two arguments for wherefunc
+    method : {"auto", "sort", "hash"}, default="auto"
+        How to match the keys. "sort" groups the right keys by sorting them.
+        "hash" uses :func:`hash_join`, which requires the left and right keys
+        to have the same types and matches them by their 128-bit hashes. It
+        avoids sorting, but unless one side is small enough to be broadcast,
+        it sends all the rows of a key to the same locale, so it suits keys
+        without heavy skew. "auto" uses "hash" when the keys have the same
+        types and one side has at most ``ak.client.broadcastJoinMaxRows``
+        rows, so that it is broadcast and nothing is shuffled, and "sort"
+        otherwise. The result is the same.
 
     Returns
     -------
@@ -230,9 +248,13 @@ def inner_join(
     `assert (left[leftInds] == right[rightInds]).all()`
     `assert wherefunc(whereargs[0][leftInds], whereargs[1][rightInds]).all()`
 
+    The pairs are ordered by left index and then by right index.
     """
     from inspect import signature
 
+    if method not in ("auto", "sort", "hash"):
+        raise ValueError(f"method must be one of 'auto', 'sort' or 'hash', not {method}")
+
     is_sequence = isinstance(left, Sequence) and isinstance(right, Sequence)
 
     # Reduce processing to codes to prevent groupby on entire Categorical
@@ -276,6 +298,22 @@ def inner_join(
         except Exception as e:
             raise ValueError("Error evaluating wherefunc") from e
 
+    if method == "auto":
+        method = "hash" if _broadcast_joinable(left, right) else "sort"
+    if method == "hash":
+        leftInds, rightInds = cast(Tuple[pdarray, pdarray], hash_join(left, right))
+        if wherefunc is None or whereargs is None:
+            return leftInds, rightInds
+        if not is_sequence:
+            leftWhere = whereargs[0][leftInds]  # type: ignore
+            leftWhere = leftWhere.codes if isinstance(leftWhere, Categorical) else leftWhere
+            rightWhere = whereargs[1][rightInds]  # type: ignore
+        else:
+            leftWhere = [wa[leftInds] for wa in whereargs[0]]
+            rightWhere = [wa[rightInds] for wa in whereargs[1]]
+        whereSatisfied = wherefunc(leftWhere, rightWhere)
+        return leftInds[whereSatisfied], rightInds[whereSatisfied]
+
     # Need dense 0-up right index, to filter out left not in right
     keep, (denseLeft, denseRight) = right_align(left, right)
     if keep.sum() == 0:
@@ -328,3 +366,291 @@ def inner_join(
     rightInds = byRight.permutation[filtRanges]
     leftInds = broadcast(filtSegs, arange(left_size)[keep12], filtRanges.size)
     return leftInds, rightInds
+
+
+def _hash_keys(left, right) -> Tuple[list, list]:
+    """
+    The arrays whose rows are hashed to join the left and right keys, which
+    must have the same types, with the codes of Categoricals standardized so
+    that equal values have equal codes.
+    """
+    if not _same_key_types(left, right):
+        raise TypeError("Left and right join keys must have the same types")
+    lefts = list(left) if isinstance(left, Sequence) else [left]
+    rights = list(right) if isinstance(right, Sequence) else [right]
+    for keys in lefts, rights:
+        if any(k.size != keys[0].size for k in keys):
+            raise ValueError("Multi-array arguments must have equal-length arrays")
+    # Categoricals are hashed by their codes, so the codes must agree
+    for i, (lf, rt) in enumerate(zip(lefts, rights)):
+        if isinstance(lf, Categorical):
+            lefts[i], rights[i] = Categorical.standardize_categories([lf, rt])
+    leftKeys = [k.codes if isinstance(k, Categorical) else k for k in lefts]
+    rightKeys = [k.codes if isinstance(k, Categorical) else k for k in rights]
+    return leftKeys, rightKeys
+
+
+def _broadcast_joinable(left, right) -> bool:
+    """
+    Whether the left and right join keys have the same types and one side has
+    at most ak.client.broadcastJoinMaxRows rows, so that a hash join of them
+    broadcasts that side rather than shuffling both. Float keys are left to
+    the sort join, whose matching of -0.0 and NaN values hashing would not
+    reproduce.
+    """
+    from arkouda.client import broadcastJoinMaxRows
+
+    if not _same_key_types(left, right):
+        return False
+    keys = list(left) if isinstance(left, Sequence) else [left]
+    if any(isinstance(k, pdarray) and k.dtype.name not in ("int64", "uint64", "bool") for k in keys):
+        return False
+    sizes = [k[0].size if isinstance(k, Sequence) else k.size for k in (left, right)]
+    return min(sizes) <= broadcastJoinMaxRows
+
+
+def _same_key_types(left, right) -> bool:
+    """
+    Whether the left and right join keys have the same types, column by column.
+    """
+    if isinstance(left, Sequence) != isinstance(right, Sequence):
+        return False
+    lefts = list(left) if isinstance(left, Sequence) else [left]
+    rights = list(right) if isinstance(right, Sequence) else [right]
+    if len(lefts) != len(rights):
+        return False
+    for lf, rt in zip(lefts, rights):
+        if type(lf) is not type(rt):
+            return False
+        if isinstance(lf, pdarray) and lf.dtype != rt.dtype:
+            return False
+    return True
+
+
+@typechecked
+def hash_join(
+    left: Union[pdarray, Strings, Categorical, Sequence[Union[pdarray, Strings, Categorical]]],
+    right: Union[pdarray, Strings, Categorical, Sequence[Union[pdarray, Strings, Categorical]]],
+    how: str = "inner",
+    broadcast: Optional[bool] = None,
+) -> Union[pdarray, Tuple[pdarray, pdarray]]:
+    """
+    Join the rows of <left> and <right> with equal keys by hashing them.
+
+    By default the rows of both sides are hashed on their keys and sent to
+    the locale that owns the hash, where the rows with equal keys are matched,
+    so neither side has to be sorted globally. When one side is small, it is
+    instead broadcast to every locale as a local hash table that the rows of
+    the other side are looked up in where they are, so the large side is not
+    shuffled.
+
+    Parameters
+    ----------
+    left : pdarray, Strings, Categorical, or Sequence of them
+        The left keys to join
+    right : pdarray, Strings, Categorical, or Sequence of them
+        The right keys to join, of the same types as the left keys
+    how : {"inner", "left", "right", "outer", "semi", "anti"}, default="inner"
+        The type of join. "left", "right" and "outer" joins also return the
+        unmatched rows of the left side, the right side or both. "semi" and
+        "anti" joins return the left rows that match and do not match any
+        right row.
+    broadcast : bool, optional
+        Whether to broadcast the smaller side rather than shuffle both sides.
+        By default the smaller side is broadcast if it has at most
+        ``ak.client.broadcastJoinMaxRows`` rows. The result is the same.
+
+    Returns
+    -------
+    Tuple[pdarray, pdarray] or pdarray
+        For "semi" and "anti" joins, the indices of the left rows that are
+        kept, in order. Otherwise the left and right indices of the matching
+        pairs, with -1 standing for the missing side of an unmatched row.
+        Pairs are ordered by left index and then by right index, except for
+        right joins, which are ordered by right index and then by left index.
+        The unmatched right rows of an outer join come last, in order.
+
+    Raises
+    ------
+    TypeError
+        Raised if the left and right keys do not have the same types
+    ValueError
+        Raised if how is not a known join type, or if multi-array keys are
+        not all the same length
+
+    Notes
+    -----
+    Keys are compared by their 128-bit hashes, not by their values: two
+    different keys with the same hash would be joined. The chance of that
+    is negligible, about 2**-128 for each pair of distinct keys.
+
+    Shuffled rows are sent to the locale that owns their hash, so all the
+    rows of a key land on one locale, and heavily skewed keys load that
+    locale unevenly.
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> left = ak.array([1, 2, 3, 2])
+    >>> right = ak.array([2, 4, 1, 2])
+    >>> ak.hash_join(left, right)
+    (array([0 1 1 3 3]), array([2 0 3 0 3]))
+    >>> ak.hash_join(left, right, how="outer")
+    (array([0 1 1 2 3 3 -1]), array([2 0 3 -1 0 3 1]))
+    >>> ak.hash_join(left, right, how="anti")
+    array([2])
+    """
+    if how not in _JOIN_TYPES:
+        raise ValueError(f"how must be one of {_JOIN_TYPES}, not {how}")
+    if how == "right":
+        rightInds, leftInds = cast(
+            Tuple[pdarray, pdarray], hash_join(right, left, how="left", broadcast=broadcast)
+        )
+        return leftInds, rightInds
+    leftKeys, rightKeys = _hash_keys(left, right)
+    left_size, right_size = leftKeys[0].size, rightKeys[0].size
+    if broadcast is None:
+        from arkouda.client import broadcastJoinMaxRows
+
+        broadcast = bool(min(left_size, right_size) <= broadcastJoinMaxRows)
+    side = "none"
+    if broadcast:
+        side = "right" if right_size <= left_size else "left"
+    repMsg = generic_msg(
+        cmd="hashJoin",
+        args={
+            "how": how,
+            "broadcast": side,
+            "nstr": len(leftKeys),
+            "leftnames": [k.name for k in leftKeys],
+            "lefttypes": [k.objType for k in leftKeys],
+            "rightnames": [k.name for k in rightKeys],
+            "righttypes": [k.objType for k in rightKeys],
+        },
+    )
+    if how in ("semi", "anti"):
+        return create_pdarray(cast(str, repMsg))
+    inds = json.loads(cast(str, repMsg))
+    return create_pdarray(inds["left"]), create_pdarray(inds["right"])
+
+
+@typechecked
+def asof_join(
+    left: pdarray,
+    right: pdarray,
+    left_by: Optional[
+        Union[pdarray, Strings, Categorical, Sequence[Union[pdarray, Strings, Categorical]]]
+    ] = None,
+    right_by: Optional[
+        Union[pdarray, Strings, Categorical, Sequence[Union[pdarray, Strings, Categorical]]]
+    ] = None,
+    direction: str = "backward",
+    tolerance: Optional[
+        Union[int, float, np.integer, np.floating, np.timedelta64, pd.Timedelta, timedelta]
+    ] = None,
+) -> pdarray:
+    """
+    Match each of the sorted <left> keys with the nearest of the sorted
+    <right> keys in the given direction, optionally among the rows with equal
+    "by" keys.
+
+    The matches are found on the server by merging the sorted keys, so no
+    intervals are built.
+
+    Parameters
+    ----------
+    left : pdarray(int64), pdarray(float64), Datetime or Timedelta
+        The left keys, sorted in ascending order
+    right : pdarray(int64), pdarray(float64), Datetime or Timedelta
+        The right keys, of the same type as the left keys and sorted in
+        ascending order
+    left_by, right_by : pdarray, Strings, Categorical, or Sequence of them, optional
+        Keys that the left and right rows must also be equal on to be matched,
+        of the same types on both sides
+    direction : {"backward", "forward", "nearest"}, default="backward"
+        Match each left key with the last right key at or before it, the first
+        right key at or after it, or the closest of the two, the backward
+        one on ties
+    tolerance : int, float or timedelta, optional
+        The farthest a right key can be from the left key it is matched with.
+        It must be an integer for int64 keys. Timedeltas are only allowed for
+        Datetime and Timedelta keys.
+
+    Returns
+    -------
+    pdarray(int64)
+        The index of the right row each left row is matched with, or -1 if
+        there is none
+
+    Raises
+    ------
+    TypeError
+        Raised if the keys are not int64 or float64 or do not have the same
+        types, if a timedelta tolerance is given for other keys or if a
+        tolerance that is not an integer is given for int64 keys
+    ValueError
+        Raised if direction is not known, if tolerance is negative, if only
+        one of left_by and right_by is given or if the keys are not sorted
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> trades = ak.array([1, 5, 10])
+    >>> quotes = ak.array([0, 2, 3, 7, 12])
+    >>> ak.asof_join(trades, quotes)
+    array([0 2 3])
+    >>> ak.asof_join(trades, quotes, direction="nearest")
+    array([0 2 4])
+    >>> ak.asof_join(trades, quotes, direction="forward", tolerance=1)
+    array([1 -1 -1])
+    """
+    if direction not in ("backward", "forward", "nearest"):
+        raise ValueError(f"direction must be one of 'backward', 'forward' or 'nearest', not {direction}")
+    if left.dtype != right.dtype or left.dtype.name not in ("int64", "float64"):
+        raise TypeError("Left and right keys must both be int64 or both be float64")
+    if (left_by is None) != (right_by is None):
+        raise ValueError("left_by and right_by must be given together")
+    if isinstance(tolerance, (np.timedelta64, pd.Timedelta, timedelta)):
+        if not isinstance(left, (Datetime, Timedelta)):
+            raise TypeError("A timedelta tolerance requires Datetime or Timedelta keys")
+        # Datetime and Timedelta values are in nanoseconds
+        tol = pd.Timedelta(tolerance).value
+    elif tolerance is None:
+        tol = None
+    elif left.dtype.name == "float64":
+        tol = float(tolerance)
+    elif isinstance(tolerance, (int, np.integer)):
+        tol = int(tolerance)
+    else:
+        # the server reads the tolerance as a key, so it must have the key's type
+        raise TypeError(f"int64 keys require an integer tolerance, not {tolerance!r}")
+    if tol is not None and tol < 0:
+        raise ValueError("tolerance must not be negative")
+    args = {
+        "left": left,
+        "right": right,
+        "direction": direction,
+        "has_tolerance": tol is not None,
+        "tolerance": tol if tol is not None else 0,
+        "nby": 0,
+    }
+    if left_by is not None:
+        leftKeys, rightKeys = _hash_keys(left_by, right_by)
+        if leftKeys[0].size != left.size or rightKeys[0].size != right.size:
+            raise ValueError("by keys must be the same size as the keys they go with")
+        args.update(
+            {
+                "nby": len(leftKeys),
+                "leftbynames": [k.name for k in leftKeys],
+                "leftbytypes": [k.objType for k in leftKeys],
+                "rightbynames": [k.name for k in rightKeys],
+                "rightbytypes": [k.objType for k in rightKeys],
+            }
+        )
+    try:
+        repMsg = generic_msg(cmd="mergeAsof", args=args)
+    except RuntimeError as e:
+        if "must be sorted" in str(e):
+            raise ValueError("Left and right keys must be sorted") from e
+        raise
+    return create_pdarray(cast(str, repMsg))
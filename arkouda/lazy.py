@@ -0,0 +1,377 @@
+"""
+Lazy evaluation of elementwise expressions.
+
+Inside a ``with ak.lazy():`` block, arithmetic, comparison and bitwise
+operators on pdarrays, as well as ``ak.abs``, ``ak.log``, ``ak.exp``,
+``ak.sqrt``, ``ak.sin``, ``ak.cos`` and ``ak.where``, are recorded into an
+expression graph instead of being sent to the server one at a time. The
+graph is shipped as a single ``fusedEval`` message the first time its result
+is needed, or when the block ends, and evaluated by the server in one pass
+over the inputs, so none of the intermediate arrays are ever allocated.
+
+An expression reads its operands when it is evaluated, so it is evaluated
+before any of them is modified in place, and at the latest when the
+outermost block ends.
+
+Only one-dimensional ``int64``, ``float64`` and ``bool`` arrays of the same
+size take part in an expression. Anything else, such as broadcasting or
+integer exponentiation, silently runs eagerly as it would outside the block.
+
+Examples
+--------
+>>> import arkouda as ak
+>>> ak.connect()
+>>> a, b, c, d = (ak.randint(1, 10, 10**8, dtype=ak.float64) for _ in range(4))
+>>> with ak.lazy():
+...     x = ak.log(a * b + c) / d
+>>> x.sum()  # the expression was evaluated with a single message
+"""
+
+from __future__ import annotations
+
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Union, cast
+
+import numpy as np
+
+from arkouda import pdarrayclass
+from arkouda.client import generic_msg
+from arkouda.numpy.dtypes import dtype, resolve_scalar_dtype
+from arkouda.pdarrayclass import create_pdarray, pdarray
+
+__all__ = ["lazy", "LazyArray"]
+
+# largest number of nodes recorded in one expression; larger expressions are
+# split by evaluating their operands first
+_MAX_NODES = 64
+
+_ARITHMETIC_OPS = frozenset(["+", "-", "*", "//", "%"])
+_BITWISE_OPS = frozenset(["&", "|", "^"])
+_COMPARISON_OPS = frozenset(["<", ">", "<=", ">=", "==", "!="])
+_FLOAT_FUNCS = frozenset(["log", "exp", "sqrt", "sin", "cos"])
+
+Operand = Union[pdarray, int, float, bool, np.number, np.bool_]
+
+# the expressions recorded by the active lazy() blocks, oldest first, which
+# may not have been evaluated yet
+_pending: List["weakref.ReferenceType[LazyArray]"] = []
+
+
+class LazyArray(pdarray):
+    """
+    A pdarray whose values are the result of a recorded elementwise expression.
+
+    The expression is evaluated on the server the first time the array's
+    name is needed, i.e. the first time it is passed to any server command,
+    before any of its operands is modified in place, or when the lazy block
+    ends, whichever comes first, and the result is reused afterwards.
+    LazyArray instances are created by operations inside a :func:`lazy`
+    block and should not be created directly.
+    """
+
+    def __init__(self, op: str, operands: Tuple[Operand, ...], mydtype: str, size: int) -> None:
+        self._op = op
+        self._operands = operands
+        self._value: Optional[pdarray] = None
+        self._num_nodes: int = 1 + sum(
+            o._num_nodes if isinstance(o, LazyArray) and not o.evaluated else 1 for o in operands
+        )
+        self.dtype = dtype(mydtype)
+        self.size = size
+        self.ndim = 1
+        self._shape = (size,)
+        self.itemsize = self.dtype.itemsize
+        self.registered_name: Optional[str] = None
+
+    def __del__(self):
+        # the evaluated pdarray, if any, deletes its own server-side data
+        pass
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self.evaluate().name
+
+    @property
+    def evaluated(self) -> bool:
+        """
+        Whether the expression has already been evaluated on the server.
+        """
+        return self._value is not None
+
+    def evaluate(self) -> pdarray:
+        """
+        Evaluate the expression on the server, if it has not been already.
+
+        Returns
+        -------
+        pdarray
+            The result of the expression
+        """
+        if self._value is None:
+            self._value = _fused_eval(self)
+            # the operands are no longer needed, so let them be collected
+            self._operands = ()
+        return self._value
+
+    def _r_binop(self, other, op: str) -> pdarray:
+        # pdarray._binop defers to pdarray subclasses, so an eager
+        # pdarray-LazyArray operation arrives here
+        if type(other) is pdarray:
+            return other._binop(self.evaluate(), op)
+        return super()._r_binop(other, op)
+
+
+@contextmanager
+def lazy() -> Iterator[None]:
+    """
+    Record elementwise operations in the block as expressions that are
+    evaluated on the server in a single fused pass when first used, or
+    before their operands are modified in place. Those still pending are
+    evaluated when the outermost block ends.
+
+    Examples
+    --------
+    >>> a = ak.arange(10**8)
+    >>> b = ak.randint(0, 10, 10**8)
+    >>> with ak.lazy():
+    ...     c = ak.where(a % 2 == 0, a * b + 1, ak.abs(a - b))
+    >>> c[:5]
+    array([1 3 9 7 17])
+    """
+    enclosing = pdarrayclass._lazy_hook
+    pdarrayclass._lazy_hook = _record
+    pdarrayclass._write_hook = _before_write
+    try:
+        yield
+    finally:
+        pdarrayclass._lazy_hook = enclosing
+        if enclosing is None:
+            # later in-place writes to the operands must not change the results
+            try:
+                _evaluate_pending()
+            finally:
+                _pending.clear()
+                pdarrayclass._write_hook = None
+
+
+def _reads(x: LazyArray, name: str) -> bool:
+    """
+    Whether evaluating the pending expression x reads the server array name.
+    """
+    for o in x._operands:
+        if isinstance(o, LazyArray):
+            if (cast(pdarray, o._value).name == name) if o.evaluated else _reads(o, name):
+                return True
+        elif isinstance(o, pdarray) and o.name == name:
+            return True
+    return False
+
+
+def _evaluate_pending(name: Optional[str] = None) -> None:
+    """
+    Evaluate the pending expressions that are still in use, or only those
+    that read the server array name. The newest are evaluated first:
+    evaluating an expression releases its operands, so subexpressions that
+    only it uses are never evaluated on their own.
+    """
+    kept = []
+    for ref in reversed(_pending):
+        x = ref()
+        if x is None or x.evaluated:
+            continue
+        if name is None or _reads(x, name):
+            x.evaluate()
+        else:
+            kept.append(ref)
+    _pending[:] = kept[::-1]
+
+
+def _before_write(a: pdarray) -> None:
+    """
+    Evaluate the pending expressions that read a before it is modified in place.
+    """
+    if _pending:
+        _evaluate_pending(a.name)
+
+
+def _kind(x: Operand) -> Optional[str]:
+    """
+    The dtype an operand takes in an expression, or None if it is unsupported.
+    """
+    if isinstance(x, LazyArray):
+        return x.dtype.name
+    if isinstance(x, pdarray):
+        # subclasses such as Datetime have their own operator semantics
+        if type(x) is not pdarray or x.ndim != 1 or x.dtype.name not in ("int64", "float64", "bool"):
+            return None
+        return x.dtype.name
+    if isinstance(x, (complex, np.complexfloating)) or not np.isscalar(x):
+        return None
+    kind = resolve_scalar_dtype(x)
+    return kind if kind in ("int64", "float64", "bool") else None
+
+
+def _result_kind(op: str, kinds: List[str]) -> Optional[str]:
+    """
+    The dtype of an operation's result, following the eager operations, or
+    None if the operation is not supported in an expression.
+    """
+    if op == "where":
+        if kinds[0] != "bool":
+            return None
+        if kinds[1] == kinds[2]:
+            return kinds[1]
+        return None if "bool" in kinds[1:] else "float64"
+    if op in _BITWISE_OPS:
+        return kinds[0] if kinds[0] == kinds[1] and kinds[0] in ("int64", "bool") else None
+    if "bool" in kinds:
+        # outside bitwise ops, bool is only compared with bool
+        return "bool" if op in _COMPARISON_OPS and kinds[0] == kinds[1] else None
+    if op in _COMPARISON_OPS:
+        return "bool"
+    if op in _FLOAT_FUNCS or op == "/":
+        return "float64"
+    if op == "abs":
+        return kinds[0]
+    if op in _ARITHMETIC_OPS or op == "**":
+        if "float64" in kinds:
+            return "float64"
+        # integer exponentiation needs the eager negative exponent check
+        return "int64" if op != "**" else None
+    return None
+
+
+def _record(op: str, *operands: Operand) -> Optional[LazyArray]:
+    """
+    Record ``op`` applied to ``operands`` as a new expression node, or return
+    None if the operation has to run eagerly.
+    """
+    arrays = [o for o in operands if isinstance(o, pdarray)]
+    if not arrays or any(o.size != arrays[0].size for o in arrays):
+        return None
+    if op == "where":
+        if not isinstance(operands[0], pdarray) or operands[0].dtype.name != "bool":
+            return None
+        # like the eager where, a scalar branch takes the dtype of the array branch
+        a, b = operands[1], operands[2]
+        if isinstance(a, pdarray) and not isinstance(b, pdarray):
+            operands = (operands[0], a, _cast_scalar(b, a.dtype))
+        elif isinstance(b, pdarray) and not isinstance(a, pdarray):
+            operands = (operands[0], _cast_scalar(a, b.dtype), b)
+        elif not isinstance(a, pdarray):
+            return None
+    kinds = [_kind(o) for o in operands]
+    if None in kinds:
+        return None
+    kind = _result_kind(op, cast(List[str], kinds))
+    if kind is None:
+        return None
+    node = LazyArray(op, operands, kind, int(arrays[0].size))
+    _pending.append(weakref.ref(node))
+    if node._num_nodes > _MAX_NODES:
+        for o in operands:
+            if isinstance(o, LazyArray):
+                o.evaluate()
+        node._num_nodes = 1 + len(operands)
+    return node
+
+
+def _cast_scalar(value: Operand, dt: np.dtype) -> Operand:
+    try:
+        return np.array([value]).astype(dt)[0]
+    except Exception:
+        raise TypeError(f"Unable to convert {value} to {dt.name}")
+
+
+class _Program:
+    """
+    The flattened form of an expression graph sent to the ``fusedEval`` command.
+
+    Nodes are stored in topological order as parallel lists; the operands of a
+    node are the indices of earlier nodes. ``array`` nodes refer to an entry
+    of ``names`` and ``const`` nodes to an entry of ``values``.
+    """
+
+    def __init__(self) -> None:
+        self.ops: List[str] = []
+        self.kinds: List[str] = []
+        self.lhs: List[int] = []
+        self.rhs: List[int] = []
+        self.third: List[int] = []
+        self.names: List[str] = []
+        self.values: List[str] = []
+        self._nodes: Dict[object, int] = {}
+
+    def _emit(self, op: str, kind: str, lhs: int = -1, rhs: int = -1, third: int = -1) -> int:
+        key = (op, kind, lhs, rhs, third)
+        if key not in self._nodes:
+            self._nodes[key] = len(self.ops)
+            self.ops.append(op)
+            self.kinds.append(kind)
+            self.lhs.append(lhs)
+            self.rhs.append(rhs)
+            self.third.append(third)
+        return self._nodes[key]
+
+    def _to_float(self, node: int) -> int:
+        return node if self.kinds[node] == "float64" else self._emit("cast", "float64", node)
+
+    def _leaf(self, x: Operand) -> int:
+        kind = cast(str, _kind(x))
+        if isinstance(x, pdarray):
+            if x.name not in self.names:
+                self.names.append(x.name)
+            return self._emit("array", kind, self.names.index(x.name))
+        if kind == "bool":
+            value = str(int(bool(x)))
+        elif kind == "int64":
+            value = str(int(cast(int, x)))
+        else:
+            value = repr(float(cast(float, x)))
+        if value not in self.values:
+            self.values.append(value)
+        return self._emit("const", kind, self.values.index(value))
+
+    def add(self, x: Operand) -> int:
+        """
+        Add the nodes computing ``x`` to the program and return the index of
+        its result node.
+        """
+        if not isinstance(x, LazyArray) or x.evaluated:
+            return self._leaf(x.evaluate() if isinstance(x, LazyArray) else x)
+        kind = x.dtype.name
+        args = [self.add(o) for o in x._operands]
+        if x._op in _FLOAT_FUNCS:
+            args = [self._to_float(args[0])]
+        elif x._op == "where":
+            if kind == "float64":
+                args[1:] = [self._to_float(a) for a in args[1:]]
+        elif x._op != "abs" and "float64" in (self.kinds[a] for a in args):
+            # arithmetic and comparisons run in float64 if either operand is float64
+            args = [self._to_float(a) for a in args]
+        elif x._op == "/":
+            args = [self._to_float(a) for a in args]
+        return self._emit(x._op, kind, *args)
+
+
+def _fused_eval(x: LazyArray) -> pdarray:
+    """
+    Evaluate an expression graph on the server with a single fusedEval message.
+    """
+    program = _Program()
+    program.add(x)
+    rep_msg = generic_msg(
+        cmd="fusedEval",
+        args={
+            "ops": program.ops,
+            "kinds": program.kinds,
+            "lhs": program.lhs,
+            "rhs": program.rhs,
+            "third": program.third,
+            "names": program.names,
+            "values": program.values,
+            "size": x.size,
+        },
+    )
+    return create_pdarray(cast(str, rep_msg))
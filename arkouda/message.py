@@ -30,6 +30,14 @@ class ParameterObject:
             "val": self.val,
         }
 
+    @property
+    def binary(self) -> str:
+        """
+        The compact encoding of the parameter: the key, dtype, and val fields,
+        in that order, each prefixed by its length in bytes and a colon.
+        """
+        return "".join(f"{len(str(f).encode())}:{f}" for f in (self.key, self.dtype, self.val))
+
     @staticmethod
     @typechecked
     def _build_pdarray_param(key: str, val) -> ParameterObject:
@@ -109,6 +117,24 @@ class ParameterObject:
         data = json.dumps({"segments": val.segments.name, "values": val.values.name})
         return ParameterObject(key, str(val.values.dtype), data)
 
+    @staticmethod
+    def _build_batch_reply_param(key: str, val) -> ParameterObject:
+        """
+        Create a ParameterObject from the BatchReply of a command queued in a batch
+
+        Parameters
+        ----------
+        key : str
+            key from the dictionary object
+        val
+            BatchReply whose first created symbol is referenced
+
+        Returns
+        -------
+        ParameterObject
+        """
+        return ParameterObject(key, "str", val.name)
+
     @staticmethod
     def _is_supported_value(val):
         import builtins
@@ -231,10 +257,12 @@ class ParameterObject:
         -------
         Dictionary - mapping the parameter type to the build function
         """
+        from arkouda.client import BatchReply
         from arkouda.segarray import SegArray
         from arkouda.strings import Strings
 
         return {
+            BatchReply.__name__: ParameterObject._build_batch_reply_param,
             Strings.__name__: ParameterObject._build_strings_param,
             SegArray.__name__: ParameterObject._build_segarray_param,
             list.__name__: ParameterObject._build_list_param,
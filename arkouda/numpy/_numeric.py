@@ -9,7 +9,7 @@ from typeguard import typechecked
 
 from arkouda.client import generic_msg
 from arkouda.dtypes import str_ as akstr_
-from arkouda.groupbyclass import GroupBy, groupable
+from arkouda.groupbyclass import GroupBy, _check_key_range, groupable
 from arkouda.numpy.dtypes import DTypes, bigint
 from arkouda.numpy.dtypes import bool_ as ak_bool
 from arkouda.numpy.dtypes import dtype as akdtype
@@ -27,13 +27,14 @@ from arkouda.numpy.dtypes import _datatype_check
 from arkouda.pdarrayclass import all as ak_all
 from arkouda.pdarrayclass import any as ak_any
 from arkouda.pdarrayclass import (
+    _lazy_op,
     argmax,
     broadcast_if_needed,
     create_pdarray,
     pdarray,
     sum,
 )
-from arkouda.pdarraycreation import array, linspace, scalar_array
+from arkouda.pdarraycreation import arange, array, linspace, scalar_array
 from arkouda.sorting import sort
 from arkouda.strings import Strings
 
@@ -248,6 +249,9 @@ def abs(pda: pdarray) -> pdarray:
     >>> ak.abs(ak.linspace(-5,-1,5))
     array([5, 4, 3, 2, 1])
     """
+    deferred = _lazy_op("abs", pda)
+    if deferred is not None:
+        return deferred
     repMsg = generic_msg(
         cmd=f"efunc{pda.ndim}D",
         args={
@@ -585,6 +589,9 @@ def log(pda: pdarray) -> pdarray:
     >>> ak.log(A) / np.log(2)
     array([0, 3.3219280948873626, 6.6438561897747253])
     """
+    deferred = _lazy_op("log", pda)
+    if deferred is not None:
+        return deferred
     repMsg = generic_msg(
         cmd=f"efunc{pda.ndim}D",
         args={
@@ -696,6 +703,9 @@ def exp(pda: pdarray) -> pdarray:
     array([11.84010843172504, 46.454368507659211, 5.5571769623557188,
            33.494295836924771, 13.478894913238722])
     """
+    deferred = _lazy_op("exp", pda)
+    if deferred is not None:
+        return deferred
     repMsg = generic_msg(
         cmd=f"efunc{pda.ndim}D",
         args={
@@ -1317,6 +1327,9 @@ def _trig_helper(pda: pdarray, func: str, where: Union[bool, pdarray] = True) ->
     """
     _datatype_check(pda.dtype, [ak_float64, ak_int64, ak_uint64], func)
     if where is True:
+        deferred = _lazy_op(func, pda)
+        if deferred is not None:
+            return deferred
         repMsg = type_cast(
             str,
             generic_msg(
@@ -1712,6 +1725,9 @@ def where(
                 " both A and B must be an str, Strings, Categorical"
             )
         return _str_cat_where(condition, A, B)
+    deferred = _lazy_op("where", condition, A, B)
+    if deferred is not None:
+        return deferred
     if isinstance(A, pdarray) and isinstance(B, pdarray):
         # TODO: handle shape broadcasting for multidimensional arrays
         repMsg = generic_msg(
@@ -2020,6 +2036,7 @@ def histogramdd(
 @typechecked
 def value_counts(
     pda: pdarray,
+    key_range: Union[Tuple[int, int], None] = None,
 ) -> tuple[groupable, pdarray]:
     """
     Count the occurrences of the unique values of an array.
@@ -2028,6 +2045,10 @@ def value_counts(
     ----------
     pda : pdarray, int64
         The array of values to count
+    key_range : (int, int), optional
+        The smallest and largest value of an int64 or uint64 pda. Giving it
+        counts the values by bin, without grouping pda, as is always done for
+        a bool pda.
 
     Returns
     -------
@@ -2041,6 +2062,8 @@ def value_counts(
     ------
     TypeError
         Raised if the parameter is not a pdarray
+    ValueError
+        Raised if key_range is not an increasing range of int64 values
 
     See Also
     --------
@@ -2049,17 +2072,30 @@ def value_counts(
     Notes
     -----
     This function differs from ``histogram()`` in that it only returns
-    counts for values that are present, leaving out empty "bins". This
-    function delegates all logic to the unique() method where the
-    return_counts parameter is set to True.
+    counts for values that are present, leaving out empty "bins". Unless
+    the values are bool or key_range is given, this function delegates all
+    logic to the unique() method where the return_counts parameter is set to
+    True. Otherwise, the server counts the values of each bin of the range
+    in a single pass over pda, so the range should be small.
 
     Examples
     --------
     >>> A = ak.array([2, 0, 2, 4, 0, 0])
     >>> ak.value_counts(A)
     (array([0, 2, 4]), array([3, 2, 1]))
+    >>> ak.value_counts(A, key_range=(0, 4))
+    (array([0, 2, 4]), array([3, 2, 1]))
     """
-    return GroupBy(pda).size()
+    if key_range is None and pda.dtype == ak_bool:
+        key_range = (0, 1)
+    if key_range is None:
+        return GroupBy(pda).size()
+
+    lo, hi = _check_key_range(key_range)
+    repMsg = generic_msg(cmd="bincount", args={"array": pda, "lo": lo, "hi": hi})
+    counts = create_pdarray(type_cast(str, repMsg))
+    present = counts > 0
+    return arange(lo, hi + 1)[present].astype(pda.dtype), counts[present]
 
 
 @typechecked
@@ -2351,6 +2387,7 @@ def putmask(
 
     Only 1D pdarrays are implemented for now.
     """
+    A._will_modify()
     generic_msg(
         cmd=f"efunc3vv{mask.ndim}D",
         args={
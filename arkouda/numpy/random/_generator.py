@@ -592,6 +592,7 @@ class Generator:
         dtype = to_numpy_dtype(x.dtype)
         name = self._name_dict[to_numpy_dtype(akint64)]
         ndim = len(x.shape)
+        x._will_modify()
         generic_msg(
             cmd=f"shuffle<{dtype.name},{ndim}>",
             args={
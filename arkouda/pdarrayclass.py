@@ -4,12 +4,12 @@ import builtins
 import json
 from functools import reduce
 from math import ceil
-from typing import List, Optional, Sequence, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 from typeguard import typechecked
 
-from arkouda.client import generic_msg
+from arkouda.client import _delete_later, generic_msg
 from arkouda.infoclass import information, pretty_print_information
 from arkouda.logger import getArkoudaLogger
 from arkouda.numpy.dtypes import NUMBER_FORMAT_STRINGS, DTypes, bigint
@@ -72,6 +72,35 @@ __all__ = [
 
 logger = getArkoudaLogger(name="pdarrayclass")
 
+# number of chunk requests kept in flight when streaming an array from the server
+_TRANSFER_CHUNKS_IN_FLIGHT = 4
+
+# installed by arkouda.lazy while a lazy() block is active; called with an operation
+# and its operands, it returns a deferred result or None if the operation runs eagerly
+_lazy_hook: Optional[Callable[..., Optional[pdarray]]] = None
+
+
+def _lazy_op(op: str, *operands) -> Optional[pdarray]:
+    """
+    Record an elementwise operation if a lazy() block is active, returning
+    None when it should be executed eagerly instead.
+    """
+    return None if _lazy_hook is None else _lazy_hook(op, *operands)
+
+
+# installed by arkouda.lazy while recorded expressions may still be pending; called
+# with an array about to be modified in place, it evaluates the expressions that read it
+_write_hook: Optional[Callable[[pdarray], None]] = None
+
+# number of times each server array has been modified in place, through any of
+# its handles, which lets caches of values derived from the array, such as
+# groupby_cache, detect changes; keyed by server name
+_mutation_counts: Dict[str, int] = {}
+
+# statistics of the values of each server array learned from earlier requests,
+# with the mutation count they hold for, keyed by server name; see pdarray._stat
+_array_stats: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
 
 @typechecked
 def parse_single_value(msg: str) -> object:
@@ -356,8 +385,9 @@ class pdarray:
     def __del__(self):
         try:
             logger.debug(f"deleting pdarray with name {self.name}")
-            generic_msg(cmd="delete", args={"name": self.name})
-        except (RuntimeError, AttributeError):
+            _delete_later(self.name)
+            _array_stats.pop(self.name, None)
+        except AttributeError:
             pass
 
     def __bool__(self) -> builtins.bool:
@@ -405,9 +435,51 @@ class pdarray:
     @max_bits.setter
     def max_bits(self, max_bits):
         if self.dtype == bigint:
+            self._will_modify()
             generic_msg(cmd="set_max_bits", args={"array": self, "max_bits": max_bits})
             self._max_bits = max_bits
 
+    def _will_modify(self) -> None:
+        """
+        Note that the array is about to be modified in place on the server,
+        which drops the statistics learned about it and first evaluates the
+        pending lazy expressions that read it.
+        """
+        if _write_hook is not None:
+            _write_hook(self)
+        _mutation_counts[self.name] = self._mutation_count() + 1
+
+    def _mutation_count(self) -> int:
+        # counted by server name, so that writes through another handle, or through
+        # the values array of a wrapper type such as Datetime or IPv4, are seen
+        return _mutation_counts.get(self.name, 0)
+
+    def _stat(self, name: str) -> Any:
+        """
+        A statistic of the values of the array learned from an earlier
+        request, or None if it is not known or the array has been modified in
+        place since.
+
+        The statistics are "sorted" (as returned by is_sorted), "min" and
+        "max" (as returned by min and max) and "nan_count" (the number of NaN
+        values).
+        """
+        stats = _array_stats.get(self.name)
+        if stats is None or stats[0] != self._mutation_count():
+            return None
+        return stats[1].get(name)
+
+    def _set_stat(self, name: str, value: Any) -> None:
+        """
+        Record a statistic of the values of the array, which holds until the
+        array is modified in place.
+        """
+        count = self._mutation_count()
+        stats = _array_stats.get(self.name)
+        if stats is None or stats[0] != count:
+            stats = _array_stats[self.name] = (count, {})
+        stats[1][name] = value
+
     def equals(self, other) -> bool:
         """
         Whether pdarrays are the same size and all entries are equal.
@@ -503,6 +575,9 @@ class pdarray:
             a supported dtype
 
         """
+        deferred = _lazy_op(op, self, other)
+        if deferred is not None:
+            return deferred
         # For pdarray subclasses like ak.Datetime and ak.Timedelta, defer to child logic
         if type(other) is not pdarray and issubclass(type(other), pdarray):
             return NotImplemented
@@ -565,6 +640,9 @@ class pdarray:
             a supported dtype
         """
 
+        deferred = _lazy_op(op, other, self)
+        if deferred is not None:
+            return deferred
         if op not in self.BinOps:
             raise ValueError(f"bad operator {op}")
         # pdarray binop scalar
@@ -766,6 +844,7 @@ class pdarray:
     def opeq(self, other, op):
         if op not in self.OpEqOps:
             raise ValueError(f"bad operator {op}")
+        self._will_modify()
         # pdarray op= pdarray
         if isinstance(other, pdarray):
             if self.shape != other.shape:
@@ -876,7 +955,7 @@ class pdarray:
                     "max_bits": self.max_bits if self.max_bits is not None else 0,
                 },
             )
-            return create_pdarray(repMsg)
+            return _subset_stats(self, create_pdarray(repMsg), stride > 0)
 
         if isinstance(key, tuple):
             # handle None and Ellipsis in the key tuple
@@ -982,7 +1061,7 @@ class pdarray:
                     "idx": key,
                 },
             )
-            return create_pdarray(repMsg)
+            return _subset_stats(self, create_pdarray(repMsg), key.dtype == "bool")
 
         if isinstance(key, slice):
             # handle the arr[:] case
@@ -998,6 +1077,7 @@ class pdarray:
             raise TypeError(f"Unhandled key type: {key} ({type(key)})")
 
     def __setitem__(self, key, value):
+        self._will_modify()
         # convert numpy array value to pdarray value
         if isinstance(value, np.ndarray):
             _value = _to_pdarray(value)
@@ -1235,6 +1315,7 @@ class pdarray:
         TypeError
             Raised if value is not an int, int64, float, or float64
         """
+        self._will_modify()
         cmd = f"set<{self.dtype},{self.ndim}>"
         generic_msg(
             cmd=cmd, args={"array": self, "dtype": self.dtype.name, "val": self.format_other(value)}
@@ -1606,10 +1687,16 @@ class pdarray:
         """
         return rotr(self, other)
 
-    def value_counts(self):
+    def value_counts(self, key_range=None):
         """
         Count the occurrences of the unique values of self.
 
+        Parameters
+        ----------
+        key_range : (int, int), optional
+            The smallest and largest value of self, if it is an integer array
+            with a small range. See ``ak.value_counts``.
+
         Returns
         -------
         unique_values : pdarray
@@ -1625,7 +1712,7 @@ class pdarray:
         """
         from arkouda.numpy import value_counts
 
-        return value_counts(self)
+        return value_counts(self, key_range=key_range)
 
     def astype(self, dtype) -> pdarray:
         """
@@ -1768,11 +1855,17 @@ class pdarray:
             )
         )
 
-    def to_ndarray(self) -> np.ndarray:
+    def to_ndarray(self, datalimit: Optional[int] = None) -> np.ndarray:
         """
         Convert the array to a np.ndarray, transferring array data from the
         Arkouda server to client-side Python. Note: if the pdarray size exceeds
-        client.maxTransferBytes, a RuntimeError is raised.
+        datalimit (client.maxTransferBytes by default), a RuntimeError is raised.
+
+        Parameters
+        ----------
+        datalimit : int, optional
+            The maximum number of bytes to transfer, overriding
+            client.maxTransferBytes for this call
 
         Returns
         -------
@@ -1793,7 +1886,12 @@ class pdarray:
         is running, under the assumption that the server is running on a
         distributed system with much more memory than the client. The user
         may override this limit by setting client.maxTransferBytes to a larger
-        value, but proceed with caution.
+        value, or for a single transfer by passing datalimit, but proceed with caution.
+
+        Arrays larger than ``client.transferChunkBytes`` are streamed from the
+        server in chunks of that size, which are written directly into the
+        returned array, so the client needs little more memory than the array
+        itself.
 
         See Also
         --------
@@ -1809,51 +1907,124 @@ class pdarray:
         >>> type(a.to_ndarray())
         numpy.ndarray
         """
-        from arkouda.client import maxTransferBytes
+        from arkouda.client import _use_shared_memory, maxTransferBytes, transferChunkBytes
 
         dt = dtype(self.dtype)
 
         if dt == bigint:
             # convert uint pdarrays into object ndarrays and recombine
-            arrs = [n.to_ndarray().astype("O") for n in self.bigint_to_uint_arrays()]
+            arrs = [n.to_ndarray(datalimit).astype("O") for n in self.bigint_to_uint_arrays()]
             return builtins.sum(n << (64 * (len(arrs) - i - 1)) for i, n in enumerate(arrs))
 
         # Total number of bytes in the array data
         arraybytes = self.size * self.dtype.itemsize
         # Guard against overflowing client memory
-        if arraybytes > maxTransferBytes:
+        if arraybytes > (maxTransferBytes if datalimit is None else datalimit):
             raise RuntimeError(
                 "Array exceeds allowed size for transfer. Increase client.maxTransferBytes to allow"
             )
-        # The reply from the server will be binary data
-        data = cast(
-            memoryview,
-            generic_msg(
-                cmd=f"tondarray<{self.dtype},{self.ndim}>", args={"array": self}, recv_binary=True
-            ),
-        )
-        # Make sure the received data has the expected length
-        if len(data) != self.size * self.dtype.itemsize:
-            raise RuntimeError(
-                f"Expected {self.size * self.dtype.itemsize} bytes but received {len(data)}"
-            )
-        # The server sends us native-endian data so we need to account for
-        # that. If the view is readonly, copy so the np array is mutable
+        # The server sends us native-endian data so we need to account for that
         if get_server_byteorder() == "big":
             dt = dt.newbyteorder(">")
         else:
             dt = dt.newbyteorder("<")
 
-        if data.readonly:
-            x = np.frombuffer(data, dt).copy()
+        if _use_shared_memory(arraybytes):
+            x = self._to_ndarray_shm(dt)
+        elif arraybytes > transferChunkBytes:
+            x = self._to_ndarray_chunked(dt, transferChunkBytes)
         else:
-            x = np.frombuffer(data, dt)
+            # The reply from the server will be binary data
+            data = cast(
+                memoryview,
+                generic_msg(
+                    cmd=f"tondarray<{self.dtype},{self.ndim}>", args={"array": self}, recv_binary=True
+                ),
+            )
+            # Make sure the received data has the expected length
+            if len(data) != arraybytes:
+                raise RuntimeError(f"Expected {arraybytes} bytes but received {len(data)}")
+            # If the view is readonly, copy so the np array is mutable
+            if data.readonly:
+                x = np.frombuffer(data, dt).copy()
+            else:
+                x = np.frombuffer(data, dt)
 
         if self.ndim == 1:
             return x
         else:
             return x.reshape(self.shape)
 
+    def _to_ndarray_shm(self, dt: np.dtype) -> np.ndarray:
+        """
+        Have the Arkouda server write the array data, in row-major order, to a
+        file in the shared memory directory negotiated by connect() and map it
+        into a np.ndarray without copying. The mapping is private, so the
+        array is writable and the file is removed right away.
+        """
+        import mmap
+        import os
+
+        from arkouda.client import (
+            _create_shared_memory_file,
+            _remove_shared_memory_file,
+            _shared_memory_path,
+        )
+
+        path = _shared_memory_path()
+        try:
+            os.close(_create_shared_memory_file(path))
+            generic_msg(
+                cmd=f"tondarrayShm<{self.dtype},{self.ndim}>", args={"array": self, "path": path}
+            )
+            with open(path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        finally:
+            _remove_shared_memory_file(path)
+        arraybytes = self.size * self.dtype.itemsize
+        if len(data) != arraybytes:
+            raise RuntimeError(f"Expected {arraybytes} bytes but received {len(data)}")
+        return np.frombuffer(data, dt)
+
+    def _to_ndarray_chunked(self, dt: np.dtype, chunkbytes: int) -> np.ndarray:
+        """
+        Transfer the array data from the Arkouda server as a series of chunks
+        of at most chunkbytes bytes, in row-major order, copying each into a
+        preallocated np.ndarray as it arrives. A few chunk requests are kept in
+        flight at once so that the transfer of one chunk overlaps the server
+        preparing the next.
+        """
+        from collections import deque
+
+        from arkouda.client import generic_msg_async
+
+        out = np.empty(self.size, dtype=dt)
+        step = builtins.max(chunkbytes // self.dtype.itemsize, 1)
+        pending: deque = deque()
+
+        def receive() -> None:
+            start, stop, reply = pending.popleft()
+            data = cast(memoryview, reply.result())
+            if len(data) != (stop - start) * self.dtype.itemsize:
+                raise RuntimeError(
+                    f"Expected {(stop - start) * self.dtype.itemsize} bytes but received {len(data)}"
+                )
+            out[start:stop] = np.frombuffer(data, dt)
+
+        for start in range(0, self.size, step):
+            stop = builtins.min(start + step, self.size)
+            reply = generic_msg_async(
+                cmd=f"tondarrayChunk<{self.dtype},{self.ndim}>",
+                args={"array": self, "start": start, "stop": stop},
+                recv_binary=True,
+            )
+            pending.append((start, stop, reply))
+            if len(pending) >= _TRANSFER_CHUNKS_IN_FLIGHT:
+                receive()
+        while pending:
+            receive()
+        return out
+
     def to_list(self) -> List:
         """
         Convert the array to a list, transferring array data from the
@@ -1955,6 +2126,107 @@ class pdarray:
         # Return a numba devicendarray
         return cuda.to_device(self.to_ndarray())
 
+    def to_arrow(self):
+        """
+        Convert the array to a pyarrow Array, transferring array data from the
+        arkouda server to Python. The numpy array received from the server is
+        wrapped by pyarrow without another copy, except for bool arrays, which
+        pyarrow stores as a bitmap.
+
+        Returns
+        -------
+        pyarrow.Array
+            A pyarrow Array with the same data as the pdarray
+
+        Raises
+        ------
+        ValueError
+            Raised if the pdarray is not one-dimensional
+        TypeError
+            Raised if the pdarray has dtype bigint
+        RuntimeError
+            Raised if there is a server-side error thrown, or if the pdarray size
+            exceeds the built-in client.maxTransferBytes size limit
+
+        See Also
+        --------
+        from_arrow, to_ndarray
+
+        Examples
+        --------
+        >>> a = ak.arange(0, 5, 1)
+        >>> a.to_arrow()
+        <pyarrow.lib.Int64Array object at 0x7f8b4c2d1e40>
+        [
+          0,
+          1,
+          2,
+          3,
+          4
+        ]
+        """
+        import pyarrow as pa  # type: ignore
+
+        if self.ndim != 1:
+            raise ValueError("Only one-dimensional pdarrays can be converted to pyarrow")
+        if self.dtype == bigint:
+            raise TypeError("bigint pdarrays cannot be converted to pyarrow")
+        return pa.array(self.to_ndarray())
+
+    @staticmethod
+    def from_arrow(arr) -> pdarray:
+        """
+        Create a pdarray from a pyarrow Array or ChunkedArray of a numeric or
+        bool type, transferring the data to the arkouda server.
+
+        Parameters
+        ----------
+        arr : pyarrow.Array or pyarrow.ChunkedArray
+            The array to transfer
+
+        Returns
+        -------
+        pdarray
+            A pdarray with the same data as arr
+
+        Raises
+        ------
+        TypeError
+            Raised if arr is not of an integer, floating point or bool type
+        ValueError
+            Raised if arr contains nulls, which pdarrays cannot represent
+
+        See Also
+        --------
+        to_arrow, array
+
+        Examples
+        --------
+        >>> import pyarrow as pa
+        >>> ak.pdarray.from_arrow(pa.array([1, 2, 3]))
+        array([1 2 3])
+        """
+        import pyarrow as pa  # type: ignore
+
+        from arkouda.pdarraycreation import array
+
+        if isinstance(arr, pa.ChunkedArray):
+            arr = arr.combine_chunks()
+        if not (
+            pa.types.is_integer(arr.type)
+            or pa.types.is_floating(arr.type)
+            or pa.types.is_boolean(arr.type)
+        ):
+            raise TypeError(f"Unsupported pyarrow type {arr.type}")
+        if arr.null_count > 0:
+            raise ValueError("pdarrays cannot contain null values")
+        values = arr.to_numpy(zero_copy_only=False)
+        if values.dtype.name not in ("int64", "uint64", "uint8", "float64", "bool"):
+            # widen types the server has no arrays of, e.g. int32 or float16
+            kind = values.dtype.kind
+            values = values.astype(np.uint64 if kind == "u" else np.int64 if kind == "i" else np.float64)
+        return cast(pdarray, array(values))
+
     @typechecked
     def to_parquet(
         self,
@@ -2698,11 +2970,29 @@ def is_sorted(pda: pdarray) -> np.bool_:
     RuntimeError
         Raised if there's a server-side error thrown
     """
-    return parse_single_value(
+    cached = pda._stat("sorted")
+    if cached is not None:
+        return cached
+    res = parse_single_value(
         generic_msg(
             cmd=f"reduce->bool{pda.ndim}D", args={"op": "is_sorted", "x": pda, "nAxes": 0, "axis": []}
         )
     )
+    pda._set_stat("sorted", res)
+    return res
+
+
+def _subset_stats(pda: pdarray, subset: pdarray, keeps_order: bool) -> pdarray:
+    """
+    Carry over to subset, which holds some of the values of pda, the
+    statistics of pda it keeps: it is sorted if pda is and keeps_order is
+    true, and it has no NaN values if pda has none.
+    """
+    if keeps_order and pda._stat("sorted"):
+        subset._set_stat("sorted", True)
+    if pda._stat("nan_count") == 0:
+        subset._set_stat("nan_count", 0)
+    return subset
 
 
 # check whether a reduction of the given axes on an 'ndim' dimensional array
@@ -2740,7 +3030,11 @@ def _comon_reduction(pda: pdarray, axis: Optional[Union[int, Tuple[int, ...]]],
     )
 
     if _reduces_to_single_value(axis_, pda.ndim):
-        return parse_single_value(
+        # the minimum and maximum are kept to answer later requests
+        cached = pda._stat(kind) if kind in ("min", "max") else None
+        if cached is not None:
+            return cached
+        res = parse_single_value(
             cast(
                 str,
                 generic_msg(
@@ -2749,6 +3043,9 @@ def _comon_reduction(pda: pdarray, axis: Optional[Union[int, Tuple[int, ...]]],
                 ),
             )
         )
+        if kind in ("min", "max"):
+            pda._set_stat(kind, res)
+        return res
     else:
         return create_pdarray(
             generic_msg(
@@ -3866,6 +4163,10 @@ def sqrt(pda: pdarray, where: Union[bool, pdarray] = True) -> pdarray:
     >>> ak.sqrt(a, ak.sqrt([True, True, False, False, True]))
     array([0, 1, 2, 3, 2])
     """
+    if where is True:
+        deferred = _lazy_op("sqrt", pda)
+        if deferred is not None:
+            return deferred
     return power(pda, 0.5, where)
 
 
@@ -1,11 +1,14 @@
 import itertools
-from typing import Any, Iterable, List, Optional, Tuple, Union, cast
+import json
+import os
+from collections import deque
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
 import numpy as np
 import pandas as pd
 from typeguard import typechecked
 
-from arkouda.client import generic_msg, get_max_array_rank
+from arkouda.client import generic_msg, generic_msg_async, get_max_array_rank
 from arkouda.numpy.dtypes import (
     NUMBER_FORMAT_STRINGS,
     DTypes,
@@ -24,8 +27,8 @@ from arkouda.numpy.dtypes import (
     resolve_scalar_dtype,
 )
 from arkouda.numpy.dtypes import uint64 as akuint64
-from arkouda.pdarrayclass import create_pdarray, pdarray
-from arkouda.strings import Strings
+from arkouda.pdarrayclass import _TRANSFER_CHUNKS_IN_FLIGHT, create_pdarray, pdarray
+from arkouda.strings import Strings, _decode_null_terminated
 
 __all__ = [
     "array",
@@ -188,9 +191,18 @@ def array(
     may override this limit by setting ak.client.maxTransferBytes to a larger value,
     but should proceed with caution.
 
-    If the pdrray or ndarray is of type U, this method is called twice recursively
-    to create the Strings object and the two corresponding pdarrays for string
-    bytes and offsets, respectively.
+    Numeric arrays larger than `ak.client.transferChunkBytes` are streamed to the
+    server in chunks of about that size, without copying the array unless it is
+    not C-contiguous, in which case it is copied one chunk at a time. When
+    connect() has set up the shared memory transport with a server on the same
+    host, arrays of at least `ak.client.sharedMemoryMinBytes` bytes are instead
+    handed to the server through a file in shared memory.
+
+    If the pdrray or ndarray is of type U, the strings are encoded as UTF-8 into
+    a buffer of null-terminated bytes, from which the server computes the
+    offsets of the resulting Strings object. Inputs whose encoding is larger
+    than `ak.client.transferChunkBytes` are encoded and sent in chunks of about
+    that size, so the whole buffer never has to be held by the client.
 
     Examples
     --------
@@ -212,7 +224,7 @@ def array(
         if dtype == bigint and max_bits != -1:
             casted.max_bits = max_bits
         return casted
-    from arkouda.client import maxTransferBytes
+    from arkouda.client import _use_shared_memory, maxTransferBytes, transferChunkBytes
 
     # If a is not already a numpy.ndarray, convert it
     if not isinstance(a, np.ndarray):
@@ -243,27 +255,8 @@ def array(
     # Check if array of strings
     # if a.dtype == numpy.object_ need to check first element
     if "U" in a.dtype.kind or (a.dtype == np.object_ and isinstance(a[0], str)):
-        # encode each string and add a null byte terminator
-        encoded = [i for i in itertools.chain.from_iterable(map(lambda x: x.encode() + b"\x00", a))]
-        nbytes = len(encoded)
-        if nbytes > maxTransferBytes:
-            raise RuntimeError(
-                f"Creating pdarray would require transferring {nbytes} bytes, which exceeds "
-                f"allowed transfer size. Increase ak.client.maxTransferBytes to force."
-            )
-        encoded_np = np.array(encoded, dtype=np.uint8)
-        rep_msg = generic_msg(
-            cmd=f"arraySegString<{encoded_np.dtype.name}>",
-            args={"size": encoded_np.size},
-            payload=_array_memview(encoded_np),
-            send_binary=True,
-        )
-        parts = cast(str, rep_msg).split("+", maxsplit=3)
-        return (
-            Strings.from_parts(parts[0], parts[1])
-            if dtype is None
-            else akcast(Strings.from_parts(parts[0], parts[1]), dtype)
-        )
+        strings = _array_strings(a, maxTransferBytes, transferChunkBytes)
+        return strings if dtype is None else akcast(strings, dtype)
 
     # If not strings, then check that dtype is supported in arkouda
     if dtype == bigint or a.dtype.name not in DTypes:
@@ -291,6 +284,13 @@ def array(
             raise RuntimeError(
                 "Array exceeds allowed transfer size. Increase ak.client.maxTransferBytes to allow"
             )
+        if _use_shared_memory(full_size * a.itemsize):
+            shared = _array_shm(a, ndim)
+            return shared if dtype is None else akcast(shared, dtype)
+        if full_size * a.itemsize > transferChunkBytes:
+            # Stream large arrays to the server in chunks
+            chunked = _array_chunked(a, ndim, transferChunkBytes)
+            return chunked if dtype is None else akcast(chunked, dtype)
         if a.ndim > 1 and a.flags["F_CONTIGUOUS"] and not a.flags["OWNDATA"]:
             # Make a copy if the array was shallow-transposed (to avoid error #3757)
             a_ = a.copy()
@@ -352,6 +352,273 @@ def promote_to_common_dtype(arrays: List[pdarray]) -> Tuple[Any, List[pdarray]]:
     return (akdtype(dt), arrays)
 
 
+def _array_chunked(a: np.ndarray, ndim: int, chunkbytes: int) -> pdarray:
+    """
+    Create a pdarray from a numpy array by transferring it to the Arkouda
+    server as a series of chunks of about chunkbytes bytes, each a slab of
+    whole rows in row-major order. Slabs of C-contiguous arrays are sent
+    without copying; slabs of other arrays (e.g. Fortran-ordered) are made
+    contiguous one at a time instead of copying the whole array. A few
+    chunks are kept in flight at once.
+    """
+    result = create_pdarray(
+        generic_msg(cmd=f"create<{a.dtype.name},{ndim}>", args={"shape": tuple(a.shape)})
+    )
+    rowsize = a.size // a.shape[0]
+    step = max(chunkbytes // (rowsize * a.itemsize), 1)
+    pending: deque = deque()
+    for i in range(0, a.shape[0], step):
+        pending.append(
+            generic_msg_async(
+                cmd=f"arrayChunk<{a.dtype.name},{ndim}>",
+                args={"array": result, "start": i * rowsize},
+                payload=_array_memview(np.ascontiguousarray(a[i : i + step])),
+                send_binary=True,
+            )
+        )
+        if len(pending) >= _TRANSFER_CHUNKS_IN_FLIGHT:
+            pending.popleft().result()
+    while pending:
+        pending.popleft().result()
+    return result
+
+
+def _array_shm(a: np.ndarray, ndim: int) -> pdarray:
+    """
+    Create a pdarray from a numpy array by writing its data, in row-major
+    order, to a file in the shared memory directory negotiated by connect()
+    for the Arkouda server to read, instead of sending it over the socket.
+    """
+    from arkouda.client import (
+        _create_shared_memory_file,
+        _remove_shared_memory_file,
+        _shared_memory_path,
+    )
+
+    path = _shared_memory_path()
+    try:
+        with os.fdopen(_create_shared_memory_file(path), "wb") as f:
+            f.write(_array_memview(np.ascontiguousarray(a)))
+        rep_msg = generic_msg(
+            cmd=f"arrayShm<{a.dtype.name},{ndim}>", args={"shape": tuple(a.shape), "path": path}
+        )
+    finally:
+        _remove_shared_memory_file(path)
+    return create_pdarray(rep_msg)
+
+
+def _encode_strings(strs: List[str]) -> np.ndarray:
+    """
+    Encode a list of str as UTF-8 into a uint8 array of null-terminated bytes,
+    with a single join and encode rather than a Python loop over the strings.
+    """
+    if not strs:
+        return np.empty(0, dtype=np.uint8)
+    return np.frombuffer(("\x00".join(strs) + "\x00").encode(), dtype=np.uint8)
+
+
+def _strings_from_reply(rep_msg) -> Strings:
+    parts = cast(str, rep_msg).split("+", maxsplit=3)
+    return Strings.from_parts(parts[0], parts[1])
+
+
+def _encoded_string_chunks(a: np.ndarray, chunkbytes: int) -> Iterator[np.ndarray]:
+    """
+    Encode the strings of a, a one-dimensional numpy array of str, as by
+    _encode_strings, in chunks of at most chunkbytes bytes split between
+    strings, or of a single string if it is longer on its own.
+
+    The strings are encoded in batches holding at most chunkbytes characters,
+    each at least one byte, and each batch is split at the real byte offsets
+    of its strings, given by their null terminators, so that the chunks stay
+    within chunkbytes however long the strings are encoded.
+    """
+    # the end offset of each string in characters, counting its terminator
+    ends = np.cumsum(np.fromiter(map(len, a), dtype=np.int64, count=a.size) + 1)
+    start = 0
+    while start < a.size:
+        base = ends[start - 1] if start > 0 else 0
+        stop = max(int(np.searchsorted(ends, base + chunkbytes, side="right")), start + 1)
+        encoded = _encode_strings(a[start:stop].tolist())
+        offsets = np.flatnonzero(encoded == 0) + 1
+        lo = 0
+        while lo < encoded.size:
+            k = int(np.searchsorted(offsets, lo + chunkbytes, side="right"))
+            if k == 0 or offsets[k - 1] <= lo:
+                # a single string longer than chunkbytes
+                k = int(np.searchsorted(offsets, lo, side="right")) + 1
+            hi = int(offsets[k - 1])
+            yield encoded[lo:hi]
+            lo = hi
+        start = stop
+
+
+def _array_strings(a: np.ndarray, max_bytes: int, chunkbytes: int) -> Strings:
+    """
+    Create a Strings object from a one-dimensional numpy array of str.
+
+    The strings are encoded in chunks of at most chunkbytes bytes, as by
+    _encoded_string_chunks, and each chunk is sent as it is encoded with a
+    few kept in flight at once. A single chunk is sent as one message;
+    several are concatenated on the server.
+    """
+    chunks = _encoded_string_chunks(a, chunkbytes)
+    first = next(chunks, np.empty(0, dtype=np.uint8))
+    second = next(chunks, None)
+    if second is None:
+        if first.size > max_bytes:
+            raise RuntimeError(
+                f"Creating pdarray would require transferring {first.size} bytes, which "
+                f"exceeds allowed transfer size. Increase ak.client.maxTransferBytes to force."
+            )
+        rep_msg = generic_msg(
+            cmd=f"arraySegString<{first.dtype.name}>",
+            args={"size": first.size},
+            payload=_array_memview(first),
+            send_binary=True,
+        )
+        return _strings_from_reply(rep_msg)
+
+    parts: List[Strings] = []
+    pending: deque = deque()
+    nbytes = 0
+    for encoded in itertools.chain([first, second], chunks):
+        nbytes += encoded.size
+        if nbytes > max_bytes:
+            raise RuntimeError(
+                f"Creating pdarray would require transferring more than {max_bytes} bytes, "
+                f"which exceeds allowed transfer size. Increase ak.client.maxTransferBytes "
+                f"to force."
+            )
+        pending.append(
+            generic_msg_async(
+                cmd=f"arraySegString<{encoded.dtype.name}>",
+                args={"size": encoded.size},
+                payload=_array_memview(encoded),
+                send_binary=True,
+            )
+        )
+        if len(pending) >= _TRANSFER_CHUNKS_IN_FLIGHT:
+            parts.append(_strings_from_reply(pending.popleft().result()))
+    while pending:
+        parts.append(_strings_from_reply(pending.popleft().result()))
+    from arkouda.pdarraysetops import concatenate
+
+    return cast(Strings, concatenate(parts))
+
+
+# dtypes of the arrays that arrayMany and tondarrayMany transfer
+_MANY_DTYPES = ("int64", "uint64", "float64", "bool")
+
+
+def _array_many(arrays: List[np.ndarray]) -> List[Union[pdarray, Strings]]:
+    """
+    Create a pdarray or Strings object from each of several numpy arrays.
+
+    One-dimensional numeric and str arrays smaller than transferChunkBytes are
+    sent together, back to back in the payload of as few arrayMany messages as
+    possible, each holding about transferChunkBytes of data. Other arrays are
+    sent one at a time by array().
+    """
+    from arkouda.client import transferChunkBytes
+
+    results: List[Optional[Union[pdarray, Strings]]] = [None] * len(arrays)
+    batch: List[Tuple[int, str, np.ndarray]] = []
+
+    def send() -> None:
+        rep_msg = generic_msg(
+            cmd="arrayMany",
+            args={"dtypes": [dt for _, dt, _ in batch], "sizes": [buf.nbytes for _, _, buf in batch]},
+            payload=memoryview(b"".join(_array_memview(buf) for _, _, buf in batch)),
+            send_binary=True,
+        )
+        for (i, dt, _), msg in zip(batch, json.loads(cast(str, rep_msg))):
+            results[i] = Strings.from_return_msg(msg) if dt == "str" else create_pdarray(msg)
+        batch.clear()
+
+    nbytes = 0
+    for i, a in enumerate(arrays):
+        if a.ndim != 1 or a.nbytes >= transferChunkBytes:
+            results[i] = array(a)
+            continue
+        if a.dtype.name in _MANY_DTYPES:
+            dt, buf = a.dtype.name, a
+        elif a.size > 0 and ("U" in a.dtype.kind or (a.dtype == np.object_ and isinstance(a[0], str))):
+            dt, buf = "str", _encode_strings(a.tolist())
+        else:
+            results[i] = array(a)
+            continue
+        if batch and nbytes + buf.nbytes > transferChunkBytes:
+            send()
+            nbytes = 0
+        batch.append((i, dt, buf))
+        nbytes += buf.nbytes
+    if batch:
+        send()
+    return cast(List[Union[pdarray, Strings]], results)
+
+
+def _to_ndarray_many(arrays: List[Union[pdarray, Strings]]) -> List[Optional[np.ndarray]]:
+    """
+    Transfer several one-dimensional pdarrays and Strings objects from the
+    server into numpy arrays, those smaller than transferChunkBytes together,
+    back to back in the replies of as few tondarrayMany messages as possible.
+
+    The result holds None for each array that is not transferred this way,
+    such as pdarray subclasses, multi-dimensional or large arrays, which the
+    caller should convert with their own to_ndarray.
+    """
+    from arkouda.client import transferChunkBytes
+
+    results: List[Optional[np.ndarray]] = [None] * len(arrays)
+    batch: List[Tuple[int, Union[pdarray, Strings], int]] = []
+
+    def receive() -> None:
+        rep_msg = generic_msg(
+            cmd="tondarrayMany",
+            args={
+                "names": [a.entry.name if isinstance(a, Strings) else a.name for _, a, _ in batch],
+                "objTypes": [a.objType for _, a, _ in batch],
+            },
+            recv_binary=True,
+        )
+        data = cast(memoryview, rep_msg)
+        if len(data) != sum(n for _, _, n in batch):
+            raise RuntimeError("Received the wrong number of bytes for the arrays")
+        start = 0
+        for i, a, n in batch:
+            if isinstance(a, Strings):
+                strings = _decode_null_terminated(np.frombuffer(data, np.uint8, n, start), int(a.size))
+                results[i] = np.array(strings) if strings else np.empty(0, dtype="<U1")
+            else:
+                # The server sends us native-endian data
+                dt = np.dtype(a.dtype.name).newbyteorder(">" if get_server_byteorder() == "big" else "<")
+                x = np.frombuffer(data, dt, a.size, start)
+                # If the view is readonly, copy so the np array is mutable
+                results[i] = x.copy() if data.readonly else x
+            start += n
+        batch.clear()
+
+    nbytes = 0
+    for i, a in enumerate(arrays):
+        if isinstance(a, Strings):
+            n = int(a.nbytes)
+        elif type(a) is pdarray and a.ndim == 1 and a.dtype.name in _MANY_DTYPES:
+            n = int(a.size * a.itemsize)
+        else:
+            continue
+        if n >= transferChunkBytes:
+            continue
+        if batch and nbytes + n > transferChunkBytes:
+            receive()
+            nbytes = 0
+        batch.append((i, a, n))
+        nbytes += n
+    if batch:
+        receive()
+    return results
+
+
 def _array_memview(a) -> memoryview:
     if (get_byteorder(a.dtype) == "<" and get_server_byteorder() == "big") or (
         get_byteorder(a.dtype) == ">" and get_server_byteorder() == "little"
@@ -925,7 +1192,7 @@ def arange(*args, **kwargs) -> pdarray:
         repMsg = generic_msg(
             cmd="arange", args={"start": start, "stop": stop, "stride": stride, "dtype": arg_dtype}
         )
-        return cast(
+        aran = cast(
             pdarray,
             (
                 create_pdarray(repMsg, max_bits=max_bits)
@@ -933,6 +1200,13 @@ def arange(*args, **kwargs) -> pdarray:
                 else array(create_pdarray(repMsg), max_bits=max_bits, dtype=dtype)
             ),
         )
+        if aran.dtype in (akint64, akuint64):
+            # the order and bounds of the values are known without asking the server
+            aran._set_stat("sorted", stride > 0 or aran.size <= 1)
+            if stride > 0 and aran.size > 0:
+                aran._set_stat("min", aran.dtype.type(start))
+                aran._set_stat("max", aran.dtype.type(int(start) + (aran.size - 1) * int(stride)))
+        return aran
     else:
         raise TypeError(
             f"start,stop,stride must be type int, np.int64, or np.uint64 {start} {stop} {stride}"
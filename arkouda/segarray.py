@@ -67,9 +67,6 @@ class SegArray:
     objType = "SegArray"
 
     def __init__(self, segments, values, lengths=None, grouping=None):
-        self.logger = getArkoudaLogger(name=__class__.__name__)
-        self.registered_name: Optional[str] = None
-
         # validate inputs
         if not isinstance(segments, pdarray) or segments.dtype != akint64:
             raise TypeError("Segments must be int64 pdarray")
@@ -83,6 +80,12 @@ class SegArray:
         elif values.size > 0:
             raise ValueError("Cannot have non-empty values with empty segments")
 
+        self._init_parts(segments, values, lengths, grouping)
+
+    def _init_parts(self, segments, values, lengths=None, grouping=None) -> None:
+        self.logger = getArkoudaLogger(name=self.__class__.__name__)
+        self.registered_name: Optional[str] = None
+
         # references to supporting pdarrays
         self.values = values
         self.segments = segments
@@ -90,26 +93,21 @@ class SegArray:
         self.valsize = values.size
         self.dtype = values.dtype
 
-        if lengths is None:
-            self.lengths = self._get_lengths()
-        else:
-            self.lengths = lengths
-
-        self._non_empty = self.lengths > 0
-        self._non_empty_count = self._non_empty.sum()
+        # the lengths, non-empty mask and grouping are computed when first used
+        self._lengths = lengths
+        self._non_empty: Optional[pdarray] = None
+        self._non_empty_count: Optional[int] = None
+        self._grouping = grouping
 
-        # grouping object computation. (This will need to be moved to the server)
-        # GroupBy computation left here because of lack of server obj. May need to move in Future
-        if grouping is None:
-            if self.size == 0 or self._non_empty_count == 0:
-                self._grouping = GroupBy(zeros(0, dtype=akint64))
-            else:
-                # Treat each sub-array as a group, for grouped aggregations
-                self._grouping = GroupBy(
-                    broadcast(self.segments[self.non_empty], arange(self._non_empty_count), self.valsize)
-                )
-        else:
-            self._grouping = grouping
+    @classmethod
+    def _from_trusted_parts(cls, segments, values, lengths=None, grouping=None) -> SegArray:
+        """
+        Construct a SegArray from parts produced by the server, or otherwise
+        known to be valid, without validating them.
+        """
+        segarr = cls.__new__(cls)
+        segarr._init_parts(segments, values, lengths, grouping)
+        return segarr
 
     @classmethod
     def from_return_msg(cls, rep_msg) -> SegArray:
@@ -124,7 +122,7 @@ class SegArray:
         )
         segments = create_pdarray(eles["segments"])
         lengths = create_pdarray(eles["lengths"]) if "lengths" in eles else None
-        return cls(segments, values, lengths=lengths)
+        return cls._from_trusted_parts(segments, values, lengths=lengths)
 
     @classmethod
     def from_parts(cls, segments, values, lengths=None, grouping=None) -> SegArray:
@@ -190,27 +188,46 @@ class SegArray:
                 newvals[offsets[j] : (offsets[j] + sizes[j])] = m[j]
             return cls(array(offsets), newvals)
 
+    @property
+    def lengths(self) -> pdarray:
+        if self._lengths is None:
+            self._lengths = self._get_lengths()
+        return self._lengths
+
     @property
     def non_empty(self):
         from arkouda.infoclass import list_symbol_table
 
-        if self._non_empty.name not in list_symbol_table():
+        if self._non_empty is None or self._non_empty.name not in list_symbol_table():
             self._non_empty = self.lengths > 0
-            self._non_empty_count = self._non_empty.sum()
+            self._non_empty_count = None
         return self._non_empty
 
+    def _get_non_empty_count(self) -> int:
+        if self._non_empty_count is None:
+            self._non_empty_count = int(self.non_empty.sum())
+        return self._non_empty_count
+
     @property
     def grouping(self):
         if self._grouping is not None:
             return self._grouping
 
-        if self.size == 0 or self._non_empty_count == 0:
+        if self.size == 0 or self._get_non_empty_count() == 0:
             self._grouping = GroupBy(zeros(0, dtype=akint64))
         else:
-            # Treat each sub-array as a group, for grouped aggregations
+            # Treat each non-empty sub-array as a group, for grouped aggregations.
+            # The values of each group are already contiguous and in order, so
+            # the grouping is built from the segments without sorting
+            segs = self.segments[self.non_empty]
             self._grouping = GroupBy(
-                broadcast(self.segments[self.non_empty], arange(self._non_empty_count), self.valsize)
+                orig_keys=broadcast(segs, arange(segs.size), self.valsize),
+                permutation=arange(self.valsize),
+                segments=segs,
+                uki=segs,
+                assume_sorted=True,
             )
+        return self._grouping
 
     @property
     def nbytes(self):
@@ -242,7 +259,7 @@ class SegArray:
             starts = self.segments[i]
             ends = starts + self.lengths[i]
             newsegs, inds, lengths = gen_ranges(starts, ends, return_lengths=True)
-            return SegArray(newsegs, self.values[inds], lengths)
+            return SegArray._from_trusted_parts(newsegs, self.values[inds], lengths)
         else:
             raise TypeError(f"Invalid index type: {type(i)}")
 
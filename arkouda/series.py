@@ -25,7 +25,7 @@ from arkouda.pdarrayclass import (
     pdarray,
 )
 from arkouda.pdarraycreation import arange, array, full, zeros
-from arkouda.pdarraysetops import argsort, concatenate, in1d, indexof1d
+from arkouda.pdarraysetops import argsort, concatenate, in1d
 from arkouda.segarray import SegArray
 from arkouda.strings import Strings
 from arkouda.util import get_callback, is_float
@@ -260,12 +260,14 @@ class Series:
                 raise TypeError(
                     "Unexpected key type. Received Strings but expected {}".format(self.index.dtype)
                 )
-            if any(~in1d(key, self.index.values)):
-                raise KeyError("{} not in index".format(key[~in1d(key, self.index.values)]))
+            missing = self.index._find(key) < 0
+            if missing.any():
+                raise KeyError("{} not in index".format(key[missing]))
         elif isinstance(key, pdarray):
             if key.dtype == self.index.dtype:
-                if any(~in1d(key, self.index.values)):
-                    raise KeyError("{} not in index".format(key[~in1d(key, self.index.values)]))
+                missing = self.index._find(key) < 0
+                if missing.any():
+                    raise KeyError("{} not in index".format(key[missing]))
             elif key.dtype == "bool_":
                 if key.size != self.index.size:
                     raise IndexError(
@@ -317,7 +319,7 @@ class Series:
         if key.dtype == "bool_":
             # boolean array indexes without sorting
             return Series(index=self.index[key], data=self.values[key])
-        indices = indexof1d(key, self.index.values)
+        indices = self.index._indexof(key)
         if len(indices) == 1:
             return self.values[indices[0]]
         else:
@@ -400,7 +402,7 @@ class Series:
         if is_supported_scalar(key):
             indices = self.index == key
         else:
-            indices = in1d(self.index.values, key)
+            indices = self.index.lookup(key)
         tf, counts = GroupBy(indices).size()
         update_count = counts[1] if len(counts) == 2 else 0
         if update_count == 0:
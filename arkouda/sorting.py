@@ -254,4 +254,8 @@ def sort(pda: pdarray, algorithm: SortingAlgorithm = SortingAlgorithm.RadixSortL
         cmd=f"sort<{pda.dtype.name},{pda.ndim}>",
         args={"alg": algorithm.name, "array": pda, "axis": axis},
     )
-    return create_pdarray(cast(str, repMsg))
+    sorted_pda = create_pdarray(cast(str, repMsg))
+    if sorted_pda.ndim == 1 and sorted_pda.dtype != float64:
+        # NaN values would make the sorted float64 array fail is_sorted
+        sorted_pda._set_stat("sorted", True)
+    return sorted_pda
@@ -6,7 +6,7 @@ from typing import List, Optional, Sequence, Union, cast
 import numpy as np
 from typeguard import typechecked
 
-from arkouda.client import generic_msg
+from arkouda.client import _delete_later, generic_msg
 from arkouda.dtypes import NumericDTypes, dtype, int_scalars
 from arkouda.logger import getArkoudaLogger
 from arkouda.pdarrayclass import create_pdarrays, pdarray
@@ -74,8 +74,8 @@ class sparray:
     def __del__(self):
         try:
             logger.debug(f"deleting sparray with name {self.name}")
-            generic_msg(cmd="delete", args={"name": self.name})
-        except (RuntimeError, AttributeError):
+            _delete_later(self.name)
+        except AttributeError:
             pass
 
     def __bool__(self) -> builtins.bool:
@@ -2131,19 +2131,9 @@ class Strings:
         >>> type(a.to_ndarray())
         numpy.ndarray
         """
-        # Get offsets and append total bytes for length calculation
-        npoffsets = np.hstack((self._comp_to_ndarray("offsets"), np.array([self.nbytes])))
-        # Get contents of strings (will error if too large)
-        npvalues = self._comp_to_ndarray("values")
-        # Compute lengths, discounting null terminators
-        lengths = np.diff(npoffsets) - 1
+        strings = self._decode_values()
         # Numpy dtype is based on max string length
-        dt = f"<U{lengths.max() if len(lengths) > 0 else 1}"
-        res = np.empty(self.size, dtype=dt)
-        # Form a string from each segment and store in numpy array
-        for i, (o, l) in enumerate(zip(npoffsets, lengths)):
-            res[i] = np.str_(codecs.decode(b"".join(npvalues[o : o + l])))
-        return res
+        return np.array(strings) if strings else np.empty(0, dtype="<U1")
 
     def to_list(self) -> list:
         """
@@ -2178,7 +2168,139 @@ class Strings:
         >>> type(a.to_list())
         list
         """
-        return self.to_ndarray().tolist()
+        return self._decode_values()
+
+    def to_arrow(self):
+        """
+        Convert the array to a pyarrow LargeStringArray, transferring the string
+        bytes from the arkouda server to Python without building Python strings.
+
+        Arkouda stores strings as a buffer of null-terminated UTF-8 bytes, which
+        maps onto Arrow's layout of bytes plus int64 offsets once the
+        terminators are removed, so the conversion is a few vectorized passes
+        over the buffer.
+
+        Returns
+        -------
+        pyarrow.LargeStringArray
+            A pyarrow array with the same strings as this array
+
+        Raises
+        ------
+        RuntimeError
+            Raised if there is a server-side error thrown, or if the number of
+            bytes exceeds the built-in client.maxTransferBytes size limit
+
+        See Also
+        --------
+        from_arrow, to_ndarray
+
+        Examples
+        --------
+        >>> a = ak.array(["hello", "my", "world"])
+        >>> a.to_arrow().to_pylist()
+        ['hello', 'my', 'world']
+        """
+        import pyarrow as pa  # type: ignore
+
+        values = self._comp_to_ndarray("values")
+        terminators = values == 0
+        ends = np.flatnonzero(terminators)
+        if ends.size != self.size:
+            raise RuntimeError(f"Expected {self.size} strings but received {ends.size}")
+        offsets = np.zeros(self.size + 1, dtype=np.int64)
+        # each string ends at its terminator, less the terminators before it
+        offsets[1:] = ends - np.arange(self.size)
+        data = values[~terminators]
+        return pa.LargeStringArray.from_buffers(
+            self.size, pa.py_buffer(offsets), pa.py_buffer(data)
+        )
+
+    @staticmethod
+    def from_arrow(arr) -> Strings:
+        """
+        Create a Strings object from a pyarrow string or large_string Array or
+        ChunkedArray, transferring the data to the arkouda server.
+
+        The Arrow bytes are copied into arkouda's null-terminated layout with
+        vectorized numpy operations and sent as two numeric arrays, so no
+        Python strings are built.
+
+        Parameters
+        ----------
+        arr : pyarrow.Array or pyarrow.ChunkedArray
+            The strings to transfer
+
+        Returns
+        -------
+        Strings
+            A Strings object with the same strings as arr
+
+        Raises
+        ------
+        TypeError
+            Raised if arr is not of type string or large_string
+        ValueError
+            Raised if arr contains nulls or strings containing null characters,
+            which Strings cannot represent
+
+        See Also
+        --------
+        to_arrow, array
+
+        Examples
+        --------
+        >>> import pyarrow as pa
+        >>> ak.Strings.from_arrow(pa.array(["hello", "my", "world"]))
+        array(['hello', 'my', 'world'])
+        """
+        import pyarrow as pa  # type: ignore
+
+        from arkouda.pdarraycreation import array
+
+        if isinstance(arr, pa.ChunkedArray):
+            arr = arr.combine_chunks()
+        offset_dtype: type
+        if pa.types.is_large_string(arr.type):
+            offset_dtype = np.int64
+        elif pa.types.is_string(arr.type):
+            offset_dtype = np.int32
+        else:
+            raise TypeError(f"Unsupported pyarrow type {arr.type}")
+        if arr.null_count > 0:
+            raise ValueError("Strings cannot contain null values")
+        size = len(arr)
+        if size == 0:
+            return cast(Strings, array(np.empty(0, dtype="<U1")))
+        _, offset_buffer, data_buffer = arr.buffers()
+        offsets = np.frombuffer(offset_buffer, dtype=offset_dtype)[arr.offset : arr.offset + size + 1]
+        first, last = int(offsets[0]), int(offsets[-1])
+        offsets = offsets.astype(np.int64) - first
+        if data_buffer is None:
+            data = np.empty(0, dtype=np.uint8)
+        else:
+            data = np.frombuffer(data_buffer, dtype=np.uint8)[first:last]
+        if (data == 0).any():
+            raise ValueError("Strings cannot contain null characters")
+
+        # every string is followed by a terminator, shifting the later strings
+        starts = offsets[:-1] + np.arange(size)
+        values = np.zeros(data.size + size, dtype=np.uint8)
+        isdata = np.ones(values.size, dtype=bool)
+        isdata[starts + np.diff(offsets)] = False
+        values[isdata] = data
+        return Strings.from_parts(cast(pdarray, array(starts)), cast(pdarray, array(values)))
+
+    def _decode_values(self) -> List[str]:
+        """
+        Transfer the string bytes from the server and decode them into a list
+        of Python strings. Every string in the values buffer is followed by a
+        null terminator, so the whole buffer is decoded at once and split at
+        the terminators instead of decoding each string separately, and the
+        offsets do not need to be transferred at all.
+        """
+        # Get contents of strings (will error if too large)
+        return _decode_null_terminated(self._comp_to_ndarray("values"), int(self.size))
 
     def _comp_to_ndarray(self, comp: str) -> np.ndarray:
         """
@@ -2883,3 +3005,16 @@ class Strings:
             cmd="sendArray",
             args={"values": self.entry, "hostname": hostname, "port": port, "objType": "strings"},
         )
+
+
+def _decode_null_terminated(values: np.ndarray, size: int) -> List[str]:
+    """
+    Decode a buffer of null-terminated UTF-8 strings, as transferred from the
+    server, into a list of Python strings with a single decode and split.
+    """
+    strings = codecs.decode(values.data, "utf_8").split("\x00")
+    # The final terminator leaves an empty string after the last split
+    strings.pop()
+    if len(strings) != size:
+        raise RuntimeError(f"Expected {size} strings but received {len(strings)}")
+    return strings
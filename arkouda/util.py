@@ -188,6 +188,7 @@ def register(obj, name):
 
 @typechecked
 def attach(name: str):
+    from arkouda.alignment import IntervalIndex
     from arkouda.dataframe import DataFrame
     from arkouda.index import Index, MultiIndex
     from arkouda.pdarrayclass import pdarray
@@ -222,6 +223,8 @@ def attach(name: str):
         rtn_obj = Series.from_return_msg(rep_msg["create"])
     elif rep_msg["objType"].lower() == BitVector.special_objType.lower():
         rtn_obj = BitVector.from_return_msg(rep_msg["create"])
+    elif rep_msg["objType"].lower() == IntervalIndex.objType.lower():
+        rtn_obj = IntervalIndex.from_return_msg(rep_msg["create"])
 
     if rtn_obj is not None:
         rtn_obj.registered_name = name
@@ -573,15 +576,28 @@ def map(
     import numpy as np
 
     from arkouda import Series, array, broadcast, full
-    from arkouda.pdarraysetops import in1d
+    from arkouda.numpy import where
+    from arkouda.pdarraysetops import concatenate, in1d
+
+    if isinstance(mapping, dict):
+        mapping = Series([array(list(mapping.keys())), array(list(mapping.values()))])
+
+    if isinstance(mapping, Series) and isinstance(mapping.values, (pdarray, Strings)):
+        # look every value up in the hash index of the mapping, which the
+        # index keeps for later lookups, instead of grouping the values
+        idx = mapping.index._hash_lookup(values, "first")
+        if idx is not None:
+            mvals = mapping.values
+            if isinstance(mvals, Strings):
+                missing = array(["null"])
+            else:
+                missing = full(1, np.nan, mvals.dtype)
+            return concatenate([mvals, missing])[where(idx >= 0, idx, mvals.size)]
 
     keys = values
     gb = GroupBy(keys, dropna=False)
     gb_keys = gb.unique_keys
 
-    if isinstance(mapping, dict):
-        mapping = Series([array(list(mapping.keys())), array(list(mapping.values()))])
-
     if isinstance(mapping, Series):
         xtra_keys = gb_keys[in1d(gb_keys, mapping.index.values, invert=True)]
 
@@ -0,0 +1,56 @@
+import arkouda as ak
+import pytest
+
+SECONDS = pytest.trials
+FORMATS = ("json", "binary")
+
+
+def _encode(fmt):
+    return ak.client._binary_args_to_str if fmt == "binary" else ak.client._json_args_to_str
+
+
+@pytest.mark.skip_correctness_only(True)
+@pytest.mark.benchmark(group="Argument_Encoding", max_time=SECONDS)
+@pytest.mark.parametrize("fmt", FORMATS)
+def bench_encode_args(benchmark, fmt):
+    a = ak.arange(10)
+    args = {"op": "+", "a": a, "value": 1, "names": [a.name] * 4, "flag": True}
+    benchmark(_encode(fmt), args)
+
+    benchmark.extra_info["description"] = (
+        f"Measures the client-side cost of encoding typical command arguments as {fmt}"
+    )
+    benchmark.extra_info["problem_size"] = "N/A"
+    benchmark.extra_info["transfer_rate"] = (
+        f"{benchmark.stats['rounds'] / benchmark.stats['total']:.4f} operations per second"
+    )
+
+
+@pytest.mark.skip_correctness_only(True)
+@pytest.mark.benchmark(group="Argument_Encoding_Round_Trip", max_time=SECONDS)
+@pytest.mark.parametrize("fmt", FORMATS)
+def bench_round_trip_args(benchmark, fmt):
+    if fmt == "binary" and not ak.client.get_config().get("binaryArguments", False):
+        pytest.skip("server does not support the binary argument format")
+
+    a = ak.arange(10)
+    args = {"array": a, "idx": 3}
+    cmd = f"[int]<{a.dtype},1>"
+
+    def run():
+        ak.client.generic_msg(cmd=cmd, args=args)
+
+    binary_args = ak.client.binaryArgs
+    ak.client.binaryArgs = fmt == "binary"
+    try:
+        benchmark(run)
+    finally:
+        ak.client.binaryArgs = binary_args
+
+    benchmark.extra_info["description"] = (
+        f"Measures the round-trip time of a small command with arguments sent as {fmt}"
+    )
+    benchmark.extra_info["problem_size"] = "N/A"
+    benchmark.extra_info["transfer_rate"] = (
+        f"{benchmark.stats['rounds'] / benchmark.stats['total']:.4f} operations per second"
+    )
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import arkouda as ak
+
+NUM_COLUMNS = 200
+
+
+def _generate_pandas_dataframe():
+    np.random.seed(pytest.seed)
+    N = max(pytest.prob_size // NUM_COLUMNS, 1)
+    data = {}
+    for i in range(NUM_COLUMNS):
+        if i % 3 == 0:
+            data[f"c_{i}"] = np.random.randint(0, 2**32, N)
+        elif i % 3 == 1:
+            data[f"c_{i}"] = np.random.random(N)
+        else:
+            data[f"c_{i}"] = np.random.randint(0, 1000, N).astype(str)
+    return pd.DataFrame(data)
+
+
+@pytest.mark.skip_correctness_only(True)
+@pytest.mark.benchmark(group="Dataframe_Pandas")
+@pytest.mark.parametrize("direction", ["from_pandas", "to_pandas"])
+def bench_dataframe_pandas(benchmark, direction):
+    """
+    Measures the performance of converting a wide DataFrame to and from pandas
+    """
+    pd_df = _generate_pandas_dataframe()
+    if direction == "from_pandas":
+        benchmark.pedantic(ak.DataFrame.from_pandas, args=(pd_df,), rounds=pytest.trials)
+    else:
+        ak_df = ak.DataFrame.from_pandas(pd_df)
+        benchmark.pedantic(ak_df.to_pandas, rounds=pytest.trials)
+    benchmark.extra_info["description"] = (
+        f"Measures the performance of DataFrame.{direction} with {NUM_COLUMNS} columns"
+    )
+    benchmark.extra_info["problem_size"] = pytest.prob_size
+
+
+@pytest.mark.skip_correctness_only(False)
+def check_correctness():
+    pd_df = _generate_pandas_dataframe()
+    ak_df = ak.DataFrame.from_pandas(pd_df)
+    pd.testing.assert_frame_equal(pd_df, ak_df.to_pandas())
@@ -4,6 +4,7 @@ import pytest
 # mixed used for groupby of str and int64
 TYPES = ["int64", "bigint", "str", "mixed"]
 NUM_ARR = [1, 2, 8, 16]
+METHODS = ["sort", "hash"]
 
 
 def generate_arrays(dtype, numArrays):
@@ -41,12 +42,15 @@ def generate_arrays(dtype, numArrays):
 @pytest.mark.benchmark(group="GroupBy_Creation")
 @pytest.mark.parametrize("numArrays", NUM_ARR)
 @pytest.mark.parametrize("dtype", TYPES)
-def bench_groupby(benchmark, numArrays, dtype):
+@pytest.mark.parametrize("method", METHODS)
+def bench_groupby(benchmark, numArrays, dtype, method):
     if dtype in pytest.dtype:
         arrays, totalbytes = generate_arrays(dtype, numArrays)
-        benchmark.pedantic(ak.GroupBy, args=[arrays], rounds=pytest.trials)
+        benchmark.pedantic(ak.GroupBy, args=[arrays], kwargs={"method": method}, rounds=pytest.trials)
 
-        benchmark.extra_info["description"] = "Measures the performance of ak.GroupBy"
+        benchmark.extra_info["description"] = (
+            f"Measures the performance of ak.GroupBy with method={method}"
+        )
         benchmark.extra_info["problem_size"] = pytest.prob_size
         benchmark.extra_info["transfer_rate"] = "{:.4f} GiB/sec".format(
             (totalbytes / benchmark.stats["mean"]) / 2 ** 30)
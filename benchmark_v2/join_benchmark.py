@@ -0,0 +1,118 @@
+import arkouda as ak
+import pytest
+
+TYPES = ("int64", "str")
+METHODS = ("sort", "hash")
+HOWS = ("inner", "left", "outer", "semi")
+MAXSTRLEN = 8
+# rows of the dimension table joined to the fact table
+DIM_ROWS = 2**12
+
+
+def generate_keys(dtype):
+    cfg = ak.get_config()
+    N = pytest.prob_size * cfg["numLocales"]
+    right_seed = None if pytest.seed is None else pytest.seed + 1
+    # the right side is half the size of the left, over the same key range
+    if dtype == "str":
+        left = ak.random_strings_uniform(1, MAXSTRLEN, N, characters="numeric", seed=pytest.seed)
+        right = ak.random_strings_uniform(1, MAXSTRLEN, N // 2, characters="numeric", seed=right_seed)
+        nbytes = left.size * 8 + left.nbytes + right.size * 8 + right.nbytes
+    else:
+        left = ak.randint(0, N, N, seed=pytest.seed)
+        right = ak.randint(0, N, N // 2, seed=right_seed)
+        nbytes = left.size * left.itemsize + right.size * right.itemsize
+    return left, right, nbytes
+
+
+@pytest.mark.skip_correctness_only(True)
+@pytest.mark.benchmark(group="Join_Inner")
+@pytest.mark.parametrize("dtype", TYPES)
+@pytest.mark.parametrize("method", METHODS)
+def bench_inner_join(benchmark, dtype, method):
+    """
+    Measures the performance of ak.join.inner_join with the sort and hash methods
+    """
+    if dtype in pytest.dtype:
+        left, right, nbytes = generate_keys(dtype)
+        benchmark.pedantic(
+            ak.join.inner_join, args=(left, right), kwargs={"method": method}, rounds=pytest.trials
+        )
+
+        benchmark.extra_info["description"] = (
+            f"Measures the performance of ak.join.inner_join with method={method}"
+        )
+        benchmark.extra_info["problem_size"] = pytest.prob_size
+        benchmark.extra_info["transfer_rate"] = "{:.4f} GiB/sec".format(
+            (nbytes / benchmark.stats["mean"]) / 2 ** 30)
+
+
+@pytest.mark.skip_correctness_only(True)
+@pytest.mark.benchmark(group="Join_Hash")
+@pytest.mark.parametrize("dtype", TYPES)
+@pytest.mark.parametrize("how", HOWS)
+def bench_hash_join(benchmark, dtype, how):
+    """
+    Measures the performance of ak.hash_join for each type of join
+    """
+    if dtype in pytest.dtype:
+        left, right, nbytes = generate_keys(dtype)
+        benchmark.pedantic(ak.hash_join, args=(left, right), kwargs={"how": how}, rounds=pytest.trials)
+
+        benchmark.extra_info["description"] = f"Measures the performance of ak.hash_join with how={how}"
+        benchmark.extra_info["problem_size"] = pytest.prob_size
+        benchmark.extra_info["transfer_rate"] = "{:.4f} GiB/sec".format(
+            (nbytes / benchmark.stats["mean"]) / 2 ** 30)
+
+
+@pytest.mark.skip_correctness_only(True)
+@pytest.mark.benchmark(group="Join_Broadcast")
+@pytest.mark.parametrize("broadcast", (False, True))
+def bench_dimension_join(benchmark, broadcast):
+    """
+    Measures the performance of ak.hash_join of a large fact table with a
+    small dimension table, shuffling both or broadcasting the dimension table
+    """
+    cfg = ak.get_config()
+    N = pytest.prob_size * cfg["numLocales"]
+    fact = ak.randint(0, 2 * DIM_ROWS, N, seed=pytest.seed)
+    dim = ak.arange(DIM_ROWS)
+    nbytes = fact.size * fact.itemsize + dim.size * dim.itemsize
+    benchmark.pedantic(
+        ak.hash_join, args=(fact, dim), kwargs={"broadcast": broadcast}, rounds=pytest.trials
+    )
+
+    benchmark.extra_info["description"] = (
+        f"Measures the performance of ak.hash_join with a small right side and broadcast={broadcast}"
+    )
+    benchmark.extra_info["problem_size"] = pytest.prob_size
+    benchmark.extra_info["transfer_rate"] = "{:.4f} GiB/sec".format(
+        (nbytes / benchmark.stats["mean"]) / 2 ** 30)
+
+
+@pytest.mark.skip_correctness_only(False)
+@pytest.mark.parametrize("dtype", TYPES)
+@pytest.mark.parametrize("how", HOWS)
+def check_correctness(dtype, how):
+    if dtype == "str":
+        left = ak.array([str(i) for i in range(10)])
+        right = ak.array(["3", "5", "3", "11"])
+    else:
+        left = ak.arange(10)
+        right = ak.array([3, 5, 3, 11])
+    expected = {
+        "inner": ([3, 3, 5], [0, 2, 1]),
+        "left": ([0, 1, 2, 3, 3, 4, 5, 6, 7, 8, 9], [-1, -1, -1, 0, 2, -1, 1, -1, -1, -1, -1]),
+        "outer": (
+            [0, 1, 2, 3, 3, 4, 5, 6, 7, 8, 9, -1],
+            [-1, -1, -1, 0, 2, -1, 1, -1, -1, -1, -1, 3],
+        ),
+        "semi": [3, 5],
+    }[how]
+    for broadcast in False, True:
+        res = ak.hash_join(left, right, how=how, broadcast=broadcast)
+        if how == "semi":
+            assert res.to_list() == expected
+        else:
+            assert (res[0].to_list(), res[1].to_list()) == expected
+        assert ak.join.inner_join(left, right, method="hash")[0].to_list() == [3, 3, 5]
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import arkouda as ak
+
+OPS = ("to_ndarray", "to_list")
+
+
+def _generate_strings():
+    return ak.random_strings_uniform(
+        minlen=1, maxlen=16, size=pytest.prob_size, seed=pytest.seed, characters="printable"
+    )
+
+
+@pytest.mark.skip_correctness_only(True)
+@pytest.mark.benchmark(group="StringTransfer_download")
+@pytest.mark.parametrize("op", OPS)
+def bench_str_transfer_download(benchmark, op):
+    s = _generate_strings()
+    nb = s.nbytes
+    ak.client.maxTransferBytes = max(nb, s.size * 8)
+
+    benchmark.pedantic(getattr(s, op), rounds=pytest.trials)
+    benchmark.extra_info["description"] = f"Measures the performance of Strings.{op}"
+    benchmark.extra_info["problem_size"] = pytest.prob_size
+    benchmark.extra_info["transfer_rate"] = "{:.4f} GiB/sec".format(
+        (nb / benchmark.stats["mean"]) / 2**30
+    )
+
+
+@pytest.mark.skip_correctness_only(True)
+@pytest.mark.benchmark(group="StringTransfer_upload")
+def bench_str_transfer_upload(benchmark):
+    strings = _generate_strings().to_ndarray()
+    nb = sum(len(x.encode()) + 1 for x in strings)
+    ak.client.maxTransferBytes = max(nb, strings.size * 8)
+
+    benchmark.pedantic(ak.array, args=(strings,), rounds=pytest.trials)
+    benchmark.extra_info["description"] = "Measures the performance of ak.array on a numpy str array"
+    benchmark.extra_info["problem_size"] = pytest.prob_size
+    benchmark.extra_info["transfer_rate"] = "{:.4f} GiB/sec".format(
+        (nb / benchmark.stats["mean"]) / 2**30
+    )
+
+
+@pytest.mark.skip_correctness_only(False)
+@pytest.mark.parametrize("op", OPS)
+def check_correctness(op):
+    strings = ["", "a", "héllo", "wörld", "日本語", "x" * 100]
+    s = ak.array(strings)
+    result = getattr(s, op)()
+    assert list(result) == strings
+    if op == "to_ndarray":
+        assert np.array_equal(result, np.array(strings))
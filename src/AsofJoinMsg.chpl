@@ -0,0 +1,259 @@
+/* as-of joins
+
+ matches each row of a left table with the right row whose key is nearest to
+ it in a given direction, optionally among the right rows with equal "by"
+ keys. Both sides must be sorted by key, so the matches are found by merging
+ sorted runs: without "by" keys each locale merges its block of the left side
+ with the slice of the right side its keys span, and with "by" keys the rows
+ are shuffled by the hash of their "by" keys, so that each group is merged on
+ one locale
+ */
+module AsofJoinMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use AryUtil;
+    use CommAggregation;
+    use ArkoudaSortCompat only sort;
+    use Unique;
+    use UniqueMsg;
+    use HashJoinMsg;
+
+    param BACKWARD = 0;
+    param FORWARD = 1;
+    param NEAREST = 2;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const ajLogger = new Logger(logLevel, logChannel);
+
+    /*
+    The last position in lo..<hi of the sorted array a whose value is at most
+    x, or lo-1 if there is none.
+    */
+    proc lastAtOrBefore(const ref a: [] ?t, lo: int, hi: int, x: t): int {
+        var l = lo, r = hi;
+        while l < r {
+            const mid = l + (r - l) / 2;
+            if a[mid] <= x then l = mid + 1; else r = mid;
+        }
+        return l - 1;
+    }
+
+    /*
+    The first position in lo..<hi of the sorted array a whose value is at
+    least x, or hi if there is none.
+    */
+    proc firstAtOrAfter(const ref a: [] ?t, lo: int, hi: int, x: t): int {
+        var l = lo, r = hi;
+        while l < r {
+            const mid = l + (r - l) / 2;
+            if a[mid] < x then l = mid + 1; else r = mid;
+        }
+        return l;
+    }
+
+    /*
+    The position in lo..<hi of the sorted array a that x is matched with in
+    the given direction and within the tolerance, if there is one, or -1.
+    Ties between a backward and a forward match go to the backward one.
+    */
+    proc asofMatch(const ref a: [] ?t, lo: int, hi: int, x: t,
+                   direction: int, hasTolerance: bool, tolerance: t): int {
+        const b = if direction != FORWARD then lastAtOrBefore(a, lo, hi, x) else lo - 1;
+        const f = if direction != BACKWARD then firstAtOrAfter(a, lo, hi, x) else hi;
+        var k = -1;
+        if b >= lo && f < hi {
+            k = if x - a[b] <= a[f] - x then b else f;
+        } else if b >= lo {
+            k = b;
+        } else if f < hi {
+            k = f;
+        }
+        if k != -1 && hasTolerance {
+            const dist = if a[k] <= x then x - a[k] else a[k] - x;
+            if dist > tolerance then k = -1;
+        }
+        return k;
+    }
+
+    /*
+    As-of join of sorted left and right keys, without "by" keys. Each locale
+    copies the slice of the right keys that can match its block of the left
+    keys and matches its left keys in it.
+
+    :returns: the index of the right row each left row is matched with, or -1
+    */
+    proc asofSorted(lOn: [?lD] ?t, rOn: [?rD] t, direction: int,
+                    hasTolerance: bool, tolerance: t) throws {
+        overMemLimit(lD.size * numBytes(int) + rD.size * numBytes(t));
+        var res = makeDistArray(lD, int);
+        res = -1;
+        const m = rD.size;
+        if m == 0 then return res;
+        coforall loc in Locales with (ref res) {
+            on loc {
+                const myD = lOn.localSubdomain();
+                if myD.size > 0 {
+                    const xMin = lOn.localAccess[myD.low], xMax = lOn.localAccess[myD.high];
+                    // the right keys just before xMin and just after xMax are
+                    // the farthest any of the block's keys can be matched with
+                    const lo = max(firstAtOrAfter(rOn, 0, m, xMin) - 1, 0);
+                    const hi = min(lastAtOrBefore(rOn, 0, m, xMax) + 2, m);
+                    const slice: [lo..<hi] t = rOn[lo..<hi];
+                    forall i in myD with (ref res) {
+                        res.localAccess[i] = asofMatch(slice, lo, hi, lOn.localAccess[i],
+                                                       direction, hasTolerance, tolerance);
+                    }
+                }
+            }
+        }
+        return res;
+    }
+
+    /*
+    As-of join of sorted left and right keys among the rows with equal "by"
+    keys. The rows are shuffled by the hash of their "by" keys, and the right
+    rows each locale owns are sorted by (hash, index), which leaves the keys
+    of each group sorted, since the right keys are sorted.
+
+    :returns: the index of the right row each left row is matched with, or -1
+    */
+    proc asofGrouped(lOn: [?lD] ?t, rOn: [?rD] t, lHashes: [] 2*uint, rHashes: [] 2*uint,
+                     direction: int, hasTolerance: bool, tolerance: t) throws {
+        // local copies of the owned rows and their keys
+        overMemLimit(lD.size * (3 * numBytes(uint) + numBytes(int) + numBytes(t))
+                     + rD.size * (3 * numBytes(uint) + numBytes(t)));
+        var res = makeDistArray(lD, int);
+        res = -1;
+        const (lShuffled, lStarts) = hashShuffle(lHashes);
+        const (rShuffled, rStarts) = hashShuffle(rHashes);
+        coforall loc in Locales with (ref res) {
+            on loc {
+                const lLow = lStarts[loc.id], lHigh = lStarts[loc.id+1];
+                const rLow = rStarts[loc.id], rHigh = rStarts[loc.id+1];
+                if lHigh > lLow && rHigh > rLow {
+                    const probe: [0..#(lHigh-lLow)] 3*uint = lShuffled[lLow..<lHigh];
+                    var build: [0..#(rHigh-rLow)] 3*uint = rShuffled[rLow..<rHigh];
+                    sort(build);
+                    var buildOn: [build.domain] t;
+                    forall (row, v) in zip(build, buildOn) with (var agg = newSrcAggregator(t)) {
+                        const (_, _, j) = row;
+                        agg.copy(v, rOn[j: int]);
+                    }
+                    var probeOn: [probe.domain] t;
+                    forall (row, v) in zip(probe, probeOn) with (var agg = newSrcAggregator(t)) {
+                        const (_, _, i) = row;
+                        agg.copy(v, lOn[i: int]);
+                    }
+                    forall (row, x) in zip(probe, probeOn) with (var agg = newDstAggregator(int)) {
+                        const (hi, lo, i) = row;
+                        const (first, last) = hashRange(build, (hi, lo));
+                        const k = asofMatch(buildOn, first, last, x, direction, hasTolerance, tolerance);
+                        if k != -1 {
+                            const (_, _, j) = build[k];
+                            agg.copy(res[i: int], j: int);
+                        }
+                    }
+                }
+            }
+        }
+        return res;
+    }
+
+    /*
+     * As-of join of the sorted int64 or float64 keys left and right, replying
+     * with the index of the right row each left row is matched with, or -1.
+     * direction is "backward", "forward" or "nearest" and, if has_tolerance
+     * is true, matches farther than tolerance from the left key are dropped.
+     * If nby is not 0, rows are only matched with rows whose "by" key
+     * columns, given as for hashJoinMsg, are equal.
+     */
+    proc mergeAsofMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const pn = Reflection.getRoutineName();
+        const directionStr = msgArgs.getValueOf("direction");
+        const hasTolerance = msgArgs.get("has_tolerance").getBoolValue();
+        const nby = msgArgs.get("nby").getIntValue();
+        const direction = if directionStr == "backward" then BACKWARD
+                          else if directionStr == "forward" then FORWARD
+                          else if directionStr == "nearest" then NEAREST
+                          else -1;
+        if direction == -1 {
+            const errorMsg = incompatibleArgumentsError(pn, "unknown direction %s".format(directionStr));
+            ajLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if nby > 128 {
+          throw new owned ErrorWithContext("Cannot hash more than 128 arrays",
+                                           getLineNumber(),
+                                           getRoutineName(),
+                                           getModuleName(),
+                                           "ArgumentError");
+        }
+        const lg: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("left"), st);
+        const rg: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("right"), st);
+        if lg.dtype != rg.dtype {
+            const errorMsg = notImplementedError(pn, lg.dtype, "asof", rg.dtype);
+            ajLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        proc asofHelper(type t, tolerance: t): MsgTuple throws {
+            const ref lOn = toSymEntry(lg, t).a;
+            const ref rOn = toSymEntry(rg, t).a;
+            if !isSorted(lOn) || !isSorted(rOn) {
+                const errorMsg = incompatibleArgumentsError(pn, "left and right keys must be sorted");
+                ajLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+            var res: [lOn.domain] int;
+            if nby == 0 {
+                res = asofSorted(lOn, rOn, direction, hasTolerance, tolerance);
+            } else {
+                var (lSize, _, _, _, _, lNames, lTypes) = validateArraysSameLength(nby,
+                    msgArgs.get("leftbynames").getList(nby), msgArgs.get("leftbytypes").getList(nby), st);
+                var (rSize, _, _, _, _, rNames, rTypes) = validateArraysSameLength(nby,
+                    msgArgs.get("rightbynames").getList(nby), msgArgs.get("rightbytypes").getList(nby), st);
+                if lSize != lOn.size || rSize != rOn.size {
+                    throw new owned ErrorWithContext("by keys must be the same size as the on keys",
+                                                     getLineNumber(),
+                                                     getRoutineName(),
+                                                     getModuleName(),
+                                                     "ArgumentError");
+                }
+                res = asofGrouped(lOn, rOn, hashArrays(lSize, lNames, lTypes, st),
+                                  hashArrays(rSize, rNames, rTypes, st),
+                                  direction, hasTolerance, tolerance);
+            }
+            const resName = st.nextName();
+            st.addEntry(resName, createSymEntry(res));
+            const repMsg = "created " + st.attrib(resName);
+            ajLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+            return new MsgTuple(repMsg, MsgType.NORMAL);
+        }
+
+        select lg.dtype {
+            when DType.Int64 {
+                return asofHelper(int, if hasTolerance then msgArgs.get("tolerance").getIntValue() else 0);
+            }
+            when DType.Float64 {
+                return asofHelper(real, if hasTolerance then msgArgs.get("tolerance").getRealValue() else 0.0);
+            }
+            otherwise {
+                const errorMsg = notImplementedError(pn, lg.dtype: string);
+                ajLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+    }
+
+    use CommandMap;
+    registerFunction("mergeAsof", mergeAsofMsg, getModuleName());
+}
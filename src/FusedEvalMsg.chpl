@@ -0,0 +1,338 @@
+module FusedEvalMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use NumPyDType;
+    use BinOp only floorDivisionHelper, modHelper;
+    use Math;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const feLogger = new Logger(logLevel, logChannel);
+
+    /* Number of elements each task evaluates an expression over at a time */
+    config const fusedEvalBlockSize = 1024;
+
+    // node kinds; bool nodes are held as 0/1 in the integer buffers
+    param KIND_INT = 0;
+    param KIND_REAL = 1;
+    param KIND_BOOL = 2;
+
+    // node operations
+    param OP_ARRAY = 0;
+    param OP_CONST = 1;
+    param OP_CAST = 2;
+    param OP_ADD = 3;
+    param OP_SUB = 4;
+    param OP_MUL = 5;
+    param OP_DIV = 6;
+    param OP_FLOORDIV = 7;
+    param OP_MOD = 8;
+    param OP_POW = 9;
+    param OP_AND = 10;
+    param OP_OR = 11;
+    param OP_XOR = 12;
+    param OP_LT = 13;
+    param OP_GT = 14;
+    param OP_LE = 15;
+    param OP_GE = 16;
+    param OP_EQ = 17;
+    param OP_NE = 18;
+    param OP_ABS = 19;
+    param OP_LOG = 20;
+    param OP_EXP = 21;
+    param OP_SQRT = 22;
+    param OP_SIN = 23;
+    param OP_COS = 24;
+    param OP_WHERE = 25;
+
+    private proc opCode(op: string): int throws {
+        select op {
+            when "array" do return OP_ARRAY;
+            when "const" do return OP_CONST;
+            when "cast" do return OP_CAST;
+            when "+" do return OP_ADD;
+            when "-" do return OP_SUB;
+            when "*" do return OP_MUL;
+            when "/" do return OP_DIV;
+            when "//" do return OP_FLOORDIV;
+            when "%" do return OP_MOD;
+            when "**" do return OP_POW;
+            when "&" do return OP_AND;
+            when "|" do return OP_OR;
+            when "^" do return OP_XOR;
+            when "<" do return OP_LT;
+            when ">" do return OP_GT;
+            when "<=" do return OP_LE;
+            when ">=" do return OP_GE;
+            when "==" do return OP_EQ;
+            when "!=" do return OP_NE;
+            when "abs" do return OP_ABS;
+            when "log" do return OP_LOG;
+            when "exp" do return OP_EXP;
+            when "sqrt" do return OP_SQRT;
+            when "sin" do return OP_SIN;
+            when "cos" do return OP_COS;
+            when "where" do return OP_WHERE;
+        }
+        throw new owned IllegalArgumentError("Unsupported fused operation: %s".format(op));
+    }
+
+    private proc kindCode(kind: string): int throws {
+        select kind {
+            when "int64" do return KIND_INT;
+            when "float64" do return KIND_REAL;
+            when "bool" do return KIND_BOOL;
+        }
+        throw new owned IllegalArgumentError("Unsupported fused dtype: %s".format(kind));
+    }
+
+    private inline proc isArithOp(op: int): bool do return op >= OP_ADD && op <= OP_XOR;
+    private inline proc isCompareOp(op: int): bool do return op >= OP_LT && op <= OP_NE;
+    private inline proc isRealFunc(op: int): bool do return op >= OP_LOG && op <= OP_COS;
+
+    // integer semantics follow binopvv: division and modulo by zero give 0
+    private inline proc intOp(op: int, x: int, y: int): int {
+        select op {
+            when OP_ADD do return x + y;
+            when OP_SUB do return x - y;
+            when OP_MUL do return x * y;
+            when OP_FLOORDIV do return if y != 0 then x / y else 0;
+            when OP_MOD do return if y != 0 then x % y else 0;
+            when OP_AND do return x & y;
+            when OP_OR do return x | y;
+            otherwise do return x ^ y;
+        }
+    }
+
+    private inline proc realOp(op: int, x: real, y: real): real {
+        select op {
+            when OP_ADD do return x + y;
+            when OP_SUB do return x - y;
+            when OP_MUL do return x * y;
+            when OP_DIV do return x / y;
+            when OP_FLOORDIV do return floorDivisionHelper(x, y);
+            when OP_MOD do return modHelper(x, y);
+            otherwise do return x ** y;
+        }
+    }
+
+    private inline proc compareOp(op: int, x, y): int {
+        select op {
+            when OP_LT do return (x < y):int;
+            when OP_GT do return (x > y):int;
+            when OP_LE do return (x <= y):int;
+            when OP_GE do return (x >= y):int;
+            when OP_EQ do return (x == y):int;
+            otherwise do return (x != y):int;
+        }
+    }
+
+    private inline proc realFunc(op: int, x: real): real {
+        select op {
+            when OP_LOG do return log(x);
+            when OP_EXP do return exp(x);
+            when OP_SQRT do return sqrt(x);
+            when OP_SIN do return sin(x);
+            otherwise do return cos(x);
+        }
+    }
+
+    /*
+      Evaluate an elementwise expression DAG in a single pass over its inputs.
+
+      The expression is a topologically ordered list of nodes given as parallel
+      lists: ``ops`` and ``kinds`` hold each node's operation and dtype, and
+      ``lhs``, ``rhs`` and ``third`` hold the indices of its operands. For
+      ``array`` nodes ``lhs`` indexes ``names`` and for ``const`` nodes it
+      indexes ``values``. The last node is the result.
+
+      The operands of an arithmetic, comparison or ``where`` node must share
+      a dtype (integer and bool count as one), so the client inserts ``cast``
+      nodes where promotion to float64 is needed.
+
+      Each task evaluates the DAG over blocks of ``fusedEvalBlockSize``
+      elements of its locale's portion of the arrays, so only the result array
+      is allocated in distributed memory.
+    */
+    proc fusedEvalMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const opNames = msgArgs["ops"].toScalarList(string),
+              kindNames = msgArgs["kinds"].toScalarList(string),
+              lhsList = msgArgs["lhs"].toScalarList(int),
+              rhsList = msgArgs["rhs"].toScalarList(int),
+              thirdList = msgArgs["third"].toScalarList(int),
+              names = msgArgs["names"].toScalarList(string),
+              values = msgArgs["values"].toScalarList(string),
+              size = msgArgs["size"].toScalar(int);
+
+        const nNodes = opNames.size;
+        if nNodes == 0 || kindNames.size != nNodes || lhsList.size != nNodes ||
+           rhsList.size != nNodes || thirdList.size != nNodes {
+            const errorMsg = "Malformed fused expression with %i nodes".format(nNodes);
+            feLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+
+        var codes, kinds, lhs, rhs, third: [0..<nNodes] int;
+        var intConsts: [0..<nNodes] int;
+        var realConsts: [0..<nNodes] real;
+        var intLeaves: [0..<nNodes] borrowed SymEntry(int, 1)?;
+        var realLeaves: [0..<nNodes] borrowed SymEntry(real, 1)?;
+        var boolLeaves: [0..<nNodes] borrowed SymEntry(bool, 1)?;
+
+        proc isOperand(n: int, i: int): bool do return 0 <= i && i < n;
+        proc isRealNode(i: int): bool do return kinds[i] == KIND_REAL;
+
+        for n in 0..<nNodes {
+            codes[n] = opCode(opNames[n]);
+            kinds[n] = kindCode(kindNames[n]);
+            lhs[n] = lhsList[n];
+            rhs[n] = rhsList[n];
+            third[n] = thirdList[n];
+            const (c, a, b) = (codes[n], lhs[n], rhs[n]);
+
+            var valid = true;
+            if c == OP_ARRAY {
+                valid = 0 <= a && a < names.size;
+                if valid {
+                    const g = getGenericTypedArrayEntry(names[a], st);
+                    valid = g.size == size && g.ndim == 1;
+                    if kinds[n] == KIND_INT && g.dtype == DType.Int64 then
+                        intLeaves[n] = toSymEntry(g, int);
+                    else if kinds[n] == KIND_REAL && g.dtype == DType.Float64 then
+                        realLeaves[n] = toSymEntry(g, real);
+                    else if kinds[n] == KIND_BOOL && g.dtype == DType.Bool then
+                        boolLeaves[n] = toSymEntry(g, bool);
+                    else
+                        valid = false;
+                }
+            } else if c == OP_CONST {
+                valid = 0 <= a && a < values.size;
+                if valid {
+                    if isRealNode(n) then realConsts[n] = values[a]:real;
+                                     else intConsts[n] = values[a]:int;
+                }
+            } else if c == OP_CAST {
+                valid = isOperand(n, a) && isRealNode(n) && !isRealNode(a);
+            } else if isArithOp(c) {
+                valid = isOperand(n, a) && isOperand(n, b) && isRealNode(a) == isRealNode(b) &&
+                        isRealNode(n) == isRealNode(a);
+                if isRealNode(n) then valid &&= c < OP_AND;
+                               else valid &&= c != OP_DIV && c != OP_POW;
+            } else if isCompareOp(c) {
+                valid = isOperand(n, a) && isOperand(n, b) && isRealNode(a) == isRealNode(b) &&
+                        kinds[n] == KIND_BOOL;
+            } else if c == OP_ABS {
+                valid = isOperand(n, a) && isRealNode(n) == isRealNode(a);
+            } else if isRealFunc(c) {
+                valid = isOperand(n, a) && isRealNode(n) && isRealNode(a);
+            } else {
+                valid = isOperand(n, a) && isOperand(n, b) && isOperand(n, third[n]) &&
+                        !isRealNode(a) && isRealNode(b) == isRealNode(third[n]) &&
+                        isRealNode(n) == isRealNode(b);
+            }
+
+            if !valid {
+                const errorMsg = "Invalid fused expression node %i: %s".format(n, opNames[n]);
+                feLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return MsgTuple.error(errorMsg);
+            }
+        }
+
+        proc evaluate(ref ea: [?D] ?t) {
+            const B = max(1, fusedEvalBlockSize);
+            coforall loc in Locales with (ref ea) do on loc {
+                // local copies of the program so tasks never go remote for it
+                const lCodes = codes, lKinds = kinds, lLhs = lhs, lRhs = rhs, lThird = third,
+                      lIntConsts = intConsts, lRealConsts = realConsts;
+                const myDom = ea.localSubdomain();
+                const nBlocks = (myDom.size + B - 1) / B;
+
+                forall blk in 0..<nBlocks with (var ibuf: [0..<nNodes, 0..<B] int,
+                                                 var rbuf: [0..<nNodes, 0..<B] real) {
+                    const base = myDom.low + blk * B;
+                    const len = min(B, myDom.high + 1 - base);
+                    for n in 0..<nNodes {
+                        const (c, a, b) = (lCodes[n], lLhs[n], lRhs[n]);
+                        const r = lKinds[n] == KIND_REAL;
+                        if c == OP_ARRAY {
+                            select lKinds[n] {
+                                when KIND_INT {
+                                    const ref la = intLeaves[n]!.a;
+                                    for j in 0..<len do ibuf[n, j] = la[base + j];
+                                }
+                                when KIND_REAL {
+                                    const ref la = realLeaves[n]!.a;
+                                    for j in 0..<len do rbuf[n, j] = la[base + j];
+                                }
+                                otherwise {
+                                    const ref la = boolLeaves[n]!.a;
+                                    for j in 0..<len do ibuf[n, j] = la[base + j]:int;
+                                }
+                            }
+                        } else if c == OP_CONST {
+                            if r then for j in 0..<len do rbuf[n, j] = lRealConsts[n];
+                                 else for j in 0..<len do ibuf[n, j] = lIntConsts[n];
+                        } else if c == OP_CAST {
+                            for j in 0..<len do rbuf[n, j] = ibuf[a, j]:real;
+                        } else if isArithOp(c) {
+                            if r then for j in 0..<len do rbuf[n, j] = realOp(c, rbuf[a, j], rbuf[b, j]);
+                                 else for j in 0..<len do ibuf[n, j] = intOp(c, ibuf[a, j], ibuf[b, j]);
+                        } else if isCompareOp(c) {
+                            if lKinds[a] == KIND_REAL
+                                then for j in 0..<len do ibuf[n, j] = compareOp(c, rbuf[a, j], rbuf[b, j]);
+                                else for j in 0..<len do ibuf[n, j] = compareOp(c, ibuf[a, j], ibuf[b, j]);
+                        } else if c == OP_ABS {
+                            if r then for j in 0..<len do rbuf[n, j] = abs(rbuf[a, j]);
+                                 else for j in 0..<len do ibuf[n, j] = abs(ibuf[a, j]);
+                        } else if isRealFunc(c) {
+                            for j in 0..<len do rbuf[n, j] = realFunc(c, rbuf[a, j]);
+                        } else {
+                            const e = lThird[n];
+                            if r then for j in 0..<len do rbuf[n, j] = if ibuf[a, j] != 0 then rbuf[b, j] else rbuf[e, j];
+                                 else for j in 0..<len do ibuf[n, j] = if ibuf[a, j] != 0 then ibuf[b, j] else ibuf[e, j];
+                        }
+                    }
+
+                    const last = nNodes - 1;
+                    for j in 0..<len {
+                        if t == real then ea[base + j] = rbuf[last, j];
+                        else if t == bool then ea[base + j] = ibuf[last, j] != 0;
+                        else ea[base + j] = ibuf[last, j];
+                    }
+                }
+            }
+        }
+
+        select kinds[nNodes - 1] {
+            when KIND_REAL {
+                overMemLimit(numBytes(real) * size);
+                var e = createSymEntry(size, real);
+                evaluate(e.a);
+                return st.insert(e);
+            }
+            when KIND_BOOL {
+                overMemLimit(numBytes(bool) * size);
+                var e = createSymEntry(size, bool);
+                evaluate(e.a);
+                return st.insert(e);
+            }
+            otherwise {
+                overMemLimit(numBytes(int) * size);
+                var e = createSymEntry(size, int);
+                evaluate(e.a);
+                return st.insert(e);
+            }
+        }
+    }
+
+    use CommandMap;
+    registerFunction("fusedEval", fusedEvalMsg, getModuleName());
+}
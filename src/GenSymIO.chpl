@@ -43,6 +43,39 @@ module GenSymIO {
         return st.insert(new shared SymEntry(makeArrayFromBytes(msgArgs.payload, shape, array_dtype)));
     }
 
+    /*
+     * Writes the payload into the elements [start, start+n) of an existing
+     * pdarray, in row-major order, so that large arrays can be transferred
+     * from the client in a series of bounded-size chunks
+     */
+    @arkouda.instantiateAndRegister
+    proc arrayChunk(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab, type array_dtype, param array_nd: int): MsgTuple throws
+        where array_dtype != bigint
+    {
+        const array = st[msgArgs["array"]]: borrowed SymEntry(array_dtype, array_nd),
+              start = msgArgs["start"].toScalar(int),
+              n = msgArgs.payload.size / typeSize(array_dtype);
+
+        if msgArgs.payload.size % typeSize(array_dtype) != 0 || start < 0 || start + n > array.size {
+            const errorMsg = "Invalid chunk of %i bytes at %i for array with %i elements"
+                             .format(msgArgs.payload.size, start, array.size);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+
+        gsLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "dtype: %? start: %? n: %?".format(array_dtype:string,start,n));
+
+        var localA = makeArrayFromPtr(msgArgs.payload.c_str():c_ptr(void):c_ptr(array_dtype), num_elts=n:uint);
+        if array_nd == 1 {
+            array.a[start..#n] = localA;
+        } else {
+            forall (i, a) in zip(localA.domain, localA) with (var agg = newDstAggregator(array_dtype)) do
+                agg.copy(array.a[array.a.domain.orderToIndex(start + i)], a);
+        }
+        return MsgTuple.success();
+    }
+
     proc makeArrayFromBytes(ref payload: bytes, shape: ?N*int, type t): [] t throws {
         var size = 1;
         for s in shape do size *= s;
@@ -132,6 +165,282 @@ module GenSymIO {
         return MsgTuple.payload(bytes.createAdoptingBuffer(ptr:c_ptr(uint(8)), size, size));
     }
 
+    /*
+     * Outputs the elements [start, stop) of the pdarray, in row-major order,
+     * as a Chapel Bytes object so that large arrays can be transferred to
+     * the client in a series of bounded-size chunks
+     */
+    @arkouda.instantiateAndRegister
+    proc tondarrayChunk(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab, type array_dtype, param array_nd: int): MsgTuple throws
+        where array_dtype != bigint
+    {
+        const array = st[msgArgs["array"]]: borrowed SymEntry(array_dtype, array_nd),
+              start = msgArgs["start"].toScalar(int),
+              stop = msgArgs["stop"].toScalar(int);
+
+        if start < 0 || stop > array.size || start > stop {
+            const errorMsg = "Invalid chunk [%i, %i) of array with %i elements".format(start, stop, array.size);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+
+        const n = stop - start;
+        overMemLimit(n * typeSize(array_dtype));
+
+        var ptr = allocate(array_dtype, n);
+        var localA = makeArrayFromPtr(ptr, n:uint);
+        if array_nd == 1 {
+            localA = array.a[start..<stop];
+        } else {
+            forall (i, a) in zip(localA.domain, localA) with (var agg = newSrcAggregator(array_dtype)) do
+                agg.copy(localA[i], array.a[array.a.domain.orderToIndex(start + i)]);
+        }
+        const size = n*c_sizeof(array_dtype):int;
+        return MsgTuple.payload(bytes.createAdoptingBuffer(ptr:c_ptr(uint(8)), size, size));
+    }
+
+    /*
+     * Checks that a shared memory transfer file is a direct child of
+     * sharedMemoryDir named like the files created by the client, so the
+     * shared memory commands cannot read or write files elsewhere
+     */
+    proc checkSharedMemoryPath(path: string) throws {
+        if sharedMemoryDir == "" || numLocales != 1 ||
+           dirname(path) != normPath(sharedMemoryDir) || !basename(path).startsWith("arkouda-") {
+            throw new owned IllegalArgumentError("Invalid shared memory transfer file: %s".format(path));
+        }
+    }
+
+    proc readSharedMemoryFile(path: string): bytes throws {
+        checkSharedMemoryPath(path);
+        var f = open(path, ioMode.r);
+        var r = f.reader(locking=false);
+        const data = r.readAll(bytes);
+        r.close();
+        f.close();
+        return data;
+    }
+
+    /*
+     * Writes to a shared memory transfer file, which the client must have
+     * created, empty and readable only by its user; the server never
+     * creates the files, which would leave them readable by other users
+     * under the usual umask
+     */
+    proc writeSharedMemoryFile(path: string, ptr: c_ptr(?t), numBytes: int) throws {
+        checkSharedMemoryPath(path);
+        if !isFile(path) {
+            throw new owned IllegalArgumentError("Shared memory transfer file does not exist: %s".format(path));
+        }
+        var f = open(path, ioMode.rw);
+        var w = f.writer(locking=false);
+        w.writeBinary(ptr, numBytes);
+        w.close();
+        f.close();
+    }
+
+    /*
+     * Lets the client check that it shares the server's sharedMemoryDir by
+     * echoing the contents of a file the client wrote into a reply file
+     */
+    proc sharedMemoryProbeMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const path = msgArgs["path"].toScalar(string);
+        var token = readSharedMemoryFile(path);
+        writeSharedMemoryFile(path + ".reply", token.c_str():c_ptr(void):c_ptr(uint(8)), token.size);
+        return MsgTuple.success();
+    }
+
+    /*
+     * Creates a pdarray from the native-endian array data the client wrote
+     * to a file in sharedMemoryDir
+     */
+    @arkouda.instantiateAndRegister
+    proc arrayShm(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab, type array_dtype, param array_nd: int): MsgTuple throws
+        where array_dtype != bigint
+    {
+        const shape = msgArgs["shape"].toScalarTuple(int, array_nd),
+              path = msgArgs["path"].toScalar(string);
+
+        var data = readSharedMemoryFile(path);
+        var size = 1;
+        for s in shape do size *= s;
+        if data.size != size * typeSize(array_dtype) {
+            const errorMsg = "Expected %i bytes in %s but found %i".format(size * typeSize(array_dtype), path, data.size);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+
+        gsLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "dtype: %? shape: %? path: %s".format(array_dtype:string,shape,path));
+
+        return st.insert(new shared SymEntry(makeArrayFromBytes(data, shape, array_dtype)));
+    }
+
+    /*
+     * Writes the pdarray, in row-major order, to a file in sharedMemoryDir
+     * that the client then maps instead of receiving the data over the socket
+     */
+    @arkouda.instantiateAndRegister
+    proc tondarrayShm(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab, type array_dtype, param array_nd: int): MsgTuple throws
+        where array_dtype != bigint
+    {
+        const array = st[msgArgs["array"]]: borrowed SymEntry(array_dtype, array_nd),
+              path = msgArgs["path"].toScalar(string);
+
+        checkSharedMemoryPath(path);
+        overMemLimit(2 * array.size * typeSize(array_dtype));
+
+        var ptr = allocate(array_dtype, array.size);
+        defer deallocate(ptr);
+        var localA = makeArrayFromPtr(ptr, array.size:uint);
+        if array_nd == 1 {
+            localA = array.a;
+        } else {
+            forall (i, a) in zip(localA.domain, localA) with (var agg = newSrcAggregator(array_dtype)) do
+                agg.copy(localA[i], array.a[array.a.domain.orderToIndex(i)]);
+        }
+        writeSharedMemoryFile(path, ptr, array.size*c_sizeof(array_dtype):int);
+        return MsgTuple.success();
+    }
+
+    /*
+     * Creates several one-dimensional pdarrays and Strings from a single
+     * payload holding their native-endian data back to back, so that all the
+     * columns of a DataFrame can be transferred in one message. Each Strings
+     * is given as its null-terminated values, from which the offsets are
+     * computed as in arraySegString.
+     *
+     * :returns: MsgTuple containing a JSON list of the created message of each array
+     */
+    proc arrayManyMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const dtypes = msgArgs["dtypes"].toScalarList(string),
+              sizes = msgArgs["sizes"].toScalarList(int);
+        ref payload = msgArgs.payload;
+
+        var total = 0;
+        for s in sizes do total += s;
+        if dtypes.size != sizes.size || total != payload.size {
+            const errorMsg = "Expected %i arrays totalling %i bytes but found %i bytes"
+                             .format(sizes.size, total, payload.size);
+            gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+
+        // the arrays already created are deleted if a later one fails
+        var names = new list(string),
+            succeeded = false;
+        defer {
+            try {
+                if !succeeded then for name in names do st.deleteEntry(name);
+            } catch e {
+                gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),e.message());
+            }
+        }
+
+        proc addArray(type t, ptr: c_ptr(uint(8)), nBytes: int): string throws {
+            const n = nBytes / typeSize(t);
+            overMemLimit(2*nBytes);
+            var a = makeDistArray(n, t);
+            a = makeArrayFromPtr(ptr:c_ptr(void):c_ptr(t), num_elts=n:uint);
+            const name = st.nextName();
+            st.addEntry(name, createSymEntry(a));
+            names.pushBack(name);
+            return "created " + st.attrib(name);
+        }
+
+        var created = new list(string);
+        var start = 0;
+        for (dtype, nBytes) in zip(dtypes, sizes) {
+            const ptr = payload.c_str():c_ptr(void):c_ptr(uint(8)) + start;
+            select dtype {
+                when "int64" do created.pushBack(addArray(int, ptr, nBytes));
+                when "uint64" do created.pushBack(addArray(uint, ptr, nBytes));
+                when "float64" do created.pushBack(addArray(real, ptr, nBytes));
+                when "bool" do created.pushBack(addArray(bool, ptr, nBytes));
+                when "str" {
+                    overMemLimit(2*nBytes);
+                    var values = makeDistArray(nBytes, uint(8));
+                    values = makeArrayFromPtr(ptr, num_elts=nBytes:uint);
+                    var strings = getSegString(segmentedCalcOffsets(values, values.domain), values, st);
+                    names.pushBack(strings.name);
+                    created.pushBack("created " + st.attrib(strings.name) +
+                                     "+created bytes.size %?".format(strings.nBytes));
+                }
+                otherwise {
+                    const errorMsg = "Unsupported dtype %s".format(dtype);
+                    gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    return MsgTuple.error(errorMsg);
+                }
+            }
+            start += nBytes;
+        }
+
+        gsLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "created %i arrays from %i bytes".format(created.size, total));
+        succeeded = true;
+        return MsgTuple.success(formatJson(created));
+    }
+
+    /*
+     * Outputs the data of several one-dimensional pdarrays and Strings back
+     * to back in a single Chapel Bytes object, so that all the columns of a
+     * DataFrame can be transferred in one message. Each Strings contributes
+     * its null-terminated values.
+     */
+    proc tondarrayManyMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const names = msgArgs["names"].toScalarList(string),
+              objTypes = msgArgs["objTypes"].toScalarList(string);
+
+        var total = 0;
+        for (name, objType) in zip(names, objTypes) {
+            if objType == "Strings" {
+                total += getSegStringEntry(name, st).bytesEntry.size;
+            } else {
+                const g = getGenericTypedArrayEntry(name, st);
+                if g.ndim != 1 {
+                    const errorMsg = "Only one-dimensional arrays can be transferred, %s has %i".format(name, g.ndim);
+                    gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    return MsgTuple.error(errorMsg);
+                }
+                total += g.size * g.itemsize;
+            }
+        }
+        overMemLimit(2*total);
+
+        var ptr = allocate(uint(8), total);
+        var start = 0;
+        proc copyArray(const ref a: [] ?t) {
+            var localA = makeArrayFromPtr((ptr + start):c_ptr(void):c_ptr(t), a.size:uint);
+            localA = a;
+            start += a.size * c_sizeof(t):int;
+        }
+
+        for (name, objType) in zip(names, objTypes) {
+            if objType == "Strings" {
+                copyArray(getSegStringEntry(name, st).bytesEntry.a);
+                continue;
+            }
+            const g = getGenericTypedArrayEntry(name, st);
+            select g.dtype {
+                when DType.Int64 do copyArray(toSymEntry(g, int).a);
+                when DType.UInt64 do copyArray(toSymEntry(g, uint).a);
+                when DType.Float64 do copyArray(toSymEntry(g, real).a);
+                when DType.Bool do copyArray(toSymEntry(g, bool).a);
+                when DType.UInt8 do copyArray(toSymEntry(g, uint(8)).a);
+                otherwise {
+                    deallocate(ptr);
+                    const errorMsg = "Unsupported dtype %s for %s".format(g.dtype:string, name);
+                    gsLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    return MsgTuple.error(errorMsg);
+                }
+            }
+        }
+
+        gsLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "transferring %i arrays in %i bytes".format(names.size, total));
+        return MsgTuple.payload(bytes.createAdoptingBuffer(ptr, total, total));
+    }
+
     /*
      * Utility proc to test casting a string to a specified type
      * :arg c: String to cast
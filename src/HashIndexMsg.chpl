@@ -0,0 +1,282 @@
+/* hash indexes
+
+ a hash index stores the rows of one or more key columns grouped by their
+ 128-bit hash, with the groups sorted by hash, so that it can be searched
+ repeatedly without grouping the keys again. The groups are also split into
+ buckets by the leading bits of their hashes, at most one group per bucket
+ on average, so a search gathers the bounds of the bucket of each query and
+ rarely has to look at more than one group
+ */
+module HashIndexMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use AryUtil;
+    use CommAggregation;
+    use RadixSortLSD;
+    use Unique;
+    use UniqueMsg;
+    use Map;
+    use IOUtils;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const hiLogger = new Logger(logLevel, logChannel);
+
+    /* The bucket of hash h, given by its leading bits. */
+    inline proc bucketOf(h: 2*uint, bits: int): int {
+        const (hi, _) = h;
+        return if bits == 0 then 0 else (hi >> (64 - bits)): int;
+    }
+
+    /*
+    Group the rows by hash, sorting the groups by hash.
+
+    :returns: the high and low words of the hash of each group, the offset of
+              each group in the permutation, the permutation, which keeps
+              the rows of a group in order, and the offset of each bucket in
+              the groups, followed by the number of groups
+    */
+    proc buildHashIndex(hashes: [?D] 2*uint) throws {
+        const n = D.size;
+        overMemLimit(radixSortLSD_memEst(n, 2 * numBytes(uint)) + n * (4 * numBytes(uint) + 3 * numBytes(int)));
+        var sorted = makeDistArray(D, 2*uint);
+        var perm = makeDistArray(D, int);
+        forall (s, p, sp) in zip(sorted, perm, radixSortLSD(hashes)) {
+            (s, p) = sp;
+        }
+        var (uniqueHashes, counts) = if n > 0 then uniqueFromSorted(sorted)
+                                     else (makeDistArray(0, 2*uint), makeDistArray(0, int));
+        const G = uniqueHashes.size;
+        var segments = makeDistArray(G, int);
+        segments = (+ scan counts) - counts;
+        var hi = makeDistArray(G, uint);
+        var lo = makeDistArray(G, uint);
+        forall (h, x, y) in zip(uniqueHashes, hi, lo) {
+            (x, y) = h;
+        }
+
+        var bits = 0;
+        while (1 << bits) < G do bits += 1;
+        const nBuckets = 1 << bits;
+        var buckets = makeDistArray(nBuckets + 1, int);
+        // the buckets between the one of the previous group and the one of
+        // group k start at k
+        forall (k, h) in zip(uniqueHashes.domain, uniqueHashes) with (var agg = newDstAggregator(int)) {
+            const prev = if k == 0 then -1 else bucketOf(uniqueHashes[k-1], bits);
+            for b in prev+1..bucketOf(h, bits) do agg.copy(buckets[b], k);
+        }
+        const lastBucket = if G == 0 then -1 else bucketOf(uniqueHashes[G-1], bits);
+        forall b in lastBucket+1..nBuckets with (var agg = newDstAggregator(int)) {
+            agg.copy(buckets[b], G);
+        }
+        return (hi, lo, segments, perm, buckets);
+    }
+
+    /*
+    Search the groups of a hash index for the hash of each query.
+
+    :returns: the group with the hash of each query, or -1
+    */
+    proc probeHashIndex(qHashes: [?qD] 2*uint, const ref hi: [] uint, const ref lo: [] uint,
+                        const ref buckets: [] int) throws {
+        overMemLimit(qD.size * (3 * numBytes(int) + 2 * numBytes(uint)));
+        var groups = makeDistArray(qD, int);
+        groups = -1;
+        if hi.size == 0 then return groups;
+        var bits = 0;
+        while (1 << bits) < buckets.size - 1 do bits += 1;
+
+        var first = makeDistArray(qD, int);
+        var last = makeDistArray(qD, int);
+        forall (h, f, l) in zip(qHashes, first, last) with (var agg = newSrcAggregator(int)) {
+            const b = bucketOf(h, bits);
+            agg.copy(f, buckets[b]);
+            agg.copy(l, buckets[b+1]);
+        }
+        // the first group of each bucket is gathered with the others, and the
+        // few buckets that hold more than one group are searched directly
+        var firstHi = makeDistArray(qD, uint);
+        var firstLo = makeDistArray(qD, uint);
+        forall (f, l, x, y) in zip(first, last, firstHi, firstLo) with (var agg = newSrcAggregator(uint)) {
+            if f < l {
+                agg.copy(x, hi[f]);
+                agg.copy(y, lo[f]);
+            }
+        }
+        forall (h, f, l, x, y, g) in zip(qHashes, first, last, firstHi, firstLo, groups) {
+            if f < l {
+                if (x, y) == h {
+                    g = f;
+                } else {
+                    for k in f+1..<l {
+                        if (hi[k], lo[k]) == h {
+                            g = k;
+                            break;
+                        }
+                    }
+                }
+            }
+        }
+        return groups;
+    }
+
+    /*
+    The rows of the groups, as positions in the permutation, found for the
+    queries, in the order of the queries.
+    */
+    proc groupRows(groups: [?qD] int, const ref segments: [] int, n: int) throws {
+        const G = segments.size;
+        var counts = makeDistArray(qD, int);
+        var starts = makeDistArray(qD, int);
+        forall (g, c, s) in zip(groups, counts, starts) with (var agg = newSrcAggregator(int)) {
+            if g != -1 {
+                agg.copy(s, segments[g]);
+                // the end of the group is gathered into c and made a count below
+                if g + 1 < G then agg.copy(c, segments[g+1]); else c = n;
+            }
+        }
+        forall (g, c, s) in zip(groups, counts, starts) {
+            if g != -1 then c -= s;
+        }
+        overMemLimit(numBytes(int) * counts.size);
+        const offsets = (+ scan counts) - counts;
+        const total = + reduce counts;
+        var rows = makeDistArray(total, int);
+        forall (c, s, o) in zip(counts, starts, offsets) with (var agg = newDstAggregator(int)) {
+            for k in 0..<c do agg.copy(rows[o+k], s+k);
+        }
+        return rows;
+    }
+
+    /*
+     * Build a hash index of the key columns given by nkeys, keynames and
+     * keytypes, as for hashUniqueMsg. Replies with the hi, lo, segments,
+     * permutation and buckets arrays of the index, as JSON.
+     */
+    proc buildHashIndexMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const n = msgArgs.get("nkeys").getIntValue();
+        if (n > 128) {
+          throw new owned ErrorWithContext("Cannot hash more than 128 arrays",
+                                           getLineNumber(),
+                                           getRoutineName(),
+                                           getModuleName(),
+                                           "ArgumentError");
+        }
+        var (size, _, _, _, _, names, types) = validateArraysSameLength(n,
+            msgArgs.get("keynames").getList(n), msgArgs.get("keytypes").getList(n), st);
+        const (hi, lo, segments, perm, buckets) = buildHashIndex(hashArrays(size, names, types, st));
+
+        var createdMap = new map(keyType=string,valType=string);
+        proc addCreated(key: string, const ref a: [] ?t) throws {
+            const name = st.nextName();
+            st.addEntry(name, createSymEntry(a));
+            createdMap.add(key, "created %s".format(st.attrib(name)));
+        }
+        addCreated("hi", hi);
+        addCreated("lo", lo);
+        addCreated("segments", segments);
+        addCreated("permutation", perm);
+        addCreated("buckets", buckets);
+        const repMsg = formatJson(createdMap);
+        hiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+     * Search the hash index given by hi, lo, segments, permutation and
+     * buckets, as built by buildHashIndexMsg, for the rows of the key
+     * columns given by nkeys, keynames and keytypes. mode is one of
+     *   "first": reply with the first indexed row equal to each query, or -1
+     *   "all": reply with all the indexed rows equal to each query, in the
+     *          order of the queries
+     *   "mask": reply with whether each indexed row is equal to any query
+     */
+    proc hashIndexLookupMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const pn = Reflection.getRoutineName();
+        const mode = msgArgs.getValueOf("mode");
+        const n = msgArgs.get("nkeys").getIntValue();
+        if !(mode == "first" || mode == "all" || mode == "mask") {
+            const errorMsg = incompatibleArgumentsError(pn, "unknown lookup mode %s".format(mode));
+            hiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if (n > 128) {
+          throw new owned ErrorWithContext("Cannot hash more than 128 arrays",
+                                           getLineNumber(),
+                                           getRoutineName(),
+                                           getModuleName(),
+                                           "ArgumentError");
+        }
+        const ref hi = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("hi"), st), uint).a;
+        const ref lo = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("lo"), st), uint).a;
+        const ref segments = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("segments"), st), int).a;
+        const ref perm = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("permutation"), st), int).a;
+        const ref buckets = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("buckets"), st), int).a;
+        var (size, _, _, _, _, names, types) = validateArraysSameLength(n,
+            msgArgs.get("keynames").getList(n), msgArgs.get("keytypes").getList(n), st);
+        const groups = probeHashIndex(hashArrays(size, names, types, st), hi, lo, buckets);
+
+        proc reply(res): MsgTuple throws {
+            const resName = st.nextName();
+            st.addEntry(resName, createSymEntry(res));
+            const repMsg = "created " + st.attrib(resName);
+            hiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+            return new MsgTuple(repMsg, MsgType.NORMAL);
+        }
+
+        select mode {
+            when "first" {
+                // the permutation keeps the rows of a group in order, so the
+                // first row of a group is the first equal to the query
+                var res = makeDistArray(groups.domain, int);
+                forall (g, r) in zip(groups, res) with (var agg = newSrcAggregator(int)) {
+                    if g != -1 then agg.copy(r, segments[g]); else r = -1;
+                }
+                forall r in res with (var agg = newSrcAggregator(int)) {
+                    if r != -1 then agg.copy(r, perm[r]);
+                }
+                return reply(res);
+            }
+            when "all" {
+                var res = groupRows(groups, segments, perm.size);
+                forall r in res with (var agg = newSrcAggregator(int)) {
+                    agg.copy(r, perm[r]);
+                }
+                return reply(res);
+            }
+            otherwise {
+                // each group found is expanded once, however many queries found it
+                var hit = makeDistArray(hi.size, int);
+                forall g in groups with (var agg = newDstAggregator(int)) {
+                    if g != -1 then agg.copy(hit[g], 1);
+                }
+                var hitGroups = makeDistArray(+ reduce hit, int);
+                const hitPos = (+ scan hit) - hit;
+                forall (g, h, p) in zip(hit.domain, hit, hitPos) with (var agg = newDstAggregator(int)) {
+                    if h == 1 then agg.copy(hitGroups[p], g);
+                }
+                var rows = groupRows(hitGroups, segments, perm.size);
+                forall r in rows with (var agg = newSrcAggregator(int)) {
+                    agg.copy(r, perm[r]);
+                }
+                var res = makeDistArray(perm.size, bool);
+                forall r in rows with (var agg = newDstAggregator(bool)) {
+                    agg.copy(res[r], true);
+                }
+                return reply(res);
+            }
+        }
+    }
+
+    use CommandMap;
+    registerFunction("buildHashIndex", buildHashIndexMsg, getModuleName());
+    registerFunction("hashIndexLookup", hashIndexLookupMsg, getModuleName());
+}
@@ -0,0 +1,573 @@
+/* hash joins
+
+ both sides of the join are hashed on their key columns. Either each row is
+ sent to the locale that owns its hash, so that all the rows with equal keys
+ meet on one locale, where they are matched with local sorts and binary
+ searches, or the small side is broadcast to every locale as a local hash
+ table that the rows of the other side are probed against where they are
+ */
+module HashJoinMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use AryUtil;
+    use CommAggregation;
+    use ArkoudaSortCompat only sort;
+    use Unique;
+    use UniqueMsg;
+    use Map;
+    use IOUtils;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const hjLogger = new Logger(logLevel, logChannel);
+
+    /*
+    The positions first..<last of the rows of a whose hash is h, where a is
+    sorted by (hash, index).
+    */
+    proc hashRange(const ref a: [?D] 3*uint, h: 2*uint): (int, int) {
+        proc bound(strict: bool): int {
+            var l = D.low, r = D.high + 1;
+            while l < r {
+                const mid = l + (r - l) / 2;
+                const (hi, lo, _) = a[mid];
+                if (hi, lo) < h || (!strict && (hi, lo) == h) {
+                    l = mid + 1;
+                } else {
+                    r = mid;
+                }
+            }
+            return l;
+        }
+        return (bound(true), bound(false));
+    }
+
+    /*
+    Matches the rows of two tables by the hashes of their keys.
+
+    Both sides are shuffled to the locales that own their hashes and the rows
+    each locale owns are sorted by (hash, index) in place, so that the rows of
+    the right side that match a left row are contiguous and in their original
+    order.
+
+    :arg lHashes: 128-bit hash of the keys of each left row
+    :type lHashes: [] 2*uint
+
+    :arg rHashes: 128-bit hash of the keys of each right row
+    :type rHashes: [] 2*uint
+
+    :returns: the shuffled left and right rows and the offsets of each
+              locale's rows in them, the number of right rows that match each
+              left row and whether each right row matches any left row
+    */
+    proc hashMatch(lHashes: [?lD] 2*uint, rHashes: [?rD] 2*uint) throws {
+        // local copies of the owned rows, counts and flags
+        overMemLimit((lD.size + rD.size) * 3 * numBytes(uint) + lD.size * numBytes(int) + rD.size * numBytes(bool));
+        var (lShuffled, lStarts) = hashShuffle(lHashes);
+        var (rShuffled, rStarts) = hashShuffle(rHashes);
+
+        var leftCounts = makeDistArray(lD, int);
+        var rightMatched = makeDistArray(rD, bool);
+        coforall loc in Locales with (ref lShuffled, ref rShuffled, ref leftCounts, ref rightMatched) {
+            on loc {
+                const lLow = lStarts[loc.id], lHigh = lStarts[loc.id+1];
+                const rLow = rStarts[loc.id], rHigh = rStarts[loc.id+1];
+                var probe: [0..#(lHigh-lLow)] 3*uint = lShuffled[lLow..<lHigh];
+                var build: [0..#(rHigh-rLow)] 3*uint = rShuffled[rLow..<rHigh];
+                sort(probe);
+                sort(build);
+                lShuffled[lLow..<lHigh] = probe;
+                rShuffled[rLow..<rHigh] = build;
+                forall row in probe with (var agg = newDstAggregator(int)) {
+                    const (hi, lo, i) = row;
+                    const (first, last) = hashRange(build, (hi, lo));
+                    agg.copy(leftCounts[i: int], last - first);
+                }
+                forall row in build with (var agg = newDstAggregator(bool)) {
+                    const (hi, lo, j) = row;
+                    const (first, last) = hashRange(probe, (hi, lo));
+                    agg.copy(rightMatched[j: int], last > first);
+                }
+            }
+        }
+        return (lShuffled, lStarts, rShuffled, rStarts, leftCounts, rightMatched);
+    }
+
+    /*
+    The end of each left row's pairs in the output of a join, and the number
+    of pairs, where each left row is paired with its matching right rows or,
+    if it has none and unmatched left rows are kept, with -1.
+    */
+    proc pairEnds(leftCounts: [?lD] int, keepLeft: bool) throws {
+        overMemLimit(lD.size * numBytes(int));
+        var outEnds = makeDistArray(lD, int);
+        forall (e, c) in zip(outEnds, leftCounts) {
+            e = if keepLeft then max(c, 1) else c;
+        }
+        outEnds = + scan outEnds;
+        const nPairs = if lD.size > 0 then outEnds[lD.high] else 0;
+        return (outEnds, nPairs);
+    }
+
+    /*
+    The end of each unmatched right row's position after the pairs in the
+    output of a join, and the number of unmatched right rows.
+    */
+    proc unmatchedEnds(rightMatched: [?rD] bool) throws {
+        overMemLimit(rD.size * numBytes(int));
+        var ends = makeDistArray(rD, int);
+        forall (u, m) in zip(ends, rightMatched) {
+            u = (!m): int;
+        }
+        ends = + scan ends;
+        const nUnmatched = if rD.size > 0 then ends[rD.high] else 0;
+        return (ends, nUnmatched);
+    }
+
+    /*
+    Writes the unmatched left rows, each in its place among the pairs, and
+    the unmatched right rows, after the pairs in right order, to the output
+    of a join, with -1 standing for the missing side.
+    */
+    proc writeUnmatched(ref leftOut: [] int, ref rightOut: [] int,
+                        leftCounts: [?lD] int, outEnds: [lD] int, keepLeft: bool,
+                        rightMatched: [?rD] bool, rightEnds: [] int, keepRight: bool, nPairs: int) {
+        if keepLeft {
+            forall (i, c, e) in zip(lD, leftCounts, outEnds) with (var lAgg = newDstAggregator(int),
+                                                                 var rAgg = newDstAggregator(int)) {
+                if c == 0 {
+                    lAgg.copy(leftOut[e-1], i);
+                    rAgg.copy(rightOut[e-1], -1);
+                }
+            }
+        }
+        if keepRight {
+            forall (j, m, e) in zip(rD, rightMatched, rightEnds) with (var lAgg = newDstAggregator(int),
+                                                                     var rAgg = newDstAggregator(int)) {
+                if !m {
+                    lAgg.copy(leftOut[nPairs + e - 1], -1);
+                    rAgg.copy(rightOut[nPairs + e - 1], j);
+                }
+            }
+        }
+    }
+
+    /*
+    The indices of the left rows that match (semi join) or do not match (anti
+    join) any right row, in order.
+    */
+    proc keptLeftRows(leftCounts: [?lD] int, anti: bool) throws {
+        overMemLimit(lD.size * (numBytes(int) + numBytes(bool)));
+        var keep = makeDistArray(lD, bool);
+        forall (k, c) in zip(keep, leftCounts) {
+            k = (c > 0) != anti;
+        }
+        const ends: [lD] int = + scan keep;
+        const nKeep = if lD.size > 0 then ends[lD.high] else 0;
+        var idx = makeDistArray(nKeep, int);
+        forall (k, e, i) in zip(keep, ends, lD) with (var agg = newDstAggregator(int)) {
+            if k then agg.copy(idx[e-1], i);
+        }
+        return idx;
+    }
+
+    /*
+    Joins two tables on equal keys by shuffling both to the locales that own
+    their hashes, returning the pairs of matching left and right indices
+    ordered by left index and then by right index. Unmatched left rows, when
+    kept, are paired with -1 in their place in the order, and unmatched right
+    rows, when kept, are paired with -1 at the end in right order.
+    */
+    proc hashJoin(lHashes: [?lD] 2*uint, rHashes: [?rD] 2*uint,
+                  keepLeft: bool, keepRight: bool) throws {
+        var (lShuffled, lStarts, rShuffled, rStarts, leftCounts, rightMatched) = hashMatch(lHashes, rHashes);
+        const (outEnds, nPairs) = pairEnds(leftCounts, keepLeft);
+        const (rightEnds, nUnmatched) = if keepRight then unmatchedEnds(rightMatched)
+                                        else (makeDistArray(0, int), 0);
+
+        overMemLimit(2 * numBytes(int) * (nPairs + nUnmatched));
+        var leftOut = makeDistArray(nPairs + nUnmatched, int);
+        var rightOut = makeDistArray(nPairs + nUnmatched, int);
+
+        // the matching pairs are written by the locale that owns their hash,
+        // where the matching right rows are contiguous and in order
+        coforall loc in Locales with (ref leftOut, ref rightOut) {
+            on loc {
+                const lLow = lStarts[loc.id], lHigh = lStarts[loc.id+1];
+                const rLow = rStarts[loc.id], rHigh = rStarts[loc.id+1];
+                if lHigh > lLow && rHigh > rLow {
+                    const probe: [0..#(lHigh-lLow)] 3*uint = lShuffled[lLow..<lHigh];
+                    const build: [0..#(rHigh-rLow)] 3*uint = rShuffled[rLow..<rHigh];
+                    var ends: [probe.domain] int;
+                    forall (row, e) in zip(probe, ends) with (var agg = newSrcAggregator(int)) {
+                        const (_, _, i) = row;
+                        agg.copy(e, outEnds[i: int]);
+                    }
+                    forall (row, e) in zip(probe, ends) with (var lAgg = newDstAggregator(int),
+                                                              var rAgg = newDstAggregator(int)) {
+                        const (hi, lo, i) = row;
+                        const (first, last) = hashRange(build, (hi, lo));
+                        const start = e - (last - first);
+                        for k in first..<last {
+                            const (_, _, j) = build[k];
+                            lAgg.copy(leftOut[start + k - first], i: int);
+                            rAgg.copy(rightOut[start + k - first], j: int);
+                        }
+                    }
+                }
+            }
+        }
+        writeUnmatched(leftOut, rightOut, leftCounts, outEnds, keepLeft,
+                       rightMatched, rightEnds, keepRight, nPairs);
+        hjLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "joined %i left and %i right rows into %i pairs".format(lD.size, rD.size, leftOut.size));
+        return (leftOut, rightOut);
+    }
+
+    /*
+    The rows of the small side of a broadcast join, sorted by (hash, index),
+    the offset of each group of equal hashes in them, followed by the number
+    of rows, and an open addressing hash table from the hashes to their
+    groups, -1 marking an empty slot. All of them are local to the calling
+    locale.
+    */
+    proc broadcastIndex(rHashes: [?rD] 2*uint) throws {
+        const m = rD.size;
+        const hashes: [0..#m] 2*uint = rHashes;
+        var rows: [0..#m] 3*uint;
+        forall (row, h, j) in zip(rows, hashes, rows.domain) {
+            const (hi, lo) = h;
+            row = (hi, lo, j: uint);
+        }
+        sort(rows);
+        var isStart: [0..#m] bool;
+        forall (s, row, k) in zip(isStart, rows, rows.domain) {
+            const (hi, lo, _) = row;
+            if k == 0 {
+                s = true;
+            } else {
+                const (prevHi, prevLo, _) = rows[k-1];
+                s = (prevHi != hi) || (prevLo != lo);
+            }
+        }
+        const groupEnds: [0..#m] int = + scan isStart;
+        const nGroups = if m > 0 then groupEnds[m-1] else 0;
+        var groupStarts: [0..nGroups] int = m;
+        forall (s, e, k) in zip(isStart, groupEnds, rows.domain) {
+            if s then groupStarts[e-1] = k;
+        }
+
+        // at most half full, so probes stay short
+        var tableSize = 1;
+        while tableSize < 2 * nGroups do tableSize *= 2;
+        var table: [0..#tableSize] int = -1;
+        for g in 0..#nGroups {
+            const (_, lo, _) = rows[groupStarts[g]];
+            var slot = (lo & (tableSize - 1): uint): int;
+            while table[slot] != -1 do slot = (slot + 1) & (tableSize - 1);
+            table[slot] = g;
+        }
+        return (rows, groupStarts, table);
+    }
+
+    /*
+    The group of the small side of a broadcast join whose hash is h, or -1.
+    */
+    inline proc broadcastLookup(const ref rows: [] 3*uint, const ref groupStarts: [] int,
+                                const ref table: [?tD] int, h: 2*uint): int {
+        const (hi, lo) = h;
+        var slot = (lo & (tD.size - 1): uint): int;
+        while table[slot] != -1 {
+            const g = table[slot];
+            const (gHi, gLo, _) = rows[groupStarts[g]];
+            if gHi == hi && gLo == lo then return g;
+            slot = (slot + 1) & (tD.size - 1);
+        }
+        return -1;
+    }
+
+    /*
+    Matches the rows of a large left table with those of a small right table
+    by the hashes of their keys, without moving the left rows: the right side
+    is copied to every locale, indexed there in a local hash table and probed
+    with the left rows each locale holds.
+
+    :returns: the indexed right rows, the position in them of the first
+              right row that matches each left row, the number of right rows
+              that match each left row and whether each right row matches
+              any left row
+    */
+    proc broadcastMatch(lHashes: [?lD] 2*uint, rHashes: [?rD] 2*uint) throws {
+        // a copy of the right rows and their index on each locale, and the first matches and counts
+        overMemLimit(numLocales * rD.size * (3 * numBytes(uint) + 3 * numBytes(int) + numBytes(bool))
+                     + lD.size * 2 * numBytes(int));
+        const (rows, groupStarts, table) = broadcastIndex(rHashes);
+        const nGroups = groupStarts.size - 1;
+
+        var leftFirst = makeDistArray(lD, int);
+        var leftCounts = makeDistArray(lD, int);
+        var groupMatched: [0..#nGroups] atomic bool;
+        coforall loc in Locales with (ref leftFirst, ref leftCounts, ref groupMatched) {
+            on loc {
+                const myRows = rows, myStarts = groupStarts, myTable = table;
+                var myMatched: [0..#nGroups] atomic bool;
+                forall i in lHashes.localSubdomain() with (ref myMatched) {
+                    const g = broadcastLookup(myRows, myStarts, myTable, lHashes.localAccess[i]);
+                    if g != -1 {
+                        leftFirst.localAccess[i] = myStarts[g];
+                        leftCounts.localAccess[i] = myStarts[g+1] - myStarts[g];
+                        myMatched[g].write(true);
+                    }
+                }
+                forall g in 0..#nGroups with (ref groupMatched) {
+                    if myMatched[g].read() then groupMatched[g].write(true);
+                }
+            }
+        }
+
+        var rightMatched = makeDistArray(rD, bool);
+        forall g in 0..#nGroups with (var agg = newDstAggregator(bool)) {
+            const matched = groupMatched[g].read();
+            for k in groupStarts[g]..<groupStarts[g+1] {
+                const (_, _, j) = rows[k];
+                agg.copy(rightMatched[j: int], matched);
+            }
+        }
+        return (rows, leftFirst, leftCounts, rightMatched);
+    }
+
+    /*
+    Joins a large left table with a small right table on equal keys by
+    broadcasting the right table, giving the same output as hashJoin.
+    */
+    proc broadcastJoin(lHashes: [?lD] 2*uint, rHashes: [?rD] 2*uint,
+                       keepLeft: bool, keepRight: bool) throws {
+        const (rows, leftFirst, leftCounts, rightMatched) = broadcastMatch(lHashes, rHashes);
+        const (outEnds, nPairs) = pairEnds(leftCounts, keepLeft);
+        const (rightEnds, nUnmatched) = if keepRight then unmatchedEnds(rightMatched)
+                                        else (makeDistArray(0, int), 0);
+
+        overMemLimit(2 * numBytes(int) * (nPairs + nUnmatched));
+        var leftOut = makeDistArray(nPairs + nUnmatched, int);
+        var rightOut = makeDistArray(nPairs + nUnmatched, int);
+
+        // the pairs are in left order, so each locale writes those of its
+        // left rows, which are mostly local
+        coforall loc in Locales with (ref leftOut, ref rightOut) {
+            on loc {
+                const myRows = rows;
+                forall i in leftCounts.localSubdomain() with (var lAgg = newDstAggregator(int),
+                                                              var rAgg = newDstAggregator(int)) {
+                    const c = leftCounts.localAccess[i];
+                    const start = outEnds.localAccess[i] - c;
+                    const first = leftFirst.localAccess[i];
+                    for k in 0..#c {
+                        const (_, _, j) = myRows[first + k];
+                        lAgg.copy(leftOut[start + k], i);
+                        rAgg.copy(rightOut[start + k], j: int);
+                    }
+                }
+            }
+        }
+        writeUnmatched(leftOut, rightOut, leftCounts, outEnds, keepLeft,
+                       rightMatched, rightEnds, keepRight, nPairs);
+        hjLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "broadcast joined %i left and %i right rows into %i pairs".format(lD.size, rD.size,
+                                                                                       leftOut.size));
+        return (leftOut, rightOut);
+    }
+
+    /*
+    Matches the rows of a small left table with those of a large right table
+    by the hashes of their keys, without moving the right rows: the left side
+    is copied to every locale, indexed there in a local hash table and probed
+    with the right rows each locale holds.
+
+    :returns: the indexed left rows and the offset of each group of equal
+              hashes in them, the group of left rows that each right row
+              matches, or the number of groups if none, the number of right
+              rows that match each group and the number of right rows that
+              match each left row
+    */
+    proc broadcastLeftMatch(lHashes: [?lD] 2*uint, rHashes: [?rD] 2*uint) throws {
+        // a copy of the left rows, their index and their counts on each locale, and the right groups
+        overMemLimit(numLocales * lD.size * (3 * numBytes(uint) + 4 * numBytes(int))
+                     + rD.size * numBytes(int));
+        const (rows, groupStarts, table) = broadcastIndex(lHashes);
+        const nGroups = groupStarts.size - 1;
+
+        var rightGroup = makeDistArray(rD, int);
+        var matches: [0..#nGroups] atomic int;
+        coforall loc in Locales with (ref rightGroup, ref matches) {
+            on loc {
+                const myRows = rows, myStarts = groupStarts, myTable = table;
+                var myMatches: [0..#nGroups] int;
+                forall j in rHashes.localSubdomain() with (+ reduce myMatches) {
+                    const g = broadcastLookup(myRows, myStarts, myTable, rHashes.localAccess[j]);
+                    rightGroup.localAccess[j] = if g == -1 then nGroups else g;
+                    if g != -1 then myMatches[g] += 1;
+                }
+                forall g in 0..#nGroups with (ref matches) {
+                    if myMatches[g] > 0 then matches[g].add(myMatches[g]);
+                }
+            }
+        }
+
+        const groupCounts: [0..#nGroups] int = [m in matches] m.read();
+        var leftCounts = makeDistArray(lD, int);
+        forall g in 0..#nGroups with (var agg = newDstAggregator(int)) {
+            for k in groupStarts[g]..<groupStarts[g+1] {
+                const (_, _, i) = rows[k];
+                agg.copy(leftCounts[i: int], groupCounts[g]);
+            }
+        }
+        return (rows, groupStarts, rightGroup, groupCounts, leftCounts);
+    }
+
+    /*
+    Joins a small left table with a large right table on equal keys by
+    broadcasting the left table, giving the same output as hashJoin. The
+    matching right rows are grouped by the left group they match with a
+    counting sort, which keeps them in right order, and each one is then
+    written next to every left row of its group.
+    */
+    proc broadcastLeftJoin(lHashes: [?lD] 2*uint, rHashes: [?rD] 2*uint,
+                           keepLeft: bool, keepRight: bool) throws {
+        const (rows, groupStarts, rightGroup, groupCounts, leftCounts) = broadcastLeftMatch(lHashes, rHashes);
+        const nGroups = groupStarts.size - 1;
+        const (outEnds, nPairs) = pairEnds(leftCounts, keepLeft);
+        var rightMatched = makeDistArray(rD, bool);
+        forall (m, g) in zip(rightMatched, rightGroup) {
+            m = g < nGroups;
+        }
+        const (rightEnds, nUnmatched) = if keepRight then unmatchedEnds(rightMatched)
+                                        else (makeDistArray(0, int), 0);
+
+        // the right rows by group, and the offset of each group among them;
+        // the unmatched right rows are last
+        const (perm, _) = directGroup(rightGroup, 0, nGroups + 1);
+        var permStarts: [0..nGroups] int;
+        permStarts[1..] = + scan groupCounts;
+        const nMatched = permStarts[nGroups];
+        // where the pairs of each left row start
+        const leftStarts: [0..#lD.size] int = outEnds - leftCounts;
+
+        overMemLimit(2 * numBytes(int) * (nPairs + nUnmatched) + numLocales * (lD.size + nGroups) * numBytes(int));
+        var leftOut = makeDistArray(nPairs + nUnmatched, int);
+        var rightOut = makeDistArray(nPairs + nUnmatched, int);
+
+        // each locale writes the pairs of the right rows it holds in perm
+        coforall loc in Locales with (ref leftOut, ref rightOut) {
+            on loc {
+                const myRows = rows, myStarts = groupStarts, myPermStarts = permStarts, myLeftStarts = leftStarts;
+                forall p in perm.localSubdomain() with (var lAgg = newDstAggregator(int),
+                                                        var rAgg = newDstAggregator(int)) {
+                    if p < nMatched {
+                        // the group of p is the last one that starts at or before it
+                        var l = 0, h = nGroups;
+                        while l < h {
+                            const mid = l + (h - l) / 2;
+                            if myPermStarts[mid] <= p then l = mid + 1; else h = mid;
+                        }
+                        const g = l - 1;
+                        const r = p - myPermStarts[g];
+                        const j = perm.localAccess[p];
+                        for k in myStarts[g]..<myStarts[g+1] {
+                            const (_, _, i) = myRows[k];
+                            lAgg.copy(leftOut[myLeftStarts[i: int] + r], i: int);
+                            rAgg.copy(rightOut[myLeftStarts[i: int] + r], j);
+                        }
+                    }
+                }
+            }
+        }
+        writeUnmatched(leftOut, rightOut, leftCounts, outEnds, keepLeft,
+                       rightMatched, rightEnds, keepRight, nPairs);
+        hjLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "broadcast joined %i left and %i right rows into %i pairs".format(lD.size, rD.size,
+                                                                                       leftOut.size));
+        return (leftOut, rightOut);
+    }
+
+    /*
+     * Joins the rows of two tables on equal key columns by hash partitioning.
+     * The key columns of each side are given as for hashUniqueMsg and must
+     * have the same types on both sides. how is one of "inner", "left",
+     * "outer", "semi" or "anti"; a right join is a left join with the sides
+     * swapped. broadcast is "left" or "right" to copy that side, which should
+     * be small, to every locale instead of shuffling both sides, or "none".
+     * semi and anti joins reply with the indices of the left rows
+     * that are kept, the others with the left and right indices of the pairs,
+     * -1 standing for a missing row.
+     */
+    proc hashJoinMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const pn = Reflection.getRoutineName();
+        const how = msgArgs.getValueOf("how");
+        const broadcast = msgArgs.getValueOf("broadcast");
+        const n = msgArgs.get("nstr").getIntValue();
+        if (n > 128) {
+          throw new owned ErrorWithContext("Cannot hash more than 128 arrays",
+                                           getLineNumber(),
+                                           getRoutineName(),
+                                           getModuleName(),
+                                           "ArgumentError");
+        }
+        const leftnames = msgArgs.get("leftnames").getList(n);
+        const lefttypes = msgArgs.get("lefttypes").getList(n);
+        const rightnames = msgArgs.get("rightnames").getList(n);
+        const righttypes = msgArgs.get("righttypes").getList(n);
+        if !(how == "inner" || how == "left" || how == "outer" || how == "semi" || how == "anti") {
+            const errorMsg = incompatibleArgumentsError(pn, "unknown join type %s".format(how));
+            hjLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if !(broadcast == "none" || broadcast == "left" || broadcast == "right") {
+            const errorMsg = incompatibleArgumentsError(pn, "unknown broadcast side %s".format(broadcast));
+            hjLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var (lSize, _, _, _, _, lNames, lTypes) = validateArraysSameLength(n, leftnames, lefttypes, st);
+        var (rSize, _, _, _, _, rNames, rTypes) = validateArraysSameLength(n, rightnames, righttypes, st);
+        const lHashes = hashArrays(lSize, lNames, lTypes, st);
+        const rHashes = hashArrays(rSize, rNames, rTypes, st);
+
+        var repMsg: string;
+        if how == "semi" || how == "anti" {
+            const leftCounts = if broadcast == "right" then broadcastMatch(lHashes, rHashes)(2)
+                               else if broadcast == "left" then broadcastLeftMatch(lHashes, rHashes)(4)
+                               else hashMatch(lHashes, rHashes)(4);
+            const idx = keptLeftRows(leftCounts, how == "anti");
+            const idxName = st.nextName();
+            st.addEntry(idxName, createSymEntry(idx));
+            repMsg = "created " + st.attrib(idxName);
+        } else {
+            const keepLeft = how != "inner", keepRight = how == "outer";
+            const (leftOut, rightOut) = if broadcast == "right"
+                                        then broadcastJoin(lHashes, rHashes, keepLeft, keepRight)
+                                        else if broadcast == "left"
+                                        then broadcastLeftJoin(lHashes, rHashes, keepLeft, keepRight)
+                                        else hashJoin(lHashes, rHashes, keepLeft, keepRight);
+            const leftName = st.nextName();
+            st.addEntry(leftName, createSymEntry(leftOut));
+            const rightName = st.nextName();
+            st.addEntry(rightName, createSymEntry(rightOut));
+            var createdMap = new map(keyType=string,valType=string);
+            createdMap.add("left", "created %s".format(st.attrib(leftName)));
+            createdMap.add("right", "created %s".format(st.attrib(rightName)));
+            repMsg = formatJson(createdMap);
+        }
+        hjLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    use CommandMap;
+    registerFunction("hashJoin", hashJoinMsg, getModuleName());
+}
@@ -81,6 +81,65 @@ module HistogramMsg
     }
 
 
+    /* bincount takes a pdarray of integer or bool values in lo..hi and returns
+       a pdarray with the number of times each value in lo..hi occurs */
+    proc bincountMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const name = msgArgs.getValueOf("array"),
+              lo = msgArgs.get("lo").getIntValue(),
+              hi = msgArgs.get("hi").getIntValue();
+        const bins = hi - lo + 1;
+        var rname = st.nextName();
+        hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                      "cmd: %s name: %s lo: %i hi: %i rname: %s".format(cmd, name, lo, hi, rname));
+
+        var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        if hi < lo {
+            var errorMsg = "the range %i..%i is empty".format(lo, hi);
+            hgmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        // helper nested procedure
+        proc bincountHelper(type t): bool throws {
+          // uint values of 2**63 or more would wrap around to negative bins
+          if t == uint {
+            if (max reduce toSymEntry(gEnt,t).a) > max(int): uint then return false;
+          }
+          // every value is its own bin
+          const a = [v in toSymEntry(gEnt,t).a] v: int;
+          if a.size > 0 && ((min reduce a) < lo || (max reduce a) > hi) then return false;
+          // per-task or per-locale counts, reduced into the result
+          if (bins <= sBound) {
+              st.addEntry(rname, createSymEntry(histogramReduceIntent(a, lo, hi, bins, 1.0)));
+          } else {
+              st.addEntry(rname, createSymEntry(histogramLocalAtomic(a, lo, hi, bins, 1.0)));
+          }
+          return true;
+        }
+
+        var inRange: bool;
+        select (gEnt.dtype) {
+            when (DType.Int64)   {inRange = bincountHelper(int);}
+            when (DType.UInt64)  {inRange = bincountHelper(uint);}
+            when (DType.Bool)    {inRange = bincountHelper(bool);}
+            otherwise {
+                var errorMsg = notImplementedError(pn,gEnt.dtype);
+                hgmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        if !inRange {
+            var errorMsg = "values of %s are outside the range %i..%i".format(name, lo, hi);
+            hgmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        var repMsg = "created " + st.attrib(rname);
+        hgmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
     /* histogram takes a pdarray and returns a pdarray with the histogram in it */
     proc histogram2DMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
         param pn = Reflection.getRoutineName();
@@ -312,4 +371,5 @@ module HistogramMsg
     registerFunction("histogram", histogramMsg, getModuleName());
     registerFunction("histogram2D", histogram2DMsg, getModuleName());
     registerFunction("histogramdD", histogramdDMsg, getModuleName());
+    registerFunction("bincount", bincountMsg, getModuleName());
 }
@@ -0,0 +1,255 @@
+/* interval indexes
+
+ an interval index answers repeated searches of a fixed set of closed
+ intervals. The distinct bounds of the intervals split the number line into
+ elementary pieces, the bounds themselves and the open gaps between them, and
+ every interval covers a contiguous run of pieces. Building the index labels
+ each piece with the best interval covering it once, so that a search only
+ has to find the piece a value falls in
+ */
+module IntervalIndexMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+    use CommAggregation;
+    use Unique;
+    use AsofJoinMsg only lastAtOrBefore;
+    use Map;
+    use IOUtils;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const iiLogger = new Logger(logLevel, logChannel);
+
+    /* The largest k such that 2**k <= x, for x >= 1. */
+    proc floorLog2(x: int): int {
+        var k = 0;
+        while (1 << (k + 1)) <= x do k += 1;
+        return k;
+    }
+
+    /* Lower x to v, if v is smaller. */
+    proc atomicMin(ref x: atomic int, v: int) {
+        var cur = x.read();
+        while v < cur && !x.compareExchange(cur, v) { }
+    }
+
+    /*
+    Build the index of the closed intervals [starts[i], ends[i]].
+
+    The pieces are numbered so that piece 2*k is the k-th distinct bound and
+    piece 2*k+1 is the gap after it, which makes interval i cover the pieces
+    2*rank(starts[i])..2*rank(ends[i]). A piece covered by several intervals
+    is labeled with the one that comes first in order, or the one with the
+    lowest index if there is no order. Labeling takes a range minimum over
+    the priorities of the covering intervals: each interval marks the two
+    power-of-two sized blocks of pieces that together cover its run, and the
+    marks are pushed down from larger blocks to smaller ones, level by level.
+
+    :returns: the distinct bounds, and the interval labeling each piece or -1
+    */
+    proc buildIntervalIndex(starts: [?D] ?t, ends: [D] t, const ref order: [] int,
+                            hasOrder: bool) throws {
+        const n = D.size;
+        overMemLimit(2 * n * (numBytes(t) + 3 * numBytes(int)) + 4 * n * numBytes(int));
+        var bounds = makeDistArray(2 * n, t);
+        bounds[0..<n] = starts;
+        bounds[n..<2*n] = ends;
+        const (breaks, _, inv) = uniqueSortWithInverse(bounds);
+        const B = breaks.size;
+        if B == 0 then return (breaks, makeDistArray(0, int));
+        const P = 2 * B - 1;
+
+        var first = makeDistArray(D, int);
+        var last = makeDistArray(D, int);
+        forall i in D with (var agg = newSrcAggregator(int)) {
+            agg.copy(first[i], inv[i]);
+            agg.copy(last[i], inv[n+i]);
+        }
+        first *= 2;
+        last *= 2;
+        var prio = makeDistArray(D, int);
+        if hasOrder {
+            forall (r, i) in zip(order.domain, order) with (var agg = newDstAggregator(int)) {
+                agg.copy(prio[i], r);
+            }
+        } else {
+            forall (p, i) in zip(prio, D) do p = i;
+        }
+
+        const NONE = max(int);
+        var best = makeDistArray(P, int);
+        best = NONE;
+        var marks: [makeDistDom(P)] atomic int;
+        for k in 0..floorLog2(P) by -1 {
+            const w = 1 << k;
+            forall m in marks do m.write(NONE);
+            forall (a, b, p) in zip(first, last, prio) with (ref marks) {
+                if floorLog2(b - a + 1) == k {
+                    atomicMin(marks[a], p);
+                    atomicMin(marks[b - w + 1], p);
+                }
+            }
+            // a block of size 2*w starting at i covers the blocks of size w
+            // starting at i and i+w
+            var next = makeDistArray(P, int);
+            forall (i, x) in zip(next.domain, next) {
+                x = min(marks[i].read(), best[i]);
+                if i >= w then x = min(x, best[i-w]);
+            }
+            best = next;
+        }
+
+        var labels = makeDistArray(P, int);
+        forall (l, p) in zip(labels, best) with (var agg = newSrcAggregator(int)) {
+            if p == NONE then l = -1;
+            else if hasOrder then agg.copy(l, order[p]);
+            else l = p;
+        }
+        return (breaks, labels);
+    }
+
+    /*
+    Search the index given by breaks and labels. Each locale copies the slice
+    of the index spanned by the values of its block and searches it.
+
+    :returns: the interval labeling the piece each value falls in, or -1
+    */
+    proc lookupIntervalIndex(values: [?D] ?t, const ref breaks: [] t,
+                             const ref labels: [] int) throws {
+        const B = breaks.size, P = labels.size;
+        overMemLimit(D.size * numBytes(int) + numLocales * B * (numBytes(t) + 2 * numBytes(int)));
+        var res = makeDistArray(D, int);
+        res = -1;
+        if B == 0 then return res;
+        coforall loc in Locales with (ref res) {
+            on loc {
+                const myD = values.localSubdomain();
+                if myD.size > 0 {
+                    const xMin = min reduce [i in myD] values.localAccess[i];
+                    const xMax = max reduce [i in myD] values.localAccess[i];
+                    // the breaks before the last one at or before xMin and
+                    // after the last one at or before xMax decide no value
+                    const lo = max(lastAtOrBefore(breaks, 0, B, xMin), 0);
+                    const hi = lastAtOrBefore(breaks, 0, B, xMax) + 1;
+                    if hi > lo {
+                        const myBreaks: [lo..<hi] t = breaks[lo..<hi];
+                        const myLabels: [2*lo..<min(2*hi, P)] int = labels[2*lo..<min(2*hi, P)];
+                        forall i in myD with (ref res) {
+                            const v = values.localAccess[i];
+                            const k = lastAtOrBefore(myBreaks, lo, hi, v);
+                            if k >= lo {
+                                if myBreaks[k] == v then res.localAccess[i] = myLabels[2*k];
+                                else if k < B - 1 then res.localAccess[i] = myLabels[2*k+1];
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        return res;
+    }
+
+    /*
+     * Build the index of the closed intervals with bounds starts and ends,
+     * which are int64, uint64 or float64 arrays of the same type. If
+     * has_order is true, intervals that overlap are ranked by the
+     * permutation order instead of by their index. Replies with the breaks
+     * and labels arrays of the index, as JSON.
+     */
+    proc buildIntervalIndexMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const pn = Reflection.getRoutineName();
+        const hasOrder = msgArgs.get("has_order").getBoolValue();
+        const sg: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("starts"), st);
+        const eg: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("ends"), st);
+        if sg.dtype != eg.dtype {
+            const errorMsg = notImplementedError(pn, sg.dtype, "intervals", eg.dtype);
+            iiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if sg.size != eg.size {
+            const errorMsg = incompatibleArgumentsError(pn, "starts and ends must be the same size");
+            iiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        proc buildHelper(type t): MsgTuple throws {
+            const ref starts = toSymEntry(sg, t).a;
+            const ref ends = toSymEntry(eg, t).a;
+            var emptyOrder: [0..-1] int;
+            const (breaks, labels) = if hasOrder
+                then buildIntervalIndex(starts, ends, toSymEntry(getGenericTypedArrayEntry(
+                                        msgArgs.getValueOf("order"), st), int).a, true)
+                else buildIntervalIndex(starts, ends, emptyOrder, false);
+            const breaksName = st.nextName();
+            st.addEntry(breaksName, createSymEntry(breaks));
+            const labelsName = st.nextName();
+            st.addEntry(labelsName, createSymEntry(labels));
+            var createdMap = new map(keyType=string,valType=string);
+            createdMap.add("breaks", "created %s".format(st.attrib(breaksName)));
+            createdMap.add("labels", "created %s".format(st.attrib(labelsName)));
+            const repMsg = formatJson(createdMap);
+            iiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+            return new MsgTuple(repMsg, MsgType.NORMAL);
+        }
+
+        select sg.dtype {
+            when DType.Int64 do return buildHelper(int);
+            when DType.UInt64 do return buildHelper(uint);
+            when DType.Float64 do return buildHelper(real);
+            otherwise {
+                const errorMsg = notImplementedError(pn, sg.dtype: string);
+                iiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+    }
+
+    /*
+     * Search the index given by breaks and labels, as built by
+     * buildIntervalIndexMsg, for values, which must have the same type as
+     * breaks. Replies with the interval containing each value, or -1.
+     */
+    proc lookupIntervalIndexMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const pn = Reflection.getRoutineName();
+        const vg: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("values"), st);
+        const bg: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("breaks"), st);
+        const ref labels = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("labels"), st), int).a;
+        if vg.dtype != bg.dtype {
+            const errorMsg = notImplementedError(pn, vg.dtype, "in", bg.dtype);
+            iiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        proc lookupHelper(type t): MsgTuple throws {
+            const res = lookupIntervalIndex(toSymEntry(vg, t).a, toSymEntry(bg, t).a, labels);
+            const resName = st.nextName();
+            st.addEntry(resName, createSymEntry(res));
+            const repMsg = "created " + st.attrib(resName);
+            iiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+            return new MsgTuple(repMsg, MsgType.NORMAL);
+        }
+
+        select vg.dtype {
+            when DType.Int64 do return lookupHelper(int);
+            when DType.UInt64 do return lookupHelper(uint);
+            when DType.Float64 do return lookupHelper(real);
+            otherwise {
+                const errorMsg = notImplementedError(pn, vg.dtype: string);
+                iiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+    }
+
+    use CommandMap;
+    registerFunction("buildIntervalIndex", buildIntervalIndexMsg, getModuleName());
+    registerFunction("lookupIntervalIndex", lookupIntervalIndexMsg, getModuleName());
+}
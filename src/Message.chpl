@@ -560,9 +560,42 @@ module Message {
     }
 
     /*
-    Parse arguments formatted as json string into objects
+    Parse arguments in the compact binary format, where each parameter is
+    encoded as its key, dtype, and val fields, in that order, each prefixed by
+    its length in bytes and a colon
+    */
+    proc parseBinaryParameters(args: string, size: int) throws {
+        const b = args: bytes;
+        var param_list = new list(ParameterObj, parSafe=true);
+        var fields: 3*string;
+        var pos = 0;
+        for 0..<size {
+            for f in 0..<3 {
+                const colon = b.find(b":", pos..);
+                if colon < 0 then
+                    throw new owned ErrorWithContext("Incorrect binary argument format %s".format(args),
+                                               getLineNumber(),
+                                               getRoutineName(),
+                                               getModuleName(),
+                                               "ValueError");
+                const n = b[pos..<colon].decode(): int;
+                fields[f] = b[colon+1..#n].decode();
+                pos = colon + 1 + n;
+            }
+            param_list.pushBack(new ParameterObj(key=fields[0], val=fields[2], dtype=fields[1]));
+        }
+        return param_list;
+    }
+
+    /*
+    Parse arguments formatted as json string, or in the compact binary format,
+    into objects
     */
     proc parseMessageArgs(json_str: string, size: int, in payload = b"") throws {
+        // JSON arguments are a list, binary arguments start with a field length
+        if !json_str.startsWith("[") then
+            return new owned MessageArgs(parseBinaryParameters(json_str, size), payload);
+
         var pArr = jsonToArray(json_str, string, size);
         var param_list = new list(ParameterObj, parSafe=true);
         forall j_str in pArr with (ref param_list) {
@@ -15,6 +15,8 @@ module MsgProcessing
     use MultiTypeSymEntry;
     use ServerErrorStrings;
     use AryUtil;
+    use IOUtils;
+    use List;
 
     private config const logLevel = ServerConfig.logLevel;
     private config const logChannel = ServerConfig.logChannel;
@@ -93,6 +95,29 @@ module MsgProcessing
         return new MsgTuple(repMsg, MsgType.NORMAL);
     }
 
+    /*
+    Delete a list of symbols from the sym table in one pass, skipping any that
+    are registered or no longer exist
+
+    :arg reqMsg: request containing (cmd,names)
+    :type reqMsg: string
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple
+    */
+    proc deleteManyMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const names = msgArgs["names"].toScalarList(string);
+        var nDeleted = 0;
+        for name in names {
+            if st.contains(name) && st.deleteEntry(name) then nDeleted += 1;
+        }
+        const repMsg = "deleted %i of %i symbols".format(nDeleted, names.size);
+        mpLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
     /* 
     Clear all unregistered symbols and associated data from sym table
     
@@ -237,6 +262,71 @@ module MsgProcessing
         }
     }
 
+    /*
+    Executes a batch of commands sent by the client in a single request, in
+    order, stopping at the first command that fails. Each command is a
+    serialized RequestMsg; its args may refer to a symbol created by an earlier
+    command in the batch using the placeholder "__batch_<i>_<n>__", which is
+    replaced with the name of the nth symbol created by the ith command.
+
+    :arg cmd: the name of the command (batch)
+    :type cmd: string
+
+    :arg msgArgs: contains the list of serialized commands
+    :type msgArgs: borrowed MessageArgs
+
+    :arg st: SymTab to act on
+    :type st: borrowed SymTab
+
+    :returns: MsgTuple containing a JSON list of the serialized reply to each command executed
+    */
+    proc batchMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        import CommandMap;
+
+        const commands = msgArgs["commands"].toScalarList(string);
+        var replies = new list(string);
+        var placeholders = new list((string, string));
+
+        for i in 0..<commands.size {
+            var rm: RequestMsg;
+            var reply: MsgTuple;
+            try {
+                deserialize(rm, commands[i]);
+                var args = rm.args;
+                for (placeholder, name) in placeholders do
+                    args = args.replace(placeholder, name);
+
+                var cmdArgs: owned MessageArgs;
+                if rm.size > 0
+                    then cmdArgs = parseMessageArgs(args, rm.size);
+                    else cmdArgs = new owned MessageArgs();
+
+                reply = CommandMap.executeCommand(rm.cmd, cmdArgs, st);
+                if reply.msgFormat == MsgFormat.BINARY then
+                    reply = MsgTuple.error("Command '%s' returns a binary reply and cannot be batched".format(rm.cmd));
+            } catch e {
+                reply = MsgTuple.error("Error executing command: %s".format(e.message()));
+            }
+
+            mpLogger.debug(getModuleName(), getRoutineName(), getLineNumber(),
+                           "batch command %i: %s".format(i, rm.cmd));
+            replies.pushBack(reply.serialize(rm.user));
+            if reply.msgType == MsgType.ERROR then break;
+
+            // record the names of the symbols the command created for later commands
+            const words = new list(reply.msg.split());
+            var n = 0;
+            for j in 1..<words.size {
+                if words[j-1].endsWith("created") {
+                    placeholders.pushBack(("__batch_%i_%i__".format(i, n), words[j]));
+                    n += 1;
+                }
+            }
+        }
+
+        return MsgTuple.success(formatJson(replies));
+    }
+
     /* 
     Response to __str__ method in python str convert array data to string 
 
@@ -30,6 +30,7 @@ module MultiTypeRegEntry {
                 IndexRegEntry, 
                 SeriesRegEntry,
                 BitVectorRegEntry,           
+                IntervalIndexRegEntry,
     }
 
     class AbstractRegEntry {
@@ -109,6 +110,33 @@ module MultiTypeRegEntry {
         }
     }
 
+    class IntervalIndexRegEntry: GenRegEntry {
+        var starts: string;
+        var ends: string;
+        var breaks: string;
+        var labels: string;
+
+        proc init(starts: string, ends: string, breaks: string, labels: string) {
+            super.init(ObjType.INTERVALINDEX);
+            this.starts = starts;
+            this.ends = ends;
+            this.breaks = breaks;
+            this.labels = labels;
+        }
+
+        proc asMap(st: borrowed SymTab): map(string, string) throws {
+            var rtnMap: map(string, string);
+            rtnMap.add("objType", this.objType: string);
+            var comps: map(string, string);
+            comps.add("starts", "created " + st.attrib(this.starts));
+            comps.add("ends", "created " + st.attrib(this.ends));
+            comps.add("breaks", "created " + st.attrib(this.breaks));
+            comps.add("labels", "created " + st.attrib(this.labels));
+            rtnMap.add("create", formatJson(comps));
+            return rtnMap;
+        }
+    }
+
     class SegArrayRegEntry: GenRegEntry {
         var segments: string;
         var values: shared ArrayRegEntry;
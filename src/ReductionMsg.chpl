@@ -16,6 +16,7 @@ module ReductionMsg
     use ServerErrors;
     use Logging;
     use Message;
+    use IOUtils;
 
     use KReduce;
     use AryUtil;
@@ -612,6 +613,24 @@ module ReductionMsg
             rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg); 
             return new MsgTuple(errorMsg, MsgType.ERROR);        
         }
+        const res = segmentedReduction(gVal, segments, op, skipNan, ddof, rname, msgArgs, st);
+        if res.msgType == MsgType.ERROR then return res;
+       var repMsg = "created " + st.attrib(rname);
+       rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+       return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+     * Reduces each segment of the values with the operator op, adding the
+     * result to the symbol table as rname. Shared by segmentedReductionMsg and
+     * segmentedReductionMultiMsg.
+     *
+     * :returns: MsgTuple that is an error if op is not supported for the values' dtype
+     */
+    proc segmentedReduction(gVal: borrowed GenSymEntry, segments: borrowed SymEntry(int, 1), op: string,
+                            skipNan: bool, ddof: int, rname: string, msgArgs: borrowed MessageArgs,
+                            st: borrowed SymTab): MsgTuple throws {
+        param pn = "segmentedReduction";
         select (gVal.dtype) {
             when (DType.Int64) {
                 var values = toSymEntry(gVal, int);
@@ -921,11 +940,395 @@ module ReductionMsg
               return new MsgTuple(errorMsg, MsgType.ERROR);
           }
        }
-       var repMsg = "created " + st.attrib(rname);
-       rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
-       return new MsgTuple(repMsg, MsgType.NORMAL);
+       return MsgTuple.success();
+    }
+
+
+    /*
+     * Computes several segmented reductions of several values arrays in a
+     * single request. Each values array is permuted into grouped order once,
+     * if a permutation is given, and then reduced with each of its operators.
+     * ops[i] is applied to values[which[i]].
+     *
+     * :returns: MsgTuple containing a JSON list of the created message of each reduction, in the order of ops
+     */
+    proc segmentedReductionMultiMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const skipNan = msgArgs.get("skip_nan").getBoolValue(),
+              ddof = msgArgs.get("ddof").getIntValue(),
+              valuesNames = msgArgs["values"].toScalarList(string),
+              ops = msgArgs["ops"].toScalarList(string),
+              which = msgArgs["which"].toScalarList(int),
+              permName = msgArgs.getValueOf("permutation");
+
+        var segments = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("segments"), st), int);
+        if ops.size != which.size {
+            const errorMsg = "Expected one values index per operator but found %i operators and %i indices"
+                             .format(ops.size, which.size);
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return MsgTuple.error(errorMsg);
+        }
+
+        proc permute(const ref a: [?D] ?t, const ref perm: [] int) throws {
+            var ret = makeDistArray(D, t);
+            if t == bigint {
+                forall (r, i) in zip(ret, perm) do r = a[i];
+            } else {
+                forall (r, i) in zip(ret, perm) with (var agg = newSrcAggregator(t)) do agg.copy(r, a[i]);
+            }
+            return ret;
+        }
+
+        // the permuted copies are always deleted, and the results already
+        // created are deleted too if a later reduction fails
+        var created: [0..<ops.size] string,
+            tmpNames = new list(string),
+            resultNames = new list(string),
+            succeeded = false;
+        defer {
+            try {
+                for name in tmpNames do st.deleteEntry(name);
+                if !succeeded then for name in resultNames do st.deleteEntry(name);
+            } catch e {
+                rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),e.message());
+            }
+        }
+
+        for v in 0..<valuesNames.size {
+            var gVal = getGenericTypedArrayEntry(valuesNames[v], st);
+            var gPermuted = gVal;
+            if permName != "" {
+                const perm = toSymEntry(getGenericTypedArrayEntry(permName, st), int);
+                overMemLimit(gVal.size * gVal.itemsize);
+                const tmpName = st.nextName();
+                select gVal.dtype {
+                    when DType.Int64 do st.addEntry(tmpName, createSymEntry(permute(toSymEntry(gVal, int).a, perm.a)));
+                    when DType.UInt64 do st.addEntry(tmpName, createSymEntry(permute(toSymEntry(gVal, uint).a, perm.a)));
+                    when DType.Float64 do st.addEntry(tmpName, createSymEntry(permute(toSymEntry(gVal, real).a, perm.a)));
+                    when DType.Bool do st.addEntry(tmpName, createSymEntry(permute(toSymEntry(gVal, bool).a, perm.a)));
+                    when DType.BigInt {
+                        const values = toSymEntry(gVal, bigint);
+                        st.addEntry(tmpName, createSymEntry(permute(values.a, perm.a), values.max_bits));
+                    }
+                    otherwise {
+                        const errorMsg = unrecognizedTypeError("segmentedReductionMulti", dtype2str(gVal.dtype));
+                        rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                        return MsgTuple.error(errorMsg);
+                    }
+                }
+                tmpNames.pushBack(tmpName);
+                gPermuted = getGenericTypedArrayEntry(tmpName, st);
+            }
+
+            for i in 0..<ops.size {
+                if which[i] != v then continue;
+                const rname = st.nextName();
+                const res = segmentedReduction(gPermuted, segments, ops[i], skipNan, ddof, rname, msgArgs, st);
+                if res.msgType == MsgType.ERROR then return res;
+                resultNames.pushBack(rname);
+                created[i] = "created " + st.attrib(rname);
+            }
+        }
+
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "computed %i reductions of %i arrays".format(ops.size, valuesNames.size));
+        succeeded = true;
+        return MsgTuple.success(formatJson(created));
+    }
+
+    /*
+     * Computes a cumulative, rank or offset operation within each group of a
+     * GroupBy. The values are gathered into grouped order with the
+     * permutation, if one is given, processed in one pass over the segments
+     * and scattered back to their original order.
+     *
+     * For the rank operations, the permutation must order the rows by group
+     * and then by value, so that the segments are the same as the grouping's.
+     *
+     * :returns: MsgTuple with the created message of the result, one value per row
+     */
+    proc segmentedScanMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const op = msgArgs.getValueOf("op"),
+              size = msgArgs.get("size").getIntValue(),
+              periods = msgArgs.get("periods").getIntValue(),
+              fillStr = msgArgs.getValueOf("fill"),
+              permName = msgArgs.getValueOf("permutation");
+        var segments = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("segments"), st), int);
+        ref segs = segments.a;
+
+        // the original index of the row at each position in grouped order
+        overMemLimit(4 * numBytes(int) * size);
+        var perm = makeDistArray(size, int);
+        if permName == "" {
+            perm = perm.domain;
+        } else {
+            perm = toSymEntry(getGenericTypedArrayEntry(permName, st), int).a;
+        }
+        const D = perm.domain;
+        // the first and last position of the group of each position
+        var starts = makeDistArray(D, int),
+            ends = makeDistArray(D, int);
+        if size > 0 {
+            const keys = expandKeys(D, segs);
+            forall (s, e, k) in zip(starts, ends, keys) with (var agg = newSrcAggregator(int)) {
+                agg.copy(s, segs[k]);
+                if k < segs.domain.high then agg.copy(e, segs[k+1]); else e = size;
+            }
+            ends -= 1;
+        }
+
+        proc grouped(const ref a: [] ?t) throws {
+            var g = makeDistArray(D, t);
+            forall (x, p) in zip(g, perm) with (var agg = newSrcAggregator(t)) {
+                agg.copy(x, a[p]);
+            }
+            return g;
+        }
+
+        proc ungroupedEntry(const ref g: [] ?t) throws {
+            var a = makeDistArray(D, t);
+            forall (x, p) in zip(g, perm) with (var agg = newDstAggregator(t)) {
+                agg.copy(a[p], x);
+            }
+            return createSymEntry(a);
+        }
+
+        const rname = st.nextName();
+        if op == "cumcount" {
+            const counts = [(s, i) in zip(starts, D)] i - s;
+            st.addEntry(rname, ungroupedEntry(counts));
+        } else {
+            var gVal = getGenericTypedArrayEntry(msgArgs.getValueOf("values"), st);
+
+            proc scanHelper(type t): bool throws {
+                const g = grouped(toSymEntry(gVal, t).a);
+                select op {
+                    when "cumsum" do st.addEntry(rname, ungroupedEntry(segCumSum(g, segs)));
+                    when "cumprod" do st.addEntry(rname, ungroupedEntry(segCumProd(g, segs)));
+                    when "cummax" do st.addEntry(rname, ungroupedEntry(segCumMax(g, segs)));
+                    when "cummin" do st.addEntry(rname, ungroupedEntry(segCumMin(g, segs)));
+                    when "rank_first", "rank_min", "rank_dense" {
+                        const method = op.replace("rank_", "");
+                        st.addEntry(rname, ungroupedEntry(segRank(g, starts, method)));
+                    }
+                    when "shift" {
+                        st.addEntry(rname, ungroupedEntry(segShift(g, starts, ends, periods, fillStr: t)));
+                    }
+                    when "diff" do st.addEntry(rname, ungroupedEntry(segDiff(g, starts, ends, periods)));
+                    otherwise do return false;
+                }
+                return true;
+            }
+
+            var supported: bool;
+            select gVal.dtype {
+                when DType.Int64 do supported = scanHelper(int);
+                when DType.UInt64 do supported = scanHelper(uint);
+                when DType.Float64 do supported = scanHelper(real);
+                when DType.Bool do supported = scanHelper(bool);
+                otherwise do supported = false;
+            }
+            if !supported {
+                const errorMsg = notImplementedError("segmentedScan", op, gVal.dtype);
+                rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return MsgTuple.error(errorMsg);
+            }
+        }
+
+        const repMsg = "created " + st.attrib(rname);
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return MsgTuple.success(repMsg);
+    }
+
+    /* Cumulative sum of each segment of values. NaN values are skipped and
+       give NaN. */
+    proc segCumSum(values: [?vD] ?intype, segments: [?D] int) throws {
+      type t = if intype == bool then int else intype;
+      var flagvalues = makeDistArray(vD, (bool, t));
+      forall (fv, v) in zip(flagvalues, values) {
+        if isRealType(t) then fv = (false, if isNan(v) then 0.0 else v);
+        else fv = (false, v:t);
+      }
+      forall s in segments with (var agg = newDstAggregator(bool)) {
+        agg.copy(flagvalues[s][0], true);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit((numBytes(t)+1) * flagvalues.size);
+      const scanresult = ResettingPlusScanOp scan flagvalues;
+      var res = makeDistArray(vD, t);
+      forall (r, fs, v) in zip(res, scanresult, values) {
+        const (_, s) = fs;
+        if isRealType(t) then r = if isNan(v) then nan else s;
+        else r = s;
+      }
+      return res;
     }
 
+    /* Cumulative product of each segment of values. NaN values are skipped
+       and give NaN. */
+    proc segCumProd(values: [?vD] ?intype, segments: [?D] int) throws {
+      type t = if intype == bool then int else intype;
+      var flagvalues = makeDistArray(vD, (bool, t));
+      forall (fv, v) in zip(flagvalues, values) {
+        if isRealType(t) then fv = (false, if isNan(v) then 1.0 else v);
+        else fv = (false, v:t);
+      }
+      forall s in segments with (var agg = newDstAggregator(bool)) {
+        agg.copy(flagvalues[s][0], true);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit((numBytes(t)+1) * flagvalues.size);
+      const scanresult = ResettingProductScanOp scan flagvalues;
+      var res = makeDistArray(vD, t);
+      forall (r, fs, v) in zip(res, scanresult, values) {
+        const (_, s) = fs;
+        if isRealType(t) then r = if isNan(v) then nan else s;
+        else r = s;
+      }
+      return res;
+    }
+
+    /* Performs a product scan, controlled by a reset flag, like
+     * ResettingPlusScanOp does a sum scan. */
+    class ResettingProductScanOp: ReduceScanOp {
+      type eltType;
+      var value: eltType;
+
+      proc identity {
+        if eltType == (bool, real) then return (false, 1.0);
+        else if eltType == (bool, uint) then return (false, 1:uint);
+        else return (false, 1);
+      }
+
+      proc accumulate(x) {
+        const (reset, other) = x;
+        const (hasReset, v) = value;
+        value = (hasReset | reset, if reset then other else (v * other));
+      }
+
+      proc accumulateOntoState(ref state, x) {
+        const (prevReset, other) = x;
+        const (hasReset, v) = state;
+        state = (hasReset | prevReset, if hasReset then v else (v * other));
+      }
+
+      proc combine(x) {
+        const (xHasReset, other) = x.value;
+        const (hasReset, v) = value;
+        value = (hasReset | xHasReset, if hasReset then v else (v * other));
+      }
+
+      proc generate() {
+        return value;
+      }
+
+      proc clone() {
+        return new unmanaged ResettingProductScanOp(eltType=eltType);
+      }
+    }
+
+    /* Cumulative maximum of each segment of values. NaN values are skipped
+       and give NaN. */
+    proc segCumMax(values: [?vD] ?intype, segments: [?D] int) throws {
+      type t = if intype == bool then int else intype;
+      // the segment keys increase, so the max scan never carries a value
+      // over from an earlier segment
+      const keys = expandKeys(vD, segments);
+      var kv = makeDistArray(vD, (int, t));
+      forall (x, k, v) in zip(kv, keys, values) {
+        if isRealType(t) then x = (k, if isNan(v) then min(real) else v);
+        else x = (k, v:t);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit((numBytes(t) + numBytes(int)) * kv.size);
+      const cummax = max scan kv;
+      var res = makeDistArray(vD, t);
+      forall (r, kc, v) in zip(res, cummax, values) {
+        const (_, c) = kc;
+        if isRealType(t) then r = if isNan(v) then nan else c;
+        else r = c;
+      }
+      return res;
+    }
+
+    /* Cumulative minimum of each segment of values. NaN values are skipped
+       and give NaN. */
+    proc segCumMin(values: [?vD] ?intype, segments: [?D] int) throws {
+      type t = if intype == bool then int else intype;
+      // negating the increasing segment keys keeps the min scan from
+      // carrying a value over from an earlier segment
+      const keys = expandKeys(vD, segments);
+      var kv = makeDistArray(vD, (int, t));
+      forall (x, k, v) in zip(kv, keys, values) {
+        if isRealType(t) then x = (-k, if isNan(v) then max(real) else v);
+        else x = (-k, v:t);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit((numBytes(t) + numBytes(int)) * kv.size);
+      const cummin = min scan kv;
+      var res = makeDistArray(vD, t);
+      forall (r, kc, v) in zip(res, cummin, values) {
+        const (_, c) = kc;
+        if isRealType(t) then r = if isNan(v) then nan else c;
+        else r = c;
+      }
+      return res;
+    }
+
+    /* 1-based rank of each of values within its segment, where the values of
+       each segment are sorted. Ties get the rank of their first occurrence
+       with method "min", consecutive ranks with "first" and ranks without
+       gaps with "dense". */
+    proc segRank(values: [?vD] ?t, starts: [vD] int, method: string) throws {
+      var res = makeDistArray(vD, int);
+      if method == "first" {
+        forall (r, s, i) in zip(res, starts, vD) do r = i - s + 1;
+        return res;
+      }
+      // flag the first occurrence of each value in its segment
+      var isNew = makeDistArray(vD, bool);
+      forall (n, s, v, i) in zip(isNew, starts, values, vD) {
+        n = (i == s) || (values[i-1] != v);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit(numBytes(int) * vD.size);
+      if method == "min" {
+        // the position of the last first occurrence is the rank of its ties
+        const lastNew = max scan [(n, i) in zip(isNew, vD)] if n then i else 0;
+        forall (r, l, s) in zip(res, lastNew, starts) do r = l - s + 1;
+      } else {
+        // the number of first occurrences so far is the dense rank
+        const flagvalues = [(n, s, i) in zip(isNew, starts, vD)] (i == s, n: int);
+        const scanresult = ResettingPlusScanOp scan flagvalues;
+        forall (r, fs) in zip(res, scanresult) {
+          const (_, c) = fs;
+          r = c;
+        }
+      }
+      return res;
+    }
+
+    /* Each of values shifted by periods positions within its segment, with
+       the positions shifted in from outside the segment set to fill. */
+    proc segShift(values: [?vD] ?t, starts: [vD] int, ends: [vD] int, periods: int, fill: t) throws {
+      var res = makeDistArray(vD, t);
+      forall (r, s, e, i) in zip(res, starts, ends, vD) with (var agg = newSrcAggregator(t)) {
+        const src = i - periods;
+        if src >= s && src <= e then agg.copy(r, values[src]); else r = fill;
+      }
+      return res;
+    }
+
+    /* The difference between each of values and the value periods positions
+       earlier in its segment, or NaN if there is none. */
+    proc segDiff(values: [?vD] ?t, starts: [vD] int, ends: [vD] int, periods: int) throws {
+      const prev = segShift(values, starts, ends, periods, 0: t);
+      var res = makeDistArray(vD, real);
+      forall (r, v, p, s, e, i) in zip(res, values, prev, starts, ends, vD) {
+        const src = i - periods;
+        r = if src >= s && src <= e then v: real - p: real else nan;
+      }
+      return res;
+    }
 
     /*  Compute the maximum/minimum of a vector and a scalar.
     */
@@ -1776,5 +2179,7 @@ module ReductionMsg
 
     use CommandMap;
     registerFunction("segmentedReduction", segmentedReductionMsg, getModuleName());
+    registerFunction("segmentedReductionMulti", segmentedReductionMultiMsg, getModuleName());
+    registerFunction("segmentedScan", segmentedScanMsg, getModuleName());
     registerFunction("sizeReduction", sizeReductionMsg, getModuleName());
 }
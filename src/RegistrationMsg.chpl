@@ -271,6 +271,16 @@ module RegistrationMsg {
         return new MsgTuple("Registered BitVector", MsgType.NORMAL);
     }
 
+    proc register_intervalindex(msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        var reg_name = msgArgs.getValueOf("name");
+        var iire = new shared IntervalIndexRegEntry(msgArgs.getValueOf("starts"),
+                                                    msgArgs.getValueOf("ends"),
+                                                    msgArgs.getValueOf("breaks"),
+                                                    msgArgs.getValueOf("labels"));
+        st.registry.register_intervalindex(reg_name, iire);
+        return new MsgTuple("Registered IntervalIndex", MsgType.NORMAL);
+    }
+
     proc registerMsg(cmd: string, msgArgs: borrowed MessageArgs,
                         st: borrowed SymTab): MsgTuple throws {
         var objtype = msgArgs.getValueOf("objType").toUpper(): ObjType;
@@ -302,6 +312,9 @@ module RegistrationMsg {
             when ObjType.BITVECTOR {
                 return register_bitvector(msgArgs, st);
             }
+            when ObjType.INTERVALINDEX {
+                return register_intervalindex(msgArgs, st);
+            }
             otherwise {
                 var errorMsg = "ObjType Not Supported by Registry: %s".format(objtype: string);
                 throw getErrorWithContext(
@@ -355,6 +368,10 @@ module RegistrationMsg {
                 var bre = gre: shared BitVectorRegEntry;
                 st.registry.unregister_bitvector(bre);
             }
+            when ObjType.INTERVALINDEX {
+                var iire = gre: shared IntervalIndexRegEntry;
+                st.registry.unregister_intervalindex(iire);
+            }
             otherwise {
                 var errorMsg = "ObjType Not Supported by Registry: %s".format(gre.objType: string);
                 throw getErrorWithContext(
@@ -426,6 +443,10 @@ module RegistrationMsg {
                 var bre = gre: shared BitVectorRegEntry;
                 rtnMap = bre.asMap(st);
             }
+            when ObjType.INTERVALINDEX {
+                var iire = gre: shared IntervalIndexRegEntry;
+                rtnMap = iire.asMap(st);
+            }
             otherwise {
                 var errorMsg = "Unexpected ObjType, %s, found in registry.".format(gre.objType: string);
                 throw getErrorWithContext(
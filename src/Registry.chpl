@@ -159,6 +159,16 @@ module Registry {
             bre.setName(name);
         }
 
+        proc register_intervalindex(name: string, iire: shared IntervalIndexRegEntry) throws {
+            checkAvailability(name);
+            tab.addOrReplace(name, iire);
+            registered_entries.pushBack(iire.starts);
+            registered_entries.pushBack(iire.ends);
+            registered_entries.pushBack(iire.breaks);
+            registered_entries.pushBack(iire.labels);
+            iire.setName(name);
+        }
+
         proc unregister_array(are: shared ArrayRegEntry) throws {
             registered_entries.remove(are.array);
             tab.remove(are.name);
@@ -283,6 +293,14 @@ module Registry {
             tab.remove(bre.name);
         }
 
+        proc unregister_intervalindex(iire: shared IntervalIndexRegEntry) throws {
+            registered_entries.remove(iire.starts);
+            registered_entries.remove(iire.ends);
+            registered_entries.remove(iire.breaks);
+            registered_entries.remove(iire.labels);
+            tab.remove(iire.name);
+        }
+
         proc lookup(name: string): shared AbstractRegEntry throws {
             checkTable(name, "lookup");
             // TODO update to return tab[name]; when 1.31 is our lowest supported version
@@ -36,6 +36,7 @@ module ServerConfig
       SERIES=11,
       INDEX=12,
       MULTIINDEX=13,
+      INTERVALINDEX=14,
     };
 
     /*
@@ -106,6 +107,12 @@ module ServerConfig
     */
     config const serverInfoNoSplash = false;
 
+    /*
+    Directory used to hand bulk array data to clients on the same host
+    through shared memory files; an empty string disables the transport
+    */
+    config const sharedMemoryDir = "/dev/shm";
+
     /*
     Hostname where I am running
     */
@@ -201,6 +208,8 @@ module ServerConfig
             const autoShutdown: bool;
             const serverInfoNoSplash: bool;
             const maxArrayDims: int;
+            const binaryArguments: bool;
+            const sharedMemoryDir: string;
         }
 
         var (Zmajor, Zminor, Zmicro) = ZMQ.version;
@@ -227,7 +236,9 @@ module ServerConfig
             byteorder = try! getByteorder(),
             autoShutdown = autoShutdown,
             serverInfoNoSplash = serverInfoNoSplash,
-            maxArrayDims = MaxArrayDims
+            maxArrayDims = MaxArrayDims,
+            binaryArguments = true,
+            sharedMemoryDir = if numLocales == 1 then sharedMemoryDir else ""
         );
         return try! formatJson(cfg);
 
@@ -350,6 +350,7 @@ module ServerDaemon {
          */
         proc registerServerCommands() {
             registerFunction("delete", deleteMsg);
+            registerFunction("deleteMany", deleteManyMsg);
             registerFunction("info", infoMsg);
             registerFunction("str", strMsg);
             registerFunction("repr", reprMsg);
@@ -358,10 +359,14 @@ module ServerDaemon {
             registerFunction("getavailmem", getmemavailMsg);
             registerFunction("getmemstatus", getMemoryStatusMsg);
             registerFunction("getCmdMap", getCommandMapMsg);
+            registerFunction("batch", batchMsg);
             registerFunction("clear", clearMsg);
             registerFunction("lsany", lsAnyMsg);
             registerFunction("getfiletype", getFileTypeMsg);
             registerFunction("globExpansion", globExpansionMsg);
+            registerFunction("sharedMemoryProbe", sharedMemoryProbeMsg);
+            registerFunction("arrayMany", arrayManyMsg);
+            registerFunction("tondarrayMany", tondarrayManyMsg);
 
             // For a few specialized cmds we're going to add dummy functions, so they
             // get added to the client listing of available commands. They will be
@@ -23,6 +23,7 @@ module Unique
 
     use CommAggregation;
     use RadixSortLSD;
+    use ArkoudaSortCompat only sort;
     use SegmentedString;
     use AryUtil;
     use Reflection;
@@ -166,6 +167,247 @@ module Unique
         }
     }
 
+    /*
+    Sends each row, as its hash and index, to the locale that owns its hash.
+
+    :arg hashes: 128-bit hash of each row
+    :type hashes: [] 2*uint
+
+    :returns: ([] 3*uint, [] int) the (hash, index) rows, with the rows owned
+              by each locale contiguous and in their original order, and the
+              offset of each locale's rows, followed by the number of rows
+    */
+    proc hashShuffle(hashes: [?aD] 2*uint) throws {
+        const n = aD.size;
+        overMemLimit(n * 3 * numBytes(uint));
+
+        inline proc owner(h: 2*uint): int {
+          const (_, lo) = h;
+          return (lo % numLocales: uint): int;
+        }
+
+        // count the rows each task sends to each locale, in transposed order
+        // so that a scan gives the position of each task's rows
+        var globalCounts = makeDistArray(numLocales*numTasks*numLocales, int);
+        coforall loc in Locales with (ref globalCounts) {
+            on loc {
+                var tasksOwnerCounts: [Tasks] [0..#numLocales] int;
+                coforall task in Tasks with (ref tasksOwnerCounts) {
+                    ref taskOwnerCounts = tasksOwnerCounts[task];
+                    const lD = hashes.localSubdomain();
+                    for i in calcBlock(task, lD.low, lD.high) {
+                        taskOwnerCounts[owner(hashes.localAccess[i])] += 1;
+                    }
+                }
+                var aggregator = newDstAggregator(int);
+                for task in Tasks {
+                    for dest in 0..#numLocales {
+                        aggregator.copy(globalCounts[calcGlobalIndex(dest, loc.id, task)],
+                                        tasksOwnerCounts[task][dest]);
+                    }
+                }
+                aggregator.flush();
+            }
+        }
+        var globalStarts = + scan globalCounts;
+        globalStarts -= globalCounts;
+
+        // send each row, as (hash, index), to the block of the locale that owns it
+        var shuffled = makeDistArray(aD, 3*uint);
+        coforall loc in Locales with (ref shuffled) {
+            on loc {
+                var tasksOwnerPos: [Tasks] [0..#numLocales] int;
+                {
+                    var aggregator = newSrcAggregator(int);
+                    for task in Tasks {
+                        for dest in 0..#numLocales {
+                            aggregator.copy(tasksOwnerPos[task][dest],
+                                            globalStarts[calcGlobalIndex(dest, loc.id, task)]);
+                        }
+                    }
+                    aggregator.flush();
+                }
+                coforall task in Tasks with (ref tasksOwnerPos, ref shuffled) {
+                    ref taskOwnerPos = tasksOwnerPos[task];
+                    const lD = hashes.localSubdomain();
+                    var aggregator = newDstAggregator(3*uint);
+                    for i in calcBlock(task, lD.low, lD.high) {
+                        const (hi, lo) = hashes.localAccess[i];
+                        const dest = owner((hi, lo));
+                        aggregator.copy(shuffled[taskOwnerPos[dest]], (hi, lo, i: uint));
+                        taskOwnerPos[dest] += 1;
+                    }
+                    aggregator.flush();
+                }
+            }
+        }
+
+        var ownerStarts: [0..numLocales] int = n;
+        for dest in 0..#numLocales {
+            ownerStarts[dest] = globalStarts[calcGlobalIndex(dest, 0, 0)];
+        }
+        return (shuffled, ownerStarts);
+    }
+
+    /*
+    hash based grouping procedure
+
+    Groups equal hashes together without a global sort: each row is sent to
+    the locale that owns its hash, and each locale then groups the rows it
+    owns locally. Groups are ordered by owning locale and then by hash, and
+    the rows of a group keep their original order.
+
+    :arg hashes: 128-bit hash of each row
+    :type hashes: [] 2*uint
+
+    :returns: ([] int, [] int) the permutation that groups the rows and the offset of each group in it
+    */
+    proc hashGroup(hashes: [?aD] 2*uint) throws {
+        const n = aD.size;
+        // local copies of the owned rows, permutation and segment flags
+        overMemLimit(n * (3 * numBytes(uint) + 2 * numBytes(int) + numBytes(bool)));
+
+        const (shuffled, ownerStarts) = hashShuffle(hashes);
+
+        // the rows owned by a locale are contiguous in shuffled; sorting them by
+        // (hash, index) groups them and keeps the rows of each group in order
+        var perm = makeDistArray(aD, int);
+        var truth = makeDistArray(aD, bool);
+        coforall loc in Locales with (ref perm, ref truth) {
+            on loc {
+                const low = ownerStarts[loc.id], high = ownerStarts[loc.id+1];
+                if high > low {
+                    var mine: [0..#(high-low)] 3*uint = shuffled[low..<high];
+                    sort(mine);
+                    var myPerm: [mine.domain] int;
+                    var myTruth: [mine.domain] bool;
+                    forall (p, t, row, j) in zip(myPerm, myTruth, mine, mine.domain) {
+                        const (hi, lo, i) = row;
+                        p = i: int;
+                        if j == 0 {
+                          t = true;
+                        } else {
+                          const (prevHi, prevLo, _) = mine[j-1];
+                          t = (prevHi != hi) || (prevLo != lo);
+                        }
+                    }
+                    perm[low..<high] = myPerm;
+                    truth[low..<high] = myTruth;
+                }
+            }
+        }
+
+        // where ever a group starts (true value) is a segment start index
+        overMemLimit(numBytes(int) * truth.size);
+        const iv: [aD] int = + scan truth;
+        var segs = makeDistArray(iv[n-1], int);
+        forall (t, v, i) in zip(truth, iv, aD) with (var agg = newDstAggregator(int)) {
+          if t then agg.copy(segs[v-1], i);
+        }
+        uLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                      "hash grouped %i rows into %i groups".format(n, segs.size));
+        return (perm, segs);
+    }
+
+    /*
+    direct-addressing grouping procedure
+
+    Groups keys that lie in a small known range with a single counting-sort
+    pass: each task counts the keys of its part of the array in every bucket
+    of the range, a scan of the counts gives the position of each task's keys
+    and the keys' indices are scattered there. Groups are ordered by key and
+    the rows of a group keep their original order, as with a sort.
+
+    :arg keys: integer or bool keys, all in lo..#nBuckets
+    :type keys: [] ?t
+
+    :arg lo: the smallest key in the range
+    :type lo: int
+
+    :arg nBuckets: the number of keys in the range
+    :type nBuckets: int
+
+    :returns: ([] int, [] int) the permutation that groups the rows and the offset of each group in it
+    */
+    proc directGroup(keys: [?aD] ?t, lo: int, nBuckets: int) throws {
+        const n = aD.size;
+        overMemLimit(numBytes(int) * (2 * numLocales * numTasks * nBuckets + n));
+
+        inline proc bucket(k: t): int {
+          return k: int - lo;
+        }
+
+        // count the keys of each task in each bucket, in transposed order so
+        // that a scan gives the position of each task's keys
+        var globalCounts = makeDistArray(nBuckets*numLocales*numTasks, int);
+        coforall loc in Locales with (ref globalCounts) {
+            on loc {
+                var tasksBucketCounts: [Tasks] [0..#nBuckets] int;
+                coforall task in Tasks with (ref tasksBucketCounts) {
+                    ref taskBucketCounts = tasksBucketCounts[task];
+                    const lD = keys.localSubdomain();
+                    for i in calcBlock(task, lD.low, lD.high) {
+                        taskBucketCounts[bucket(keys.localAccess[i])] += 1;
+                    }
+                }
+                var aggregator = newDstAggregator(int);
+                for task in Tasks {
+                    for b in 0..#nBuckets {
+                        aggregator.copy(globalCounts[calcGlobalIndex(b, loc.id, task)],
+                                        tasksBucketCounts[task][b]);
+                    }
+                }
+                aggregator.flush();
+            }
+        }
+        var globalStarts = + scan globalCounts;
+        globalStarts -= globalCounts;
+
+        // put the index of each key at the next position of its bucket
+        var perm = makeDistArray(aD, int);
+        coforall loc in Locales with (ref perm) {
+            on loc {
+                var tasksBucketPos: [Tasks] [0..#nBuckets] int;
+                {
+                    var aggregator = newSrcAggregator(int);
+                    for task in Tasks {
+                        for b in 0..#nBuckets {
+                            aggregator.copy(tasksBucketPos[task][b],
+                                            globalStarts[calcGlobalIndex(b, loc.id, task)]);
+                        }
+                    }
+                    aggregator.flush();
+                }
+                coforall task in Tasks with (ref tasksBucketPos, ref perm) {
+                    ref taskBucketPos = tasksBucketPos[task];
+                    const lD = keys.localSubdomain();
+                    var aggregator = newDstAggregator(int);
+                    for i in calcBlock(task, lD.low, lD.high) {
+                        const b = bucket(keys.localAccess[i]);
+                        aggregator.copy(perm[taskBucketPos[b]], i);
+                        taskBucketPos[b] += 1;
+                    }
+                    aggregator.flush();
+                }
+            }
+        }
+
+        // the non-empty buckets are the groups
+        var bucketStarts: [0..nBuckets] int = n;
+        for b in 0..#nBuckets {
+            bucketStarts[b] = globalStarts[calcGlobalIndex(b, 0, 0)];
+        }
+        const nonEmpty = [b in 0..#nBuckets] bucketStarts[b+1] > bucketStarts[b];
+        const iv = + scan nonEmpty;
+        var segs = makeDistArray(if nBuckets > 0 then iv[nBuckets-1] else 0, int);
+        forall b in 0..#nBuckets with (var agg = newDstAggregator(int)) {
+            if nonEmpty[b] then agg.copy(segs[iv[b]-1], bucketStarts[b]);
+        }
+        uLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                      "direct grouped %i rows into %i groups".format(n, segs.size));
+        return (perm, segs);
+    }
+
     proc uniqueGroup(str: SegString, returnInverse = false) throws {
         if (str.size == 0) {
             uLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),"zero size");
@@ -41,13 +41,104 @@ module UniqueMsg
         // flag to return segments and permutation for GroupBy
         const returnGroups = msgArgs.get("returnGroupStr").getBoolValue();
         const assumeSorted = msgArgs.get("assumeSortedStr").getBoolValue();
-        var repMsg: string = "";
         // number of arrays
         var n = msgArgs.get("nstr").getIntValue();
         var keynames = msgArgs.get("keynames").getList(n);
         var keytypes = msgArgs.get("keytypes").getList(n);
         var (permutation, segments) = uniqueAndCount(n, keynames, keytypes, assumeSorted, st);
-        
+        return new MsgTuple(groupsReply(permutation, segments, returnGroups, st), MsgType.NORMAL);
+    }
+
+    /*
+     * Groups the rows of the key arrays by hashing them rather than sorting
+     * them. Takes the same arguments and gives the same reply as uniqueMsg,
+     * but the unique keys are in no particular order.
+     */
+    proc hashUniqueMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const returnGroups = msgArgs.get("returnGroupStr").getBoolValue();
+        var n = msgArgs.get("nstr").getIntValue();
+        var keynames = msgArgs.get("keynames").getList(n);
+        var keytypes = msgArgs.get("keytypes").getList(n);
+        if (n > 128) {
+          throw new owned ErrorWithContext("Cannot hash more than 128 arrays",
+                                           getLineNumber(),
+                                           getRoutineName(),
+                                           getModuleName(),
+                                           "ArgumentError");
+        }
+        var (size, _, _, _, _, names, types) = validateArraysSameLength(n, keynames, keytypes, st);
+        if size == 0 {
+          return new MsgTuple(groupsReply(createSymEntry(0, int), createSymEntry(0, int), returnGroups, st),
+                              MsgType.NORMAL);
+        }
+        var (perm, segs) = hashGroup(hashArrays(size, names, types, st));
+        return new MsgTuple(groupsReply(createSymEntry(perm), createSymEntry(segs), returnGroups, st),
+                            MsgType.NORMAL);
+    }
+
+    /*
+     * Groups the rows of a single integer or bool key array whose values lie
+     * in lo..hi with a counting sort rather than a radix sort. Gives the same
+     * reply, and the same grouping, as uniqueMsg.
+     */
+    proc directUniqueMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        const returnGroups = msgArgs.get("returnGroupStr").getBoolValue();
+        const name = msgArgs.getValueOf("keyname"),
+              lo = msgArgs.get("lo").getIntValue(),
+              hi = msgArgs.get("hi").getIntValue();
+        var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        if hi < lo {
+          const errorMsg = "the key range %i..%i is empty".format(lo, hi);
+          umLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+          return MsgTuple.error(errorMsg);
+        }
+
+        proc directHelper(type t): MsgTuple throws {
+            const ref keys = toSymEntry(gEnt, t).a;
+            if keys.size == 0 {
+              return new MsgTuple(groupsReply(createSymEntry(0, int), createSymEntry(0, int), returnGroups, st),
+                                  MsgType.NORMAL);
+            }
+            // keys are counted in int buckets, which uint keys of 2**63 or
+            // more would wrap around to
+            if t == uint {
+              if (max reduce keys) > max(int): uint {
+                const errorMsg = "uint64 keys of 2**63 or more cannot be grouped in an int64 key range";
+                umLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return MsgTuple.error(errorMsg);
+              }
+            }
+            const kMin = min reduce [k in keys] k: int,
+                  kMax = max reduce [k in keys] k: int;
+            if kMin < lo || kMax > hi {
+              const errorMsg = "keys in %i..%i are outside the key range %i..%i".format(kMin, kMax, lo, hi);
+              umLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+              return MsgTuple.error(errorMsg);
+            }
+            var (perm, segs) = directGroup(keys, lo, hi - lo + 1);
+            return new MsgTuple(groupsReply(createSymEntry(perm), createSymEntry(segs), returnGroups, st),
+                                MsgType.NORMAL);
+        }
+
+        select gEnt.dtype {
+            when DType.Int64 do return directHelper(int);
+            when DType.UInt64 do return directHelper(uint);
+            when DType.Bool do return directHelper(bool);
+            otherwise {
+                const errorMsg = notImplementedError(getRoutineName(), gEnt.dtype);
+                umLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return MsgTuple.error(errorMsg);
+            }
+        }
+    }
+
+    /*
+     * Adds the indices of the first row of each group to the SymTab and, if
+     * returnGroups, the permutation and segments too, returning the
+     * created message for them.
+     */
+    proc groupsReply(permutation, segments, returnGroups: bool, st: borrowed SymTab): string throws {
+        var repMsg: string = "";
         // If returning grouping info, add to SymTab and prepend to repMsg
         if returnGroups {
           var pname = st.nextName();
@@ -74,7 +165,7 @@ module UniqueMsg
         repMsg += "created " + st.attrib(iname);
         /* // Gather unique values, store in SymTab, and build repMsg */
         /* repMsg += storeUniqueKeys(n, fields, gatherInds, st); */
-        return new MsgTuple(repMsg, MsgType.NORMAL);
+        return repMsg;
     }
 
     proc storeUniqueKeys(n, names: [] string, types: [] string, gatherInds, st): string throws {
@@ -347,4 +438,6 @@ module UniqueMsg
 
     use CommandMap;
     registerFunction("unique", uniqueMsg, getModuleName());
+    registerFunction("hashUnique", hashUniqueMsg, getModuleName());
+    registerFunction("directUnique", directUniqueMsg, getModuleName());
 }
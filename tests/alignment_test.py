@@ -159,3 +159,75 @@ class TestAlignment:
             values, intervals, tiebreak=tiebreak_smallest, hierarchical=False
         )
         assert smallest_result.to_list() == smallest_answer
+
+    def test_lookup_index(self):
+        keys = ak.array([30, 10, 20])
+        values = ak.array([3, 1, 2])
+        args = ak.array([10, 40, 30, 30])
+        expected = ak.lookup(keys, values, args).to_list()
+        assert expected == [1, -1, 3, 3]
+        idx = ak.Index(keys)
+        assert ak.lookup(idx, values, args).to_list() == expected
+        assert ak.lookup(idx, values, args[:2]).to_list() == expected[:2]
+
+        keys2 = ak.array(["x", "y", "x"])
+        args2 = ak.array(["x", "y", "x", "y"])
+        midx = ak.Index.factory([keys, keys2])
+        assert ak.lookup(midx, values, [args, args2]).to_list() == [-1, -1, 3, -1]
+
+    @pytest.mark.parametrize("dtype", DATA_TYPES)
+    def test_interval_index(self, dtype):
+        lb = [0, 10, 20, 30, 40, 50]
+        ub = [9, 19, 29, 39, 49, 59]
+        v = [22, 51, 44, 1, 38, 19, 40, 60, 100, 9, 50]
+        lower_bound, upper_bound, vals = self.get_interval_info(lb, ub, v, dtype)
+        expected = ak.search_intervals(vals, (lower_bound, upper_bound)).to_list()
+
+        index = ak.IntervalIndex(lower_bound, upper_bound)
+        assert index.size == len(lb)
+        assert index.lookup(vals).to_list() == expected
+        assert ak.search_intervals(vals, index).to_list() == expected
+        assert (
+            ak.interval_lookup(index, ak.arange(len(lb)) * 2, vals).to_list()
+            == ak.interval_lookup((lower_bound, upper_bound), ak.arange(len(lb)) * 2, vals).to_list()
+        )
+
+        # unsorted and overlapping intervals, including a point interval
+        lb = [30, 0, 5, 12, 12]
+        ub = [40, 20, 15, 12, 35]
+        v = [0, 3, 5, 12, 13, 15, 16, 20, 21, 30, 35, 36, 40, 41]
+        lower_bound, upper_bound, vals = self.get_interval_info(lb, ub, v, dtype)
+        index = ak.IntervalIndex(lower_bound, upper_bound)
+        assert index.lookup(vals).to_list() == [1, 1, 1, 1, 1, 1, 1, 1, 4, 0, 0, 0, 0, -1]
+        tiebreak = upper_bound - lower_bound
+        index = ak.IntervalIndex(lower_bound, upper_bound, tiebreak=tiebreak)
+        assert index.lookup(vals).to_list() == [1, 1, 2, 3, 2, 2, 1, 1, 4, 0, 0, 0, 0, -1]
+
+    def test_interval_index_registration(self):
+        index = ak.IntervalIndex(ak.array([0, 10, 5]), ak.array([9, 19, 12]))
+        vals = ak.array([3, 7, 11, 12, 15, 20, -1])
+        try:
+            index.register("interval_index_test")
+            assert index.is_registered()
+            attached = ak.attach("interval_index_test")
+            assert isinstance(attached, ak.IntervalIndex)
+            assert attached.lookup(vals).to_list() == [0, 0, 1, 1, 1, -1, -1]
+            assert attached.starts.to_list() == [0, 10, 5]
+        finally:
+            index.unregister()
+        assert not index.is_registered()
+
+    def test_interval_index_errors(self):
+        lower_bound = ak.array([0, 10, 20])
+        upper_bound = ak.array([9, 19, 29])
+        with pytest.raises(TypeError):
+            ak.IntervalIndex(lower_bound, ak.cast(upper_bound, ak.float64))
+        with pytest.raises(ValueError):
+            ak.IntervalIndex(upper_bound, lower_bound)
+        with pytest.raises(ValueError):
+            ak.IntervalIndex(lower_bound, ak.array([9, 19]))
+        index = ak.IntervalIndex(lower_bound, upper_bound)
+        with pytest.raises(TypeError):
+            index.lookup(ak.array([1.5]))
+        with pytest.raises(ValueError):
+            ak.search_intervals(ak.array([1]), index, tiebreak=ak.arange(3))
@@ -0,0 +1,70 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+import arkouda as ak
+
+STRINGS = ["", "a", "héllo", "", "日本語", "x" * 100, " "]
+
+
+class TestArrow:
+    @pytest.mark.parametrize("dtype", [ak.int64, ak.uint64, ak.float64, ak.bool_])
+    def test_pdarray_round_trip(self, dtype):
+        pda = ak.array(np.arange(10) % 3).astype(dtype)
+        arr = pda.to_arrow()
+        assert arr.to_numpy(zero_copy_only=False).tolist() == pda.to_list()
+        assert ak.pdarray.from_arrow(arr).to_list() == pda.to_list()
+
+    def test_pdarray_from_arrow(self):
+        assert ak.pdarray.from_arrow(pa.array([1, -2], pa.int32())).dtype == ak.int64
+        assert ak.pdarray.from_arrow(pa.chunked_array([[1.5], [2.5]])).to_list() == [1.5, 2.5]
+        with pytest.raises(ValueError):
+            ak.pdarray.from_arrow(pa.array([1, None]))
+        with pytest.raises(TypeError):
+            ak.pdarray.from_arrow(pa.array(["a"]))
+
+    def test_strings_round_trip(self):
+        s = ak.array(STRINGS)
+        arr = s.to_arrow()
+        assert arr.type == pa.large_string()
+        assert arr.to_pylist() == STRINGS
+        assert ak.Strings.from_arrow(arr).to_list() == STRINGS
+        assert ak.Strings.from_arrow(pa.array(STRINGS)).to_list() == STRINGS
+        assert ak.Strings.from_arrow(pa.array(["z"] + STRINGS)[1:]).to_list() == STRINGS
+        chunked = pa.chunked_array([STRINGS[:3], STRINGS[3:]])
+        assert ak.Strings.from_arrow(chunked).to_list() == STRINGS
+        assert ak.Strings.from_arrow(pa.array([], pa.string())).size == 0
+        with pytest.raises(ValueError):
+            ak.Strings.from_arrow(pa.array(["a", None]))
+
+    def test_categorical_round_trip(self):
+        cat = ak.Categorical(ak.array(["a", "b", "a", "c"]))
+        arr = cat.to_arrow()
+        assert pa.types.is_dictionary(arr.type)
+        assert arr.to_pylist() == cat.to_list()
+        assert ak.Categorical.from_arrow(arr).to_list() == cat.to_list()
+        chunked = pa.chunked_array(
+            [pa.array(["a", "b"]).dictionary_encode(), pa.array(["c", "a"]).dictionary_encode()]
+        )
+        assert ak.Categorical.from_arrow(chunked).to_list() == ["a", "b", "c", "a"]
+
+    def test_dataframe_round_trip(self):
+        df = ak.DataFrame(
+            {
+                "int": ak.arange(4),
+                "float": ak.linspace(0, 1, 4),
+                "str": ak.array(["w", "x", "y", "z"]),
+                "cat": ak.Categorical(ak.array(["a", "b", "a", "b"])),
+                "date": ak.Datetime(ak.arange(4) * 10**9),
+            }
+        )
+        table = df.to_arrow()
+        assert table.column_names == ["int", "float", "str", "cat", "date"]
+        for name in ["int", "float", "str", "cat"]:
+            assert table.column(name).to_pylist() == df[name].to_list()
+        assert pa.types.is_timestamp(table.column("date").type)
+        result = ak.DataFrame.from_arrow(table)
+        assert isinstance(result["cat"], ak.Categorical)
+        assert isinstance(result["date"], ak.Datetime)
+        for name in table.column_names:
+            assert result[name].to_list() == df[name].to_list()
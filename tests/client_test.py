@@ -1,3 +1,6 @@
+import json
+
+import numpy as np
 import pytest
 
 import arkouda as ak
@@ -139,6 +142,8 @@ class TestClient:
         """
         ak.client.pdarrayIterThresh = 50
         ak.client.maxTransferBytes = 1048576000
+        ak.client.transferChunkBytes = 1048576
+        ak.client.sharedMemoryMinBytes = 1
         ak.client.verbose = True
         assert 50 == ak.client.pdarrayIterThresh
         assert 1048576000 == ak.client.maxTransferBytes
@@ -146,6 +151,8 @@ class TestClient:
         ak.client.set_defaults()
         assert 100 == ak.client.pdarrayIterThresh
         assert 1073741824 == ak.client.maxTransferBytes
+        assert 67108864 == ak.client.transferChunkBytes
+        assert 1048576 == ak.client.sharedMemoryMinBytes
         assert not ak.client.verbose
 
     def test_client_get_server_commands(self):
@@ -156,3 +163,105 @@ class TestClient:
         cmds = ak.client.get_server_commands()
         for cmd in ["connect", "info", "str"]:
             assert cmd in cmds
+
+    def test_generic_msg_async(self):
+        """
+        Tests the ak.client.generic_msg_async method, including many requests
+        in flight at once, binary replies, and server-side errors
+        """
+        futures = [ak.client.generic_msg_async(cmd="noop") for _ in range(100)]
+        assert all(f.result() == "noop" for f in futures)
+
+        a = ak.arange(10)
+        futures = [
+            ak.client.generic_msg_async(cmd="str", args={"array": a, "printThresh": 100})
+            for _ in range(10)
+        ]
+        assert all(f.result() == str(a) for f in futures)
+
+        data = ak.client.generic_msg_async(
+            cmd=f"tondarray<{a.dtype},{a.ndim}>", args={"array": a}, recv_binary=True
+        ).result()
+        assert len(data) == a.size * a.itemsize
+
+        with pytest.raises(RuntimeError):
+            ak.client.generic_msg_async(cmd="not_a_command").result()
+
+    def test_deferred_delete(self):
+        """
+        Tests that garbage-collected pdarrays are queued for deletion and
+        deleted when the next request is sent
+        """
+        a = ak.arange(10)
+        names = [(a + i).name for i in range(100)]
+        assert names[-1] in ak.client._pending_deletes
+        # the pending deletes are done before the next command is sent
+        symbols = ak.list_symbol_table()
+        assert a.name in symbols
+        assert not any(name in symbols for name in names)
+        assert len(ak.client._pending_deletes) == 0
+
+    def test_binary_args(self):
+        """
+        Tests sending command arguments in the compact binary format
+        """
+        if not ak.client.get_config().get("binaryArguments", False):
+            pytest.skip("server does not support the binary argument format")
+        a = ak.arange(10)
+        try:
+            ak.client.binaryArgs = True
+            b = a + 1
+            assert (b.to_ndarray() == np.arange(1, 11)).all()
+            assert b[3] == 4
+            assert ak.sum(ak.array(["a", "bc"]).get_lengths()) == 3
+        finally:
+            ak.client.binaryArgs = False
+
+    def test_batch(self):
+        """
+        Tests the ak.batch context manager, including commands that refer to
+        symbols created earlier in the batch, flushing, and server-side errors
+        """
+        a = ak.arange(10)
+        with ak.batch() as b:
+            doubled = b.generic_msg(cmd="binopvs<int64,int64,1>", args={"op": "*", "a": a, "value": 2})
+            shifted = b.generic_msg(
+                cmd="binopvs<int64,int64,1>", args={"op": "+", "a": doubled, "value": 1}
+            )
+            with ak.batch() as nested:
+                assert nested is b
+                info = nested.generic_msg(cmd="info", args={"names": json.dumps([a.name])})
+            assert not shifted.done
+        assert (ak.create_pdarray(shifted.result()) == a * 2 + 1).all()
+        assert (ak.create_pdarray(doubled.result()) == a * 2).all()
+        assert a.name in info.result()
+
+        # a command sent directly flushes the batch first
+        with ak.batch() as b:
+            info = b.generic_msg(cmd="info", args={"names": json.dumps([a.name])})
+            assert "imok" == generic_msg(cmd="ruok")
+            assert info.done
+
+        with pytest.raises(RuntimeError):
+            with ak.batch() as b:
+                b.generic_msg(cmd="not_a_command")
+                skipped = b.generic_msg(cmd="info", args={"names": json.dumps([a.name])})
+        with pytest.raises(RuntimeError):
+            skipped.result()
+
+        # functions that batch their own commands work inside a batch
+        with ak.batch() as b:
+            info = b.generic_msg(cmd="info", args={"names": json.dumps([a.name])})
+            g = ak.GroupBy(ak.array([3, 1, 3, 2]))
+            assert info.done
+            assert g.unique_keys.to_list() == [1, 2, 3]
+            assert sorted(ak.unique(ak.array(["b", "a", "b"])).to_list()) == ["a", "b"]
+
+    def test_aio(self):
+        """
+        Tests the asyncio interface in ak.aio
+        """
+        import asyncio
+
+        assert ["noop"] * 10 == asyncio.run(ak.aio.noop(10))
+        assert "imok" == asyncio.run(ak.aio.generic_msg(cmd="ruok"))
@@ -297,6 +297,27 @@ class TestDataFrame:
 
         pd_assert_frame_equal(df.to_pandas(retain_index=True), expected_df)
 
+    def test_round_trip_pandas_wide(self):
+        columns = [
+            np.arange(5),
+            np.linspace(0, 1, 5),
+            np.arange(5) % 2 == 0,
+            np.arange(5, dtype=np.uint64),
+            np.array(["a", "héllo", "", "日本", "z"], dtype=object),
+        ]
+        pd_df = pd.DataFrame({f"c_{i}": columns[i % 5] for i in range(200)})
+        ak_df = ak.DataFrame(pd_df)
+        assert isinstance(ak_df["c_4"], ak.Strings)
+        assert_frame_equal(pd_df, ak_df.to_pandas())
+
+        # small transfer chunks split the columns across several messages
+        default = ak.client.transferChunkBytes
+        try:
+            ak.client.transferChunkBytes = 100
+            assert_frame_equal(pd_df, ak.DataFrame(pd_df).to_pandas())
+        finally:
+            ak.client.transferChunkBytes = default
+
     def test_convenience_init(self):
         dict1 = {"0": [1, 2], "1": [True, False], "2": ["foo", "bar"], "3": [2.3, -1.8]}
         dict2 = {"0": (1, 2), "1": (True, False), "2": ("foo", "bar"), "3": (2.3, -1.8)}
@@ -719,6 +740,42 @@ class TestDataFrame:
         assert_frame_equal(pd_result4, ak_result4.to_pandas(retain_index=True))
         assert isinstance(ak_result4, ak.dataframe.DataFrame)
 
+    def test_gb_agg(self):
+        ak_df = self.build_ak_df_example2()
+        pd_df = ak_df.to_pandas(retain_index=True)
+
+        ak_result = ak_df.groupby("key1").agg({"count": ["min", "max"], "nums": "sum"})
+        pd_result = pd_df.groupby("key1").agg({"count": ["min", "max"], "nums": "sum"})
+        pd_result.columns = ["count_min", "count_max", "nums"]
+        assert_frame_equal(ak_result.to_pandas(retain_index=True), pd_result)
+
+        ak_result = ak_df.groupby(["key1", "key2"]).agg("sum")
+        assert_frame_equal(
+            ak_result.to_pandas(retain_index=True),
+            ak_df.groupby(["key1", "key2"]).sum().to_pandas(retain_index=True),
+        )
+
+    def test_gb_scans(self):
+        ak_df = self.build_ak_df_example2()
+        pd_df = ak_df.to_pandas(retain_index=True)
+
+        for op in ["cumsum", "cumprod", "cummax", "cummin"]:
+            assert_frame_equal(
+                getattr(ak_df.groupby("key1"), op)(["count", "nums"]).to_pandas(retain_index=True),
+                getattr(pd_df.groupby("key1")[["count", "nums"]], op)(),
+            )
+        assert (
+            ak_df.groupby("key1").cumcount().to_list() == pd_df.groupby("key1").cumcount().to_list()
+        )
+        assert_frame_equal(
+            ak_df.groupby("key1").shift("nums", fill_value=0).to_pandas(retain_index=True),
+            pd_df.groupby("key1")[["nums"]].shift(fill_value=0),
+        )
+        assert_frame_equal(
+            ak_df.groupby("key1").rank("nums", method="min").to_pandas(retain_index=True),
+            pd_df.groupby("key1")[["nums"]].rank(method="min").astype("int64"),
+        )
+
     def test_gb_aggregations_numeric_types(self):
         ak_df = self.build_ak_df_example_numeric_types()
         pd_df = ak_df.to_pandas(retain_index=True)
@@ -1136,6 +1193,88 @@ class TestDataFrame:
                     # assert_frame_equal(sorted_ak.to_pandas()[sorted_column_names],
                     # sorted_pd[sorted_column_names])
 
+    def test_merge_broadcast_join(self, monkeypatch):
+        # a small table is merged by a hash join that broadcasts it
+        fact = ak.DataFrame({"key": ak.randint(0, 200, 10_000, seed=1), "x": ak.arange(10_000)})
+        dim = ak.DataFrame({"key": ak.arange(100), "y": 10 * ak.arange(100)})
+        joins = []
+        hash_join = ak.join.hash_join
+
+        def spy(*args, **kwargs):
+            joins.append(kwargs.get("how", "inner"))
+            return hash_join(*args, **kwargs)
+
+        monkeypatch.setattr(ak.join, "hash_join", spy)
+        monkeypatch.setattr(ak.dataframe, "hash_join", spy)
+        for left, right in (fact, dim), (dim, fact):
+            for how in "inner", "left", "right", "outer":
+                joins.clear()
+                ak_merge = ak.merge(left, right, on="key", how=how).to_pandas()
+                pd_merge = pd.merge(left.to_pandas(), right.to_pandas(), on="key", how=how)
+                # the unmatched rows are found by anti joins
+                assert "inner" in joins and (how == "inner") == ("anti" not in joins)
+                assert_frame_equal(
+                    ak_merge.sort_values(["key", "x"]).reset_index(drop=True)[pd_merge.columns],
+                    pd_merge.sort_values(["key", "x"]).reset_index(drop=True),
+                    check_dtype=False,
+                )
+
+    @pytest.mark.parametrize("direction", ["backward", "forward", "nearest"])
+    def test_merge_asof(self, direction):
+        size = 1000
+        trades = pd.DataFrame(
+            {
+                "time": np.sort(np.random.randint(0, size, size)),
+                "sym": np.random.choice(["a", "b", "c"], size),
+                "qty": np.random.randint(0, 100, size),
+            }
+        )
+        quotes = pd.DataFrame(
+            {
+                "time": np.sort(np.random.randint(0, size, size // 2)),
+                "sym": np.random.choice(["a", "b", "d"], size // 2),
+                "qty": np.random.randint(0, 100, size // 2),
+                "bid": np.random.uniform(0, 1, size // 2),
+            }
+        )
+        ak_trades, ak_quotes = ak.DataFrame(trades), ak.DataFrame(quotes)
+        for by in None, "sym":
+            for tolerance in None, 5:
+                ak_merge = ak.merge_asof(
+                    ak_trades, ak_quotes, on="time", by=by, direction=direction, tolerance=tolerance
+                )
+                pd_merge = pd.merge_asof(
+                    trades,
+                    quotes,
+                    on="time",
+                    by=by,
+                    direction=direction,
+                    tolerance=tolerance,
+                    suffixes=("_x", "_y"),
+                )
+                assert ak_merge.columns.values == list(pd_merge.columns)
+                for col in pd_merge.columns:
+                    from_ak = ak_merge[col].to_ndarray()
+                    from_pd = pd_merge[col].to_numpy()
+                    if from_pd.dtype == object:
+                        assert (from_ak == from_pd.astype(str)).all()
+                    else:
+                        assert np.allclose(from_ak, from_pd, equal_nan=True)
+
+        # Datetime keys take a timedelta tolerance
+        times = ak.Datetime(ak.array([0, 10, 20]), unit="s")
+        quote_times = ak.Datetime(ak.array([5, 19]), unit="s")
+        res = ak.merge_asof(
+            ak.DataFrame({"time": times}),
+            ak.DataFrame({"time": quote_times, "bid": ak.array([1, 2])}),
+            on="time",
+            tolerance=pd.Timedelta(seconds=5),
+        )
+        assert np.allclose(res["bid"].to_ndarray(), [np.nan, 1, 2], equal_nan=True)
+
+        with pytest.raises(ValueError):
+            ak.merge_asof(ak_trades, ak_quotes, on="qty")
+
     def test_isna_notna(self):
         df = ak.DataFrame(
             {
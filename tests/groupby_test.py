@@ -214,6 +214,201 @@ class TestGroupBy:
         assert keys.to_list() == [False, True]
         assert locs.to_list() == [2, 0]
 
+    def test_agg_multiple(self):
+        keys = ak.randint(0, 10, 1000, seed=1)
+        ivals = ak.randint(-100, 100, 1000, seed=2)
+        fvals = ak.randint(0, 1, 1000, dtype=ak.float64, seed=3)
+        g = ak.GroupBy(keys)
+        ops = ["sum", "min", "max", "mean", "argmin", "argmax", "var", "nunique"]
+        unique_keys, results = g.agg({"i": (ivals, ops), "f": (fvals, "std"), "i2": (ivals, "prod")})
+        assert unique_keys.to_list() == g.unique_keys.to_list()
+        assert list(results.keys()) == ["i", "f", "i2"]
+        assert list(results["i"].keys()) == ops
+        for op in ops:
+            expected = g.aggregate(ivals, op)[1].to_list()
+            assert np.allclose(results["i"][op].to_list(), expected)
+        assert np.allclose(results["f"]["std"].to_list(), g.std(fvals)[1].to_list())
+        assert np.allclose(results["i2"]["prod"].to_list(), g.prod(ivals)[1].to_list())
+
+        with pytest.raises(ValueError):
+            g.agg({"i": (ivals, ["sum", "total"])})
+
+        # the results computed before a failing reduction are not left behind
+        symbols = set(ak.list_symbol_table())
+        with pytest.raises(RuntimeError):
+            g.agg({"i": (ivals, ["sum", "max"]), "f": (fvals, "xor")})
+        assert set(ak.list_symbol_table()) <= symbols
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_hash_method(self, size):
+        a = ak.randint(0, size // 4, size, seed=1)
+        b = ak.random_strings_uniform(1, 3, size, seed=2)
+        vals = ak.randint(0, 100, size, seed=3)
+        for keys in (a, [a, b]):
+            gs = ak.GroupBy(keys)
+            gh = ak.GroupBy(keys, method="hash")
+            assert gh.ngroups == gs.ngroups
+            # the groups are the same, but in a different order
+            hkeys, hsum = gh.sum(vals)
+            skeys, ssum = gs.sum(vals)
+            hord = ak.coargsort(list(hkeys) if isinstance(hkeys, tuple) else [hkeys])
+            sord = ak.coargsort(list(skeys) if isinstance(skeys, tuple) else [skeys])
+            assert hsum[hord].to_list() == ssum[sord].to_list()
+            assert gh.first(vals)[1][hord].to_list() == gs.first(vals)[1][sord].to_list()
+            assert gh.broadcast(hsum).to_list() == gs.broadcast(ssum).to_list()
+
+        assert sorted(ak.unique(a, method="hash").to_list()) == ak.unique(a).to_list()
+        with pytest.raises(ValueError):
+            ak.GroupBy(a, method="tree")
+        with pytest.raises(ValueError):
+            ak.GroupBy(a, assume_sorted=True, method="hash")
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_direct_method(self, size):
+        a = ak.randint(-5, 20, size, seed=1)
+        bools = a % 3 == 0
+        cat = ak.Categorical(ak.random_strings_uniform(1, 2, size, seed=2))
+        vals = ak.randint(0, 100, size, seed=3)
+        cases = [(a, {"key_range": (-5, 19)}), (a, {"method": "direct"}), (bools, {}), (cat, {})]
+        for keys, kwargs in cases:
+            gd = ak.GroupBy(keys, **kwargs)
+            assert gd.method == "direct"
+            # counting gives the same grouping as sorting the integer keys
+            plain = keys.codes if isinstance(keys, ak.Categorical) else keys.astype(ak.int64)
+            expected = ak.GroupBy(plain)
+            assert gd.permutation.to_list() == expected.permutation.to_list()
+            assert gd.segments.to_list() == expected.segments.to_list()
+            assert gd.sum(vals)[1].to_list() == expected.sum(vals)[1].to_list()
+        assert cat[cat.group()].to_list() == cat[ak.argsort(cat.codes)].to_list()
+
+        for v, kwargs in ((a, {"key_range": (-5, 19)}), (bools, {})):
+            ukeys, counts = ak.value_counts(v, **kwargs)
+            expected_keys, expected_counts = np.unique(v.to_ndarray(), return_counts=True)
+            assert ukeys.dtype == v.dtype
+            assert ukeys.to_list() == expected_keys.tolist()
+            assert counts.to_list() == expected_counts.tolist()
+
+        with pytest.raises(RuntimeError):
+            ak.GroupBy(a, key_range=(0, 19))
+        with pytest.raises(ValueError):
+            ak.unique([a, a], method="direct")
+        with pytest.raises(TypeError):
+            ak.unique(ak.linspace(0, 1, 10), method="direct")
+        # the server counts keys in int64 buckets
+        big = ak.array([2**63, 2**63 + 1, 2**63], dtype=ak.uint64)
+        with pytest.raises(ValueError):
+            ak.GroupBy(big, method="direct")
+        with pytest.raises(ValueError):
+            ak.value_counts(big, key_range=(2**63, 2**63 + 1))
+        with pytest.raises(ValueError):
+            ak.GroupBy(a, key_range=(19, -5))
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_scans(self, size):
+        keys = np.random.randint(0, 20, size)
+        ivals = np.random.randint(-5, 5, size)
+        fvals = np.random.uniform(-5, 5, size)
+        fvals[np.random.randint(0, size, size // 10)] = np.nan
+        g = ak.GroupBy(ak.array(keys))
+        pd_int = pd.Series(ivals).groupby(keys)
+        pd_float = pd.Series(fvals).groupby(keys)
+
+        for op in ["cumsum", "cumprod", "cummax", "cummin"]:
+            assert getattr(g, op)(ak.array(ivals)).to_list() == getattr(pd_int, op)().to_list()
+            assert np.allclose(
+                getattr(g, op)(ak.array(fvals)).to_ndarray(),
+                getattr(pd_float, op)().to_numpy(),
+                equal_nan=True,
+            )
+        assert g.cumcount().to_list() == pd_int.cumcount().to_list()
+        for method in ["dense", "min", "first"]:
+            assert (
+                g.rank(ak.array(ivals), method=method).to_list()
+                == pd_int.rank(method=method).astype(int).to_list()
+            )
+        for periods in [1, 3, -2]:
+            assert (
+                g.shift(ak.array(ivals), periods, fill_value=0).to_list()
+                == pd_int.shift(periods, fill_value=0).to_list()
+            )
+            assert np.allclose(
+                g.shift(ak.array(fvals), periods).to_ndarray(),
+                pd_float.shift(periods).to_numpy(),
+                equal_nan=True,
+            )
+            assert np.allclose(
+                g.diff(ak.array(ivals), periods).to_ndarray(),
+                pd_int.diff(periods).to_numpy(),
+                equal_nan=True,
+            )
+
+        with pytest.raises(ValueError):
+            g.rank(ak.array(ivals), method="average")
+        with pytest.raises(ValueError):
+            g.cumsum(ak.arange(size + 1))
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_extend(self, size):
+        keys = ak.randint(0, 100, size, seed=1)
+        strs = ak.random_strings_uniform(1, 2, size, seed=2)
+        vals = ak.randint(0, 10, size, seed=3)
+        for k in (keys, [keys, strs]):
+            half = size // 2
+            first = k[:half] if isinstance(k, ak.pdarray) else [a[:half] for a in k]
+            rest = k[half:] if isinstance(k, ak.pdarray) else [a[half:] for a in k]
+            g = ak.GroupBy(first)
+            _, sums = g.sum(vals[:half])
+            _, maxes = g.max(vals[:half])
+            g.extend(rest)
+
+            expected = ak.GroupBy(k)
+            assert g.ngroups == expected.ngroups and g.length == expected.length
+            assert g.permutation.to_list() == expected.permutation.to_list()
+            assert g.segments.to_list() == expected.segments.to_list()
+            assert g.sum(vals)[1].to_list() == expected.sum(vals)[1].to_list()
+            assert (
+                g.extend_aggregate(sums, vals[half:], "sum").to_list()
+                == expected.sum(vals)[1].to_list()
+            )
+            assert (
+                g.extend_aggregate(maxes, vals[half:], "max").to_list()
+                == expected.max(vals)[1].to_list()
+            )
+
+        with pytest.raises(ValueError):
+            g.extend_aggregate(sums, vals[half:], "mean")
+        with pytest.raises(ValueError):
+            ak.GroupBy(keys).extend([keys, keys])
+
+        # the NaN group survives the merge when NaN keys are kept
+        fkeys = ak.array([1.0, np.nan, 2.0, np.nan, 1.0, 3.0])
+        g = ak.GroupBy(fkeys[:3], dropna=False)
+        g.extend(fkeys[3:])
+        expected = ak.GroupBy(fkeys, dropna=False)
+        assert g.ngroups == expected.ngroups == 4
+        assert g.size()[1].to_list() == expected.size()[1].to_list()
+
+    def test_groupby_cache(self):
+        a = ak.randint(0, 10, 1000, seed=1)
+        s = ak.array([str(i % 7) for i in range(1000)])
+        with ak.groupby_cache():
+            g1 = ak.GroupBy([a, s])
+            g2 = ak.GroupBy([a, s])
+            assert g2.permutation is g1.permutation and g2.segments is g1.segments
+            assert ak.GroupBy(a).permutation is not g1.permutation
+
+            a[0] = 100
+            g3 = ak.GroupBy([a, s])
+            assert g3.permutation is not g1.permutation
+            assert 100 in g3.unique_keys[0].to_list()
+
+            a += 1
+            assert ak.GroupBy([a, s]).permutation is not g3.permutation
+
+        with ak.groupby_cache(max_bytes=0):
+            assert ak.GroupBy(a).permutation is not ak.GroupBy(a).permutation
+        assert ak.GroupBy(a).permutation is not ak.GroupBy(a).permutation
+
     def test_boolean_arrays(self):
         a = ak.array([True, False, True, True, False])
         true_ct = a.sum()
@@ -653,6 +848,22 @@ class TestGroupBy:
             assert i_res[0].to_list() == bi_res[0].to_list()
             assert i_res[1].to_list() == (bi_res[1] - 2**200).to_list()
 
+    def test_groupby_uses_stats(self):
+        keys = ak.sort(ak.randint(0, 10, 100, seed=1))
+        g = ak.GroupBy(keys)
+        assert g.assume_sorted
+        assert g.unique_keys.to_list() == ak.GroupBy(keys[::-1]).unique_keys.to_list()
+        assert g.size()[1].to_list() == np.unique(keys.to_ndarray(), return_counts=True)[1].tolist()
+
+        fkeys = ak.array([1.5, 0.5, 1.5, np.nan])
+        assert ak.GroupBy(fkeys).unique_keys.to_list() == [0.5, 1.5]
+        assert fkeys._stat("nan_count") == 1
+        fkeys[3] = 2.5
+        assert fkeys._stat("nan_count") is None
+        assert ak.GroupBy(fkeys).unique_keys.to_list() == [0.5, 1.5, 2.5]
+        assert fkeys._stat("nan_count") == 0
+        assert ak.GroupBy([fkeys, ak.arange(4)]).size()[1].to_list() == [1, 1, 1, 1]
+
     def test_zero_length_groupby(self):
         """
         This tests groupby boundary condition on a zero length pdarray, see Issue #900 for details
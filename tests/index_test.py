@@ -472,6 +472,41 @@ class TestIndex:
 
         assert lk.to_list() == [i in [0, size - 1] for i in range(size)]
 
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_hash_index_lookup(self, size):
+        vals = ak.randint(0, size // 4, size, seed=1)
+        idx = ak.Index(vals)
+        query = ak.randint(-5, size // 4 + 5, 100, seed=2)
+        assert idx.lookup(query).to_list() == ak.in1d(vals, query).to_list()
+        assert idx._hash_index is not None
+        hash_index = idx._hash_index
+
+        # the hash index is reused until the values change
+        query = ak.array([0, 1, size])
+        assert idx.lookup(query).to_list() == ak.in1d(vals, query).to_list()
+        assert idx._hash_index is hash_index
+        assert idx._find(query).to_list() == ak.find(query, vals).to_list()
+        assert idx._indexof(query).to_list() == ak.indexof1d(query, vals).to_list()
+
+        vals[:] = size
+        assert idx.lookup(query).to_list() == [True] * size
+        assert idx._hash_index is not hash_index
+        assert idx._find(query).to_list() == [-1, -1, 0]
+
+        sidx = ak.Index(ak.array(["a", "b", "c", "b"]))
+        assert sidx.lookup(ak.array(["b", "d"])).to_list() == [False, True, False, True]
+        cat = ak.Categorical(ak.array(["c", "d", "a"]))
+        assert sidx._find(cat).to_list() == [2, -1, 0]
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_hash_index_lookup_multi(self, size):
+        a = ak.randint(0, 10, size, seed=1)
+        b = ak.array(ak.randint(0, 10, size, seed=2).to_ndarray().astype(str))
+        idx = ak.Index.factory([a, b])
+        query = [ak.array([0, 3, 11]), ak.array(["1", "3", "1"])]
+        assert idx.lookup(query).to_list() == ak.in1d([a, b], query).to_list()
+        assert idx._find(query).to_list() == ak.find(query, [a, b]).to_list()
+
     @pytest.mark.parametrize("size", pytest.prob_size)
     def test_multi_argsort(self, size):
         idx = ak.Index.factory([ak.arange(size), ak.arange(size)])
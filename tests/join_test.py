@@ -195,6 +195,123 @@ class TestJoin:
         )
         assert cat_left[left].to_list() == cat_right[right].to_list()
 
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_hash_join(self, size):
+        nleft = np.random.randint(0, size // 4, size)
+        nright = np.random.randint(0, size // 4, size // 2)
+        left, right = ak.array(nleft), ak.array(nright)
+        matches = {}
+        for j, v in enumerate(nright.tolist()):
+            matches.setdefault(v, []).append(j)
+        inner = [(i, j) for i, v in enumerate(nleft.tolist()) for j in matches.get(v, [])]
+        unmatched_left = [(i, -1) for i, v in enumerate(nleft.tolist()) if v not in matches]
+        left_values = set(nleft.tolist())
+        unmatched_right = [(-1, j) for j, v in enumerate(nright.tolist()) if v not in left_values]
+
+        def pairs(inds):
+            return list(zip(inds[0].to_list(), inds[1].to_list()))
+
+        # the right side is shuffled or broadcast to every locale
+        for bc in False, True:
+            assert pairs(ak.hash_join(left, right, broadcast=bc)) == inner
+            assert pairs(ak.hash_join(left, right, how="left", broadcast=bc)) == sorted(
+                inner + unmatched_left
+            )
+            assert pairs(ak.hash_join(left, right, how="outer", broadcast=bc)) == (
+                sorted(inner + unmatched_left) + unmatched_right
+            )
+            assert pairs(ak.hash_join(right, left, how="right", broadcast=bc)) == sorted(
+                [(j, i) for i, j in inner + unmatched_left], key=lambda p: (p[1], p[0])
+            )
+            semi = ak.hash_join(left, right, how="semi", broadcast=bc)
+            assert semi.to_list() == sorted({i for i, _ in inner})
+            anti = ak.hash_join(left, right, how="anti", broadcast=bc)
+            assert anti.to_list() == [i for i, _ in unmatched_left]
+
+        # a small left side is broadcast in turn, with the same output
+        inner_rl = sorted((j, i) for i, j in inner)
+        unmatched_rl = [(j, -1) for _, j in unmatched_right]
+        for bc in False, True:
+            assert pairs(ak.hash_join(right, left, broadcast=bc)) == inner_rl
+            assert pairs(ak.hash_join(right, left, how="left", broadcast=bc)) == sorted(
+                inner_rl + unmatched_rl
+            )
+            assert pairs(ak.hash_join(right, left, how="outer", broadcast=bc)) == (
+                sorted(inner_rl + unmatched_rl) + [(-1, i) for i, _ in unmatched_left]
+            )
+            semi = ak.hash_join(right, left, how="semi", broadcast=bc)
+            assert semi.to_list() == sorted({j for _, j in inner})
+            anti = ak.hash_join(right, left, how="anti", broadcast=bc)
+            assert anti.to_list() == [j for _, j in unmatched_right]
+
+        # the hash and sort joins give the same pairs, in the same order
+        for keys in (left, right), (ak.cast(left, ak.str_), ak.cast(right, ak.str_)):
+            assert pairs(ak.join.inner_join(*keys, method="hash")) == inner
+            assert pairs(ak.join.inner_join(*keys, method="sort")) == inner
+            assert pairs(ak.join.inner_join(*keys)) == inner
+        l_ind, r_ind = ak.join.inner_join(
+            left, right, wherefunc=join_where, whereargs=(left, right), method="hash"
+        )
+        sort_inds = ak.join.inner_join(
+            left, right, wherefunc=join_where, whereargs=(left, right), method="sort"
+        )
+        assert pairs((l_ind, r_ind)) == pairs(sort_inds)
+
+    def test_hash_join_multi_and_categorical(self):
+        a = ak.array([1, 2, 2, 3])
+        s = ak.array(["a", "b", "c", "b"])
+        b = ak.array([2, 3, 2, 1])
+        t = ak.array(["b", "b", "b", "x"])
+        for bc in False, True:
+            l_ind, r_ind = ak.hash_join([a, s], [b, t], broadcast=bc)
+            assert l_ind.to_list() == [1, 1, 3]
+            assert r_ind.to_list() == [0, 2, 1]
+
+        # categoricals with different categories are matched by value
+        cat_l, cat_r = ak.hash_join(ak.Categorical(s), ak.Categorical(t))
+        assert cat_l.to_list() == [1, 1, 1, 3, 3, 3]
+        assert cat_r.to_list() == [0, 1, 2, 0, 1, 2]
+
+        with pytest.raises(TypeError):
+            ak.hash_join(a, s)
+        with pytest.raises(TypeError):
+            ak.hash_join(a, ak.cast(b, ak.float64))
+        with pytest.raises(ValueError):
+            ak.hash_join(a, b, how="cross")
+        with pytest.raises(TypeError):
+            ak.join.inner_join(a, ak.cast(b, ak.float64), method="hash")
+        with pytest.raises(ValueError):
+            ak.join.inner_join(a, b, method="tree")
+
+    def test_asof_join(self):
+        trades = ak.array([1, 2, 3, 5, 10])
+        quotes = ak.array([0, 2, 2, 3, 7, 12])
+        assert ak.asof_join(trades, quotes).to_list() == [0, 2, 3, 3, 4]
+        assert ak.asof_join(trades, quotes, direction="forward").to_list() == [1, 1, 3, 4, 5]
+        assert ak.asof_join(trades, quotes, direction="nearest").to_list() == [0, 2, 3, 3, 5]
+        assert ak.asof_join(trades, quotes, tolerance=1).to_list() == [0, 2, 3, -1, -1]
+        float_res = ak.asof_join(ak.cast(trades, ak.float64), ak.cast(quotes, ak.float64))
+        assert float_res.to_list() == [0, 2, 3, 3, 4]
+        float_res = ak.asof_join(ak.cast(trades, ak.float64), ak.cast(quotes, ak.float64), tolerance=1)
+        assert float_res.to_list() == [0, 2, 3, -1, -1]
+
+        # only rows with equal by keys are matched
+        syms = ak.Categorical(ak.array(["a", "b", "a", "b", "a"]))
+        quote_syms = ak.Categorical(ak.array(["b", "a", "b", "a", "a", "b"]))
+        res = ak.asof_join(trades, quotes, left_by=syms, right_by=quote_syms)
+        assert res.to_list() == [-1, 2, 3, 2, 4]
+
+        with pytest.raises(ValueError):
+            ak.asof_join(trades[::-1], quotes)
+        with pytest.raises(ValueError):
+            ak.asof_join(trades, quotes, direction="sideways")
+        with pytest.raises(TypeError):
+            ak.asof_join(trades, ak.cast(quotes, ak.float64))
+        with pytest.raises(TypeError):
+            ak.asof_join(trades, quotes, tolerance=np.timedelta64(1, "s"))
+        with pytest.raises(TypeError):
+            ak.asof_join(trades, quotes, tolerance=1.5)
+
     def test_lookup(self):
         keys = ak.arange(5)
         values = 10 * keys
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import arkouda as ak
+
+
+class TestLazy:
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_fused_arithmetic(self, size):
+        na = np.random.randint(1, 100, size)
+        nb = np.random.uniform(1, 10, size)
+        nc = np.random.randint(1, 10, size)
+        a, b, c = ak.array(na), ak.array(nb), ak.array(nc)
+
+        with ak.lazy():
+            x = (a * b + c) / 2
+            y = a // c + a % c - 3 * a
+            z = 1.5 ** ak.log(b) - ak.sqrt(a) * ak.exp(-b) + ak.abs(a - 50)
+            assert isinstance(x, ak.LazyArray) and not x.evaluated
+        # the expressions still pending are evaluated when the block ends
+        assert x.evaluated and y.evaluated and z.evaluated
+        assert x.dtype == ak.float64 and y.dtype == ak.int64 and z.dtype == ak.float64
+
+        assert np.allclose(x.to_ndarray(), (na * nb + nc) / 2)
+        assert np.array_equal(y.to_ndarray(), na // nc + na % nc - 3 * na)
+        assert np.allclose(
+            z.to_ndarray(), 1.5 ** np.log(nb) - np.sqrt(na) * np.exp(-nb) + np.abs(na - 50)
+        )
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_fused_where_and_comparisons(self, size):
+        na = np.random.randint(-10, 10, size)
+        nb = np.random.uniform(-10, 10, size)
+        a, b = ak.array(na), ak.array(nb)
+
+        with ak.lazy():
+            mask = (a > 0) & (b < 5.0) | (a == -3)
+            x = ak.where(mask, ak.cos(b) * a, ak.sin(a))
+            y = ak.where(a >= 0, a, 0)
+        assert mask.dtype == ak.bool_ and y.dtype == ak.int64
+
+        nmask = (na > 0) & (nb < 5.0) | (na == -3)
+        assert np.array_equal(mask.to_ndarray(), nmask)
+        assert np.allclose(x.to_ndarray(), np.where(nmask, np.cos(nb) * na, np.sin(na)))
+        assert np.array_equal(y.to_ndarray(), np.where(na >= 0, na, 0))
+
+    def test_integer_division_by_zero(self):
+        a = ak.array([7, -7, 7, 0])
+        b = ak.array([2, 2, 0, 0])
+        with ak.lazy():
+            q, r = a // b, a % b
+        assert q.to_list() == (a // b).to_list()
+        assert r.to_list() == (a % b).to_list()
+
+    def test_eager_fallback(self):
+        a = ak.arange(10)
+        u = ak.arange(10, dtype=ak.uint64)
+        with ak.lazy():
+            assert not isinstance(a**2, ak.LazyArray)
+            assert not isinstance(u + 1, ak.LazyArray)
+            with pytest.raises(ValueError):
+                a + ak.arange(5)
+            x = a + 1
+        # operations on a lazy result outside the block run eagerly
+        y = x * 2
+        assert not isinstance(y, ak.LazyArray)
+        assert y.to_list() == [(i + 1) * 2 for i in range(10)]
+        assert (ak.arange(10) + x).to_list() == [2 * i + 1 for i in range(10)]
+
+    def test_long_expression(self):
+        a = ak.arange(10)
+        with ak.lazy():
+            x = a
+            for _ in range(200):
+                x = x + 1
+        assert x.to_list() == list(range(200, 210))
+
+    def test_operand_writes(self):
+        # an expression sees its operands as they were when it was recorded
+        a = ak.arange(5)
+        with ak.lazy():
+            b = a * 2
+        a[0] = 100
+        assert b.to_list() == [0, 2, 4, 6, 8]
+
+        a = ak.arange(5)
+        with ak.lazy():
+            b = a * 2
+            c = b + a
+            a += 1
+            a[1] = 100
+            assert b.evaluated and c.evaluated
+            d = a * 2
+            assert not d.evaluated
+        assert b.to_list() == [0, 2, 4, 6, 8]
+        assert c.to_list() == [0, 3, 6, 9, 12]
+        assert d.to_list() == [2, 200, 6, 8, 10]
+
+        # expressions that do not read the written array stay pending
+        e = ak.arange(5)
+        with ak.lazy():
+            f = e + 1
+            a.fill(0)
+            assert not f.evaluated
+        assert f.to_list() == [1, 2, 3, 4, 5]
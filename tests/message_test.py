@@ -3,7 +3,7 @@ import json
 import pytest
 
 import arkouda as ak
-from arkouda.client import _json_args_to_str
+from arkouda.client import _binary_args_to_str, _json_args_to_str
 from arkouda.message import MessageFormat, MessageType, ReplyMessage, RequestMessage
 
 
@@ -318,3 +318,30 @@ class TestJSONArgs:
             ]
         )
         assert args == expected
+
+    def test_batch_reply_arg(self):
+        from arkouda.client import BatchReply
+
+        reply = BatchReply(3)
+        size, args = _json_args_to_str({"array": reply, "idx": reply.symbol(2)})
+        expected = json.dumps(
+            [
+                json.dumps({"key": "array", "dtype": "str", "val": "__batch_3_0__"}),
+                json.dumps({"key": "idx", "dtype": "str", "val": "__batch_3_2__"}),
+            ]
+        )
+        assert size == 2
+        assert args == expected
+
+    def test_binary_args(self):
+        pda = ak.arange(10)
+        size, args = _binary_args_to_str({"op": "+", "a": pda, "names": ["ab", "c"], "s": "é:x"})
+        names = json.dumps(["ab", "c"])
+        assert size == 4
+        assert args == (
+            "2:op3:str1:+"
+            + f"1:a5:int64{len(pda.name)}:{pda.name}"
+            + f"5:names3:str{len(names)}:{names}"
+            + "1:s3:str4:é:x"
+        )
+        assert _binary_args_to_str() == (0, "")
@@ -1,5 +1,6 @@
 import datetime as dt
 import math
+import os
 import statistics
 from collections import deque
 
@@ -116,6 +117,61 @@ class TestPdarrayCreation:
 
         assert_arkouda_array_equal(ak.transpose(ak.array(nda)), ak.array(np.transpose(nda)))
 
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    @pytest.mark.parametrize("dtype", [ak.int64, ak.uint64, ak.float64, ak.bool_])
+    def test_array_creation_chunked(self, size, dtype):
+        nda = np.random.randint(0, 100, size).astype(dtype)
+        try:
+            # force the array to be streamed in several chunks
+            ak.client.transferChunkBytes = 1000
+            pda = ak.array(nda)
+        finally:
+            ak.client.set_defaults()
+        assert pda.dtype == dtype
+        assert np.array_equal(pda.to_ndarray(), nda)
+
+    @pytest.mark.skip_if_max_rank_less_than(2)
+    def test_array_creation_chunked_multi_dim(self):
+        nda = np.random.randint(0, 100, (40, 25))
+        try:
+            ak.client.transferChunkBytes = 1000
+            for a in [nda, np.asfortranarray(nda), nda.T, nda[::2]]:
+                assert np.array_equal(ak.array(a).to_ndarray(), a)
+        finally:
+            ak.client.set_defaults()
+
+    @pytest.mark.parametrize("dtype", [ak.int64, ak.uint64, ak.float64, ak.bool_])
+    def test_array_transfer_shared_memory(self, dtype):
+        if ak.client.sharedMemoryDir is None:
+            pytest.skip("shared memory transport is not available")
+        nda = np.random.randint(0, 100, 1000).astype(dtype)
+        try:
+            # force arrays of any size through shared memory
+            ak.client.sharedMemoryMinBytes = 1
+            pda = ak.array(nda)
+            assert pda.dtype == dtype
+            result = pda.to_ndarray()
+            assert np.array_equal(result, nda)
+            assert result.flags.writeable
+            if ak.client.get_max_array_rank() >= 2:
+                nda2 = nda.reshape((40, 25))
+                for a in [nda2, np.asfortranarray(nda2), nda2.T]:
+                    assert np.array_equal(ak.array(a).to_ndarray(), a)
+        finally:
+            ak.client.set_defaults()
+
+    def test_shared_memory_file_permissions(self, tmp_path):
+        from arkouda.client import _create_shared_memory_file, _remove_shared_memory_file
+
+        path = str(tmp_path / "arkouda-test")
+        os.close(_create_shared_memory_file(path))
+        try:
+            assert os.stat(path).st_mode & 0o777 == 0o600
+            with pytest.raises(FileExistsError):
+                _create_shared_memory_file(path)
+        finally:
+            _remove_shared_memory_file(path)
+
     def test_infer_shape_from_size(self):
         from arkouda.util import _infer_shape_from_size
 
@@ -118,3 +118,82 @@ class TestPdarrayClass:
         aMin02 = ak.min(a, axis=(0, 2))
         assert aMin02.shape == (1, 7, 1)
         assert aMin02[0, 6, 0] == -1
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_stats_cache(self, size):
+        a = ak.arange(size)
+        assert a._stat("sorted") and a._stat("min") == 0 and a._stat("max") == size - 1
+        assert a.is_sorted() and a.min() == 0 and a.max() == size - 1
+        assert a[::2]._stat("sorted") and a[a % 3 == 0]._stat("sorted")
+        assert a[::-1]._stat("sorted") is None
+
+        # statistics are dropped when the array is modified in place
+        a[0] = size
+        assert a._stat("sorted") is None and a._stat("min") is None
+        assert not a.is_sorted() and a.min() == 1 and a.max() == size
+        assert a._stat("sorted") is not None and not a._stat("sorted") and a._stat("max") == size
+        a += 1
+        assert a.min() == 2 and a.max() == size + 1
+
+        b = ak.randint(0, 100, size, seed=SEED)
+        assert b._stat("sorted") is None
+        s = ak.sort(b)
+        assert s._stat("sorted") and s.is_sorted()
+
+    def test_stats_cache_server_writes(self):
+        # functions that write their argument on the server drop its statistics too
+        a = ak.arange(10)
+        assert a.is_sorted() and a.max() == 9
+        ak.putmask(a, a > 2, ak.array([0]))
+        assert a.max() == 2 and not a.is_sorted()
+        g = ak.GroupBy(a)
+        assert g.unique_keys.to_list() == [0, 1, 2]
+        assert g.size()[1].to_list() == [8, 1, 1]
+
+        b = ak.arange(100)
+        assert b.is_sorted()
+        ak.random.default_rng(SEED).shuffle(b)
+        assert not b.is_sorted()
+
+    def test_stats_cache_attached_handles(self):
+        # statistics belong to the server array, so writes through another handle drop them
+        a = ak.arange(10)
+        try:
+            a.register("stats_cache_test")
+            x = ak.attach("stats_cache_test")
+            y = ak.attach("stats_cache_test")
+            assert x.is_sorted() and x.max() == 9
+            y[0] = 5
+            assert not x.is_sorted() and not a.is_sorted() and x.min() == 1
+            g = ak.GroupBy(x)
+            assert g.unique_keys.to_list() == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+            assert g.size()[1].to_list() == [1, 1, 1, 1, 2, 1, 1, 1, 1]
+        finally:
+            a.unregister()
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    @pytest.mark.parametrize("dtype", [ak.int64, ak.uint64, ak.float64])
+    def test_to_ndarray_chunked(self, size, dtype):
+        a = ak.array(ak.randint(0, 100, size, dtype=dtype, seed=SEED))
+        expected = a.to_ndarray()
+        try:
+            # force the array to be streamed in several chunks
+            ak.client.transferChunkBytes = 1000
+            chunked = a.to_ndarray()
+        finally:
+            ak.client.set_defaults()
+        assert np.array_equal(chunked, expected)
+        assert chunked.flags.writeable
+
+        with pytest.raises(RuntimeError):
+            a.to_ndarray(datalimit=a.size * a.itemsize - 1)
+
+    @pytest.mark.skip_if_max_rank_less_than(2)
+    def test_to_ndarray_chunked_multidim(self):
+        a = ak.arange(1000).reshape((10, 100))
+        try:
+            ak.client.transferChunkBytes = 808
+            chunked = a.to_ndarray()
+        finally:
+            ak.client.set_defaults()
+        assert np.array_equal(chunked, np.arange(1000).reshape((10, 100)))
@@ -232,6 +232,24 @@ class TestSegArray:
         assert isinstance(segarr, ak.SegArray)
         assert segarr.lengths.to_list() == [2, 3, 1, 0]
 
+    def test_lazy_grouping(self):
+        segs = ak.array([0, 0, 2, 5, 5, 6])
+        vals = ak.array([3, 1, 4, 1, 5, 9, 2])
+        sa = ak.SegArray(segs, vals)
+        # nothing is computed until it is needed
+        assert sa._lengths is None and sa._non_empty is None and sa._grouping is None
+
+        assert sa.sum().to_list() == [4, 10, 9, 2]
+        expected = ak.GroupBy(ak.array([1, 1, 2, 2, 2, 4, 5]))
+        assert sa.grouping.permutation.to_list() == expected.permutation.to_list()
+        assert sa.grouping.segments.to_list() == expected.segments.to_list()
+        assert sa.grouping.unique_keys.to_list() == list(range(4))
+        assert sa.lengths.to_list() == [0, 2, 3, 0, 1, 1]
+
+        sliced = sa[ak.array([1, 2, 4])]
+        assert sliced.to_list() == [[3, 1], [4, 1, 5], [9]]
+        assert sliced.max().to_list() == [3, 5, 9]
+
     def test_empty_creation(self):
         sa = ak.SegArray(ak.array([], dtype=ak.int64), ak.array([]))
 
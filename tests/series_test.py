@@ -283,6 +283,22 @@ class TestSeries:
         assert result.index.values.to_list() == [5, 4, 2, 3, 1]
         assert result.values.to_list() == ["a", "a", "b", "b", "c"]
 
+    def test_label_lookup_after_index_change(self):
+        s = ak.Series(ak.arange(5) * 10, index=ak.array(["a", "b", "c", "d", "e"]))
+        assert s[ak.array(["d", "a", "d"])].values.to_list() == [30, 0, 30]
+        assert s.loc[ak.array(["b", "e"])].values.to_list() == [10, 40]
+        with pytest.raises(KeyError):
+            s[ak.array(["a", "z"])]
+
+        # a hash index built for an earlier lookup is not used after the
+        # index values are replaced
+        s.index.values = ak.array(["v", "w", "x", "y", "z"])
+        assert s[ak.array(["z", "v"])].values.to_list() == [40, 0]
+        s[ak.array(["w"])] = 7
+        assert s.values.to_list() == [0, 7, 20, 30, 40]
+        with pytest.raises(KeyError):
+            s[ak.array(["a"])]
+
     def test_to_markdown(self):
         s = ak.Series(["elk", "pig", "dog", "quetzal"], name="animal")
         assert (
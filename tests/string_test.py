@@ -73,6 +73,37 @@ class TestString:
         s3 = ak.array(["a", "b", "c", "d"])
         assert not s.equals(s3)
 
+    def test_to_ndarray_and_list(self):
+        strings = ["", "a", "héllo", "", "日本語", "x" * 100, " "]
+        s = ak.array(strings)
+        assert s.to_list() == strings
+        nda = s.to_ndarray()
+        assert nda.dtype == np.dtype("<U100")
+        assert nda.tolist() == strings
+        assert s[ak.arange(0)].to_list() == []
+        assert s[ak.arange(0)].to_ndarray().dtype == np.dtype("<U1")
+
+    def test_array_chunked_upload(self):
+        strings = [f"wörd {i} ✓" * (i % 5) for i in range(5000)]
+        default = ak.client.transferChunkBytes
+        try:
+            ak.client.transferChunkBytes = 4096
+            assert ak.array(strings).to_list() == strings
+            assert ak.array(np.array(strings, dtype=object)).to_list() == strings
+        finally:
+            ak.client.transferChunkBytes = default
+        assert ak.array(np.array([], dtype="<U1")).size == 0
+
+    def test_array_chunk_sizes(self):
+        from arkouda.pdarraycreation import _encoded_string_chunks
+
+        # short strings first and long ones later, which a sample of the first
+        # strings would underestimate
+        strings = np.array(["a"] * 2000 + ["✓" * 500] * 20 + ["b" * 5000])
+        chunks = list(_encoded_string_chunks(strings, 1024))
+        assert all(c.size <= 1024 or (c == 0).sum() == 1 for c in chunks)
+        assert bytes(np.concatenate(chunks)).split(b"\x00")[:-1] == [s.encode() for s in strings]
+
     @pytest.mark.parametrize("size", pytest.prob_size)
     def test_compare_strings(self, size):
         base_words, np_base_words = self.base_words(size)